@@ -52,13 +52,19 @@ CREATE TABLE IF NOT EXISTS campaigns (
     fecha_inicio TIMESTAMP NOT NULL,
     fecha_fin TIMESTAMP NOT NULL,
     presupuesto DECIMAL(12,2) DEFAULT 0.0,
-    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('MARKETING', 'VENTAS', 'PROMOCIONAL', 'BRAND')),
-    status VARCHAR(50) NOT NULL DEFAULT 'PENDIENTE' CHECK (status IN ('ACTIVA', 'INACTIVA', 'COMPLETADA', 'CANCELADA', 'PENDIENTE')),
+    moneda VARCHAR(3) NOT NULL DEFAULT 'USD',
+    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('PERFORMANCE', 'BRAND_AWARENESS', 'LEAD_GENERATION', 'SALES', 'ENGAGEMENT')),
+    status VARCHAR(50) NOT NULL DEFAULT 'DRAFT' CHECK (status IN ('DRAFT', 'ACTIVE', 'PAUSED', 'COMPLETED', 'CANCELLED')),
     partner_id UUID REFERENCES partners(id),
     total_conversions INTEGER DEFAULT 0,
     total_clicks INTEGER DEFAULT 0,
-    conversion_rate DECIMAL(3,2) DEFAULT 0.0,
+    conversion_rate DECIMAL(5,4) DEFAULT 0.0,
     roi DECIMAL(8,2) DEFAULT 0.0,
+    is_approved BOOLEAN NOT NULL DEFAULT FALSE,
+    targeting_json JSONB,
+    settings_json JSONB,
+    metricas_json JSONB,
+    approval_json JSONB,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -69,12 +75,16 @@ CREATE TABLE IF NOT EXISTS commissions (
     partner_id UUID NOT NULL REFERENCES partners(id),
     campaign_id UUID REFERENCES campaigns(id),
     monto DECIMAL(12,2) NOT NULL,
-    porcentaje DECIMAL(3,2) DEFAULT 0.0,
-    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('FIJO', 'PORCENTUAL', 'HIBRIDO')),
-    status VARCHAR(50) NOT NULL DEFAULT 'PENDIENTE' CHECK (status IN ('PENDIENTE', 'APROBADA', 'PAGADA', 'CANCELADA', 'RECHAZADA')),
+    moneda VARCHAR(3) NOT NULL DEFAULT 'USD',
+    porcentaje DECIMAL(7,4) DEFAULT 0.0,
+    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('SALE_COMMISSION', 'LEAD_COMMISSION', 'PERFORMANCE_BONUS', 'REFERRAL_BONUS', 'MILESTONE_BONUS')),
+    status VARCHAR(50) NOT NULL DEFAULT 'PENDING' CHECK (status IN ('PENDING', 'APPROVED', 'PAID', 'CANCELLED', 'DISPUTED', 'ON_HOLD')),
+    transaction_id VARCHAR(100) UNIQUE,
     fecha_calculo TIMESTAMP NOT NULL,
     fecha_pago TIMESTAMP,
     descripcion TEXT,
+    detalles_json JSONB,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -83,8 +93,8 @@ CREATE TABLE IF NOT EXISTS commissions (
 CREATE TABLE IF NOT EXISTS analytics_reports (
     id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
     titulo VARCHAR(255) NOT NULL,
-    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('PARTNER_PERFORMANCE', 'CAMPAIGN_ANALYSIS', 'COMMISSION_SUMMARY', 'REVENUE_REPORT', 'CONVERSION_ANALYSIS')),
-    status VARCHAR(50) NOT NULL DEFAULT 'GENERANDO' CHECK (status IN ('GENERANDO', 'COMPLETADO', 'ERROR', 'ARCHIVADO')),
+    tipo VARCHAR(50) NOT NULL CHECK (tipo IN ('PARTNER_PERFORMANCE', 'CAMPAIGN_ANALYTICS', 'COMMISSION_SUMMARY', 'REVENUE_ANALYSIS', 'CONVERSION_METRICS', 'PROFILE_360')),
+    status VARCHAR(50) NOT NULL DEFAULT 'PENDING' CHECK (status IN ('PENDING', 'GENERATING', 'COMPLETED', 'FAILED', 'ARCHIVED')),
     fecha_inicio TIMESTAMP NOT NULL,
     fecha_fin TIMESTAMP NOT NULL,
     datos_json JSONB,
@@ -93,6 +103,9 @@ CREATE TABLE IF NOT EXISTS analytics_reports (
     archivo_path VARCHAR(500),
     partner_id UUID REFERENCES partners(id),
     campaign_id UUID REFERENCES campaigns(id),
+    generated_at TIMESTAMP,
+    generation_time_seconds DOUBLE PRECISION,
+    is_deleted BOOLEAN NOT NULL DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -124,6 +137,14 @@ CREATE INDEX IF NOT EXISTS idx_commissions_fecha_calculo ON commissions(fecha_ca
 CREATE INDEX IF NOT EXISTS idx_analytics_reports_partner_id ON analytics_reports(partner_id);
 CREATE INDEX IF NOT EXISTS idx_analytics_reports_campaign_id ON analytics_reports(campaign_id);
 CREATE INDEX IF NOT EXISTS idx_analytics_reports_tipo ON analytics_reports(tipo);
+-- Keyset pagination on (created_at, id) and case-insensitive email lookups
+CREATE INDEX IF NOT EXISTS idx_partners_email_lower ON partners(LOWER(email));
+CREATE INDEX IF NOT EXISTS idx_partners_created_at_id ON partners(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_campaigns_created_at_id ON campaigns(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_campaigns_partner_id_status ON campaigns(partner_id, status);
+CREATE INDEX IF NOT EXISTS idx_commissions_created_at_id ON commissions(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_commissions_partner_id_created_at ON commissions(partner_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_analytics_reports_created_at_id ON analytics_reports(created_at, id);
 CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_id ON domain_events(aggregate_id);
 CREATE INDEX IF NOT EXISTS idx_domain_events_aggregate_type ON domain_events(aggregate_type);
 CREATE INDEX IF NOT EXISTS idx_domain_events_event_type ON domain_events(event_type);
@@ -13,6 +13,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../..'))
 from src.pulsar_event_dispatcher import PulsarEventDispatcher
+from src.idempotency_store import IdempotencyStore, create_idempotency_store
 
 # Importar control de estado del servicio
 from src.campaign_management.service_state import is_service_enabled
@@ -21,21 +22,26 @@ from src.campaign_management.service_state import is_service_enabled
 class CampaignManagementSagaIntegration:
     """Integración de Saga para el servicio de Campaign Management usando Apache Pulsar"""
     
-    def __init__(self, event_dispatcher: PulsarEventDispatcher):
+    def __init__(self, event_dispatcher: PulsarEventDispatcher, processed_events: IdempotencyStore = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.event_dispatcher = event_dispatcher
+        self.processed_events = processed_events or create_idempotency_store("campaign-management")  # Para evitar procesar eventos duplicados
         self._subscribe_to_events()
     
     def _subscribe_to_events(self):
         """Suscribirse a eventos relevantes"""
         # Eventos normales
-        self.event_dispatcher.subscribe("CampaignsEnabled", self._handle_campaigns_enabled)
+        self._subscribe("CampaignsEnabled", self._handle_campaigns_enabled)
         
         # Eventos de compensación
-        self.event_dispatcher.subscribe("CampaignsDisableRequested", self._handle_campaigns_disable_requested)
+        self._subscribe("CampaignsDisableRequested", self._handle_campaigns_disable_requested)
         
         self.logger.info("Campaign Management service subscribed to saga events")
     
+    def _subscribe(self, event_type: str, handler):
+        """Suscribe un handler que ignora las entregas duplicadas del evento"""
+        self.event_dispatcher.subscribe(event_type, self.processed_events.idempotent(event_type, handler))
+    
     def _handle_campaigns_enabled(self, event_data: Dict[str, Any]):
         """Maneja el evento de campañas habilitadas"""
         partner_id = event_data["partner_id"]
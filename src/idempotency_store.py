@@ -0,0 +1,278 @@
+import hashlib
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import Column, Float, String, create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import declarative_base, sessionmaker
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter with k hash positions derived from one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        # Standard sizing: m = -n ln p / (ln 2)^2, k = m/n ln 2
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class _RotatingBloomFilter:
+    """Two Bloom filter generations rotated every `window_seconds`.
+
+    Bloom filters cannot forget, so a key is added to the current generation and
+    looked up in both; rotating drops the older one. Any key added within the last
+    `window_seconds` is therefore always reported as possibly present.
+    """
+
+    def __init__(self, capacity: int, window_seconds: float, error_rate: float = 0.001):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.window_seconds = window_seconds
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous = BloomFilter(capacity, error_rate)
+        self._rotated_at = time.monotonic()
+
+    def _maybe_rotate(self):
+        if time.monotonic() - self._rotated_at >= self.window_seconds:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+            self._rotated_at = time.monotonic()
+
+    def add(self, key: str):
+        self._maybe_rotate()
+        self._current.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        self._maybe_rotate()
+        return key in self._current or key in self._previous
+
+
+Base = declarative_base()
+
+
+class ProcessedEventRecord(Base):
+    __tablename__ = 'processed_events'
+
+    key = Column(String, primary_key=True)
+    expires_at = Column(Float, nullable=False, index=True)
+
+
+class SqlIdempotencyBackend:
+    """Durable tier of the idempotency store (SQLite or Postgres through SQLAlchemy)."""
+
+    def __init__(self, database_url: str = None, engine=None, purge_every: int = 1000):
+        self.engine = engine or create_engine(database_url, pool_pre_ping=True)
+        self.purge_every = purge_every
+        self._session_factory = sessionmaker(bind=self.engine)
+        self._writes = 0
+        Base.metadata.create_all(self.engine)
+
+    def add_if_absent(self, key: str, expires_at: float) -> bool:
+        """Record the key unless an unexpired record exists; True if it was recorded."""
+        now = time.time()
+        with self._session_factory() as session:
+            session.add(ProcessedEventRecord(key=key, expires_at=expires_at))
+            try:
+                session.commit()
+            except IntegrityError:
+                session.rollback()
+                # Take over an expired record; a live one means the key is a duplicate
+                updated = session.query(ProcessedEventRecord).filter(
+                    ProcessedEventRecord.key == key,
+                    ProcessedEventRecord.expires_at <= now
+                ).update({"expires_at": expires_at}, synchronize_session=False)
+                session.commit()
+                if updated == 0:
+                    return False
+
+        self._writes += 1
+        if self._writes % self.purge_every == 0:
+            self.purge_expired()
+        return True
+
+    def contains(self, key: str) -> bool:
+        with self._session_factory() as session:
+            record = session.get(ProcessedEventRecord, key)
+            return record is not None and record.expires_at > time.time()
+
+    def remove(self, key: str):
+        with self._session_factory() as session:
+            session.query(ProcessedEventRecord).filter(ProcessedEventRecord.key == key).delete()
+            session.commit()
+
+    def live_keys(self, prefix: str) -> Iterable[str]:
+        """Unexpired keys with the given prefix, used to warm the Bloom filter after a restart."""
+        with self._session_factory() as session:
+            rows = session.query(ProcessedEventRecord.key).filter(
+                ProcessedEventRecord.key.startswith(prefix, autoescape=True),
+                ProcessedEventRecord.expires_at > time.time()
+            ).yield_per(1000)
+            for (key,) in rows:
+                yield key
+
+    def purge_expired(self):
+        with self._session_factory() as session:
+            session.query(ProcessedEventRecord).filter(
+                ProcessedEventRecord.expires_at <= time.time()
+            ).delete(synchronize_session=False)
+            session.commit()
+
+
+class IdempotencyStore:
+    """Bounded duplicate suppression for saga event handlers.
+
+    Keys live in an in-memory LRU with a TTL, capped at `max_entries`, so memory stays
+    fixed and every check is O(1). An optional durable backend keeps keys across
+    restarts and replicas; `check_and_mark` then costs one insert round trip. An
+    optional Bloom filter lets lookups rule out never-seen keys without touching the
+    LRU or the durable tier.
+    """
+
+    def __init__(self,
+                 namespace: str,
+                 ttl_seconds: float = 24 * 3600,
+                 max_entries: int = 100_000,
+                 use_bloom_filter: bool = False,
+                 bloom_capacity: Optional[int] = None,
+                 bloom_error_rate: float = 0.001,
+                 durable: Optional[SqlIdempotencyBackend] = None):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.durable = durable
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.duplicates = 0
+
+        # Sized for the keys expected per TTL window; overfilling only raises the false positive rate
+        self._bloom = _RotatingBloomFilter(bloom_capacity or max_entries, ttl_seconds, bloom_error_rate) if use_bloom_filter else None
+        if self._bloom is not None and self.durable is not None:
+            # Without warming, the empty filter would wave through keys persisted before a restart
+            for key in self.durable.live_keys(f"{namespace}:"):
+                self._bloom.add(key)
+
+    def check_and_mark(self, key: str) -> bool:
+        """Mark the key as processed; True the first time, False for a duplicate."""
+        full_key = f"{self.namespace}:{key}"
+        now = time.time()
+        with self._lock:
+            maybe_seen = self._bloom is None or full_key in self._bloom
+            if maybe_seen:
+                expires_at = self._entries.get(full_key)
+                if expires_at is not None and expires_at > now:
+                    self._entries.move_to_end(full_key)
+                    self.duplicates += 1
+                    return False
+            self._remember(full_key, now + self.ttl_seconds, now)
+
+        if self.durable is not None:
+            try:
+                if not self.durable.add_if_absent(full_key, now + self.ttl_seconds):
+                    self.duplicates += 1
+                    return False
+            except Exception as e:
+                # The in-memory tiers still suppress duplicates seen by this process
+                self.logger.warning(f"Durable idempotency check failed for {full_key}: {e}")
+        return True
+
+    def seen(self, key: str) -> bool:
+        """Whether the key was marked and has not expired (does not mark it)."""
+        full_key = f"{self.namespace}:{key}"
+        with self._lock:
+            if self._bloom is not None and full_key not in self._bloom:
+                return False
+            expires_at = self._entries.get(full_key)
+            if expires_at is not None and expires_at > time.time():
+                return True
+        return self.durable is not None and self.durable.contains(full_key)
+
+    def forget(self, key: str):
+        """Unmark a key so a redelivery is processed again (e.g. after a handler failure)."""
+        full_key = f"{self.namespace}:{key}"
+        with self._lock:
+            self._entries.pop(full_key, None)
+        if self.durable is not None:
+            self.durable.remove(full_key)
+
+    def idempotent(self, event_type: str, handler: Callable[[Dict[str, Any]], Any],
+                   key_fn: Optional[Callable[[str, Dict[str, Any]], str]] = None) -> Callable[[Dict[str, Any]], Any]:
+        """Wrap an event handler so redelivered events are skipped.
+
+        A handler that raises is unmarked so the redelivery can retry it.
+        """
+        key_fn = key_fn or event_key
+
+        @wraps(handler)
+        def wrapper(event_data: Dict[str, Any]):
+            key = key_fn(event_type, event_data)
+            if not self.check_and_mark(key):
+                self.logger.info(f"Duplicate {event_type} skipped: {key}")
+                return None
+            try:
+                return handler(event_data)
+            except Exception:
+                self.forget(key)
+                raise
+
+        return wrapper
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, full_key: str, expires_at: float, now: float):
+        self._entries[full_key] = expires_at
+        self._entries.move_to_end(full_key)
+        if self._bloom is not None:
+            self._bloom.add(full_key)
+
+        # Expired keys cluster at the front (oldest first); the LRU cap bounds the rest
+        while self._entries:
+            oldest_key, oldest_expiry = next(iter(self._entries.items()))
+            if oldest_expiry > now and len(self._entries) <= self.max_entries:
+                break
+            self._entries.popitem(last=False)
+
+
+def event_key(event_type: str, event_data: Dict[str, Any]) -> str:
+    """Idempotency key of a saga event: its event id if present, else type, partner and causation id."""
+    event_id = event_data.get("event_id")
+    if event_id:
+        return f"{event_type}:{event_id}"
+    return f"{event_type}:{event_data.get('partner_id', '')}:{event_data.get('causation_id', '')}"
+
+
+def create_idempotency_store(namespace: str) -> IdempotencyStore:
+    """Create the idempotency store of a service from the environment.
+
+    IDEMPOTENCY_DATABASE_URL enables the durable tier (e.g. sqlite:///idempotency.db
+    or a Postgres URL shared by the replicas of the service).
+    """
+    database_url = os.getenv('IDEMPOTENCY_DATABASE_URL')
+    return IdempotencyStore(
+        namespace=namespace,
+        ttl_seconds=float(os.getenv('IDEMPOTENCY_TTL_SECONDS', str(24 * 3600))),
+        max_entries=int(os.getenv('IDEMPOTENCY_MAX_ENTRIES', '100000')),
+        use_bloom_filter=os.getenv('IDEMPOTENCY_BLOOM_FILTER', 'false').lower() in ('1', 'true', 'yes'),
+        durable=SqlIdempotencyBackend(database_url) if database_url else None
+    )
@@ -329,36 +329,111 @@ class Contract(AggregateRoot):
         contract = cls()
         
         for event in events:
-            if isinstance(event, ContractCreated):
-                contract._partner_id = event.partner_id
-                contract._contract_type = ContractType(event.contract_type)
-                contract._template_id = event.template_id
-                contract._created_at = event.timestamp
-                contract._updated_at = event.timestamp
-                contract._state = ContractState.DRAFT
-            
-            elif isinstance(event, ContractTermsUpdated):
-                # Apply terms update logic
-                contract._updated_at = event.timestamp
-            
-            elif isinstance(event, ContractSubmittedForLegalReview):
-                contract._state = ContractState.LEGAL_REVIEW
-                contract._legal_reviewer = event.legal_reviewer
-                contract._updated_at = event.timestamp
-            
-            elif isinstance(event, ContractSigned):
-                contract._state = ContractState.SIGNED
-                contract._signed_at = event.timestamp
-                contract._updated_at = event.timestamp
-            
-            elif isinstance(event, ContractActivated):
-                contract._state = ContractState.ACTIVE
-                contract._activated_at = event.activation_date
-                contract._updated_at = event.timestamp
-            
-            contract._increment_version()
+            contract._apply_event(event)
         
         return contract
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any], events: List[DomainEvent] = None) -> 'Contract':
+        """Restore a contract from a snapshot and replay only the events after it"""
+        contract = cls(snapshot["id"])
+        contract._partner_id = snapshot["partner_id"]
+        contract._contract_type = ContractType(snapshot["contract_type"]) if snapshot["contract_type"] else None
+        contract._template_id = snapshot["template_id"]
+        contract._state = ContractState(snapshot["state"])
+        contract._terms = ContractTerms(**snapshot["terms"]) if snapshot["terms"] else None
+        contract._legal_reviewer = snapshot["legal_reviewer"]
+        contract._signatures = [
+            Signature(
+                signer=sig["signer"],
+                signature_method=sig["signature_method"],
+                signature_data=sig["signature_data"],
+                timestamp=datetime.fromisoformat(sig["timestamp"]),
+                ip_address=sig["ip_address"]
+            ) for sig in snapshot["signatures"]
+        ]
+        contract._created_at = _parse_datetime(snapshot["created_at"])
+        contract._updated_at = _parse_datetime(snapshot["updated_at"])
+        contract._signed_at = _parse_datetime(snapshot["signed_at"])
+        contract._activated_at = _parse_datetime(snapshot["activated_at"])
+        contract._metadata = dict(snapshot["metadata"])
+        contract._version = snapshot["version"]
+        
+        for event in events or []:
+            contract._apply_event(event)
+        
+        return contract
+    
+    def to_snapshot(self) -> Dict[str, Any]:
+        """Serialize the full contract state, including its version"""
+        return {
+            "id": self.id,
+            "partner_id": self._partner_id,
+            "contract_type": self._contract_type.value if self._contract_type else None,
+            "template_id": self._template_id,
+            "state": self._state.value,
+            "terms": {
+                "commission_rate": self._terms.commission_rate,
+                "payment_terms": self._terms.payment_terms,
+                "termination_clause": self._terms.termination_clause,
+                "liability_limit": self._terms.liability_limit,
+                "intellectual_property": self._terms.intellectual_property,
+                "data_protection": self._terms.data_protection,
+                "performance_metrics": self._terms.performance_metrics
+            } if self._terms else None,
+            "legal_reviewer": self._legal_reviewer,
+            "signatures": [
+                {
+                    "signer": sig.signer,
+                    "signature_method": sig.signature_method,
+                    "signature_data": sig.signature_data,
+                    "timestamp": sig.timestamp.isoformat(),
+                    "ip_address": sig.ip_address
+                } for sig in self._signatures
+            ],
+            "created_at": self._created_at.isoformat() if self._created_at else None,
+            "updated_at": self._updated_at.isoformat() if self._updated_at else None,
+            "signed_at": self._signed_at.isoformat() if self._signed_at else None,
+            "activated_at": self._activated_at.isoformat() if self._activated_at else None,
+            "metadata": self._metadata,
+            "version": self._version
+        }
+    
+    def _apply_event(self, event: DomainEvent):
+        if isinstance(event, ContractCreated):
+            if event.contract_id:
+                self._id = event.contract_id
+            self._partner_id = event.partner_id
+            self._contract_type = ContractType(event.contract_type)
+            self._template_id = event.template_id
+            self._created_at = event.timestamp
+            self._updated_at = event.timestamp
+            self._state = ContractState.DRAFT
+        
+        elif isinstance(event, ContractTermsUpdated):
+            # Apply terms update logic
+            self._updated_at = event.timestamp
+        
+        elif isinstance(event, ContractSubmittedForLegalReview):
+            self._state = ContractState.LEGAL_REVIEW
+            self._legal_reviewer = event.legal_reviewer
+            self._updated_at = event.timestamp
+        
+        elif isinstance(event, ContractSigned):
+            self._state = ContractState.SIGNED
+            self._signed_at = event.timestamp
+            self._updated_at = event.timestamp
+        
+        elif isinstance(event, ContractActivated):
+            self._state = ContractState.ACTIVE
+            self._activated_at = event.activation_date
+            self._updated_at = event.timestamp
+        
+        self._increment_version()
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
 
 
 @dataclass
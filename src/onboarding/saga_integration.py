@@ -14,28 +14,33 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../..'))
 from src.pulsar_event_dispatcher import PulsarEventDispatcher
+from src.idempotency_store import IdempotencyStore, create_idempotency_store
 
 
 class OnboardingSagaIntegration:
     """Integración de Saga para el servicio de Onboarding usando Apache Pulsar"""
     
-    def __init__(self, event_dispatcher: PulsarEventDispatcher):
+    def __init__(self, event_dispatcher: PulsarEventDispatcher, processed_events: IdempotencyStore = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.event_dispatcher = event_dispatcher
-        self._processed_events = set()  # Para evitar procesar eventos duplicados
+        self.processed_events = processed_events or create_idempotency_store("onboarding")  # Para evitar procesar eventos duplicados
         self._subscribe_to_events()
     
     def _subscribe_to_events(self):
         """Suscribirse a eventos relevantes"""
         # Eventos normales
-        self.event_dispatcher.subscribe("PartnerOnboardingInitiated", self._handle_partner_onboarding_initiated)
-        self.event_dispatcher.subscribe("ContractCreationRequested", self._handle_contract_creation_requested)
-        self.event_dispatcher.subscribe("DocumentVerificationRequested", self._handle_document_verification_requested)
+        self._subscribe("PartnerOnboardingInitiated", self._handle_partner_onboarding_initiated)
+        self._subscribe("ContractCreationRequested", self._handle_contract_creation_requested)
+        self._subscribe("DocumentVerificationRequested", self._handle_document_verification_requested)
         
         # Eventos de compensación
-        self.event_dispatcher.subscribe("ContractCancellationRequested", self._handle_contract_cancellation_requested)
-        self.event_dispatcher.subscribe("DocumentVerificationRevertRequested", self._handle_document_verification_revert_requested)
-        self.event_dispatcher.subscribe("PartnerRegistrationRevertRequested", self._handle_partner_registration_revert_requested)
+        self._subscribe("ContractCancellationRequested", self._handle_contract_cancellation_requested)
+        self._subscribe("DocumentVerificationRevertRequested", self._handle_document_verification_revert_requested)
+        self._subscribe("PartnerRegistrationRevertRequested", self._handle_partner_registration_revert_requested)
+    
+    def _subscribe(self, event_type: str, handler):
+        """Suscribe un handler que ignora las entregas duplicadas del evento"""
+        self.event_dispatcher.subscribe(event_type, self.processed_events.idempotent(event_type, handler))
     
     def _handle_partner_onboarding_initiated(self, event_data: Dict[str, Any]):
         """Maneja el evento de onboarding iniciado"""
@@ -114,13 +119,6 @@ class OnboardingSagaIntegration:
         partner_id = event_data["partner_id"]
         saga_id = event_data.get("saga_id")
         
-        # Check for duplicate events
-        event_id = f"contract_cancellation_requested_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Contract cancellation request already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Compensating: Cancelling contract for partner {partner_id}")
         
         try:
@@ -160,13 +158,6 @@ class OnboardingSagaIntegration:
         partner_id = event_data["partner_id"]
         saga_id = event_data.get("saga_id")
         
-        # Check for duplicate events
-        event_id = f"document_revert_requested_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Document verification revert request already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Compensating: Reverting document verification for partner {partner_id}")
         
         try:
@@ -206,13 +197,6 @@ class OnboardingSagaIntegration:
         partner_id = event_data["partner_id"]
         saga_id = event_data.get("saga_id")
         
-        # Check for duplicate events
-        event_id = f"partner_revert_requested_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Partner registration revert request already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Compensating: Reverting partner registration for partner {partner_id}")
         
         try:
@@ -1,7 +1,7 @@
 import json
 from datetime import datetime
-from typing import List, Dict, Any, Type
-from sqlalchemy import Column, String, Integer, DateTime, Text, Index
+from typing import List, Dict, Any, Optional, Tuple, Type
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
 
@@ -30,6 +30,33 @@ class EventRecord(Base):
     )
 
 
+class SnapshotRecord(Base):
+    """Latest snapshot per aggregate, stored in onboarding.contract_snapshots (sql/init.sql)"""
+    __tablename__ = 'contract_snapshots'
+    __table_args__ = {'schema': 'onboarding'}
+    
+    aggregate_id = Column(String, primary_key=True)
+    aggregate_data = Column(JSON, nullable=False)
+    # Event stream version the snapshot covers; replay resumes after it
+    version = Column(Integer, nullable=False)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class SnapshotPolicy:
+    """Decides when a loaded aggregate should be snapshotted.
+    
+    A snapshot is taken once `every_n_events` events had to be replayed on top of
+    the previous snapshot. `every_n_events=0` disables automatic snapshots, leaving
+    only on-demand ones.
+    """
+    
+    def __init__(self, every_n_events: int = 100):
+        self.every_n_events = every_n_events
+    
+    def should_snapshot(self, events_replayed: int) -> bool:
+        return self.every_n_events > 0 and events_replayed >= self.every_n_events
+
+
 class SqlAlchemyEventStore(EventStore):
     def __init__(self, session: Session, event_registry: Dict[str, Type[DomainEvent]]):
         self.session = session
@@ -58,12 +85,22 @@ class SqlAlchemyEventStore(EventStore):
     
     async def get_events(self, aggregate_id: str, from_version: int = 0) -> List[DomainEvent]:
         """Retrieve events for an aggregate from the event store"""
+        events, _ = await self.get_event_stream(aggregate_id, from_version)
+        return events
+    
+    async def get_event_stream(self, aggregate_id: str, from_version: int = 0) -> Tuple[List[DomainEvent], int]:
+        """Retrieve the events after from_version and the stream version read up to.
+        
+        The stream version counts every stored event, including types missing from the
+        registry, so it is the version a snapshot must record to resume replay correctly.
+        """
         try:
             records = self.session.query(EventRecord).filter(
                 EventRecord.aggregate_id == aggregate_id,
                 EventRecord.version > from_version
             ).order_by(EventRecord.version).all()
             
+            stream_version = records[-1].version if records else from_version
             events = []
             for record in records:
                 event_class = self.event_registry.get(record.event_type)
@@ -80,7 +117,7 @@ class SqlAlchemyEventStore(EventStore):
                     event.timestamp = record.timestamp
                     events.append(event)
             
-            return events
+            return events, stream_version
             
         except Exception as e:
             raise Exception(f"Failed to retrieve events: {str(e)}")
@@ -137,14 +174,46 @@ class SqlAlchemyEventStore(EventStore):
             raise Exception(f"Failed to get aggregate version: {str(e)}")
     
     def create_snapshot(self, aggregate_id: str, version: int, data: Dict[str, Any]):
-        """Create a snapshot of an aggregate state"""
-        # TODO: Implement snapshot functionality for performance optimization
-        pass
+        """Create a snapshot of an aggregate state at a stream version, keeping only the latest one"""
+        try:
+            record = self.session.get(SnapshotRecord, aggregate_id)
+            if record is None:
+                self.session.add(SnapshotRecord(
+                    aggregate_id=aggregate_id,
+                    aggregate_data=data,
+                    version=version,
+                    created_at=datetime.utcnow()
+                ))
+            elif version > record.version:
+                record.aggregate_data = data
+                record.version = version
+                record.created_at = datetime.utcnow()
+            else:
+                # A newer snapshot was already stored
+                return
+            
+            self.session.commit()
+            
+        except Exception as e:
+            self.session.rollback()
+            raise Exception(f"Failed to create snapshot: {str(e)}")
     
-    def get_snapshot(self, aggregate_id: str) -> Dict[str, Any]:
+    def get_snapshot(self, aggregate_id: str) -> Optional[Dict[str, Any]]:
         """Retrieve the latest snapshot for an aggregate"""
-        # TODO: Implement snapshot retrieval
-        return None
+        try:
+            record = self.session.get(SnapshotRecord, aggregate_id)
+            if record is None:
+                return None
+            
+            return {
+                "aggregate_id": record.aggregate_id,
+                "version": record.version,
+                "data": record.aggregate_data,
+                "created_at": record.created_at
+            }
+            
+        except Exception as e:
+            raise Exception(f"Failed to retrieve snapshot: {str(e)}")
 
 
 class EventPublisher:
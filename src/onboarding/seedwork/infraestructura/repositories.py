@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy import Column, String, DateTime, Text, Enum as SqlEnum, Float, JSON, Boolean
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import Session
@@ -7,7 +7,7 @@ import json
 
 from src.onboarding.modulos.contracts.dominio.entidades import Contract, ContractState, ContractType, ContractTerms, Signature
 from src.onboarding.modulos.contracts.dominio.repositorios import ContractRepository, ContractTemplateRepository
-from src.onboarding.seedwork.infraestructura.event_store import SqlAlchemyEventStore
+from src.onboarding.seedwork.infraestructura.event_store import SqlAlchemyEventStore, SnapshotPolicy
 
 
 Base = declarative_base()
@@ -47,9 +47,10 @@ class ContractTemplateModel(Base):
 
 
 class SqlAlchemyContractRepository(ContractRepository):
-    def __init__(self, session: Session, event_store: SqlAlchemyEventStore):
+    def __init__(self, session: Session, event_store: SqlAlchemyEventStore, snapshot_policy: SnapshotPolicy = None):
         self.session = session
         self.event_store = event_store
+        self.snapshot_policy = snapshot_policy or SnapshotPolicy()
     
     async def save(self, contract: Contract):
         """Save contract to database"""
@@ -85,19 +86,43 @@ class SqlAlchemyContractRepository(ContractRepository):
     async def get_by_id(self, contract_id: str) -> Optional[Contract]:
         """Retrieve contract by ID using event sourcing"""
         try:
-            # Get events from event store
-            events = await self.event_store.get_events(contract_id)
-            
-            if not events:
-                return None
-            
-            # Reconstruct contract from events
-            contract = Contract.from_events(events)
+            contract, stream_version, events_replayed = await self._load(contract_id)
+            if contract and self.snapshot_policy.should_snapshot(events_replayed):
+                self._take_snapshot(contract, stream_version)
             return contract
             
         except Exception as e:
             raise Exception(f"Failed to retrieve contract: {str(e)}")
     
+    async def snapshot(self, contract_id: str) -> Optional[Contract]:
+        """Snapshot a contract on demand, regardless of the snapshot policy"""
+        contract, stream_version, _ = await self._load(contract_id)
+        if contract:
+            self._take_snapshot(contract, stream_version)
+        return contract
+    
+    async def _load(self, contract_id: str) -> Tuple[Optional[Contract], int, int]:
+        """Contract, event stream version it reflects and number of events replayed"""
+        # Start from the latest snapshot and replay only the events after it
+        snapshot = self.event_store.get_snapshot(contract_id)
+        from_version = snapshot["version"] if snapshot else 0
+        events, stream_version = await self.event_store.get_event_stream(contract_id, from_version=from_version)
+        
+        if snapshot:
+            contract = Contract.from_snapshot(snapshot["data"], events)
+        elif events:
+            contract = Contract.from_events(events)
+        else:
+            return None, stream_version, 0
+        return contract, stream_version, len(events)
+    
+    def _take_snapshot(self, contract: Contract, stream_version: int):
+        self.event_store.create_snapshot(
+            aggregate_id=contract.id,
+            version=stream_version,
+            data=contract.to_snapshot()
+        )
+    
     async def get_by_partner_id(self, partner_id: str) -> List[Contract]:
         """Get all contracts for a partner"""
         try:
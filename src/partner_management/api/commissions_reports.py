@@ -0,0 +1,75 @@
+"""
+Commission report endpoints.
+The JSON report carries only the aggregates; NDJSON and CSV reports stream
+their line items as they are read from the repository.
+"""
+
+import logging
+from datetime import datetime
+
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+
+# Same import root as the commission service, so its DomainException is the one caught here
+from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.modulos.commissions.aplicacion.reportes import FORMATOS_REPORTE
+from partner_management.modulos.commissions.aplicacion.servicios_aplicacion import ServicioCommission
+
+logger = logging.getLogger(__name__)
+
+# Create Blueprint
+bp = Blueprint('commissions_reports', __name__, url_prefix='/api/v1')
+
+
+def _parse_date(name: str) -> datetime:
+    value = request.args.get(name)
+    if not value:
+        raise DomainException(f"{name} is required", error_code="MISSING_PARAMETER")
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise DomainException(f"{name} must be an ISO 8601 date", error_code="INVALID_DATE")
+
+
+@bp.route('/commissions-query/report', methods=['GET'])
+def generar_reporte_comisiones_query():
+    """
+    Commission report endpoint.
+
+    `format=json` (default) returns the aggregates; `format=ndjson` and
+    `format=csv` stream every commission in the period.
+    """
+    try:
+        start_date = _parse_date('start_date')
+        end_date = _parse_date('end_date')
+        partner_id = request.args.get('partner_id')
+        status = request.args.get('status')
+        formato = request.args.get('format', 'json').lower()
+
+        servicio = ServicioCommission()
+
+        if formato == 'json':
+            reporte = servicio.generar_reporte_comisiones(start_date, end_date, partner_id=partner_id, status=status)
+            return jsonify(reporte), 200
+
+        if formato not in FORMATOS_REPORTE:
+            return jsonify({'error': f"format must be one of: {['json'] + list(FORMATOS_REPORTE)}"}), 400
+
+        chunks = servicio.transmitir_reporte_comisiones(
+            start_date, end_date, partner_id=partner_id, status=status, formato=formato
+        )
+        filename = f"commissions_{start_date:%Y%m%d}_{end_date:%Y%m%d}.{formato}"
+        logger.info(f"Streaming {formato} commission report {filename}")
+        return Response(
+            stream_with_context(chunks),
+            status=200,
+            mimetype=FORMATOS_REPORTE[formato],
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+        )
+
+    except DomainException as e:
+        logger.warning(f"Commission report validation error: {str(e)}")
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        logger.error(f"Commission report error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
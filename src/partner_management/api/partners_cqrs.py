@@ -2,31 +2,65 @@
 Separates commands (write operations) from queries (read operations).
 """
 
+import json
 import logging
 from flask import Blueprint, request, jsonify, Response
 from datetime import datetime
+from typing import Optional
 
-from src.partner_management.seedwork.aplicacion.comandos import ejecutar_comando
+from src.partner_management.seedwork.aplicacion.command_queue import (
+    CommandQueueFullException,
+    get_command_queue
+)
+from src.partner_management.seedwork.aplicacion.comandos import CommandStatus
 from src.partner_management.seedwork.aplicacion.queries import ejecutar_query
 from src.partner_management.seedwork.dominio.excepciones import DomainException
 from src.partner_management.modulos.partners.aplicacion.comandos.crear_partner import CrearPartner
 from src.partner_management.modulos.partners.aplicacion.comandos.actualizar_partner import ActualizarPartner
 from src.partner_management.modulos.partners.aplicacion.comandos.activar_partner import ActivarPartner
 from src.partner_management.modulos.partners.aplicacion.comandos.desactivar_partner import DesactivarPartner
+from src.partner_management.modulos.partners.aplicacion.comandos.reconstruir_profile_360 import ReconstruirProfile360
 from src.partner_management.modulos.partners.aplicacion.queries.obtener_partner import ObtenerPartner
-from src.partner_management.modulos.partners.aplicacion.queries.obtener_todos_partners import ObtenerTodosPartners
+from src.partner_management.modulos.partners.aplicacion.queries.obtener_todos_partners import (
+    ObtenerTodosPartners, TOTAL_EXACTO, TOTAL_APROXIMADO, SIN_TOTAL
+)
 from src.partner_management.modulos.partners.aplicacion.queries.obtener_profile_360 import ObtenerProfile360
+from src.partner_management.modulos.partners.aplicacion.queries.obtener_profile_360_materializado import ObtenerProfile360Materializado
 
 logger = logging.getLogger(__name__)
 
 # Create Blueprint
 bp = Blueprint('partners_cqrs', __name__, url_prefix='/api/v1')
 
+# Endpoints whose response contract changed from their v1 counterpart
+bp_v2 = Blueprint('partners_cqrs_v2', __name__, url_prefix='/api/v2')
+
 
 # ============================================================================
 # COMMAND ENDPOINTS (WRITE OPERATIONS) - Async, return HTTP 202
 # ============================================================================
 
+def _accept_command(comando, command_name: str, location_template: Optional[str] = '/api/v1/partners-query/{result}') -> Response:
+    """Queue a command and answer 202 with its status URL, or 429 when the queue is full."""
+    try:
+        execution = get_command_queue().submit(comando, location_template=location_template)
+    except CommandQueueFullException as e:
+        logger.warning(f"{command_name} command rejected: {str(e)}")
+        response = jsonify({'error': str(e), 'error_code': e.error_code})
+        response.status_code = 429
+        response.headers['Retry-After'] = '1'
+        return response
+    
+    status_url = f'/api/v1/partners-comando/status/{execution.command_id}'
+    logger.info(f"{command_name} command accepted for processing: {execution.command_id}")
+    return Response(
+        json.dumps({'command_id': execution.command_id, 'status': execution.status.value, 'status_url': status_url}),
+        status=202,
+        mimetype='application/json',
+        headers={'Location': status_url}
+    )
+
+
 @bp.route('/partners-comando', methods=['POST'])
 def crear_partner_comando():
     """
@@ -58,17 +92,8 @@ def crear_partner_comando():
             pais=data.get('pais')
         )
         
-        # Execute command asynchronously
-        partner_id = ejecutar_comando(comando)
-        
-        # Return immediately with 202 (Accepted)
-        logger.info(f"CreatePartner command accepted for processing: {partner_id}")
-        return Response(
-            '{}', 
-            status=202,
-            mimetype='application/json',
-            headers={'Location': f'/api/v1/partners-query/{partner_id}'}
-        )
+        # Queue command and return immediately with 202 (Accepted)
+        return _accept_command(comando, "CreatePartner")
     
     except DomainException as e:
         logger.warning(f"CreatePartner command validation error: {str(e)}")
@@ -104,17 +129,8 @@ def actualizar_partner_comando(partner_id):
             pais=data.get('pais')
         )
         
-        # Execute command asynchronously
-        result_partner_id = ejecutar_comando(comando)
-        
-        # Return immediately with 202 (Accepted)
-        logger.info(f"UpdatePartner command accepted for processing: {result_partner_id}")
-        return Response(
-            '{}',
-            status=202,
-            mimetype='application/json',
-            headers={'Location': f'/api/v1/partners-query/{result_partner_id}'}
-        )
+        # Queue command and return immediately with 202 (Accepted)
+        return _accept_command(comando, "UpdatePartner")
     
     except DomainException as e:
         logger.warning(f"UpdatePartner command validation error: {str(e)}")
@@ -142,17 +158,8 @@ def activar_partner_comando(partner_id):
             razon_activacion=data.get('razon_activacion')
         )
         
-        # Execute command asynchronously
-        result_partner_id = ejecutar_comando(comando)
-        
-        # Return immediately with 202 (Accepted)
-        logger.info(f"ActivatePartner command accepted for processing: {result_partner_id}")
-        return Response(
-            '{}',
-            status=202,
-            mimetype='application/json',
-            headers={'Location': f'/api/v1/partners-query/{result_partner_id}'}
-        )
+        # Queue command and return immediately with 202 (Accepted)
+        return _accept_command(comando, "ActivatePartner")
     
     except DomainException as e:
         logger.warning(f"ActivatePartner command validation error: {str(e)}")
@@ -180,17 +187,8 @@ def desactivar_partner_comando(partner_id):
             razon_desactivacion=data.get('razon_desactivacion')
         )
         
-        # Execute command asynchronously
-        result_partner_id = ejecutar_comando(comando)
-        
-        # Return immediately with 202 (Accepted)
-        logger.info(f"DeactivatePartner command accepted for processing: {result_partner_id}")
-        return Response(
-            '{}',
-            status=202,
-            mimetype='application/json',
-            headers={'Location': f'/api/v1/partners-query/{result_partner_id}'}
-        )
+        # Queue command and return immediately with 202 (Accepted)
+        return _accept_command(comando, "DeactivatePartner")
     
     except DomainException as e:
         logger.warning(f"DeactivatePartner command validation error: {str(e)}")
@@ -201,6 +199,44 @@ def desactivar_partner_comando(partner_id):
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@bp.route('/partners-comando/profile-360/reconstruir', methods=['POST'])
+def reconstruir_profile_360_comando():
+    """
+    Rebuild Profile360 read model command endpoint.
+    """
+    try:
+        logger.info("Processing RebuildProfile360 command")
+        
+        data = request.get_json() if request.is_json else {}
+        comando = ReconstruirProfile360(batch_size=int(data.get('batch_size', 5000)))
+        
+        # The result is an event count, not a resource to redirect to
+        return _accept_command(comando, "RebuildProfile360", location_template=None)
+    
+    except Exception as e:
+        logger.error(f"RebuildProfile360 command error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
+@bp.route('/partners-comando/status/<string:command_id>', methods=['GET'])
+def obtener_estado_comando(command_id):
+    """
+    Command status endpoint polled through the Location header of a 202.
+    """
+    execution = get_command_queue().get_status(command_id)
+    if not execution:
+        return jsonify({'error': 'Command not found'}), 404
+    
+    if execution.status == CommandStatus.COMPLETED and execution.resource_location:
+        # Point the client at the resource the command produced
+        return jsonify(execution.to_dict()), 303, {'Location': execution.resource_location}
+    
+    if not execution.is_finished:
+        return jsonify(execution.to_dict()), 200, {'Retry-After': '1'}
+    
+    return jsonify(execution.to_dict()), 200
+
+
 # ============================================================================
 # QUERY ENDPOINTS (READ OPERATIONS) - Sync, return HTTP 200 with data
 # ============================================================================
@@ -237,6 +273,9 @@ def obtener_partner_query(partner_id):
 def obtener_todos_partners_query():
     """
     Get all partners query endpoint with filtering and pagination.
+    
+    With `limit` and no `offset`, pages are keyset-based: follow `next_cursor`
+    through `?cursor=`. `total` selects an exact, approximate or no total count.
     """
     try:
         logger.info("Processing GetAllPartners query")
@@ -250,11 +289,19 @@ def obtener_todos_partners_query():
         # Pagination parameters
         limit = request.args.get('limit', type=int)
         offset = request.args.get('offset', type=int, default=0)
+        cursor = request.args.get('cursor')
+        total = request.args.get('total', TOTAL_EXACTO)
         
         # Validate limit
         if limit is not None and limit > 100:
             limit = 100  # Max 100 items per page
         
+        if total not in (TOTAL_EXACTO, TOTAL_APROXIMADO, SIN_TOTAL):
+            return jsonify({'error': f"total must be one of: {TOTAL_EXACTO}, {TOTAL_APROXIMADO}, {SIN_TOTAL}"}), 400
+        
+        if cursor and offset:
+            return jsonify({'error': 'cursor and offset cannot be combined'}), 400
+        
         # Create query
         query = ObtenerTodosPartners(
             status=status,
@@ -262,26 +309,42 @@ def obtener_todos_partners_query():
             ciudad=ciudad,
             pais=pais,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor,
+            total=total
         )
         
         # Execute query synchronously
         resultado = ejecutar_query(query)
         
         # Prepare response with pagination info
+        if resultado.limit and not resultado.offset:
+            # Keyset page: the handler already probed for a following row
+            has_next = resultado.next_cursor is not None
+        elif resultado.limit and resultado.total is not None:
+            has_next = resultado.offset + len(resultado.partners) < resultado.total
+        else:
+            has_next = False
+        
         response_data = {
             'partners': [partner.to_dict() for partner in resultado.partners],
             'pagination': {
                 'total': resultado.total,
+                'total_is_approximate': resultado.total_is_approximate,
                 'limit': resultado.limit,
                 'offset': resultado.offset,
-                'has_next': resultado.offset + len(resultado.partners) < resultado.total if resultado.limit else False
+                'next_cursor': resultado.next_cursor,
+                'has_next': has_next
             }
         }
         
         logger.info(f"GetAllPartners query completed: {len(resultado.partners)} partners returned")
         return jsonify(response_data), 200
     
+    except DomainException as e:
+        logger.warning(f"GetAllPartners query validation error: {str(e)}")
+        return jsonify({'error': str(e)}), 400
+    
     except Exception as e:
         logger.error(f"GetAllPartners query error: {str(e)}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -315,6 +378,33 @@ def obtener_profile_360_query(partner_id):
         return jsonify({'error': 'Internal server error'}), 500
 
 
+@bp_v2.route('/partners-query/<string:partner_id>/profile-360', methods=['GET'])
+def obtener_profile_360_materializado_query(partner_id):
+    """
+    Get materialized partner 360 profile query endpoint.
+    
+    The document shape (campaigns, commissions, trends, risk_inputs, freshness)
+    differs from the v1 profile, hence the new API version.
+    """
+    try:
+        logger.info(f"Processing GetMaterializedProfile360 query for: {partner_id}")
+        
+        # Precomputed document, or projected from the repositories if not materialized yet
+        materializado = ejecutar_query(ObtenerProfile360Materializado(partner_id=partner_id))
+        if materializado.documento:
+            freshness = materializado.documento['freshness']
+            headers = {'X-Profile-Last-Event-At': freshness['last_event_at'] or freshness['projected_at']}
+            logger.info(f"GetMaterializedProfile360 query completed successfully: {partner_id}")
+            return jsonify(materializado.documento), 200, headers
+        else:
+            logger.warning(f"Partner profile not found: {partner_id}")
+            return jsonify({'error': 'Partner profile not found'}), 404
+    
+    except Exception as e:
+        logger.error(f"GetMaterializedProfile360 query error: {str(e)}")
+        return jsonify({'error': 'Internal server error'}), 500
+
+
 # ============================================================================
 # HEALTH CHECK ENDPOINTS
 # ============================================================================
@@ -334,12 +424,15 @@ def health_check():
                     'create_partner': '/api/v1/partners-comando [POST]',
                     'update_partner': '/api/v1/partners-comando/{id} [PUT]',
                     'activate_partner': '/api/v1/partners-comando/{id}/activar [PUT]',
-                    'deactivate_partner': '/api/v1/partners-comando/{id}/desactivar [PUT]'
+                    'deactivate_partner': '/api/v1/partners-comando/{id}/desactivar [PUT]',
+                    'rebuild_profile_360': '/api/v1/partners-comando/profile-360/reconstruir [POST]',
+                    'command_status': '/api/v1/partners-comando/status/{command_id} [GET]'
                 },
                 'queries': {
                     'get_partner': '/api/v1/partners-query/{id} [GET]',
                     'get_all_partners': '/api/v1/partners-query [GET]',
-                    'get_profile_360': '/api/v1/partners-query/{id}/profile-360 [GET]'
+                    'get_profile_360': '/api/v1/partners-query/{id}/profile-360 [GET]',
+                    'get_materialized_profile_360': '/api/v2/partners-query/{id}/profile-360 [GET]'
                 }
             }
         }
@@ -371,7 +464,7 @@ def api_info():
         ],
         'endpoints_summary': {
             'commands': 4,
-            'queries': 3,
+            'queries': 4,
             'utility': 2
         },
         'documentation': '/api/v1/partners-health'
@@ -3,7 +3,7 @@ Endpoints para el Dashboard de Sagas
 Proporciona APIs REST para acceder a logs, métricas y estado de las Sagas.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify
 import logging
 from datetime import datetime, timezone, timedelta
 
@@ -63,12 +63,22 @@ def performance():
             "memory_usage_mb": system_metrics.memory_usage_mb,
             "cpu_usage_percent": system_metrics.cpu_usage_percent,
             "total_events_processed": system_metrics.total_events_processed,
-            "system_uptime_hours": system_metrics.system_uptime_hours
+            "system_uptime_hours": system_metrics.system_uptime_hours,
+            "latency_percentiles": saga_metrics.get_latency_percentiles()
         })
     except Exception as e:
         logger.error(f"Error getting performance metrics: {e}")
         return jsonify({"error": str(e)}), 500
 
+@dashboard_bp.route('/metrics')
+def prometheus_metrics():
+    """Métricas de Sagas y latencias en formato de exposición Prometheus"""
+    try:
+        return Response(saga_metrics.render_prometheus(), mimetype='text/plain; version=0.0.4')
+    except Exception as e:
+        logger.error(f"Error rendering Prometheus metrics: {e}")
+        return jsonify({"error": str(e)}), 500
+
 @dashboard_bp.route('/alerts')
 def alerts():
     """Alertas activas del sistema"""
@@ -131,9 +141,8 @@ def logs():
             start_time = datetime.now(timezone.utc) - timedelta(hours=hours)
             filters['start_time'] = start_time
         
-        # Get logs
-        logs = saga_log.search_logs(**filters)
-        recent_logs = logs[-limit:] if logs else []
+        # Get logs (only the most recent `limit` matches are materialized)
+        recent_logs = saga_log.search_logs(**filters, limit=limit) if limit > 0 else []
         
         return jsonify([{
             "id": log.id,
@@ -16,6 +16,7 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../../..'))
 from src.pulsar_event_dispatcher import PulsarEventDispatcher
+from src.partner_management.seedwork.infraestructura.utils import performance_monitor
 
 saga_bp = Blueprint('sagas', __name__)
 logger = logging.getLogger(__name__)
@@ -32,7 +33,7 @@ def _get_event_dispatcher():
     global event_dispatcher
     if event_dispatcher is None:
         try:
-            event_dispatcher = PulsarEventDispatcher("partner-management")
+            event_dispatcher = PulsarEventDispatcher("partner-management", latency_recorder=performance_monitor.record_metric)
         except Exception as e:
             logger.warning(f"Failed to initialize Pulsar dispatcher: {e}")
             # Create a mock dispatcher for testing
@@ -3,7 +3,7 @@ Base command classes for Analytics module.
 """
 
 from partner_management.seedwork.aplicacion.comandos import Command, ComandoHandler
-from partner_management.seedwork.dominio.repositorio import Repositorio
+from partner_management.seedwork.dominio.repositorios import Repositorio
 from ...dominio.entidades import AnalyticsReport
 
 
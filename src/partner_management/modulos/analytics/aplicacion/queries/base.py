@@ -3,7 +3,7 @@ Base query classes for Analytics module.
 """
 
 from partner_management.seedwork.aplicacion.queries import Query, QueryHandler, QueryResult
-from partner_management.seedwork.dominio.repositorio import Repositorio
+from partner_management.seedwork.dominio.repositorios import Repositorio
 from ...dominio.entidades import AnalyticsReport
 
 
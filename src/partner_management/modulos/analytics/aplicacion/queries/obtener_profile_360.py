@@ -3,8 +3,11 @@ Get 360-degree Profile Analytics query implementation for HexaBuilders.
 """
 
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from datetime import datetime, timedelta
 
 from partner_management.seedwork.aplicacion.queries import ejecutar_query
@@ -37,6 +40,69 @@ class Profile360Result(AnalyticsQueryResult):
         return self.profile_data
 
 
+class Profile360Loader:
+    """
+    Request-scoped loader for the data behind a 360-degree profile.
+    
+    Each entity type is fetched from its repository once per partner and memoized,
+    so every profile section reads the same lists instead of querying again. Loads
+    are serialized by a lock, which keeps the unit of work's session single-threaded
+    while the sections themselves run on the profile thread pool.
+    """
+    
+    def __init__(self, uow):
+        self._uow = uow
+        self._cache: Dict[Tuple[str, str], List[Any]] = {}
+        self._lock = threading.Lock()
+        self.round_trips = 0
+    
+    def campaigns(self, partner_id: str) -> List[Any]:
+        return self._load('campaigns', 'obtener_por_partner', partner_id)
+    
+    def commissions(self, partner_id: str) -> List[Any]:
+        return self._load('commissions', 'obtener_por_partner_id', partner_id)
+    
+    def reports(self, partner_id: str) -> List[Any]:
+        return self._load('analytics', 'obtener_por_partner_id', partner_id)
+    
+    def prime(self, partner_id: str) -> None:
+        """Fetch the entity types the sections read up front, before they fan out."""
+        self.campaigns(partner_id)
+        self.commissions(partner_id)
+    
+    def _load(self, repository_name: str, method_name: str, partner_id: str) -> List[Any]:
+        key = (repository_name, partner_id)
+        with self._lock:
+            if key not in self._cache:
+                repository = getattr(self._uow, repository_name)
+                self._cache[key] = list(getattr(repository, method_name)(partner_id))
+                self.round_trips += 1
+            return self._cache[key]
+
+
+_profile_executor: Optional[ThreadPoolExecutor] = None
+_profile_executor_lock = threading.Lock()
+
+
+def _get_profile_executor() -> ThreadPoolExecutor:
+    global _profile_executor
+    if _profile_executor is None:
+        with _profile_executor_lock:
+            if _profile_executor is None:
+                _profile_executor = ThreadPoolExecutor(
+                    max_workers=int(os.getenv('PROFILE_360_WORKERS', '4')),
+                    thread_name_prefix="profile-360"
+                )
+    return _profile_executor
+
+
+def _compute_sections(sections: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run independent profile sections on the thread pool, keeping their order."""
+    executor = _get_profile_executor()
+    futures = {name: executor.submit(section) for name, section in sections.items()}
+    return {name: future.result() for name, future in futures.items()}
+
+
 @ejecutar_query.register
 def handle_obtener_profile_360(query: ObtenerProfile360) -> Profile360Result:
     """
@@ -60,6 +126,11 @@ def handle_obtener_profile_360(query: ObtenerProfile360) -> Profile360Result:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=query.period_months * 30)
             
+            # One repository round trip per entity type, shared by every section
+            loader = Profile360Loader(uow)
+            loader.prime(query.partner_id)
+            partner_id = query.partner_id
+            
             # Collect comprehensive data
             profile_data = {
                 'partner_id': query.partner_id,
@@ -69,23 +140,25 @@ def handle_obtener_profile_360(query: ObtenerProfile360) -> Profile360Result:
                     'end_date': end_date.isoformat(),
                     'period_months': query.period_months
                 },
-                'partner_overview': _get_partner_overview(partner),
-                'performance_metrics': _get_performance_metrics(query.partner_id, start_date, end_date, uow),
-                'campaign_analytics': _get_campaign_analytics(query.partner_id, start_date, end_date, uow),
-                'commission_analytics': _get_commission_analytics(query.partner_id, start_date, end_date, uow),
-                'trend_analysis': _get_trend_analysis(query.partner_id, start_date, end_date, uow),
-                'benchmarking': _get_benchmarking_data(query.partner_id, uow),
-                'risk_assessment': _get_risk_assessment(query.partner_id, uow),
-                'opportunity_analysis': _get_opportunity_analysis(query.partner_id, uow)
+                'partner_overview': _get_partner_overview(partner)
             }
+            profile_data.update(_compute_sections({
+                'performance_metrics': lambda: _get_performance_metrics(partner_id, start_date, end_date, loader),
+                'campaign_analytics': lambda: _get_campaign_analytics(partner_id, start_date, end_date, loader),
+                'commission_analytics': lambda: _get_commission_analytics(partner_id, start_date, end_date, loader),
+                'trend_analysis': lambda: _get_trend_analysis(partner_id, start_date, end_date, loader),
+                'benchmarking': lambda: _get_benchmarking_data(partner_id, loader),
+                'risk_assessment': lambda: _get_risk_assessment(partner_id, loader),
+                'opportunity_analysis': lambda: _get_opportunity_analysis(partner_id, loader)
+            }))
             
-            # Add predictions if requested
+            # Predictions and recommendations read the sections above
+            derived_sections = {}
             if query.include_predictions:
-                profile_data['predictions'] = _generate_predictions(query.partner_id, profile_data, uow)
-            
-            # Add recommendations if requested
+                derived_sections['predictions'] = lambda: _generate_predictions(partner_id, profile_data, loader)
             if query.include_recommendations:
-                profile_data['recommendations'] = _generate_recommendations(query.partner_id, profile_data, uow)
+                derived_sections['recommendations'] = lambda: _generate_recommendations(partner_id, profile_data, loader)
+            profile_data.update(_compute_sections(derived_sections))
             
             logger.info(f"360-degree profile generated successfully for partner: {query.partner_id}")
             return Profile360Result(profile_data)
@@ -121,18 +194,13 @@ def _get_partner_overview(partner) -> Dict[str, Any]:
     }
 
 
-def _get_performance_metrics(partner_id: str, start_date: datetime, end_date: datetime, uow) -> Dict[str, Any]:
+def _get_performance_metrics(partner_id: str, start_date: datetime, end_date: datetime, loader) -> Dict[str, Any]:
     """Get comprehensive performance metrics."""
     
     from decimal import Decimal
     
-    # Get campaigns
-    campaigns_repo = uow.campaigns
-    partner_campaigns = campaigns_repo.obtener_por_partner_id(partner_id)
-    
-    # Get commissions
-    commissions_repo = uow.commissions
-    partner_commissions = commissions_repo.obtener_por_partner_id(partner_id)
+    partner_campaigns = loader.campaigns(partner_id)
+    partner_commissions = loader.commissions(partner_id)
     
     # Calculate performance metrics
     total_campaigns = len(partner_campaigns)
@@ -170,11 +238,10 @@ def _get_performance_metrics(partner_id: str, start_date: datetime, end_date: da
     }
 
 
-def _get_campaign_analytics(partner_id: str, start_date: datetime, end_date: datetime, uow) -> Dict[str, Any]:
+def _get_campaign_analytics(partner_id: str, start_date: datetime, end_date: datetime, loader) -> Dict[str, Any]:
     """Get detailed campaign analytics."""
     
-    campaigns_repo = uow.campaigns
-    partner_campaigns = campaigns_repo.obtener_por_partner_id(partner_id)
+    partner_campaigns = loader.campaigns(partner_id)
     
     # Campaign status breakdown
     status_breakdown = {}
@@ -207,11 +274,10 @@ def _get_campaign_analytics(partner_id: str, start_date: datetime, end_date: dat
     }
 
 
-def _get_commission_analytics(partner_id: str, start_date: datetime, end_date: datetime, uow) -> Dict[str, Any]:
+def _get_commission_analytics(partner_id: str, start_date: datetime, end_date: datetime, loader) -> Dict[str, Any]:
     """Get detailed commission analytics."""
     
-    commissions_repo = uow.commissions
-    partner_commissions = commissions_repo.obtener_por_partner_id(partner_id)
+    partner_commissions = loader.commissions(partner_id)
     
     from decimal import Decimal
     
@@ -259,7 +325,7 @@ def _get_commission_analytics(partner_id: str, start_date: datetime, end_date: d
     }
 
 
-def _get_trend_analysis(partner_id: str, start_date: datetime, end_date: datetime, uow) -> Dict[str, Any]:
+def _get_trend_analysis(partner_id: str, start_date: datetime, end_date: datetime, loader) -> Dict[str, Any]:
     """Get trend analysis across all metrics."""
     
     return {
@@ -288,7 +354,7 @@ def _get_trend_analysis(partner_id: str, start_date: datetime, end_date: datetim
     }
 
 
-def _get_benchmarking_data(partner_id: str, uow) -> Dict[str, Any]:
+def _get_benchmarking_data(partner_id: str, loader) -> Dict[str, Any]:
     """Get benchmarking against platform averages."""
     
     return {
@@ -312,7 +378,7 @@ def _get_benchmarking_data(partner_id: str, uow) -> Dict[str, Any]:
     }
 
 
-def _get_risk_assessment(partner_id: str, uow) -> Dict[str, Any]:
+def _get_risk_assessment(partner_id: str, loader) -> Dict[str, Any]:
     """Assess partner risks and stability."""
     
     return {
@@ -344,7 +410,7 @@ def _get_risk_assessment(partner_id: str, uow) -> Dict[str, Any]:
     }
 
 
-def _get_opportunity_analysis(partner_id: str, uow) -> Dict[str, Any]:
+def _get_opportunity_analysis(partner_id: str, loader) -> Dict[str, Any]:
     """Analyze growth opportunities."""
     
     return {
@@ -382,7 +448,7 @@ def _get_opportunity_analysis(partner_id: str, uow) -> Dict[str, Any]:
     }
 
 
-def _generate_predictions(partner_id: str, profile_data: Dict[str, Any], uow) -> Dict[str, Any]:
+def _generate_predictions(partner_id: str, profile_data: Dict[str, Any], loader) -> Dict[str, Any]:
     """Generate predictive analytics."""
     
     return {
@@ -413,7 +479,7 @@ def _generate_predictions(partner_id: str, profile_data: Dict[str, Any], uow) ->
     }
 
 
-def _generate_recommendations(partner_id: str, profile_data: Dict[str, Any], uow) -> Dict[str, Any]:
+def _generate_recommendations(partner_id: str, profile_data: Dict[str, Any], loader) -> Dict[str, Any]:
     """Generate actionable recommendations."""
     
     return {
@@ -28,6 +28,11 @@ class AnalyticsReportDTO:
     chart_types: List[str]
     export_formats: List[str]
     
+    # Metadata
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    
     # Generation info
     generated_date: Optional[datetime] = None
     generated_by: Optional[str] = None
@@ -53,10 +58,6 @@ class AnalyticsReportDTO:
     trends_json: Optional[str] = None
     benchmarks_json: Optional[str] = None
     
-    # Metadata
-    created_at: datetime
-    updated_at: datetime
-    version: int
     is_deleted: bool = False
     
     @classmethod
@@ -231,9 +232,9 @@ class AnalyticsReportSummaryDTO:
     report_type: str
     status: str
     period_name: str
+    created_at: datetime
     generated_date: Optional[datetime] = None
     generated_by: Optional[str] = None
-    created_at: datetime
     is_up_to_date: bool = False
     has_critical_insights: bool = False
     
@@ -13,7 +13,7 @@ from partner_management.seedwork.dominio.excepciones import DomainException
 from ..dominio.entidades import AnalyticsReport
 from ..dominio.objetos_valor import (
     ReportType, ReportPeriod, ReportConfiguration, DataFilter, ReportStatus,
-    AnalyticsMetrics, Insight, TrendAnalysis, BenchmarkComparison
+    AnalyticsMetrics, MetricValue, Insight, TrendAnalysis, BenchmarkComparison
 )
 from .dto import AnalyticsReportDTO
 
@@ -333,8 +333,7 @@ class FabricaAnalytics(Fabrica):
         description: str,
         severity: str = "info",
         confidence: float = 0.8,
-        actionable: bool = True,
-        recommendations: Optional[List[str]] = None
+        recommendation: Optional[str] = None
     ) -> Insight:
         """Create an Insight value object."""
         
@@ -344,8 +343,7 @@ class FabricaAnalytics(Fabrica):
             description=description,
             severity=severity,
             confidence=confidence,
-            actionable=actionable,
-            recommendations=recommendations or []
+            recommendation=recommendation
         )
     
     def crear_trend_analysis(
@@ -353,10 +351,8 @@ class FabricaAnalytics(Fabrica):
         metric_name: str,
         trend_direction: str,
         trend_strength: float,
-        period_comparison: str,
-        data_points: List[float],
-        analysis: str,
-        confidence: float = 0.75
+        period_over_period_change: float,
+        historical_data: Optional[List[Dict[str, Any]]] = None
     ) -> TrendAnalysis:
         """Create a TrendAnalysis value object."""
         
@@ -364,39 +360,34 @@ class FabricaAnalytics(Fabrica):
             metric_name=metric_name,
             trend_direction=trend_direction,
             trend_strength=trend_strength,
-            period_comparison=period_comparison,
-            data_points=data_points,
-            analysis=analysis,
-            confidence=confidence
+            period_over_period_change=period_over_period_change,
+            historical_data=historical_data or []
         )
     
     def crear_benchmark_comparison(
         self,
         metric_name: str,
-        partner_value: float,
-        benchmark_value: float,
-        benchmark_type: str,
-        percentile_rank: Optional[float] = None
+        actual_value: MetricValue,
+        benchmark_value: MetricValue
     ) -> BenchmarkComparison:
         """Create a BenchmarkComparison value object."""
         
         # Determine comparison result
-        if partner_value > benchmark_value:
+        if actual_value.value > benchmark_value.value:
             comparison_result = "above"
-            peer_comparison = "above_average"
-        elif partner_value < benchmark_value:
+        elif actual_value.value < benchmark_value.value:
             comparison_result = "below"
-            peer_comparison = "below_average"
         else:
-            comparison_result = "equal"
-            peer_comparison = "average"
+            comparison_result = "at"
+        
+        percentage_difference = 0.0
+        if benchmark_value.value:
+            percentage_difference = float((actual_value.value - benchmark_value.value) / benchmark_value.value * 100)
         
         return BenchmarkComparison(
             metric_name=metric_name,
-            partner_value=partner_value,
+            actual_value=actual_value,
             benchmark_value=benchmark_value,
-            benchmark_type=benchmark_type,
             comparison_result=comparison_result,
-            percentile_rank=percentile_rank or 50.0,
-            peer_comparison=peer_comparison
+            percentage_difference=percentage_difference
         )
\ No newline at end of file
@@ -8,13 +8,14 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Any
 from decimal import Decimal
 
-from partner_management.seedwork.dominio.repositorio import Repositorio
+from partner_management.seedwork.dominio.repositorios import Repositorio
 from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.indexed_collection import IndexedCollection
 
 from ..dominio.entidades import AnalyticsReport
 from ..dominio.objetos_valor import (
     ReportType, ReportPeriod, ReportConfiguration, ReportStatus,
-    AnalyticsMetrics, Insight, TrendAnalysis, BenchmarkComparison
+    AnalyticsMetrics, MetricValue, MetricType, Insight, TrendAnalysis, BenchmarkComparison
 )
 from .dto import AnalyticsReportDTO
 from .fabricas import FabricaAnalytics
@@ -25,7 +26,15 @@ class RepositorioAnalyticsMock(Repositorio):
     
     def __init__(self):
         super().__init__()
-        self._reports: Dict[str, AnalyticsReport] = {}
+        self._reports: IndexedCollection[AnalyticsReport] = IndexedCollection(
+            hash_indexes={
+                'partner_id': lambda r: r.partner_id,
+                'status': lambda r: r.status,
+                'report_type': lambda r: r.report_type,
+                'is_deleted': lambda r: getattr(r, 'is_deleted', False)
+            },
+            sorted_indexes={'created_at': lambda r: r.created_at}
+        )
         self._fabrica = FabricaAnalytics()
         self._initialize_sample_data()
     
@@ -35,28 +44,19 @@ class RepositorioAnalyticsMock(Repositorio):
     
     def obtener_todos(self) -> List[AnalyticsReport]:
         """Get all analytics reports."""
-        return [r for r in self._reports.values() if not r.is_deleted]
+        return self._reports.query(where={'is_deleted': False})
     
     def obtener_por_partner_id(self, partner_id: str) -> List[AnalyticsReport]:
         """Get analytics reports by partner ID."""
-        return [
-            r for r in self._reports.values() 
-            if r.partner_id == partner_id and not r.is_deleted
-        ]
+        return self._reports.query(where={'partner_id': partner_id, 'is_deleted': False})
     
     def obtener_por_status(self, status: ReportStatus) -> List[AnalyticsReport]:
         """Get analytics reports by status."""
-        return [
-            r for r in self._reports.values() 
-            if r.status == status and not r.is_deleted
-        ]
+        return self._reports.query(where={'status': status, 'is_deleted': False})
     
     def obtener_por_tipo(self, report_type: ReportType) -> List[AnalyticsReport]:
         """Get analytics reports by type."""
-        return [
-            r for r in self._reports.values() 
-            if r.report_type == report_type and not r.is_deleted
-        ]
+        return self._reports.query(where={'report_type': report_type, 'is_deleted': False})
     
     def obtener_todos_con_filtros(
         self,
@@ -66,41 +66,37 @@ class RepositorioAnalyticsMock(Repositorio):
     ) -> List[AnalyticsReport]:
         """Get analytics reports with filters and pagination."""
         
-        reports = [r for r in self._reports.values() if not r.is_deleted]
-        
+        # Newest first, paged straight off the created_at index
+        return self._reports.query(
+            where=self._where(filters),
+            order_by='created_at',
+            descending=True,
+            lower=filters.get('start_date') if filters else None,
+            upper=filters.get('end_date') if filters else None,
+            offset=offset,
+            limit=limit
+        )
+    
+    def contar_con_filtros(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count analytics reports with filters."""
+        return self._reports.count(
+            where=self._where(filters),
+            order_by='created_at',
+            lower=filters.get('start_date') if filters else None,
+            upper=filters.get('end_date') if filters else None
+        )
+    
+    def _where(self, filters: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Translate request filters into index lookups."""
+        where: Dict[str, Any] = {'is_deleted': False}
         if filters:
-            # Apply partner_id filter
             if 'partner_id' in filters:
-                reports = [r for r in reports if r.partner_id == filters['partner_id']]
-            
-            # Apply status filter
+                where['partner_id'] = filters['partner_id']
             if 'status' in filters:
-                status_filter = ReportStatus(filters['status'])
-                reports = [r for r in reports if r.status == status_filter]
-            
-            # Apply report_type filter
+                where['status'] = ReportStatus(filters['status'])
             if 'report_type' in filters:
-                type_filter = ReportType(filters['report_type'])
-                reports = [r for r in reports if r.report_type == type_filter]
-            
-            # Apply date range filters
-            if 'start_date' in filters:
-                start_date = filters['start_date']
-                reports = [r for r in reports if r.created_at >= start_date]
-            
-            if 'end_date' in filters:
-                end_date = filters['end_date']
-                reports = [r for r in reports if r.created_at <= end_date]
-        
-        # Sort by creation date (newest first)
-        reports.sort(key=lambda r: r.created_at, reverse=True)
-        
-        # Apply pagination
-        return reports[offset:offset + limit]
-    
-    def contar_con_filtros(self, filters: Optional[Dict[str, Any]] = None) -> int:
-        """Count analytics reports with filters."""
-        return len(self.obtener_todos_con_filtros(filters, limit=10000, offset=0))
+                where['report_type'] = ReportType(filters['report_type'])
+        return where
     
     def obtener_reportes_recientes(
         self,
@@ -111,18 +107,18 @@ class RepositorioAnalyticsMock(Repositorio):
         """Get recent analytics reports."""
         
         cutoff_date = datetime.now() - timedelta(days=days)
-        reports = [
-            r for r in self._reports.values()
-            if r.created_at >= cutoff_date and not r.is_deleted
-        ]
-        
+        where: Dict[str, Any] = {'is_deleted': False}
         if partner_id:
-            reports = [r for r in reports if r.partner_id == partner_id]
+            where['partner_id'] = partner_id
         
-        # Sort by creation date (newest first)
-        reports.sort(key=lambda r: r.created_at, reverse=True)
-        
-        return reports[:limit]
+        # Newest first
+        return self._reports.query(
+            where=where,
+            order_by='created_at',
+            descending=True,
+            lower=cutoff_date,
+            limit=limit
+        )
     
     def obtener_reportes_completados(
         self,
@@ -131,13 +127,10 @@ class RepositorioAnalyticsMock(Repositorio):
     ) -> List[AnalyticsReport]:
         """Get completed analytics reports."""
         
-        reports = [
-            r for r in self._reports.values()
-            if r.status == ReportStatus.COMPLETED and not r.is_deleted
-        ]
-        
+        where: Dict[str, Any] = {'status': ReportStatus.COMPLETED, 'is_deleted': False}
         if partner_id:
-            reports = [r for r in reports if r.partner_id == partner_id]
+            where['partner_id'] = partner_id
+        reports = self._reports.query(where=where)
         
         # Sort by generation date (newest first)
         reports.sort(key=lambda r: r.generated_date or r.created_at, reverse=True)
@@ -170,49 +163,51 @@ class RepositorioAnalyticsMock(Repositorio):
         """Add new analytics report."""
         if report.id in self._reports:
             raise DomainException(f"Analytics report with ID {report.id} already exists")
-        self._reports[report.id] = report
+        self._reports.add(report)
     
     def actualizar(self, report: AnalyticsReport) -> None:
         """Update existing analytics report."""
         if report.id not in self._reports:
             raise DomainException(f"Analytics report with ID {report.id} not found")
-        self._reports[report.id] = report
+        self._reports.add(report)
     
     def eliminar(self, report: AnalyticsReport) -> None:
-        """Soft delete analytics report."""
-        if report.id in self._reports:
-            report.soft_delete()
-            self._reports[report.id] = report
+        """Delete analytics report; AnalyticsReport has no soft-delete state, so it is removed."""
+        self._reports.remove(report.id)
     
     def obtener_estadisticas_plataforma(self) -> Dict[str, Any]:
         """Get platform-wide analytics statistics."""
         
-        all_reports = [r for r in self._reports.values() if not r.is_deleted]
-        completed_reports = [r for r in all_reports if r.status == ReportStatus.COMPLETED]
+        total_reports = self._reports.count(where={'is_deleted': False})
+        completed_reports = self._reports.query(where={'status': ReportStatus.COMPLETED, 'is_deleted': False})
         
-        # Count by status
+        # Count by status and type from the index postings
         status_counts = {}
-        for report in all_reports:
-            status = report.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
+        for status in self._reports.distinct('status'):
+            count = self._reports.count(where={'status': status, 'is_deleted': False})
+            if count:
+                status_counts[status.value] = count
         
-        # Count by type
         type_counts = {}
-        for report in all_reports:
-            report_type = report.report_type.value
-            type_counts[report_type] = type_counts.get(report_type, 0) + 1
+        for report_type in self._reports.distinct('report_type'):
+            count = self._reports.count(where={'report_type': report_type, 'is_deleted': False})
+            if count:
+                type_counts[report_type.value] = count
         
         # Partner coverage
-        unique_partners = len(set(r.partner_id for r in all_reports))
+        unique_partners = sum(
+            1 for partner_id in self._reports.distinct('partner_id')
+            if self._reports.count(where={'partner_id': partner_id, 'is_deleted': False})
+        )
         
         return {
-            'total_reports': len(all_reports),
+            'total_reports': total_reports,
             'completed_reports': len(completed_reports),
             'status_breakdown': status_counts,
             'type_breakdown': type_counts,
             'unique_partners_analyzed': unique_partners,
             'average_generation_time': self._calculate_average_generation_time(completed_reports),
-            'success_rate': len(completed_reports) / len(all_reports) if all_reports else 0
+            'success_rate': len(completed_reports) / total_reports if total_reports else 0
         }
     
     def _calculate_average_generation_time(self, completed_reports: List[AnalyticsReport]) -> float:
@@ -241,7 +236,7 @@ class RepositorioAnalyticsMock(Repositorio):
             partner_id = sample_partner_ids[i % len(sample_partner_ids)]
             
             # Vary report types
-            report_types = ['PARTNER_PERFORMANCE', 'COMMISSION_SUMMARY', 'CAMPAIGN_ANALYSIS', 'COMPREHENSIVE']
+            report_types = ['PARTNER_PERFORMANCE', 'COMMISSION_SUMMARY', 'CAMPAIGN_ANALYTICS', 'PROFILE_360']
             report_type = report_types[i % len(report_types)]
             
             # Create report period
@@ -259,6 +254,7 @@ class RepositorioAnalyticsMock(Repositorio):
             )
             
             configuration = ReportConfiguration(
+                report_type=report_type_obj,
                 include_charts=True,
                 include_comparisons=i % 2 == 0,  # Alternate
                 include_trends=i % 3 == 0,       # Every third
@@ -280,16 +276,25 @@ class RepositorioAnalyticsMock(Repositorio):
             benchmarks = []
             
             if status == ReportStatus.COMPLETED:
+                performance_score = 0.6 + (i % 25) * 0.015
                 metrics = AnalyticsMetrics(
-                    total_campaigns=10 + (i * 2),
-                    active_campaigns=3 + (i % 5),
-                    completed_campaigns=7 + i,
-                    total_commissions=25 + (i * 3),
-                    total_commission_amount=Decimal(str(1000 + (i * 200))),
-                    average_commission=Decimal(str(40 + (i * 8))),
-                    partner_rating=4.0 + (i % 10) * 0.05,
-                    conversion_rate=0.7 + (i % 20) * 0.01,
-                    performance_score=0.6 + (i % 25) * 0.015
+                    partner_metrics={
+                        'partner_rating': MetricValue(4.0 + (i % 10) * 0.05, MetricType.GAUGE)
+                    },
+                    campaign_metrics={
+                        'total_campaigns': MetricValue(10 + (i * 2), MetricType.COUNTER),
+                        'active_campaigns': MetricValue(3 + (i % 5), MetricType.COUNTER),
+                        'completed_campaigns': MetricValue(7 + i, MetricType.COUNTER)
+                    },
+                    commission_metrics={
+                        'total_commissions': MetricValue(25 + (i * 3), MetricType.COUNTER),
+                        'total_commission_amount': MetricValue(Decimal(str(1000 + (i * 200))), MetricType.CURRENCY, 'USD'),
+                        'average_commission': MetricValue(Decimal(str(40 + (i * 8))), MetricType.CURRENCY, 'USD')
+                    },
+                    performance_metrics={
+                        'conversion_rate': MetricValue(70 + (i % 20), MetricType.PERCENTAGE),
+                        'performance_score': MetricValue(performance_score, MetricType.GAUGE)
+                    }
                 )
                 
                 # Add sample insights
@@ -301,7 +306,7 @@ class RepositorioAnalyticsMock(Repositorio):
                             description=f"Sample performance insight for report #{i+1}",
                             severity="info" if i % 2 == 0 else "warning",
                             confidence=0.8 + (i % 20) * 0.01,
-                            recommendations=[f"Recommendation A for report #{i+1}", f"Recommendation B for report #{i+1}"]
+                            recommendation=f"Recommendation for report #{i+1}"
                         )
                     ]
                 
@@ -310,12 +315,13 @@ class RepositorioAnalyticsMock(Repositorio):
                     trends = [
                         self._fabrica.crear_trend_analysis(
                             metric_name="commission_amount",
-                            trend_direction="increasing" if i % 2 == 0 else "decreasing",
+                            trend_direction="up" if i % 2 == 0 else "down",
                             trend_strength=0.5 + (i % 30) * 0.015,
-                            period_comparison="month_over_month",
-                            data_points=[100 + j*10 + (i*5) for j in range(6)],  # Mock data points
-                            analysis=f"Sample trend analysis for report #{i+1}",
-                            confidence=0.7 + (i % 25) * 0.01
+                            period_over_period_change=0.1 + (i % 5) * 0.05,
+                            historical_data=[
+                                {'date': (period_end - timedelta(days=30 * j)).isoformat(), 'value': 100 + j*10 + (i*5)}
+                                for j in range(6)
+                            ]
                         )
                     ]
                 
@@ -324,10 +330,8 @@ class RepositorioAnalyticsMock(Repositorio):
                     benchmarks = [
                         self._fabrica.crear_benchmark_comparison(
                             metric_name="performance_score",
-                            partner_value=metrics.performance_score,
-                            benchmark_value=0.75,
-                            benchmark_type="platform_average",
-                            percentile_rank=50.0 + (i % 40)
+                            actual_value=MetricValue(performance_score, MetricType.GAUGE),
+                            benchmark_value=MetricValue(0.75, MetricType.GAUGE)
                         )
                     ]
             
@@ -336,8 +340,7 @@ class RepositorioAnalyticsMock(Repositorio):
                 partner_id=partner_id,
                 report_type=report_type_obj,
                 report_period=report_period,
-                configuration=configuration,
-                status=status
+                configuration=configuration
             )
             
             # Set creation date
@@ -360,4 +363,4 @@ class RepositorioAnalyticsMock(Repositorio):
                 report.fallar_generacion(f"Sample error message for report #{i+1}")
             
             # Store report
-            self._reports[report.id] = report
\ No newline at end of file
+            self._reports.add(report)
\ No newline at end of file
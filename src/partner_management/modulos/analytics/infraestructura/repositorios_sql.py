@@ -0,0 +1,285 @@
+"""
+SQLAlchemy repositories for Analytics module in HexaBuilders.
+Persists analytics reports in the `analytics_reports` table with filtering,
+counting and platform statistics pushed down to the database.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Index, String, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
+
+from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.repositorios_sql import (
+    Base, Keyset, SqlAlchemyRepositorio, valor_a_json, valor_desde_json
+)
+
+from ..dominio.entidades import AnalyticsReport
+from ..dominio.objetos_valor import (
+    ReportType, ReportPeriod, ReportConfiguration, ReportStatus, DataFilter,
+    AnalyticsMetrics, Insight, TrendAnalysis, BenchmarkComparison
+)
+
+JsonDocument = JSON().with_variant(JSONB(), 'postgresql')
+
+
+class AnalyticsReportModel(Base):
+    __tablename__ = 'analytics_reports'
+
+    id = Column(String(36), primary_key=True)
+    titulo = Column(String(255), nullable=False)
+    tipo = Column(String(50), nullable=False, index=True)
+    status = Column(String(50), nullable=False, index=True)
+    fecha_inicio = Column(DateTime, nullable=False)
+    fecha_fin = Column(DateTime, nullable=False)
+    datos_json = Column(JsonDocument, nullable=True)
+    metricas_json = Column(JsonDocument, nullable=True)
+    configuracion_json = Column(JsonDocument, nullable=True)
+    archivo_path = Column(String(500), nullable=True)
+    partner_id = Column(String(36), nullable=True, index=True)
+    campaign_id = Column(String(36), nullable=True, index=True)
+    generated_at = Column(DateTime, nullable=True)
+    generation_time_seconds = Column(Float, nullable=True)
+    is_deleted = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_analytics_reports_created_at_id', 'created_at', 'id'),
+    )
+
+
+class RepositorioAnalyticsSQLAlchemy(SqlAlchemyRepositorio):
+    """SQLAlchemy repository for AnalyticsReport entities."""
+
+    model = AnalyticsReportModel
+
+    def obtener_por_id(self, report_id: str) -> Optional[AnalyticsReport]:
+        """Get analytics report by ID."""
+        return self._obtener(report_id)
+
+    def obtener_todos(self) -> List[AnalyticsReport]:
+        """Get all analytics reports."""
+        return self._buscar(self._condiciones(), order_by=(AnalyticsReportModel.created_at,))
+
+    def obtener_por_partner_id(self, partner_id: str) -> List[AnalyticsReport]:
+        """Get analytics reports by partner ID."""
+        return self._buscar(self._condiciones({'partner_id': partner_id}), order_by=(AnalyticsReportModel.created_at,))
+
+    def obtener_por_status(self, status: ReportStatus) -> List[AnalyticsReport]:
+        """Get analytics reports by status."""
+        return self._buscar(self._condiciones({'status': status.value}), order_by=(AnalyticsReportModel.created_at,))
+
+    def obtener_por_tipo(self, report_type: ReportType) -> List[AnalyticsReport]:
+        """Get analytics reports by type."""
+        return self._buscar(self._condiciones({'report_type': report_type.value}), order_by=(AnalyticsReportModel.created_at,))
+
+    def obtener_todos_con_filtros(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[AnalyticsReport]:
+        """Get analytics reports with filters and pagination, newest first."""
+        return self._buscar(
+            self._condiciones(filters),
+            order_by=(AnalyticsReportModel.created_at.desc(), AnalyticsReportModel.id.desc()),
+            limit=limit,
+            offset=offset
+        )
+
+    def obtener_pagina(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        after: Optional[Keyset] = None,
+        descending: bool = True
+    ) -> List[AnalyticsReport]:
+        """Get a page of reports ordered by (created_at, id), starting after the `after` keyset."""
+        return self._pagina_keyset(self._condiciones(filters), limit=limit, after=after, descending=descending)
+
+    def contar_con_filtros(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count analytics reports with filters."""
+        return self._contar(self._condiciones(filters))
+
+    def obtener_reportes_recientes(
+        self,
+        partner_id: Optional[str] = None,
+        days: int = 30,
+        limit: int = 10
+    ) -> List[AnalyticsReport]:
+        """Get recent analytics reports."""
+        filters: Dict[str, Any] = {'start_date': datetime.now() - timedelta(days=days)}
+        if partner_id:
+            filters['partner_id'] = partner_id
+        return self.obtener_todos_con_filtros(filters, limit=limit)
+
+    def obtener_reportes_completados(
+        self,
+        partner_id: Optional[str] = None,
+        limit: int = 50
+    ) -> List[AnalyticsReport]:
+        """Get completed analytics reports, most recently generated first."""
+        filters: Dict[str, Any] = {'status': ReportStatus.COMPLETED.value}
+        if partner_id:
+            filters['partner_id'] = partner_id
+        return self._buscar(
+            self._condiciones(filters),
+            order_by=(
+                func.coalesce(AnalyticsReportModel.generated_at, AnalyticsReportModel.created_at).desc(),
+                AnalyticsReportModel.id.desc()
+            ),
+            limit=limit
+        )
+
+    def obtener_insights_criticos(
+        self,
+        partner_id: Optional[str] = None,
+        days: int = 30
+    ) -> List[Dict[str, Any]]:
+        """Get critical insights from recent reports."""
+        critical_insights = []
+        for report in self.obtener_reportes_recientes(partner_id, days, 20):
+            if report.status == ReportStatus.COMPLETED:
+                for insight in report.obtener_insights_criticos():
+                    critical_insights.append({
+                        'report_id': report.id,
+                        'partner_id': report.partner_id,
+                        'insight': insight,
+                        'generated_at': report.generated_date
+                    })
+        return critical_insights
+
+    def agregar(self, report: AnalyticsReport) -> None:
+        """Add new analytics report."""
+        try:
+            self._insertar(report)
+        except IntegrityError as e:
+            raise DomainException(f"Analytics report with ID {report.id} already exists") from e
+
+    def actualizar(self, report: AnalyticsReport) -> None:
+        """Update existing analytics report."""
+        if not self._actualizar(report):
+            raise DomainException(f"Analytics report with ID {report.id} not found")
+
+    def eliminar(self, report: AnalyticsReport) -> None:
+        """Soft delete analytics report."""
+        with self._session() as session:
+            session.execute(
+                update(AnalyticsReportModel)
+                .where(AnalyticsReportModel.id == report.id)
+                .values(is_deleted=True, updated_at=datetime.utcnow())
+            )
+
+    def obtener_estadisticas_plataforma(self) -> Dict[str, Any]:
+        """Get platform-wide analytics statistics with aggregate queries."""
+        live = self._condiciones()
+        completed = AnalyticsReportModel.status == ReportStatus.COMPLETED.value
+
+        with self._session() as session:
+            status_counts = dict(session.execute(
+                select(AnalyticsReportModel.status, func.count()).where(*live).group_by(AnalyticsReportModel.status)
+            ).all())
+            type_counts = dict(session.execute(
+                select(AnalyticsReportModel.tipo, func.count()).where(*live).group_by(AnalyticsReportModel.tipo)
+            ).all())
+            unique_partners = session.scalar(
+                select(func.count(func.distinct(AnalyticsReportModel.partner_id))).where(*live)
+            )
+            average_generation_time = session.scalar(
+                select(func.avg(AnalyticsReportModel.generation_time_seconds)).where(*live, completed)
+            )
+
+        total_reports = sum(status_counts.values())
+        completed_reports = status_counts.get(ReportStatus.COMPLETED.value, 0)
+        return {
+            'total_reports': total_reports,
+            'completed_reports': completed_reports,
+            'status_breakdown': status_counts,
+            'type_breakdown': type_counts,
+            'unique_partners_analyzed': unique_partners,
+            'average_generation_time': float(average_generation_time or 0.0),
+            'success_rate': completed_reports / total_reports if total_reports else 0
+        }
+
+    def _condiciones(self, filters: Optional[Dict[str, Any]] = None) -> List[Any]:
+        """Translate request filters into WHERE clauses."""
+        filters = filters or {}
+        condiciones: List[Any] = [AnalyticsReportModel.is_deleted.is_(False)]
+
+        if 'partner_id' in filters:
+            condiciones.append(AnalyticsReportModel.partner_id == filters['partner_id'])
+
+        if 'status' in filters:
+            condiciones.append(AnalyticsReportModel.status == ReportStatus(filters['status']).value)
+
+        if 'report_type' in filters:
+            condiciones.append(AnalyticsReportModel.tipo == ReportType(filters['report_type']).value)
+
+        if filters.get('start_date'):
+            condiciones.append(AnalyticsReportModel.created_at >= filters['start_date'])
+
+        if filters.get('end_date'):
+            condiciones.append(AnalyticsReportModel.created_at <= filters['end_date'])
+
+        return condiciones
+
+    def _a_fila(self, report: AnalyticsReport) -> Dict[str, Any]:
+        return {
+            'id': report.id,
+            'titulo': report.report_period.period_name,
+            'tipo': report.report_type.value,
+            'status': report.status.value,
+            'fecha_inicio': report.report_period.start_date,
+            'fecha_fin': report.report_period.end_date,
+            'datos_json': {
+                'period_name': report.report_period.period_name,
+                'insights': valor_a_json(report.insights),
+                'trends': valor_a_json(report.trends),
+                'benchmarks': valor_a_json(report.benchmarks),
+                'generated_by': report._generated_by,
+                'error_message': report._error_message
+            },
+            'metricas_json': valor_a_json(report.metrics),
+            'configuracion_json': {
+                'configuration': valor_a_json(report.configuration),
+                'data_filter': valor_a_json(report.data_filter)
+            },
+            'partner_id': report.partner_id,
+            'generated_at': report.generated_date,
+            'generation_time_seconds': report._generation_time_seconds,
+            'created_at': report.created_at,
+            'updated_at': report.updated_at
+        }
+
+    def _a_entidad(self, registro: AnalyticsReportModel) -> AnalyticsReport:
+        datos = registro.datos_json or {}
+        configuracion = registro.configuracion_json or {}
+        report = AnalyticsReport(
+            partner_id=registro.partner_id,
+            report_type=ReportType(registro.tipo),
+            report_period=ReportPeriod(
+                start_date=registro.fecha_inicio,
+                end_date=registro.fecha_fin,
+                period_name=datos.get('period_name', registro.titulo)
+            ),
+            configuration=valor_desde_json(ReportConfiguration, configuracion.get('configuration')),
+            report_id=registro.id,
+            data_filter=valor_desde_json(DataFilter, configuracion.get('data_filter')),
+            status=ReportStatus(registro.status),
+            metrics=valor_desde_json(AnalyticsMetrics, registro.metricas_json),
+            insights=valor_desde_json(List[Insight], datos.get('insights')),
+            trends=valor_desde_json(List[TrendAnalysis], datos.get('trends')),
+            benchmarks=valor_desde_json(List[BenchmarkComparison], datos.get('benchmarks'))
+        )
+        report._generated_date = registro.generated_at
+        report._generated_by = datos.get('generated_by')
+        report._generation_time_seconds = registro.generation_time_seconds
+        report._error_message = datos.get('error_message')
+        report._created_at = registro.created_at
+        report._updated_at = registro.updated_at
+        # Loading is not a domain change
+        report.limpiar_eventos()
+        return report
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 
-from partner_management.seedwork.infraestructura.repositorios import RepositorioMock
+from partner_management.seedwork.infraestructura.indexed_collection import IndexedCollection
 from ..dominio.entidades import Campaign
 from ..dominio.objetos_valor import (
     CampaignName, CampaignDescription, CampaignBudget, CampaignDateRange,
@@ -17,12 +17,32 @@ from ..dominio.objetos_valor import (
 from .fabricas import RepositorioCampaigns
 
 
-class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
+class RepositorioCampaignsMock(RepositorioCampaigns):
     """Mock implementation of CampaignRepository."""
     
+    # Sort keys not backed by a sorted index; created_at is paged off the index
+    _SORT_KEYS = {
+        'updated_at': lambda c: c.updated_at,
+        'nombre': lambda c: c.nombre.value,
+        'start_date': lambda c: c.fecha_rango.start_date,
+        'end_date': lambda c: c.fecha_rango.end_date,
+        'status': lambda c: c.status.value
+    }
+    
     def __init__(self):
         super().__init__()
-        self._campaigns: Dict[str, Campaign] = {}
+        self._campaigns: IndexedCollection[Campaign] = IndexedCollection(
+            hash_indexes={
+                'partner_id': lambda c: c.partner_id,
+                'status': lambda c: c.status.value,
+                'tipo': lambda c: c.tipo.value,
+                'is_approved': lambda c: c.approval.is_approved
+            },
+            sorted_indexes={
+                'created_at': lambda c: c.created_at,
+                'start_date': lambda c: c.fecha_rango.start_date
+            }
+        )
         self._initialize_mock_data()
     
     def _initialize_mock_data(self):
@@ -67,7 +87,7 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
         )
         campaign1._created_at = datetime(2024, 5, 20, 10, 0, 0)
         campaign1._updated_at = datetime(2024, 6, 15, 14, 30, 0)
-        self._campaigns[campaign1_id] = campaign1
+        self._campaigns.add(campaign1)
         
         # Mock Campaign 2: Draft Brand Awareness Campaign
         campaign2_id = str(uuid.uuid4())
@@ -94,7 +114,7 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
         )
         campaign2._created_at = datetime(2024, 6, 10, 16, 0, 0)
         campaign2._updated_at = datetime(2024, 6, 12, 9, 15, 0)
-        self._campaigns[campaign2_id] = campaign2
+        self._campaigns.add(campaign2)
         
         # Mock Campaign 3: Completed Lead Generation Campaign
         campaign3_id = str(uuid.uuid4())
@@ -131,7 +151,7 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
         )
         campaign3._created_at = datetime(2024, 3, 15, 14, 0, 0)
         campaign3._updated_at = datetime(2024, 6, 30, 23, 59, 59)
-        self._campaigns[campaign3_id] = campaign3
+        self._campaigns.add(campaign3)
     
     def obtener_por_id(self, campaign_id: str) -> Optional[Campaign]:
         """Get campaign by ID."""
@@ -139,17 +159,11 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
     
     def obtener_por_partner(self, partner_id: str) -> List[Campaign]:
         """Get campaigns by partner ID."""
-        return [
-            campaign for campaign in self._campaigns.values()
-            if campaign.partner_id == partner_id
-        ]
+        return self._campaigns.query(where={'partner_id': partner_id})
     
     def obtener_por_status(self, status: CampaignStatus) -> List[Campaign]:
         """Get campaigns by status."""
-        return [
-            campaign for campaign in self._campaigns.values()
-            if campaign.status == status
-        ]
+        return self._campaigns.query(where={'status': status.value})
     
     def obtener_con_filtros(
         self,
@@ -161,95 +175,82 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
     ) -> Tuple[List[Campaign], int]:
         """Get campaigns with filters and pagination."""
         
-        campaigns = list(self._campaigns.values())
-        
-        # Apply filters
-        if filtros.get('partner_id'):
-            campaigns = [c for c in campaigns if c.partner_id == filtros['partner_id']]
-        
-        if filtros.get('status'):
-            campaigns = [c for c in campaigns if c.status.value == filtros['status']]
-        
-        if filtros.get('tipo'):
-            campaigns = [c for c in campaigns if c.tipo.value == filtros['tipo']]
+        where = {}
+        for campo in ('partner_id', 'status', 'tipo'):
+            if filtros.get(campo):
+                where[campo] = filtros[campo]
+        if filtros.get('is_approved') is not None:
+            where['is_approved'] = filtros['is_approved']
         
-        if filtros.get('fecha_inicio_desde'):
-            fecha_desde = datetime.fromisoformat(filtros['fecha_inicio_desde'])
-            campaigns = [c for c in campaigns if c.fecha_rango.start_date >= fecha_desde]
+        fecha_desde = datetime.fromisoformat(filtros['fecha_inicio_desde']) if filtros.get('fecha_inicio_desde') else None
+        fecha_hasta = datetime.fromisoformat(filtros['fecha_inicio_hasta']) if filtros.get('fecha_inicio_hasta') else None
+        presupuesto_min = filtros.get('presupuesto_min')
+        presupuesto_max = filtros.get('presupuesto_max')
         
-        if filtros.get('fecha_inicio_hasta'):
-            fecha_hasta = datetime.fromisoformat(filtros['fecha_inicio_hasta'])
-            campaigns = [c for c in campaigns if c.fecha_rango.start_date <= fecha_hasta]
+        reverse_order = sort_order.lower() == 'desc'
+        start_idx = (page - 1) * page_size
         
-        if filtros.get('presupuesto_min'):
-            campaigns = [c for c in campaigns if c.presupuesto.amount >= filtros['presupuesto_min']]
+        # Index-only filters ordered by created_at: page straight off the sorted index
+        if sort_by not in self._SORT_KEYS and not (fecha_desde or fecha_hasta or presupuesto_min or presupuesto_max):
+            campaigns = self._campaigns.query(
+                where=where or None,
+                order_by='created_at',
+                descending=reverse_order,
+                offset=start_idx,
+                limit=page_size
+            )
+            return campaigns, self._campaigns.count(where=where or None)
         
-        if filtros.get('presupuesto_max'):
-            campaigns = [c for c in campaigns if c.presupuesto.amount <= filtros['presupuesto_max']]
+        if fecha_desde or fecha_hasta:
+            campaigns = self._campaigns.query(
+                where=where or None,
+                order_by='start_date',
+                lower=fecha_desde,
+                upper=fecha_hasta
+            )
+        else:
+            campaigns = self._campaigns.query(where=where or None)
         
-        if filtros.get('is_approved') is not None:
-            campaigns = [c for c in campaigns if c.approval.is_approved == filtros['is_approved']]
+        # Budget bounds are checked only on the indexed candidates
+        if presupuesto_min:
+            campaigns = [c for c in campaigns if c.presupuesto.amount >= presupuesto_min]
+        if presupuesto_max:
+            campaigns = [c for c in campaigns if c.presupuesto.amount <= presupuesto_max]
         
         total = len(campaigns)
         
-        # Apply sorting
-        reverse_order = sort_order.lower() == 'desc'
-        
-        if sort_by == 'created_at':
-            campaigns.sort(key=lambda c: c.created_at, reverse=reverse_order)
-        elif sort_by == 'updated_at':
-            campaigns.sort(key=lambda c: c.updated_at, reverse=reverse_order)
-        elif sort_by == 'nombre':
-            campaigns.sort(key=lambda c: c.nombre.value, reverse=reverse_order)
-        elif sort_by == 'start_date':
-            campaigns.sort(key=lambda c: c.fecha_rango.start_date, reverse=reverse_order)
-        elif sort_by == 'end_date':
-            campaigns.sort(key=lambda c: c.fecha_rango.end_date, reverse=reverse_order)
-        elif sort_by == 'status':
-            campaigns.sort(key=lambda c: c.status.value, reverse=reverse_order)
-        else:
-            campaigns.sort(key=lambda c: c.created_at, reverse=reverse_order)
-        
-        # Apply pagination
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_campaigns = campaigns[start_idx:end_idx]
+        campaigns.sort(key=self._SORT_KEYS.get(sort_by, lambda c: c.created_at), reverse=reverse_order)
         
-        return paginated_campaigns, total
+        return campaigns[start_idx:start_idx + page_size], total
     
     def obtener_todos(self) -> List[Campaign]:
         """Get all campaigns."""
-        return list(self._campaigns.values())
+        return self._campaigns.values()
     
     def agregar(self, campaign: Campaign) -> None:
         """Add campaign to repository."""
-        self._campaigns[campaign.id] = campaign
+        self._campaigns.add(campaign)
     
     def actualizar(self, campaign: Campaign) -> None:
         """Update campaign in repository."""
         if campaign.id in self._campaigns:
-            self._campaigns[campaign.id] = campaign
+            self._campaigns.add(campaign)
         else:
             raise ValueError(f"Campaign with ID {campaign.id} not found")
     
     def eliminar(self, campaign_id: str) -> None:
         """Delete campaign from repository."""
-        if campaign_id in self._campaigns:
-            del self._campaigns[campaign_id]
-        else:
+        if self._campaigns.remove(campaign_id) is None:
             raise ValueError(f"Campaign with ID {campaign_id} not found")
     
     def obtener_activas_por_partner(self, partner_id: str) -> List[Campaign]:
         """Get active campaigns for a partner."""
-        return [
-            campaign for campaign in self._campaigns.values()
-            if campaign.partner_id == partner_id and campaign.status == CampaignStatus.ACTIVE
-        ]
+        return self._campaigns.query(where={'partner_id': partner_id, 'status': CampaignStatus.ACTIVE.value})
     
     def obtener_por_presupuesto_rango(self, min_budget: Decimal, max_budget: Decimal) -> List[Campaign]:
         """Get campaigns within budget range."""
         return [
-            campaign for campaign in self._campaigns.values()
+            campaign for campaign in self._campaigns
             if min_budget <= campaign.presupuesto.amount <= max_budget
         ]
     
@@ -257,20 +258,16 @@ class RepositorioCampaignsMock(RepositorioCampaigns, RepositorioMock):
         """Get expired campaigns."""
         now = datetime.now()
         return [
-            campaign for campaign in self._campaigns.values()
-            if campaign.fecha_rango.end_date < now and campaign.status in [CampaignStatus.ACTIVE, CampaignStatus.PAUSED]
+            campaign for campaign in self._campaigns.query(
+                where={'status': [CampaignStatus.ACTIVE.value, CampaignStatus.PAUSED.value]}
+            )
+            if campaign.fecha_rango.end_date < now
         ]
     
     def contar_por_partner(self, partner_id: str) -> int:
         """Count campaigns for a partner."""
-        return len([
-            campaign for campaign in self._campaigns.values()
-            if campaign.partner_id == partner_id
-        ])
+        return self._campaigns.count(where={'partner_id': partner_id})
     
     def contar_por_status(self, status: CampaignStatus) -> int:
         """Count campaigns by status."""
-        return len([
-            campaign for campaign in self._campaigns.values()
-            if campaign.status == status
-        ])
\ No newline at end of file
+        return self._campaigns.count(where={'status': status.value})
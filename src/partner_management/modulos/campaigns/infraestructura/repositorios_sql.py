@@ -0,0 +1,236 @@
+"""
+SQLAlchemy repository implementation for Campaigns in HexaBuilders.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Integer, Numeric, String, Text, delete, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from partner_management.seedwork.infraestructura.repositorios_sql import (
+    Base, Keyset, SqlAlchemyRepositorio, valor_a_json, valor_desde_json
+)
+from ..dominio.entidades import Campaign
+from ..dominio.objetos_valor import (
+    CampaignName, CampaignDescription, CampaignBudget, CampaignDateRange,
+    CampaignType, CampaignStatus, CampaignTargeting, CampaignSettings,
+    CampaignMetrics, CampaignApproval
+)
+
+JsonDocument = JSON().with_variant(JSONB(), 'postgresql')
+
+
+class CampaignModel(Base):
+    __tablename__ = 'campaigns'
+
+    id = Column(String(36), primary_key=True)
+    nombre = Column(String(255), nullable=False)
+    descripcion = Column(Text, nullable=True)
+    fecha_inicio = Column(DateTime, nullable=False, index=True)
+    fecha_fin = Column(DateTime, nullable=False, index=True)
+    presupuesto = Column(Numeric(12, 2), default=0)
+    moneda = Column(String(3), nullable=False, default='USD')
+    tipo = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False, index=True)
+    partner_id = Column(String(36), nullable=True, index=True)
+    total_conversions = Column(Integer, default=0)
+    total_clicks = Column(Integer, default=0)
+    conversion_rate = Column(Numeric(5, 4), default=0)
+    roi = Column(Numeric(8, 2), default=0)
+    is_approved = Column(Boolean, nullable=False, default=False)
+    targeting_json = Column(JsonDocument, nullable=True)
+    settings_json = Column(JsonDocument, nullable=True)
+    metricas_json = Column(JsonDocument, nullable=True)
+    approval_json = Column(JsonDocument, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_campaigns_created_at_id', 'created_at', 'id'),
+        Index('idx_campaigns_partner_id_status', 'partner_id', 'status'),
+    )
+
+
+class RepositorioCampaignsSQLAlchemy(SqlAlchemyRepositorio):
+    """SQLAlchemy implementation of CampaignRepository."""
+
+    model = CampaignModel
+
+    _SORT_COLUMNS = {
+        'created_at': CampaignModel.created_at,
+        'updated_at': CampaignModel.updated_at,
+        'nombre': CampaignModel.nombre,
+        'start_date': CampaignModel.fecha_inicio,
+        'end_date': CampaignModel.fecha_fin,
+        'status': CampaignModel.status
+    }
+
+    def __init__(self, session_factory=None, session=None):
+        SqlAlchemyRepositorio.__init__(self, session_factory=session_factory, session=session)
+
+    def obtener_por_id(self, campaign_id: str) -> Optional[Campaign]:
+        """Get campaign by ID."""
+        return self._obtener(campaign_id)
+
+    def obtener_por_partner(self, partner_id: str) -> List[Campaign]:
+        """Get campaigns by partner ID."""
+        return self._buscar([CampaignModel.partner_id == partner_id], order_by=(CampaignModel.created_at,))
+
+    def obtener_por_status(self, status: CampaignStatus) -> List[Campaign]:
+        """Get campaigns by status."""
+        return self._buscar([CampaignModel.status == status.value], order_by=(CampaignModel.created_at,))
+
+    def obtener_con_filtros(
+        self,
+        filtros: Dict,
+        page: int = 1,
+        page_size: int = 10,
+        sort_by: str = "created_at",
+        sort_order: str = "desc"
+    ) -> Tuple[List[Campaign], int]:
+        """Get campaigns with filters and pagination."""
+        condiciones = self._condiciones(filtros)
+
+        sort_column = self._SORT_COLUMNS.get(sort_by, CampaignModel.created_at)
+        if sort_order.lower() == 'desc':
+            order_by = (sort_column.desc(), CampaignModel.id.desc())
+        else:
+            order_by = (sort_column.asc(), CampaignModel.id.asc())
+
+        campaigns = self._buscar(condiciones, order_by=order_by, limit=page_size, offset=(page - 1) * page_size)
+        return campaigns, self._contar(condiciones)
+
+    def obtener_pagina(
+        self,
+        filtros: Optional[Dict] = None,
+        limit: int = 50,
+        after: Optional[Keyset] = None,
+        descending: bool = True
+    ) -> List[Campaign]:
+        """Get a page of campaigns ordered by (created_at, id), starting after the `after` keyset."""
+        return self._pagina_keyset(self._condiciones(filtros or {}), limit=limit, after=after, descending=descending)
+
+    def obtener_todos(self) -> List[Campaign]:
+        """Get all campaigns."""
+        return self._buscar(order_by=(CampaignModel.created_at,))
+
+    def agregar(self, campaign: Campaign) -> None:
+        """Add campaign to repository."""
+        self._insertar(campaign)
+
+    def actualizar(self, campaign: Campaign) -> None:
+        """Update campaign in repository."""
+        if not self._actualizar(campaign):
+            raise ValueError(f"Campaign with ID {campaign.id} not found")
+
+    def eliminar(self, campaign_id: str) -> None:
+        """Delete campaign from repository."""
+        with self._session() as session:
+            result = session.execute(delete(CampaignModel).where(CampaignModel.id == campaign_id))
+        if not result.rowcount:
+            raise ValueError(f"Campaign with ID {campaign_id} not found")
+
+    def obtener_activas_por_partner(self, partner_id: str) -> List[Campaign]:
+        """Get active campaigns for a partner."""
+        return self._buscar([
+            CampaignModel.partner_id == partner_id,
+            CampaignModel.status == CampaignStatus.ACTIVE.value
+        ])
+
+    def obtener_por_presupuesto_rango(self, min_budget: Decimal, max_budget: Decimal) -> List[Campaign]:
+        """Get campaigns within budget range."""
+        return self._buscar([CampaignModel.presupuesto.between(min_budget, max_budget)])
+
+    def obtener_vencidas(self) -> List[Campaign]:
+        """Get expired campaigns."""
+        return self._buscar([
+            CampaignModel.fecha_fin < datetime.now(),
+            CampaignModel.status.in_([CampaignStatus.ACTIVE.value, CampaignStatus.PAUSED.value])
+        ])
+
+    def contar_por_partner(self, partner_id: str) -> int:
+        """Count campaigns for a partner."""
+        return self._contar([CampaignModel.partner_id == partner_id])
+
+    def contar_por_status(self, status: CampaignStatus) -> int:
+        """Count campaigns by status."""
+        return self._contar([CampaignModel.status == status.value])
+
+    def _condiciones(self, filtros: Dict) -> List[Any]:
+        """Translate request filters into WHERE clauses."""
+        condiciones: List[Any] = []
+
+        if filtros.get('partner_id'):
+            condiciones.append(CampaignModel.partner_id == filtros['partner_id'])
+
+        if filtros.get('status'):
+            condiciones.append(CampaignModel.status == filtros['status'])
+
+        if filtros.get('tipo'):
+            condiciones.append(CampaignModel.tipo == filtros['tipo'])
+
+        if filtros.get('fecha_inicio_desde'):
+            condiciones.append(CampaignModel.fecha_inicio >= datetime.fromisoformat(filtros['fecha_inicio_desde']))
+
+        if filtros.get('fecha_inicio_hasta'):
+            condiciones.append(CampaignModel.fecha_inicio <= datetime.fromisoformat(filtros['fecha_inicio_hasta']))
+
+        if filtros.get('presupuesto_min'):
+            condiciones.append(CampaignModel.presupuesto >= filtros['presupuesto_min'])
+
+        if filtros.get('presupuesto_max'):
+            condiciones.append(CampaignModel.presupuesto <= filtros['presupuesto_max'])
+
+        if filtros.get('is_approved') is not None:
+            condiciones.append(CampaignModel.is_approved.is_(bool(filtros['is_approved'])))
+
+        return condiciones
+
+    def _a_fila(self, campaign: Campaign) -> Dict[str, Any]:
+        metricas = campaign.metricas
+        return {
+            'id': campaign.id,
+            'nombre': campaign.nombre.value,
+            'descripcion': campaign.descripcion.value,
+            'fecha_inicio': campaign.fecha_rango.start_date,
+            'fecha_fin': campaign.fecha_rango.end_date,
+            'presupuesto': campaign.presupuesto.amount,
+            'moneda': campaign.presupuesto.currency,
+            'tipo': campaign.tipo.value,
+            'status': campaign.status.value,
+            'partner_id': campaign.partner_id,
+            'total_conversions': metricas.conversions,
+            'total_clicks': metricas.clicks,
+            'conversion_rate': metricas.conversion_rate(),
+            'roi': metricas.return_on_ad_spend(),
+            'is_approved': campaign.approval.is_approved,
+            'targeting_json': valor_a_json(campaign.targeting),
+            'settings_json': valor_a_json(campaign.settings),
+            'metricas_json': valor_a_json(metricas),
+            'approval_json': valor_a_json(campaign.approval),
+            'created_at': campaign.created_at,
+            'updated_at': campaign.updated_at
+        }
+
+    def _a_entidad(self, registro: CampaignModel) -> Campaign:
+        campaign = Campaign(
+            nombre=CampaignName(registro.nombre),
+            descripcion=CampaignDescription(registro.descripcion),
+            partner_id=registro.partner_id,
+            tipo=CampaignType(registro.tipo),
+            presupuesto=CampaignBudget(Decimal(registro.presupuesto), registro.moneda),
+            fecha_rango=CampaignDateRange(start_date=registro.fecha_inicio, end_date=registro.fecha_fin),
+            campaign_id=registro.id,
+            status=CampaignStatus(registro.status),
+            targeting=valor_desde_json(CampaignTargeting, registro.targeting_json),
+            settings=valor_desde_json(CampaignSettings, registro.settings_json),
+            metricas=valor_desde_json(CampaignMetrics, registro.metricas_json),
+            approval=valor_desde_json(CampaignApproval, registro.approval_json)
+        )
+        campaign._created_at = registro.created_at
+        campaign._updated_at = registro.updated_at
+        # Loading is not a domain change
+        campaign.limpiar_eventos()
+        return campaign
@@ -11,7 +11,7 @@ from partner_management.seedwork.aplicacion.comandos import ejecutar_comando
 from partner_management.seedwork.infraestructura.uow import UnitOfWork
 from partner_management.seedwork.dominio.excepciones import DomainException
 from ...dominio.objetos_valor import CommissionAmount, CommissionRate
-from .base import CommandCommission
+from .base import ComandoCommission
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +9,7 @@ from typing import Optional
 from partner_management.seedwork.aplicacion.comandos import ejecutar_comando
 from partner_management.seedwork.infraestructura.uow import UnitOfWork
 from partner_management.seedwork.dominio.excepciones import DomainException
-from .base import CommandCommission
+from .base import ComandoCommission
 
 logger = logging.getLogger(__name__)
 
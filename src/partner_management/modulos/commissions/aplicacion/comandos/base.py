@@ -9,7 +9,7 @@ from partner_management.seedwork.aplicacion.comandos import Command, ComandoHand
 
 
 @dataclass
-class ComandoCommission(Comando, ABC):
+class ComandoCommission(Command, ABC):
     """Base class for all commission commands."""
     pass
 
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from partner_management.seedwork.aplicacion.comandos import ejecutar_comando
 from partner_management.seedwork.infraestructura.uow import UnitOfWork
 from partner_management.seedwork.dominio.excepciones import DomainException
-from .base import CommandCommission
+from .base import ComandoCommission
 
 logger = logging.getLogger(__name__)
 
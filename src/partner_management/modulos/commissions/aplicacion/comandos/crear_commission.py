@@ -17,7 +17,7 @@ from ...dominio.objetos_valor import (
     CommissionType, CommissionStatus, CommissionCalculation
 )
 from ...infraestructura.fabricas import FabricaCommission
-from .base import CommandCommission
+from .base import ComandoCommission
 
 logger = logging.getLogger(__name__)
 
@@ -6,7 +6,7 @@ import logging
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional
 
-from partner_management.seedwork.aplicacion.queries import ejecutar_query
+from partner_management.seedwork.aplicacion.queries import ejecutar_query, codificar_cursor
 from partner_management.seedwork.infraestructura.uow import UnitOfWork
 from partner_management.seedwork.dominio.excepciones import DomainException
 from .base import QueryCommission, CommissionQueryResult
@@ -16,22 +16,38 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class ObtenerTodosCommissions(QueryCommission):
-    """Query to get all commissions with optional filtering."""
+    """
+    Query to get all commissions with optional filtering.
+    
+    With `pagination` the commissions are paged newest first by keyset on
+    (created_at, id); the result's `next_cursor` goes into the next page's
+    `PaginationInfo.cursor`. Otherwise `limit`/`offset` apply.
+    """
     
     partner_id: Optional[str] = None
     status: Optional[str] = None
     commission_type: Optional[str] = None
     limit: int = 100
     offset: int = 0
+    total_aproximado: bool = False
 
 
 class CommissionsListResult(CommissionQueryResult):
     """Commissions list query result."""
     
-    def __init__(self, commissions_data: List[Dict[str, Any]], total_count: int):
+    def __init__(
+        self,
+        commissions_data: List[Dict[str, Any]],
+        total_count: int,
+        next_cursor: Optional[str] = None,
+        total_is_approximate: bool = False
+    ):
         self.commissions = commissions_data
         self.total_count = total_count
         self.count = len(commissions_data)
+        self.next_cursor = next_cursor
+        self.has_next_page = next_cursor is not None
+        self.total_is_approximate = total_is_approximate
 
 
 @ejecutar_query.register
@@ -59,20 +75,42 @@ def handle_obtener_todos_commissions(query: ObtenerTodosCommissions) -> Commissi
                 filters['commission_type'] = query.commission_type
             
             # Get commissions with pagination
-            commissions = repo.obtener_todos_con_filtros(
-                filters=filters,
-                limit=query.limit,
-                offset=query.offset
-            )
+            next_cursor = None
+            pagination = query.pagination
+            if pagination is not None and (pagination.cursor or pagination.page_number == 1):
+                # Keyset page: one extra row tells whether another page follows
+                commissions = repo.obtener_pagina(
+                    filters=filters,
+                    limit=pagination.page_size + 1,
+                    after=pagination.keyset
+                )
+                if len(commissions) > pagination.page_size:
+                    commissions = commissions[:pagination.page_size]
+                    last = commissions[-1]
+                    next_cursor = codificar_cursor(last.created_at, last.id)
+            else:
+                commissions = repo.obtener_todos_con_filtros(
+                    filters=filters,
+                    limit=pagination.limit if pagination else query.limit,
+                    offset=pagination.offset if pagination else query.offset
+                )
             
             # Get total count
-            total_count = repo.contar_con_filtros(filters)
+            if query.total_aproximado:
+                total_count = repo.contar_aproximado(filters)
+            else:
+                total_count = repo.contar_con_filtros(filters)
             
             # Convert to summary format
             commissions_data = [commission.get_summary() for commission in commissions]
             
             logger.info(f"Retrieved {len(commissions)} commissions out of {total_count} total")
-            return CommissionsListResult(commissions_data, total_count)
+            return CommissionsListResult(
+                commissions_data,
+                total_count,
+                next_cursor=next_cursor,
+                total_is_approximate=query.total_aproximado
+            )
     
     except Exception as e:
         logger.error(f"Failed to get commissions: {str(e)}")
@@ -0,0 +1,141 @@
+"""
+Streaming commission reports for HexaBuilders.
+Commissions are read from the repository in keyset batches, aggregated in a
+single pass and optionally serialized as NDJSON or CSV chunks, so memory stays
+constant regardless of the report period.
+"""
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from ..dominio.entidades import Commission
+
+FORMATO_NDJSON = 'ndjson'
+FORMATO_CSV = 'csv'
+
+# Streaming format -> response mimetype
+FORMATOS_REPORTE = {
+    FORMATO_NDJSON: 'application/x-ndjson',
+    FORMATO_CSV: 'text/csv'
+}
+
+CSV_COLUMNS = [
+    'id', 'partner_id', 'commission_amount', 'commission_currency', 'commission_rate',
+    'commission_type', 'status', 'transaction_reference', 'transaction_amount', 'created_at'
+]
+
+# Flush the serialized lines once the buffer reaches this many characters
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class ResumenReporteComisiones:
+    """Running aggregates of a commission report, updated one commission at a time."""
+
+    start_date: datetime
+    end_date: datetime
+    total_commissions: int = 0
+    total_amount: Decimal = Decimal('0')
+    status_breakdown: Dict[str, int] = field(default_factory=dict)
+    type_breakdown: Dict[str, int] = field(default_factory=dict)
+
+    def agregar(self, commission: Commission) -> None:
+        """Fold a commission into the aggregates."""
+        status = commission.status.value
+        comm_type = commission.commission_type.value
+
+        self.total_commissions += 1
+        self.total_amount += commission.commission_amount.amount
+        self.status_breakdown[status] = self.status_breakdown.get(status, 0) + 1
+        self.type_breakdown[comm_type] = self.type_breakdown.get(comm_type, 0) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'report_period': {
+                'start_date': self.start_date.isoformat(),
+                'end_date': self.end_date.isoformat()
+            },
+            'total_commissions': self.total_commissions,
+            'total_amount': str(self.total_amount),
+            'status_breakdown': self.status_breakdown,
+            'type_breakdown': self.type_breakdown
+        }
+
+
+def linea_reporte(commission: Commission) -> Dict[str, Any]:
+    """Flat, JSON-ready line item of a commission with the `CSV_COLUMNS` fields."""
+    return {
+        'id': commission.id,
+        'partner_id': commission.partner_id,
+        'commission_amount': str(commission.commission_amount.amount),
+        'commission_currency': commission.commission_amount.currency,
+        'commission_rate': str(commission.commission_rate.as_percentage()),
+        'commission_type': commission.commission_type.value,
+        'status': commission.status.value,
+        'transaction_reference': commission.transaction_reference.transaction_id,
+        'transaction_amount': str(commission.transaction_reference.transaction_amount),
+        'created_at': commission.created_at.isoformat()
+    }
+
+
+def generar_lineas_reporte(
+    commissions: Iterable[Commission],
+    resumen: ResumenReporteComisiones,
+    formato: str = FORMATO_NDJSON,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Aggregate commissions into `resumen` while yielding their line items in chunks.
+
+    NDJSON emits one `{"type": "commission"}` record per commission and a final
+    `{"type": "summary"}` record. CSV emits a header and one row per commission;
+    the aggregates remain available in `resumen` once the iterator is exhausted.
+    """
+    if formato not in FORMATOS_REPORTE:
+        raise ValueError(f"Report format must be one of: {list(FORMATOS_REPORTE)}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if formato == FORMATO_CSV else None
+    if writer is not None:
+        writer.writerow(CSV_COLUMNS)
+
+    for commission in commissions:
+        resumen.agregar(commission)
+        linea = linea_reporte(commission)
+        if writer is not None:
+            writer.writerow([linea[column] for column in CSV_COLUMNS])
+        else:
+            buffer.write(json.dumps({'type': 'commission', 'data': linea}))
+            buffer.write('\n')
+
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if writer is None:
+        buffer.write(json.dumps({'type': 'summary', 'data': resumen.to_dict()}))
+        buffer.write('\n')
+
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def filtros_reporte(
+    start_date: datetime,
+    end_date: datetime,
+    partner_id: Optional[str] = None,
+    status: Optional[str] = None
+) -> Dict[str, Any]:
+    """Repository filters for a report period; the date range bounds the created_at index."""
+    filters: Dict[str, Any] = {'start_date': start_date, 'end_date': end_date}
+    if partner_id:
+        filters['partner_id'] = partner_id
+    if status:
+        filters['status'] = status
+    return filters
@@ -4,12 +4,13 @@ Implements CQRS pattern with command and query separation.
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Iterator, Optional, List, Dict, Any
 from datetime import datetime
 from decimal import Decimal
 
-from partner_management.seedwork.aplicacion.servicios import ServicioAplicacion
-from partner_management.seedwork.infraestructura.uow import UnitOfWork
+from partner_management.seedwork.aplicacion.queries import iterar_por_keyset
+from partner_management.seedwork.aplicacion.servicios import ApplicationService
+from partner_management.seedwork.dependencias import get_commission_repository
 from partner_management.seedwork.dominio.excepciones import DomainException
 
 from .comandos.crear_commission import CrearCommission, handle_crear_commission
@@ -21,11 +22,17 @@ from .comandos.procesar_pago_commission import ProcesarPagoCommission, handle_pr
 from .queries.obtener_commission import ObtenerCommission, handle_obtener_commission
 from .queries.obtener_todos_commissions import ObtenerTodosCommissions, handle_obtener_todos_commissions
 from .queries.obtener_comisiones_partner import ObtenerComisionesPartner, handle_obtener_comisiones_partner
+from .reportes import (
+    FORMATO_NDJSON, FORMATOS_REPORTE, ResumenReporteComisiones, filtros_reporte, generar_lineas_reporte,
+    linea_reporte
+)
+from ..dominio.entidades import Commission
+from ..dominio.objetos_valor import CommissionStatus
 
 logger = logging.getLogger(__name__)
 
 
-class ServicioCommission(ServicioAplicacion):
+class ServicioCommission(ApplicationService):
     """
     Application service for Commission operations.
     Coordinates CQRS operations and business workflows.
@@ -307,50 +314,87 @@ class ServicioCommission(ServicioAplicacion):
         start_date: datetime,
         end_date: datetime,
         partner_id: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        incluir_comisiones: bool = False
     ) -> Dict[str, Any]:
         """
         Generate commission report for specified period.
+        
+        The period and filters are resolved by the repository and the
+        commissions are aggregated in one pass. Line items are only included
+        with `incluir_comisiones`; use `transmitir_reporte_comisiones` to
+        stream them instead.
         """
         self._logger.info(f"Generating commission report from {start_date} to {end_date}")
+        filters = self._filtros_reporte(start_date, end_date, partner_id, status)
         
-        # Get commissions data
-        commissions_data = self.obtener_todos_commissions(
-            partner_id=partner_id,
-            status=status,
-            limit=10000  # Large limit for report
+        resumen = ResumenReporteComisiones(start_date, end_date)
+        line_items = [] if incluir_comisiones else None
+        
+        for commission in self._iterar_comisiones(filters):
+            resumen.agregar(commission)
+            if line_items is not None:
+                line_items.append(linea_reporte(commission))
+        
+        reporte = resumen.to_dict()
+        if line_items is not None:
+            reporte['commissions'] = line_items
+        return reporte
+    
+    def transmitir_reporte_comisiones(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        partner_id: Optional[str] = None,
+        status: Optional[str] = None,
+        formato: str = FORMATO_NDJSON
+    ) -> Iterator[str]:
+        """
+        Stream a commission report as NDJSON or CSV chunks.
+        
+        Arguments are validated before the first chunk is produced; the
+        repository is read lazily while the caller consumes the iterator.
+        """
+        if formato not in FORMATOS_REPORTE:
+            raise DomainException(
+                f"Report format must be one of: {list(FORMATOS_REPORTE)}", error_code="INVALID_REPORT_FORMAT"
+            )
+        filters = self._filtros_reporte(start_date, end_date, partner_id, status)
+        self._logger.info(f"Streaming {formato} commission report from {start_date} to {end_date}")
+        
+        return generar_lineas_reporte(
+            self._iterar_comisiones(filters),
+            ResumenReporteComisiones(start_date, end_date),
+            formato
         )
+    
+    def _iterar_comisiones(self, filters: Dict[str, Any]) -> Iterator[Commission]:
+        """Read the filtered commissions oldest first, one keyset page at a time."""
+        repository = get_commission_repository()
+        return iterar_por_keyset(
+            lambda limit, after: repository.obtener_pagina(filters, limit=limit, after=after, descending=False)
+        )
+    
+    def _filtros_reporte(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        partner_id: Optional[str],
+        status: Optional[str]
+    ) -> Dict[str, Any]:
+        """Validate report arguments and build the repository filters."""
+        if start_date > end_date:
+            raise DomainException("Report start date must not be after end date", error_code="INVALID_REPORT_PERIOD")
         
-        # Filter by date range (this would be better done at repository level)
-        filtered_commissions = []
-        for commission in commissions_data['commissions']:
-            commission_date = datetime.fromisoformat(commission['timestamps']['created_at'])
-            if start_date <= commission_date <= end_date:
-                filtered_commissions.append(commission)
-        
-        # Calculate report metrics
-        total_amount = sum(Decimal(c['commission_amount']) for c in filtered_commissions)
-        status_breakdown = {}
-        type_breakdown = {}
-        
-        for commission in filtered_commissions:
-            status = commission['status']
-            comm_type = commission['commission_type']
-            
-            status_breakdown[status] = status_breakdown.get(status, 0) + 1
-            type_breakdown[comm_type] = type_breakdown.get(comm_type, 0) + 1
+        if status:
+            try:
+                CommissionStatus(status)
+            except ValueError:
+                raise DomainException(
+                    f"Status must be one of: {[s.value for s in CommissionStatus]}", error_code="INVALID_COMMISSION_STATUS"
+                )
         
-        return {
-            'report_period': {
-                'start_date': start_date.isoformat(),
-                'end_date': end_date.isoformat()
-            },
-            'total_commissions': len(filtered_commissions),
-            'total_amount': str(total_amount),
-            'status_breakdown': status_breakdown,
-            'type_breakdown': type_breakdown,
-            'commissions': filtered_commissions
-        }
+        return filtros_reporte(start_date, end_date, partner_id, status)
     
     def _calculate_automatic_commission(
         self,
@@ -31,6 +31,11 @@ class CommissionDTO:
     calculation_period_end: datetime
     period_name: str
     
+    # Metadata
+    created_at: datetime
+    updated_at: datetime
+    version: int
+    
     # Approval details
     approval_date: Optional[datetime] = None
     approved_by: Optional[str] = None
@@ -58,10 +63,6 @@ class CommissionDTO:
     calculation_date: Optional[datetime] = None
     base_amount: Optional[Decimal] = None
     
-    # Metadata
-    created_at: datetime
-    updated_at: datetime
-    version: int
     is_deleted: bool = False
     
     @classmethod
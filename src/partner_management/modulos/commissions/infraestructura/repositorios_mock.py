@@ -6,11 +6,12 @@ Provides in-memory data persistence for development and testing.
 import uuid
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from collections import defaultdict
 
-from partner_management.seedwork.dominio.repositorio import Repositorio
+from partner_management.seedwork.dominio.repositorios import Repositorio
 from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.indexed_collection import IndexedCollection
 
 from ..dominio.entidades import Commission
 from ..dominio.objetos_valor import (
@@ -26,7 +27,16 @@ class RepositorioCommissionMock(Repositorio):
     
     def __init__(self):
         super().__init__()
-        self._commissions: Dict[str, Commission] = {}
+        self._commissions: IndexedCollection[Commission] = IndexedCollection(
+            hash_indexes={
+                'partner_id': lambda c: c.partner_id,
+                'status': lambda c: c.status,
+                'commission_type': lambda c: c.commission_type,
+                'transaction_id': lambda c: c.transaction_reference.transaction_id,
+                'is_deleted': lambda c: getattr(c, 'is_deleted', False)
+            },
+            sorted_indexes={'created_at': lambda c: c.created_at}
+        )
         self._fabrica = FabricaCommission()
         self._initialize_sample_data()
     
@@ -36,28 +46,20 @@ class RepositorioCommissionMock(Repositorio):
     
     def obtener_por_transaction_id(self, transaction_id: str) -> Optional[Commission]:
         """Get commission by transaction ID."""
-        for commission in self._commissions.values():
-            if commission.transaction_reference.transaction_id == transaction_id:
-                return commission
-        return None
+        commissions = self._commissions.query(where={'transaction_id': transaction_id}, limit=1)
+        return commissions[0] if commissions else None
     
     def obtener_todos(self) -> List[Commission]:
         """Get all commissions."""
-        return [c for c in self._commissions.values() if not c.is_deleted]
+        return self._commissions.query(where={'is_deleted': False})
     
     def obtener_por_partner_id(self, partner_id: str) -> List[Commission]:
         """Get commissions by partner ID."""
-        return [
-            c for c in self._commissions.values() 
-            if c.partner_id == partner_id and not c.is_deleted
-        ]
+        return self._commissions.query(where={'partner_id': partner_id, 'is_deleted': False})
     
     def obtener_por_status(self, status: CommissionStatus) -> List[Commission]:
         """Get commissions by status."""
-        return [
-            c for c in self._commissions.values() 
-            if c.status == status and not c.is_deleted
-        ]
+        return self._commissions.query(where={'status': status, 'is_deleted': False})
     
     def obtener_todos_con_filtros(
         self,
@@ -67,59 +69,87 @@ class RepositorioCommissionMock(Repositorio):
     ) -> List[Commission]:
         """Get commissions with filters and pagination."""
         
-        commissions = [c for c in self._commissions.values() if not c.is_deleted]
+        filters = filters or {}
         
-        if filters:
-            # Apply partner_id filter
-            if 'partner_id' in filters:
-                commissions = [c for c in commissions if c.partner_id == filters['partner_id']]
-            
-            # Apply status filter
-            if 'status' in filters:
-                status_filter = CommissionStatus(filters['status'])
-                commissions = [c for c in commissions if c.status == status_filter]
-            
-            # Apply commission_type filter
-            if 'commission_type' in filters:
-                type_filter = CommissionType(filters['commission_type'])
-                commissions = [c for c in commissions if c.commission_type == type_filter]
-            
-            # Apply date range filters
-            if 'start_date' in filters:
-                start_date = filters['start_date']
-                commissions = [c for c in commissions if c.created_at >= start_date]
-            
-            if 'end_date' in filters:
-                end_date = filters['end_date']
-                commissions = [c for c in commissions if c.created_at <= end_date]
+        # Sorted by creation date (newest first); the date range bounds the created_at index
+        return self._commissions.query(
+            where=self._where(filters),
+            order_by='created_at',
+            descending=True,
+            lower=filters.get('start_date'),
+            upper=filters.get('end_date'),
+            offset=offset,
+            limit=limit
+        )
+    
+    def obtener_pagina(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        after: Optional[Tuple[datetime, str]] = None,
+        descending: bool = True
+    ) -> List[Commission]:
+        """Get a page of commissions ordered by (created_at, id), starting after the `after` keyset."""
         
-        # Sort by creation date (newest first)
-        commissions.sort(key=lambda c: c.created_at, reverse=True)
+        filters = filters or {}
         
-        # Apply pagination
-        return commissions[offset:offset + limit]
+        return self._commissions.query(
+            where=self._where(filters),
+            order_by='created_at',
+            descending=descending,
+            lower=filters.get('start_date'),
+            upper=filters.get('end_date'),
+            limit=limit,
+            after=after
+        )
+    
+    def _where(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Translate request filters into index lookups."""
+        where: Dict[str, Any] = {'is_deleted': False}
+        
+        if 'partner_id' in filters:
+            where['partner_id'] = filters['partner_id']
+        
+        if 'status' in filters:
+            where['status'] = CommissionStatus(filters['status'])
+        
+        if 'commission_type' in filters:
+            where['commission_type'] = CommissionType(filters['commission_type'])
+        
+        return where
     
     def contar_con_filtros(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count commissions with filters."""
-        return len(self.obtener_todos_con_filtros(filters, limit=10000, offset=0))
+        filters = filters or {}
+        return self._commissions.count(
+            where=self._where(filters),
+            order_by='created_at',
+            lower=filters.get('start_date'),
+            upper=filters.get('end_date')
+        )
+    
+    def contar_aproximado(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Estimate commissions matching filters from the index sizes; date ranges count exactly."""
+        filters = filters or {}
+        if filters.get('start_date') or filters.get('end_date'):
+            return self.contar_con_filtros(filters)
+        return self._commissions.estimate(where=self._where(filters))
     
     def agregar(self, commission: Commission) -> None:
         """Add new commission."""
         if commission.id in self._commissions:
             raise DomainException(f"Commission with ID {commission.id} already exists")
-        self._commissions[commission.id] = commission
+        self._commissions.add(commission)
     
     def actualizar(self, commission: Commission) -> None:
         """Update existing commission."""
         if commission.id not in self._commissions:
             raise DomainException(f"Commission with ID {commission.id} not found")
-        self._commissions[commission.id] = commission
+        self._commissions.add(commission)
     
     def eliminar(self, commission: Commission) -> None:
-        """Soft delete commission."""
-        if commission.id in self._commissions:
-            commission.soft_delete()
-            self._commissions[commission.id] = commission
+        """Delete commission; Commission has no soft-delete state, so it is removed."""
+        self._commissions.remove(commission.id)
     
     def obtener_estadisticas_partner(self, partner_id: str) -> Dict[str, Any]:
         """Get commission statistics for partner."""
@@ -240,4 +270,4 @@ class RepositorioCommissionMock(Repositorio):
                 commission._payment_reference = f"pay_{uuid.uuid4().hex[:8]}"
             
             # Store commission
-            self._commissions[commission.id] = commission
\ No newline at end of file
+            self._commissions.add(commission)
\ No newline at end of file
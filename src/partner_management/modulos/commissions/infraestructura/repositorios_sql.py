@@ -0,0 +1,246 @@
+"""
+SQLAlchemy repositories for Commission module in HexaBuilders.
+Persists commissions in the `commissions` table with filtering, counting and
+aggregation pushed down to the database.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Boolean, Column, DateTime, Index, Numeric, String, Text, case, func, select, update
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import IntegrityError
+
+from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.repositorios_sql import (
+    Base, Keyset, SqlAlchemyRepositorio, valor_a_json, valor_desde_json
+)
+
+from ..dominio.entidades import Commission
+from ..dominio.objetos_valor import (
+    CommissionAmount, CommissionRate, CommissionPeriod, TransactionReference,
+    PaymentDetails, CommissionCalculation, CommissionType, CommissionStatus
+)
+
+JsonDocument = JSON().with_variant(JSONB(), 'postgresql')
+
+# Lifecycle fields set by the aggregate's state transitions rather than its constructor
+_TRACKING_FIELDS = {
+    'approval_date': datetime,
+    'approved_by': str,
+    'approval_notes': str,
+    'payment_date': datetime,
+    'payment_reference': str,
+    'cancellation_date': datetime,
+    'cancellation_reason': str,
+    'cancelled_by': str,
+    'hold_date': datetime,
+    'hold_reason': str,
+    'held_by': str
+}
+
+
+class CommissionModel(Base):
+    __tablename__ = 'commissions'
+
+    id = Column(String(36), primary_key=True)
+    partner_id = Column(String(36), nullable=False, index=True)
+    campaign_id = Column(String(36), nullable=True, index=True)
+    monto = Column(Numeric(12, 2), nullable=False)
+    moneda = Column(String(3), nullable=False, default='USD')
+    porcentaje = Column(Numeric(7, 4), default=0)
+    tipo = Column(String(50), nullable=False)
+    status = Column(String(50), nullable=False, index=True)
+    transaction_id = Column(String(100), nullable=True, unique=True)
+    fecha_calculo = Column(DateTime, nullable=False, index=True)
+    fecha_pago = Column(DateTime, nullable=True)
+    descripcion = Column(Text, nullable=True)
+    detalles_json = Column(JsonDocument, nullable=True)
+    is_deleted = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_commissions_created_at_id', 'created_at', 'id'),
+        Index('idx_commissions_partner_id_created_at', 'partner_id', 'created_at'),
+    )
+
+
+class RepositorioCommissionSQLAlchemy(SqlAlchemyRepositorio):
+    """SQLAlchemy repository for Commission entities."""
+
+    model = CommissionModel
+
+    def obtener_por_id(self, commission_id: str) -> Optional[Commission]:
+        """Get commission by ID."""
+        return self._obtener(commission_id)
+
+    def obtener_por_transaction_id(self, transaction_id: str) -> Optional[Commission]:
+        """Get commission by transaction ID."""
+        commissions = self._buscar([CommissionModel.transaction_id == transaction_id], limit=1)
+        return commissions[0] if commissions else None
+
+    def obtener_todos(self) -> List[Commission]:
+        """Get all commissions."""
+        return self._buscar(self._condiciones({}), order_by=(CommissionModel.created_at,))
+
+    def obtener_por_partner_id(self, partner_id: str) -> List[Commission]:
+        """Get commissions by partner ID."""
+        return self._buscar(self._condiciones({'partner_id': partner_id}), order_by=(CommissionModel.created_at,))
+
+    def obtener_por_status(self, status: CommissionStatus) -> List[Commission]:
+        """Get commissions by status."""
+        return self._buscar(self._condiciones({'status': status.value}), order_by=(CommissionModel.created_at,))
+
+    def obtener_todos_con_filtros(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Commission]:
+        """Get commissions with filters and pagination, newest first."""
+        return self._buscar(
+            self._condiciones(filters or {}),
+            order_by=(CommissionModel.created_at.desc(), CommissionModel.id.desc()),
+            limit=limit,
+            offset=offset
+        )
+
+    def obtener_pagina(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 100,
+        after: Optional[Keyset] = None,
+        descending: bool = True
+    ) -> List[Commission]:
+        """Get a page of commissions ordered by (created_at, id), starting after the `after` keyset."""
+        return self._pagina_keyset(self._condiciones(filters or {}), limit=limit, after=after, descending=descending)
+
+    def contar_con_filtros(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count commissions with filters."""
+        return self._contar(self._condiciones(filters or {}))
+
+    def contar_aproximado(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Estimate commissions with filters."""
+        return self._contar_aproximado(self._condiciones(filters or {}))
+
+    def agregar(self, commission: Commission) -> None:
+        """Add new commission."""
+        try:
+            self._insertar(commission)
+        except IntegrityError as e:
+            raise DomainException(f"Commission with ID {commission.id} already exists") from e
+
+    def actualizar(self, commission: Commission) -> None:
+        """Update existing commission."""
+        if not self._actualizar(commission):
+            raise DomainException(f"Commission with ID {commission.id} not found")
+
+    def eliminar(self, commission: Commission) -> None:
+        """Soft delete commission."""
+        with self._session() as session:
+            session.execute(
+                update(CommissionModel)
+                .where(CommissionModel.id == commission.id)
+                .values(is_deleted=True, updated_at=datetime.utcnow())
+            )
+            self._registrar_eventos(session, [commission])
+
+    def obtener_estadisticas_partner(self, partner_id: str) -> Dict[str, Any]:
+        """Get commission statistics for partner with a single aggregate query."""
+        stmt = select(
+            func.count(),
+            func.coalesce(func.sum(CommissionModel.monto), 0),
+            func.coalesce(func.sum(case(
+                (CommissionModel.status == CommissionStatus.PAID.value, CommissionModel.monto), else_=0
+            )), 0),
+            func.coalesce(func.sum(case(
+                (CommissionModel.status.in_([CommissionStatus.PENDING.value, CommissionStatus.APPROVED.value]),
+                 CommissionModel.monto),
+                else_=0
+            )), 0)
+        ).where(*self._condiciones({'partner_id': partner_id}))
+
+        with self._session() as session:
+            total, earned, paid, pending = session.execute(stmt).one()
+
+        total_earned = Decimal(str(earned))
+        return {
+            'total_commissions': total,
+            'total_earned': total_earned,
+            'total_paid': Decimal(str(paid)),
+            'total_pending': Decimal(str(pending)),
+            'average_commission': total_earned / total if total else Decimal('0')
+        }
+
+    def _condiciones(self, filters: Dict[str, Any]) -> List[Any]:
+        """Translate request filters into WHERE clauses."""
+        condiciones: List[Any] = [CommissionModel.is_deleted.is_(False)]
+
+        if 'partner_id' in filters:
+            condiciones.append(CommissionModel.partner_id == filters['partner_id'])
+
+        if 'status' in filters:
+            condiciones.append(CommissionModel.status == CommissionStatus(filters['status']).value)
+
+        if 'commission_type' in filters:
+            condiciones.append(CommissionModel.tipo == CommissionType(filters['commission_type']).value)
+
+        if filters.get('start_date'):
+            condiciones.append(CommissionModel.created_at >= filters['start_date'])
+
+        if filters.get('end_date'):
+            condiciones.append(CommissionModel.created_at <= filters['end_date'])
+
+        return condiciones
+
+    def _a_fila(self, commission: Commission) -> Dict[str, Any]:
+        detalles = {
+            'commission_rate': valor_a_json(commission.commission_rate),
+            'transaction_reference': valor_a_json(commission.transaction_reference),
+            'calculation_period': valor_a_json(commission.calculation_period),
+            'calculation_details': valor_a_json(commission.calculation_details),
+            'payment_details': valor_a_json(commission.payment_details)
+        }
+        detalles.update({
+            campo: valor_a_json(getattr(commission, f'_{campo}', None)) for campo in _TRACKING_FIELDS
+        })
+        return {
+            'id': commission.id,
+            'partner_id': commission.partner_id,
+            'monto': commission.commission_amount.amount,
+            'moneda': commission.commission_amount.currency,
+            'porcentaje': commission.commission_rate.rate,
+            'tipo': commission.commission_type.value,
+            'status': commission.status.value,
+            'transaction_id': commission.transaction_reference.transaction_id,
+            'fecha_calculo': commission.calculation_period.start_date,
+            'fecha_pago': commission.payment_date,
+            'descripcion': commission.calculation_period.period_name,
+            'detalles_json': detalles,
+            'created_at': commission.created_at,
+            'updated_at': commission.updated_at
+        }
+
+    def _a_entidad(self, registro: CommissionModel) -> Commission:
+        detalles = registro.detalles_json or {}
+        commission = Commission(
+            partner_id=registro.partner_id,
+            commission_amount=CommissionAmount(Decimal(registro.monto), registro.moneda),
+            commission_rate=valor_desde_json(CommissionRate, detalles['commission_rate']),
+            commission_type=CommissionType(registro.tipo),
+            transaction_reference=valor_desde_json(TransactionReference, detalles['transaction_reference']),
+            calculation_period=valor_desde_json(CommissionPeriod, detalles['calculation_period']),
+            commission_id=registro.id,
+            status=CommissionStatus(registro.status),
+            calculation_details=valor_desde_json(CommissionCalculation, detalles.get('calculation_details')),
+            payment_details=valor_desde_json(PaymentDetails, detalles.get('payment_details'))
+        )
+        for campo, tipo in _TRACKING_FIELDS.items():
+            setattr(commission, f'_{campo}', valor_desde_json(tipo, detalles.get(campo)))
+        commission._created_at = registro.created_at
+        commission._updated_at = registro.updated_at
+        # Loading is not a domain change
+        commission.limpiar_eventos()
+        return commission
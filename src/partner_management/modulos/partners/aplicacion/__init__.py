@@ -9,11 +9,13 @@ from .comandos.crear_partner import CrearPartner
 from .comandos.actualizar_partner import ActualizarPartner
 from .comandos.activar_partner import ActivarPartner
 from .comandos.desactivar_partner import DesactivarPartner
+from .comandos.reconstruir_profile_360 import ReconstruirProfile360
 
 # Query imports
 from .queries.obtener_partner import ObtenerPartner
 from .queries.obtener_todos_partners import ObtenerTodosPartners
 from .queries.obtener_profile_360 import ObtenerProfile360
+from .queries.obtener_profile_360_materializado import ObtenerProfile360Materializado
 
 # Event handler configuration
 # TODO: Fix pydispatcher dependency
@@ -29,11 +31,13 @@ __all__ = [
     'ActualizarPartner', 
     'ActivarPartner',
     'DesactivarPartner',
+    'ReconstruirProfile360',
     
     # Queries
     'ObtenerPartner',
     'ObtenerTodosPartners',
     'ObtenerProfile360',
+    'ObtenerProfile360Materializado',
     
     # Handlers module (commented out due to pydispatcher dependency)
     # 'handlers'
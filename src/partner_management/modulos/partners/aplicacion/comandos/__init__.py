@@ -6,10 +6,12 @@ from .crear_partner import CrearPartner
 from .actualizar_partner import ActualizarPartner
 from .activar_partner import ActivarPartner
 from .desactivar_partner import DesactivarPartner
+from .reconstruir_profile_360 import ReconstruirProfile360
 
 __all__ = [
     'CrearPartner',
     'ActualizarPartner',
     'ActivarPartner', 
-    'DesactivarPartner'
+    'DesactivarPartner',
+    'ReconstruirProfile360'
 ]
\ No newline at end of file
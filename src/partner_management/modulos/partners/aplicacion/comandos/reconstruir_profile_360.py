@@ -0,0 +1,35 @@
+"""
+Rebuild of the Profile360 read model from the partner, campaign and commission repositories.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from src.partner_management.seedwork.aplicacion.comandos import ejecutar_comando
+from ...infraestructura.profile_360_read_model import get_profile_360_read_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReconstruirProfile360:
+    """Command to rebuild the Profile360 read model from the state stored in the repositories."""
+    
+    batch_size: int = 5000
+
+
+@ejecutar_comando.register
+def handle_reconstruir_profile_360(comando: ReconstruirProfile360) -> int:
+    """
+    Handle RebuildProfile360 command.
+    """
+    logger.info("Executing RebuildProfile360 command")
+    
+    try:
+        replayed = get_profile_360_read_model().rebuild(batch_size=comando.batch_size)
+        logger.info(f"Profile360 read model rebuilt from {replayed} events")
+        return replayed
+    
+    except Exception as e:
+        logger.error(f"Failed to rebuild Profile360 read model: {str(e)}")
+        raise
@@ -5,9 +5,11 @@ Partner queries module initialization.
 from .obtener_partner import ObtenerPartner
 from .obtener_todos_partners import ObtenerTodosPartners  
 from .obtener_profile_360 import ObtenerProfile360
+from .obtener_profile_360_materializado import ObtenerProfile360Materializado
 
 __all__ = [
     'ObtenerPartner',
     'ObtenerTodosPartners',
-    'ObtenerProfile360'
+    'ObtenerProfile360',
+    'ObtenerProfile360Materializado'
 ]
\ No newline at end of file
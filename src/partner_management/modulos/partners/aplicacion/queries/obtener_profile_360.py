@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
 from src.partner_management.seedwork.aplicacion.queries import ejecutar_query
-from src.partner_management.seedwork.infraestructura.uow import UnitOfWork
+from src.partner_management.seedwork.dependencias import get_partner_repository
 from src.partner_management.seedwork.dominio.excepciones import DomainException
 from ...infraestructura.dto import PartnerDTO
 from .base import QueryPartner, QueryResultPartner
@@ -61,34 +61,33 @@ def handle_obtener_profile_360(query: ObtenerProfile360) -> RespuestaProfile360:
     try:
         # Validate input
         if not query.partner_id:
-            raise DomainException("Partner ID is required")
+            raise DomainException("Partner ID is required", error_code="MISSING_PARTNER_ID")
         
-        # Use Unit of Work for read operations
-        with UnitOfWork() as uow:
-            repo = uow.partners
-            
-            # Get base partner
-            partner = repo.obtener_por_id(query.partner_id)
-            if not partner:
-                logger.warning(f"Partner not found: {query.partner_id}")
-                return RespuestaProfile360(profile=None)
-            
-            # Convert to DTO
-            partner_dto = PartnerDTO.from_entity(partner)
-            
-            # Gather related data (mocked for now - would integrate with other modules)
-            profile_data = Profile360Data(
-                partner=partner_dto,
-                metricas=_get_partner_metrics(query.partner_id),
-                campanas_activas=_get_active_campaigns(query.partner_id),
-                campanas_completadas=_get_completed_campaigns(query.partner_id),
-                comisiones_pendientes=_get_pending_commissions(query.partner_id),
-                comisiones_pagadas=_get_paid_commissions(query.partner_id),
-                historial_actividad=_get_activity_history(query.partner_id)
-            )
-            
-            logger.info(f"Profile 360 retrieved successfully for partner: {partner.id}")
-            return RespuestaProfile360(profile=profile_data)
+        # Read-only, so the registered repository is used without a unit of work
+        repo = get_partner_repository()
+        
+        # Get base partner
+        partner = repo.obtener_por_id(query.partner_id)
+        if not partner:
+            logger.warning(f"Partner not found: {query.partner_id}")
+            return RespuestaProfile360(profile=None)
+        
+        # Convert to DTO
+        partner_dto = PartnerDTO.from_entity(partner)
+        
+        # Gather related data (mocked for now - would integrate with other modules)
+        profile_data = Profile360Data(
+            partner=partner_dto,
+            metricas=_get_partner_metrics(query.partner_id),
+            campanas_activas=_get_active_campaigns(query.partner_id),
+            campanas_completadas=_get_completed_campaigns(query.partner_id),
+            comisiones_pendientes=_get_pending_commissions(query.partner_id),
+            comisiones_pagadas=_get_paid_commissions(query.partner_id),
+            historial_actividad=_get_activity_history(query.partner_id)
+        )
+        
+        logger.info(f"Profile 360 retrieved successfully for partner: {partner.id}")
+        return RespuestaProfile360(profile=profile_data)
     
     except Exception as e:
         logger.error(f"Failed to get profile 360 for partner {query.partner_id}: {str(e)}")
@@ -0,0 +1,44 @@
+"""
+Serves the precomputed Profile360 document from the event-driven read model.
+
+Partners the live read model has not seen yet are projected from the repositories
+on demand, so every response has the same document shape.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+
+from src.partner_management.seedwork.aplicacion.queries import ejecutar_query
+from src.partner_management.seedwork.dominio.excepciones import DomainException
+from ...infraestructura.profile_360_read_model import get_profile_360_read_model
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ObtenerProfile360Materializado:
+    """Query to get the materialized 360-degree profile of a partner."""
+    partner_id: str
+
+
+@dataclass
+class RespuestaProfile360Materializado:
+    """Response for GetMaterializedProfile360 query."""
+    documento: Optional[Dict[str, Any]] = None
+
+
+@ejecutar_query.register
+def handle_obtener_profile_360_materializado(query: ObtenerProfile360Materializado) -> RespuestaProfile360Materializado:
+    """
+    Handle GetMaterializedProfile360 query.
+    """
+    if not query.partner_id:
+        raise DomainException("Partner ID is required", error_code="MISSING_PARTNER_ID")
+    
+    read_model = get_profile_360_read_model()
+    documento = read_model.get(query.partner_id)
+    if documento is None:
+        logger.debug(f"No materialized profile 360 for partner, projecting from repositories: {query.partner_id}")
+        documento = read_model.project(query.partner_id)
+    return RespuestaProfile360Materializado(documento=documento)
@@ -5,7 +5,7 @@ import logging
 from dataclasses import dataclass
 from typing import List, Optional
 
-from src.partner_management.seedwork.aplicacion.queries import ejecutar_query
+from src.partner_management.seedwork.aplicacion.queries import ejecutar_query, codificar_cursor, decodificar_cursor
 from src.partner_management.seedwork.infraestructura.uow import InMemoryUnitOfWork
 from ...infraestructura.dto import PartnerDTO
 from .base import QueryPartner, QueryResultPartner
@@ -13,9 +13,21 @@ from .base import QueryPartner, QueryResultPartner
 logger = logging.getLogger(__name__)
 
 
+# How the response total is computed
+TOTAL_EXACTO = 'exact'
+TOTAL_APROXIMADO = 'approximate'
+SIN_TOTAL = 'none'
+
+
 @dataclass
 class ObtenerTodosPartners:
-    """Query to get all partners with optional filtering."""
+    """
+    Query to get all partners with optional filtering.
+    
+    With a `limit` and no `offset` the query pages by keyset on (created_at, id):
+    pass the previous response's `next_cursor` as `cursor` to get the next page.
+    `offset` keeps the legacy offset pagination.
+    """
     
     status: Optional[str] = None
     tipo: Optional[str] = None
@@ -23,6 +35,8 @@ class ObtenerTodosPartners:
     pais: Optional[str] = None
     limit: Optional[int] = None
     offset: Optional[int] = None
+    cursor: Optional[str] = None
+    total: str = TOTAL_EXACTO
 
 
 @dataclass
@@ -30,9 +44,11 @@ class RespuestaObtenerTodosPartners:
     """Response for GetAllPartners query."""
     
     partners: List[PartnerDTO]
-    total: int
+    total: Optional[int]
     limit: Optional[int] = None
     offset: Optional[int] = None
+    next_cursor: Optional[str] = None
+    total_is_approximate: bool = False
 
 
 @ejecutar_query.register
@@ -58,15 +74,33 @@ def handle_obtener_todos_partners(query: ObtenerTodosPartners) -> RespuestaObten
             if query.pais:
                 filtros['pais'] = query.pais
             
-            # Get partners with filters
-            partners = repo.obtener_todos(
-                filtros=filtros,
-                limit=query.limit,
-                offset=query.offset
-            )
+            next_cursor = None
+            if query.limit and not query.offset:
+                # Keyset page: seek past the cursor, fetch one extra row to know if more follow
+                partners = repo.obtener_pagina(
+                    filtros=filtros,
+                    limit=query.limit + 1,
+                    after=decodificar_cursor(query.cursor) if query.cursor else None,
+                    descending=False
+                )
+                if len(partners) > query.limit:
+                    partners = partners[:query.limit]
+                    last = partners[-1]
+                    next_cursor = codificar_cursor(last.created_at, last.id)
+            else:
+                partners = repo.obtener_todos(
+                    filtros=filtros,
+                    limit=query.limit,
+                    offset=query.offset
+                )
             
             # Get total count for pagination
-            total = repo.contar_con_filtros(filtros)
+            if query.total == SIN_TOTAL:
+                total = None
+            elif query.total == TOTAL_APROXIMADO:
+                total = repo.contar_aproximado(filtros)
+            else:
+                total = repo.contar_con_filtros(filtros)
             
             # Convert to DTOs
             partner_dtos = [PartnerDTO.from_entity(partner) for partner in partners]
@@ -77,7 +111,9 @@ def handle_obtener_todos_partners(query: ObtenerTodosPartners) -> RespuestaObten
                 partners=partner_dtos,
                 total=total,
                 limit=query.limit,
-                offset=query.offset
+                offset=query.offset,
+                next_cursor=next_cursor,
+                total_is_approximate=query.total == TOTAL_APROXIMADO
             )
     
     except Exception as e:
@@ -4,12 +4,18 @@ Cada servicio maneja su propio estado y publica eventos para coordinar.
 """
 
 import logging
-import threading
-from typing import Dict, Any, List, Optional
+import time
+from typing import Callable, Dict, Any, List, Optional
 from datetime import datetime, timezone
 from enum import Enum
 from uuid import uuid4
 
+from src.partner_management.seedwork.infraestructura.saga_state_store import (
+    SagaStateConflictError,
+    SagaStateStore,
+    create_saga_state_store
+)
+
 
 class ChoreographySagaStatus(Enum):
     """Estados de una Saga de Choreography"""
@@ -26,26 +32,61 @@ class ChoreographySagaStatus(Enum):
 
 
 class SagaStateRepository:
-    """Repositorio para el estado de la Saga"""
+    """Repositorio para el estado de la Saga.
+    
+    Delegates to a pluggable SagaStateStore. Each state carries a "version" and
+    saving a state read from the repository is a compare-and-set on it.
+    """
     
-    def __init__(self):
+    def __init__(self, store: SagaStateStore = None, max_update_attempts: int = 5):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._memory_storage = {}
+        self.store = store or create_saga_state_store()
+        self.max_update_attempts = max_update_attempts
     
     def save(self, partner_id: str, saga_state: Dict[str, Any]):
-        """Guarda el estado de la Saga"""
-        self._memory_storage[partner_id] = saga_state
+        """Guarda el estado de la Saga; lanza SagaStateConflictError si otro escritor se adelantó"""
+        saga_state["version"] = self.store.save(partner_id, self._encode(saga_state), saga_state.get("version"))
         self.logger.debug(f"Saga state saved for partner {partner_id}")
     
     def get(self, partner_id: str) -> Optional[Dict[str, Any]]:
         """Obtiene el estado de la Saga"""
-        return self._memory_storage.get(partner_id)
+        saga_state = self.store.get(partner_id)
+        return self._decode(saga_state) if saga_state is not None else None
+    
+    def update(self, partner_id: str, mutator: Callable[[Dict[str, Any]], Optional[bool]]) -> Optional[Dict[str, Any]]:
+        """Aplica `mutator` al estado con reintentos ante conflictos de versión.
+        
+        The mutator edits the state in place and may return False to skip the write.
+        Returns the saved state, or None if there is no state or the write was skipped.
+        """
+        for _ in range(self.max_update_attempts):
+            saga_state = self.get(partner_id)
+            if saga_state is None or mutator(saga_state) is False:
+                return None
+            try:
+                self.save(partner_id, saga_state)
+                return saga_state
+            except SagaStateConflictError:
+                self.logger.debug(f"Saga state conflict for partner {partner_id}, retrying")
+        raise SagaStateConflictError(partner_id, saga_state.get("version"), None)
     
     def delete(self, partner_id: str):
         """Elimina el estado de la Saga"""
-        if partner_id in self._memory_storage:
-            del self._memory_storage[partner_id]
+        self.store.delete(partner_id)
         self.logger.debug(f"Saga state deleted for partner {partner_id}")
+    
+    def get_all(self) -> List[Dict[str, Any]]:
+        """Obtiene el estado de todas las Sagas"""
+        return [self._decode(saga_state) for saga_state in self.store.get_all()]
+    
+    def _encode(self, saga_state: Dict[str, Any]) -> Dict[str, Any]:
+        status = saga_state.get("status")
+        return {**saga_state, "status": status.value if isinstance(status, ChoreographySagaStatus) else status}
+    
+    def _decode(self, saga_state: Dict[str, Any]) -> Dict[str, Any]:
+        if saga_state.get("status") is not None:
+            saga_state["status"] = ChoreographySagaStatus(saga_state["status"])
+        return saga_state
 
 
 # Importar el dispatcher de Pulsar y SagaLog
@@ -53,9 +94,27 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../../../..'))
 from src.pulsar_event_dispatcher import PulsarEventDispatcher
+from src.idempotency_store import IdempotencyStore, create_idempotency_store
 from src.partner_management.seedwork.infraestructura.saga_log import get_saga_log, SagaLogLevel, SagaEventType
 from src.partner_management.seedwork.infraestructura.saga_audit_trail import get_saga_audit_trail
 from src.partner_management.seedwork.infraestructura.saga_metrics import get_saga_metrics
+from src.partner_management.seedwork.infraestructura.saga_timers import SagaTimerWheel, get_saga_timer_wheel
+
+
+# Estados en los que la saga ya se está compensando o quedó compensada
+COMPENSATION_STATUSES = [
+    ChoreographySagaStatus.COMPENSATING,
+    ChoreographySagaStatus.COMPENSATED
+]
+
+# Estados en los que una saga sigue en curso y su timeout debe compensarla
+TIMEOUT_ACTIVE_STATUSES = [
+    ChoreographySagaStatus.INITIATED,
+    ChoreographySagaStatus.PARTNER_REGISTERED,
+    ChoreographySagaStatus.CONTRACT_CREATED,
+    ChoreographySagaStatus.DOCUMENTS_VERIFIED,
+    ChoreographySagaStatus.CAMPAIGNS_ENABLED
+]
 
 
 class ChoreographySagaOrchestrator:
@@ -63,17 +122,18 @@ class ChoreographySagaOrchestrator:
     Orquestador de Saga basado en Choreography usando Apache Pulsar.
     """
     
-    def __init__(self, saga_state_repository: SagaStateRepository, event_dispatcher: PulsarEventDispatcher, timeout_seconds: int = 30):
+    def __init__(self, saga_state_repository: SagaStateRepository, event_dispatcher: PulsarEventDispatcher, timeout_seconds: int = 30,
+                 timer_wheel: SagaTimerWheel = None, processed_events: IdempotencyStore = None):
         self.saga_state_repository = saga_state_repository
         self.event_dispatcher = event_dispatcher
         self.logger = logging.getLogger(self.__class__.__name__)
         self.timeout_seconds = timeout_seconds
         
-        # Track processed events to prevent duplicates
-        self._processed_events = set()
+        # Track processed events to prevent duplicates (bounded, optionally durable)
+        self.processed_events = processed_events or create_idempotency_store("partner-management")
         
-        # Track saga timeouts
-        self._saga_timeouts = {}  # saga_id -> timeout_timer
+        # Saga timeouts share a single timer wheel instead of a thread per saga
+        self.timer_wheel = timer_wheel or get_saga_timer_wheel()
         
         # Initialize logging and monitoring components
         self.saga_log = get_saga_log()
@@ -82,22 +142,33 @@ class ChoreographySagaOrchestrator:
         
         # Suscribirse a eventos
         self._subscribe_to_events()
+        
+        # Re-armar los timeouts de las sagas que seguían en curso
+        self._rearm_saga_timeouts()
     
     def _subscribe_to_events(self):
         """Suscribirse a eventos de la Saga"""
         # Eventos normales
-        self.event_dispatcher.subscribe("PartnerRegistrationCompleted", self._handle_partner_registered)
-        self.event_dispatcher.subscribe("ContractCreated", self._handle_contract_created)
-        self.event_dispatcher.subscribe("DocumentsVerified", self._handle_documents_verified)
-        self.event_dispatcher.subscribe("CampaignsEnabledConfirmed", self._handle_campaigns_enabled)
-        self.event_dispatcher.subscribe("RecruitmentSetupConfirmed", self._handle_recruitment_setup)
+        self._subscribe("PartnerRegistrationCompleted", self._handle_partner_registered)
+        self._subscribe("ContractCreated", self._handle_contract_created)
+        self._subscribe("DocumentsVerified", self._handle_documents_verified)
+        self._subscribe("CampaignsEnabledConfirmed", self._handle_campaigns_enabled)
+        self._subscribe("RecruitmentSetupConfirmed", self._handle_recruitment_setup)
         
         # Eventos de compensación
-        self.event_dispatcher.subscribe("RecruitmentSetupCompensated", self._handle_recruitment_compensated)
-        self.event_dispatcher.subscribe("CampaignsDisabled", self._handle_campaigns_compensated)
-        self.event_dispatcher.subscribe("DocumentVerificationReverted", self._handle_documents_compensated)
-        self.event_dispatcher.subscribe("ContractCancelled", self._handle_contract_compensated)
-        self.event_dispatcher.subscribe("PartnerRegistrationReverted", self._handle_partner_compensated)
+        self._subscribe("RecruitmentSetupCompensated", self._handle_recruitment_compensated)
+        self._subscribe("CampaignsDisabled", self._handle_campaigns_compensated)
+        self._subscribe("DocumentVerificationReverted", self._handle_documents_compensated)
+        self._subscribe("ContractCancelled", self._handle_contract_compensated)
+        self._subscribe("PartnerRegistrationReverted", self._handle_partner_compensated)
+    
+    def _subscribe(self, event_type: str, handler):
+        """Suscribe un handler que ignora las entregas duplicadas del evento.
+        
+        The event is marked as processed before the handler runs and unmarked if it
+        raises, so the redelivery of the negatively acknowledged message retries it.
+        """
+        self.event_dispatcher.subscribe(event_type, self.processed_events.idempotent(event_type, handler))
     
     def start_partner_onboarding(self, partner_data: Dict[str, Any], correlation_id: str) -> str:
         """Inicia el proceso de onboarding de un partner"""
@@ -152,14 +223,7 @@ class ChoreographySagaOrchestrator:
             # Try to get saga_id from saga state
             saga_state = self.saga_state_repository.get(partner_id)
             saga_id = saga_state.get("saga_id") if saga_state else f"saga_{partner_id}"
-        event_id = f"partner_registered_{partner_id}_{event_data.get('causation_id', '')}"
         
-        # Check if we've already processed this event
-        if event_id in self._processed_events:
-            self.logger.info(f"Event already processed, skipping: {event_id}")
-            return
-            
-        self._processed_events.add(event_id)
         self.logger.info(f"Partner registered: {partner_id}")
         
         # Log event received and step started
@@ -172,9 +236,9 @@ class ChoreographySagaOrchestrator:
         self._update_saga_state(partner_id, ChoreographySagaStatus.PARTNER_REGISTERED, ["partner_registration"])
         
         # Log step completed
-        self.saga_log.step_completed(saga_id, partner_id, "partner_registration", event_data["correlation_id"], "partner-management")
+        step_duration_ms = self.saga_log.step_completed(saga_id, partner_id, "partner_registration", event_data["correlation_id"], "partner-management")
         self.audit_trail.record_step_success(saga_id, partner_id, "partner_registration", event_data["correlation_id"], "partner-management")
-        self.saga_metrics.record_saga_step(saga_id, "partner_registration", 0, True)  # Duration would need to be calculated
+        self.saga_metrics.record_saga_step(saga_id, "partner_registration", step_duration_ms or 0, True)
         self.saga_metrics.record_saga_event(saga_id)
         
         # Solicitar creación de contrato
@@ -198,14 +262,7 @@ class ChoreographySagaOrchestrator:
             # Try to get saga_id from saga state
             saga_state = self.saga_state_repository.get(partner_id)
             saga_id = saga_state.get("saga_id") if saga_state else f"saga_{partner_id}"
-        event_id = f"contract_created_{partner_id}_{event_data.get('causation_id', '')}"
         
-        # Check if we've already processed this event
-        if event_id in self._processed_events:
-            self.logger.info(f"Event already processed, skipping: {event_id}")
-            return
-            
-        self._processed_events.add(event_id)
         self.logger.info(f"Contract created for partner: {partner_id}")
         
         # Log event received and step started
@@ -218,9 +275,9 @@ class ChoreographySagaOrchestrator:
         self._update_saga_state(partner_id, ChoreographySagaStatus.CONTRACT_CREATED, ["contract_creation"])
         
         # Log step completed
-        self.saga_log.step_completed(saga_id, partner_id, "contract_creation", event_data["correlation_id"], "partner-management")
+        step_duration_ms = self.saga_log.step_completed(saga_id, partner_id, "contract_creation", event_data["correlation_id"], "partner-management")
         self.audit_trail.record_step_success(saga_id, partner_id, "contract_creation", event_data["correlation_id"], "partner-management")
-        self.saga_metrics.record_saga_step(saga_id, "contract_creation", 0, True)
+        self.saga_metrics.record_saga_step(saga_id, "contract_creation", step_duration_ms or 0, True)
         self.saga_metrics.record_saga_event(saga_id)
         
         # Solicitar verificación de documentos
@@ -253,14 +310,7 @@ class ChoreographySagaOrchestrator:
             # Try to get saga_id from saga state
             saga_state = self.saga_state_repository.get(partner_id)
             saga_id = saga_state.get("saga_id") if saga_state else f"saga_{partner_id}"
-        event_id = f"documents_verified_{partner_id}_{event_data.get('causation_id', '')}"
         
-        # Check if we've already processed this event
-        if event_id in self._processed_events:
-            self.logger.info(f"Event already processed, skipping: {event_id}")
-            return
-            
-        self._processed_events.add(event_id)
         self.logger.info(f"Documents verified for partner: {partner_id}")
         
         # Log event received and step started
@@ -273,9 +323,9 @@ class ChoreographySagaOrchestrator:
         self._update_saga_state(partner_id, ChoreographySagaStatus.DOCUMENTS_VERIFIED, ["document_verification"])
         
         # Log step completed
-        self.saga_log.step_completed(saga_id, partner_id, "document_verification", event_data["correlation_id"], "partner-management")
+        step_duration_ms = self.saga_log.step_completed(saga_id, partner_id, "document_verification", event_data["correlation_id"], "partner-management")
         self.audit_trail.record_step_success(saga_id, partner_id, "document_verification", event_data["correlation_id"], "partner-management")
-        self.saga_metrics.record_saga_step(saga_id, "document_verification", 0, True)
+        self.saga_metrics.record_saga_step(saga_id, "document_verification", step_duration_ms or 0, True)
         self.saga_metrics.record_saga_event(saga_id)
         
         # Habilitar campañas
@@ -308,14 +358,7 @@ class ChoreographySagaOrchestrator:
             # Try to get saga_id from saga state
             saga_state = self.saga_state_repository.get(partner_id)
             saga_id = saga_state.get("saga_id") if saga_state else f"saga_{partner_id}"
-        event_id = f"campaigns_enabled_{partner_id}_{event_data.get('causation_id', '')}"
         
-        # Check if we've already processed this event
-        if event_id in self._processed_events:
-            self.logger.info(f"Event already processed, skipping: {event_id}")
-            return
-            
-        self._processed_events.add(event_id)
         self.logger.info(f"Campaigns enabled for partner: {partner_id}")
         
         # Log event received and step started
@@ -328,9 +371,9 @@ class ChoreographySagaOrchestrator:
         self._update_saga_state(partner_id, ChoreographySagaStatus.CAMPAIGNS_ENABLED, ["campaigns_enabled"])
         
         # Log step completed
-        self.saga_log.step_completed(saga_id, partner_id, "campaigns_enabled", event_data["correlation_id"], "partner-management")
+        step_duration_ms = self.saga_log.step_completed(saga_id, partner_id, "campaigns_enabled", event_data["correlation_id"], "partner-management")
         self.audit_trail.record_step_success(saga_id, partner_id, "campaigns_enabled", event_data["correlation_id"], "partner-management")
-        self.saga_metrics.record_saga_step(saga_id, "campaigns_enabled", 0, True)
+        self.saga_metrics.record_saga_step(saga_id, "campaigns_enabled", step_duration_ms or 0, True)
         self.saga_metrics.record_saga_event(saga_id)
         
         # Configurar reclutamiento
@@ -363,14 +406,7 @@ class ChoreographySagaOrchestrator:
             # Try to get saga_id from saga state
             saga_state = self.saga_state_repository.get(partner_id)
             saga_id = saga_state.get("saga_id") if saga_state else f"saga_{partner_id}"
-        event_id = f"recruitment_setup_{partner_id}_{event_data.get('causation_id', '')}"
         
-        # Check if we've already processed this event
-        if event_id in self._processed_events:
-            self.logger.info(f"Event already processed, skipping: {event_id}")
-            return
-            
-        self._processed_events.add(event_id)
         self.logger.info(f"Recruitment setup completed for partner: {partner_id}")
         
         # Log event received and step started
@@ -383,9 +419,9 @@ class ChoreographySagaOrchestrator:
         self._update_saga_state(partner_id, ChoreographySagaStatus.RECRUITMENT_SETUP, ["recruitment_setup"])
         
         # Log step completed
-        self.saga_log.step_completed(saga_id, partner_id, "recruitment_setup", event_data["correlation_id"], "partner-management")
+        step_duration_ms = self.saga_log.step_completed(saga_id, partner_id, "recruitment_setup", event_data["correlation_id"], "partner-management")
         self.audit_trail.record_step_success(saga_id, partner_id, "recruitment_setup", event_data["correlation_id"], "partner-management")
-        self.saga_metrics.record_saga_step(saga_id, "recruitment_setup", 0, True)
+        self.saga_metrics.record_saga_step(saga_id, "recruitment_setup", step_duration_ms or 0, True)
         self.saga_metrics.record_saga_event(saga_id)
         
         # Completar la Saga
@@ -393,9 +429,7 @@ class ChoreographySagaOrchestrator:
     
     def _update_saga_state(self, partner_id: str, status: ChoreographySagaStatus, completed_steps: List[str] = None):
         """Actualiza el estado de la Saga"""
-        saga_state = self.saga_state_repository.get(partner_id)
-        
-        if saga_state:
+        def apply(saga_state: Dict[str, Any]):
             saga_state["status"] = status
             saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
             
@@ -406,12 +440,17 @@ class ChoreographySagaOrchestrator:
                 existing_steps = set(saga_state["completed_steps"])
                 new_steps = [step for step in completed_steps if step not in existing_steps]
                 saga_state["completed_steps"].extend(new_steps)
-            
-            self.saga_state_repository.save(partner_id, saga_state)
+        
+        self.saga_state_repository.update(partner_id, apply)
     
     def _complete_saga(self, partner_id: str, correlation_id: str, causation_id: str):
         """Completa la Saga exitosamente"""
-        saga_state = self.saga_state_repository.get(partner_id)
+        def apply(saga_state: Dict[str, Any]):
+            saga_state["status"] = ChoreographySagaStatus.COMPLETED
+            saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
+            saga_state.pop("timeout_at", None)
+        
+        saga_state = self.saga_state_repository.update(partner_id, apply)
         
         if saga_state:
             saga_id = saga_state.get("saga_id")
@@ -420,10 +459,6 @@ class ChoreographySagaOrchestrator:
             if saga_id:
                 self._clear_saga_timeout(saga_id)
             
-            saga_state["status"] = ChoreographySagaStatus.COMPLETED
-            saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-            self.saga_state_repository.save(partner_id, saga_state)
-            
             # Record saga completion in metrics
             if saga_id:
                 self.saga_metrics.record_saga_completion(saga_id, "COMPLETED")
@@ -436,55 +471,74 @@ class ChoreographySagaOrchestrator:
     
     def update(self, partner_id: str, updates: Dict[str, Any]):
         """Actualiza el estado de la Saga con los cambios especificados"""
-        saga_state = self.saga_state_repository.get(partner_id)
-        
-        if saga_state:
+        def apply(saga_state: Dict[str, Any]):
             saga_state.update(updates)
             saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-            self.saga_state_repository.save(partner_id, saga_state)
+        
+        self.saga_state_repository.update(partner_id, apply)
     
     def _set_saga_timeout(self, saga_id: str, partner_id: str, correlation_id: str):
         """Configura un timeout para la saga"""
-        def timeout_handler():
-            self.logger.warning(f"Saga {saga_id} timed out after {self.timeout_seconds} seconds")
-            
-            # Check if saga is still active
-            saga_state = self.saga_state_repository.get(partner_id)
-            if saga_state and saga_state.get("status") in [ChoreographySagaStatus.INITIATED, 
-                                                          ChoreographySagaStatus.PARTNER_REGISTERED,
-                                                          ChoreographySagaStatus.CONTRACT_CREATED,
-                                                          ChoreographySagaStatus.DOCUMENTS_VERIFIED,
-                                                          ChoreographySagaStatus.CAMPAIGNS_ENABLED]:
-                # Initiate compensation
-                self._initiate_compensation(partner_id, "timeout", correlation_id)
-                
-                # Log timeout
-                self.saga_log.saga_failed(saga_id, partner_id, correlation_id, "partner-management", 
-                                        {"reason": "timeout", "timeout_seconds": self.timeout_seconds})
-                self.audit_trail.record_saga_failure(saga_id, partner_id, correlation_id, "partner-management", 
-                                                   {"reason": "timeout", "timeout_seconds": self.timeout_seconds})
-        
-        # Cancel existing timeout if any
-        if saga_id in self._saga_timeouts:
-            self._saga_timeouts[saga_id].cancel()
-        
-        # Set new timeout
-        timer = threading.Timer(self.timeout_seconds, timeout_handler)
-        timer.start()
-        self._saga_timeouts[saga_id] = timer
+        # The deadline is persisted with the saga so it survives a restart
+        timeout_at = time.time() + self.timeout_seconds
+        self.update(partner_id, {"timeout_at": timeout_at})
+        
+        self.timer_wheel.schedule_at(saga_id, timeout_at, self._handle_saga_timeout, saga_id, partner_id, correlation_id)
         
         self.logger.debug(f"Timeout set for saga {saga_id}: {self.timeout_seconds} seconds")
     
+    def _handle_saga_timeout(self, saga_id: str, partner_id: str, correlation_id: str):
+        """Compensa la saga si sigue en curso al vencer su timeout"""
+        self.logger.warning(f"Saga {saga_id} timed out after {self.timeout_seconds} seconds")
+        
+        # Check if saga is still active
+        saga_state = self.saga_state_repository.get(partner_id)
+        if saga_state and saga_state.get("saga_id") == saga_id and saga_state.get("status") in TIMEOUT_ACTIVE_STATUSES:
+            # Initiate compensation
+            self._initiate_compensation(partner_id, "timeout", correlation_id, expected_statuses=TIMEOUT_ACTIVE_STATUSES)
+            
+            # Log timeout
+            self.saga_log.saga_failed(saga_id, partner_id, correlation_id, "partner-management", 
+                                    {"reason": "timeout", "timeout_seconds": self.timeout_seconds})
+            self.audit_trail.record_saga_failure(saga_id, partner_id, correlation_id, "partner-management", 
+                                               {"reason": "timeout", "timeout_seconds": self.timeout_seconds})
+    
     def _clear_saga_timeout(self, saga_id: str):
         """Cancela el timeout de una saga"""
-        if saga_id in self._saga_timeouts:
-            self._saga_timeouts[saga_id].cancel()
-            del self._saga_timeouts[saga_id]
+        if self.timer_wheel.cancel(saga_id):
             self.logger.debug(f"Timeout cleared for saga {saga_id}")
     
-    def _initiate_compensation(self, partner_id: str, failed_step: str, correlation_id: str):
+    def _rearm_saga_timeouts(self):
+        """Vuelve a programar los timeouts persistidos de las sagas en curso"""
+        rearmed = 0
+        for saga_state in self.saga_state_repository.get_all():
+            timeout_at = saga_state.get("timeout_at")
+            if timeout_at is None or saga_state.get("status") not in TIMEOUT_ACTIVE_STATUSES:
+                continue
+            # Deadlines that passed while the service was down fire on the next tick
+            self.timer_wheel.schedule_at(saga_state["saga_id"], timeout_at, self._handle_saga_timeout,
+                                         saga_state["saga_id"], saga_state["partner_id"], saga_state.get("correlation_id"))
+            rearmed += 1
+        
+        if rearmed:
+            self.logger.info(f"Re-armed {rearmed} saga timeouts")
+    
+    def _initiate_compensation(self, partner_id: str, failed_step: str, correlation_id: str,
+                               expected_statuses: List[ChoreographySagaStatus] = None):
         """Inicia la compensación de la Saga"""
-        saga_state = self.saga_state_repository.get(partner_id)
+        def apply(saga_state: Dict[str, Any]):
+            # Checked inside the compare-and-set: a concurrent handler or replica may
+            # have advanced, completed or already compensated the saga
+            if saga_state.get("status") in COMPENSATION_STATUSES:
+                return False
+            if expected_statuses is not None and saga_state.get("status") not in expected_statuses:
+                return False
+            saga_state["status"] = ChoreographySagaStatus.COMPENSATING
+            saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
+            saga_state["failed_steps"] = saga_state.get("failed_steps", []) + [failed_step]
+            saga_state.pop("timeout_at", None)
+        
+        saga_state = self.saga_state_repository.update(partner_id, apply)
         
         if saga_state:
             saga_id = saga_state.get("saga_id")
@@ -493,11 +547,6 @@ class ChoreographySagaOrchestrator:
             if saga_id:
                 self._clear_saga_timeout(saga_id)
             
-            saga_state["status"] = ChoreographySagaStatus.COMPENSATING
-            saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-            saga_state["failed_steps"] = saga_state.get("failed_steps", []) + [failed_step]
-            self.saga_state_repository.save(partner_id, saga_state)
-            
             # Record saga failure in metrics
             if saga_id:
                 self.saga_metrics.record_saga_completion(saga_id, "FAILED")
@@ -527,9 +576,7 @@ class ChoreographySagaOrchestrator:
         
         # Compensate in reverse order (LIFO)
         compensation_steps = list(reversed(completed_steps))
-        saga_state["compensation_steps"] = compensation_steps
-        saga_state["compensation_index"] = 0
-        self.saga_state_repository.save(partner_id, saga_state)
+        self.update(partner_id, {"compensation_steps": compensation_steps, "compensation_index": 0})
         
         self.logger.info(f"Starting compensation for {len(compensation_steps)} steps: {compensation_steps}")
         
@@ -579,12 +626,11 @@ class ChoreographySagaOrchestrator:
     
     def _complete_compensation(self, partner_id: str, saga_id: str, correlation_id: str):
         """Completa el proceso de compensación"""
-        saga_state = self.saga_state_repository.get(partner_id)
-        if saga_state:
+        def apply(saga_state: Dict[str, Any]):
             saga_state["status"] = ChoreographySagaStatus.COMPENSATED
             saga_state["updated_at"] = datetime.now(timezone.utc).isoformat()
-            self.saga_state_repository.save(partner_id, saga_state)
-            
+        
+        if self.saga_state_repository.update(partner_id, apply):
             # Log compensation completion
             self.saga_log.saga_completed(saga_id, partner_id, correlation_id, "partner-management", 
                                        {"status": "COMPENSATED", "reason": "compensation_completed"})
@@ -600,13 +646,6 @@ class ChoreographySagaOrchestrator:
         saga_id = event_data.get("saga_id")
         correlation_id = event_data["correlation_id"]
         
-        # Check for duplicate events
-        event_id = f"recruitment_compensated_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Recruitment compensation event already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Recruitment setup compensated for partner: {partner_id}")
         
         # Log step completed
@@ -622,13 +661,6 @@ class ChoreographySagaOrchestrator:
         saga_id = event_data.get("saga_id")
         correlation_id = event_data["correlation_id"]
         
-        # Check for duplicate events
-        event_id = f"campaigns_compensated_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Campaigns compensation event already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Campaigns disabled for partner: {partner_id}")
         
         # Log step completed
@@ -644,13 +676,6 @@ class ChoreographySagaOrchestrator:
         saga_id = event_data.get("saga_id")
         correlation_id = event_data["correlation_id"]
         
-        # Check for duplicate events
-        event_id = f"documents_compensated_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Documents compensation event already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Document verification reverted for partner: {partner_id}")
         
         # Log step completed
@@ -666,13 +691,6 @@ class ChoreographySagaOrchestrator:
         saga_id = event_data.get("saga_id")
         correlation_id = event_data["correlation_id"]
         
-        # Check for duplicate events
-        event_id = f"contract_compensated_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Contract compensation event already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Contract cancelled for partner: {partner_id}")
         
         # Log step completed
@@ -688,13 +706,6 @@ class ChoreographySagaOrchestrator:
         saga_id = event_data.get("saga_id")
         correlation_id = event_data["correlation_id"]
         
-        # Check for duplicate events
-        event_id = f"partner_compensated_{partner_id}_{event_data.get('causation_id', '')}"
-        if event_id in self._processed_events:
-            self.logger.info(f"Partner compensation event already processed, skipping: {event_id}")
-            return
-        self._processed_events.add(event_id)
-        
         self.logger.info(f"Partner registration reverted for partner: {partner_id}")
         
         # Log step completed
@@ -706,14 +717,12 @@ class ChoreographySagaOrchestrator:
     
     def _advance_compensation(self, partner_id: str, saga_id: str, correlation_id: str):
         """Avanza al siguiente paso de compensación"""
-        saga_state = self.saga_state_repository.get(partner_id)
-        if not saga_state:
-            return
+        def apply(saga_state: Dict[str, Any]):
+            # Increment compensation index
+            saga_state["compensation_index"] = saga_state.get("compensation_index", 0) + 1
         
-        # Increment compensation index
-        compensation_index = saga_state.get("compensation_index", 0) + 1
-        saga_state["compensation_index"] = compensation_index
-        self.saga_state_repository.save(partner_id, saga_state)
+        if not self.saga_state_repository.update(partner_id, apply):
+            return
         
         # Execute next compensation step
         self._execute_compensation_step(partner_id, saga_id, correlation_id)
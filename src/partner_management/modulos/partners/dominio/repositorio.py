@@ -3,7 +3,8 @@ Partner repository interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from datetime import datetime
+from typing import List, Optional, Dict, Tuple
 from .entidades import Partner
 from .objetos_valor import PartnerStatus, PartnerType
 
@@ -31,11 +32,26 @@ class PartnerRepository(ABC):
         """Get all partners with optional filtering."""
         pass
 
+    @abstractmethod
+    def obtener_pagina(
+        self,
+        filtros: Optional[Dict[str, str]] = None,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        descending: bool = True
+    ) -> List[Partner]:
+        """Get a page of partners ordered by (created_at, id), starting after the `after` keyset."""
+        pass
+
     @abstractmethod
     def contar_con_filtros(self, filtros: Optional[Dict[str, str]] = None) -> int:
         """Count partners with filters."""
         pass
 
+    def contar_aproximado(self, filtros: Optional[Dict[str, str]] = None) -> int:
+        """Estimate partners matching filters; implementations may trade accuracy for speed."""
+        return self.contar_con_filtros(filtros)
+
     @abstractmethod
     def agregar(self, partner: Partner) -> None:
         """Add new partner."""
@@ -53,14 +53,14 @@ class PartnerDTO:
         
         return cls(
             id=partner.id,
-            nombre=partner.name.value,
+            nombre=partner.nombre.value,
             email=partner.email.value,
-            telefono=partner.phone.value,
-            tipo=partner.type.value,
+            telefono=partner.telefono.value,
+            tipo=partner.tipo.value,
             status=partner.status.value,
-            direccion=partner.direccion,
-            ciudad=partner.ciudad,
-            pais=partner.pais,
+            direccion=partner.direccion.direccion if partner.direccion else None,
+            ciudad=partner.direccion.ciudad if partner.direccion else None,
+            pais=partner.direccion.pais if partner.direccion else None,
             fecha_creacion=partner.created_at.isoformat() if partner.created_at else None,
             fecha_actualizacion=partner.updated_at.isoformat() if partner.updated_at else None,
             validaciones=validaciones,
@@ -0,0 +1,643 @@
+"""
+Materialized Profile360 read model maintained from partner, campaign and commission domain events.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+from pydispatch import dispatcher
+
+logger = logging.getLogger(__name__)
+
+# Events equivalent to the stored state of one partner, or of every partner with None
+HistorySource = Callable[[Optional[str]], Iterable[Dict[str, Any]]]
+
+
+PARTNER_EVENTS = (
+    'PartnerCreated', 'PartnerStatusChanged', 'PartnerActivated', 'PartnerDeactivated',
+    'PartnerUpdated', 'PartnerSuspended', 'PartnerDeleted'
+)
+CAMPAIGN_EVENTS = (
+    'CampaignCreated', 'CampaignStatusChanged', 'CampaignActivated', 'CampaignPaused',
+    'CampaignCompleted', 'CampaignCancelled'
+)
+COMMISSION_EVENTS = (
+    'CommissionCreated', 'CommissionStatusChanged', 'CommissionApproved', 'CommissionPaid',
+    'CommissionCancelled', 'CommissionDisputed', 'CommissionHeld', 'CommissionReleased',
+    'CommissionRecalculated', 'CommissionAdjusted'
+)
+PROFILE_360_EVENTS = PARTNER_EVENTS + CAMPAIGN_EVENTS + COMMISSION_EVENTS
+
+# Status implied by events that do not carry one
+_CAMPAIGN_EVENT_STATUS = {
+    'CampaignCreated': 'DRAFT',
+    'CampaignActivated': 'ACTIVE',
+    'CampaignPaused': 'PAUSED',
+    'CampaignCompleted': 'COMPLETED',
+    'CampaignCancelled': 'CANCELLED'
+}
+_COMMISSION_EVENT_STATUS = {
+    'CommissionCreated': 'PENDING',
+    'CommissionApproved': 'APPROVED',
+    'CommissionPaid': 'PAID',
+    'CommissionCancelled': 'CANCELLED',
+    'CommissionDisputed': 'DISPUTED',
+    'CommissionHeld': 'ON_HOLD',
+    'CommissionReleased': 'PENDING'
+}
+_PARTNER_EVENT_STATUS = {
+    'PartnerActivated': 'ACTIVO',
+    'PartnerDeactivated': 'INACTIVO',
+    'PartnerSuspended': 'SUSPENDIDO'
+}
+
+# Daily trend bucket counters
+_CAMPAIGNS_CREATED, _CAMPAIGNS_COMPLETED, _COMMISSIONS_EARNED, _COMMISSIONS_PAID = range(4)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value)) if value is not None else Decimal('0')
+    except (InvalidOperation, ValueError):
+        return Decimal('0')
+
+
+def _event_day(occurred_on: Optional[str]) -> date:
+    try:
+        return datetime.fromisoformat(occurred_on).date()
+    except (TypeError, ValueError):
+        return datetime.now(timezone.utc).date()
+
+
+@dataclass
+class PartnerProfile360View:
+    """Incrementally maintained aggregates of one partner."""
+
+    partner_id: str
+    partner: Dict[str, Any] = field(default_factory=dict)
+    campaign_status: Dict[str, str] = field(default_factory=dict)
+    campaign_budget: Dict[str, Decimal] = field(default_factory=dict)
+    campaign_counts: Dict[str, int] = field(default_factory=dict)
+    commission_status: Dict[str, str] = field(default_factory=dict)
+    commission_amount: Dict[str, Decimal] = field(default_factory=dict)
+    commission_counts: Dict[str, int] = field(default_factory=dict)
+    commission_sums: Dict[str, Decimal] = field(default_factory=dict)
+    total_budget: Decimal = Decimal('0')
+    # Day ordinal -> [campaigns created, campaigns completed, commissions earned, commissions paid]
+    daily: Dict[int, List[Any]] = field(default_factory=dict)
+    events_applied: int = 0
+    last_event_id: Optional[str] = None
+    last_event_at: Optional[str] = None
+    projected_at: Optional[str] = None
+
+    def set_campaign_status(self, campaign_id: str, status: str) -> Optional[str]:
+        old_status = self.campaign_status.get(campaign_id)
+        if old_status == status:
+            return old_status
+        if old_status is not None:
+            self.campaign_counts[old_status] -= 1
+        self.campaign_status[campaign_id] = status
+        self.campaign_counts[status] = self.campaign_counts.get(status, 0) + 1
+        return old_status
+
+    def set_commission(self, commission_id: str, status: Optional[str] = None, amount: Optional[Decimal] = None) -> Optional[str]:
+        old_status = self.commission_status.get(commission_id)
+        old_amount = self.commission_amount.get(commission_id, Decimal('0'))
+        new_status = status or old_status or 'PENDING'
+        new_amount = old_amount if amount is None else amount
+        if old_status is not None:
+            self.commission_counts[old_status] -= 1
+            self.commission_sums[old_status] -= old_amount
+        self.commission_status[commission_id] = new_status
+        self.commission_amount[commission_id] = new_amount
+        self.commission_counts[new_status] = self.commission_counts.get(new_status, 0) + 1
+        self.commission_sums[new_status] = self.commission_sums.get(new_status, Decimal('0')) + new_amount
+        return old_status
+
+    def bump(self, day: date, counter: int, amount: Any = 1):
+        bucket = self.daily.get(day.toordinal())
+        if bucket is None:
+            bucket = self.daily[day.toordinal()] = [0, 0, Decimal('0'), Decimal('0')]
+        bucket[counter] += amount
+
+    def prune(self, oldest_day: int):
+        for day in [day for day in self.daily if day < oldest_day]:
+            del self.daily[day]
+
+    def to_document(self, window_days: int, today: Optional[date] = None) -> Dict[str, Any]:
+        today = today or datetime.now(timezone.utc).date()
+        total_campaigns = len(self.campaign_status)
+        completed_campaigns = self.campaign_counts.get('COMPLETED', 0)
+        total_commissions = len(self.commission_status)
+        total_earned = sum(self.commission_sums.values(), Decimal('0'))
+        paid_amount = self.commission_sums.get('PAID', Decimal('0'))
+        pending_amount = self.commission_sums.get('PENDING', Decimal('0')) + self.commission_sums.get('APPROVED', Decimal('0'))
+        disputed = self.commission_counts.get('DISPUTED', 0)
+        cancelled = self.commission_counts.get('CANCELLED', 0)
+
+        return {
+            'partner_id': self.partner_id,
+            'partner': dict(self.partner),
+            'campaigns': {
+                'total': total_campaigns,
+                'active': self.campaign_counts.get('ACTIVE', 0),
+                'completed': completed_campaigns,
+                'status_breakdown': {s: n for s, n in self.campaign_counts.items() if n},
+                'completion_rate': completed_campaigns / total_campaigns if total_campaigns else 0,
+                'total_budget': str(self.total_budget)
+            },
+            'commissions': {
+                'total': total_commissions,
+                'status_breakdown': {s: n for s, n in self.commission_counts.items() if n},
+                'earnings_by_status': {s: str(a) for s, a in self.commission_sums.items() if self.commission_counts.get(s)},
+                'total_earned': str(total_earned),
+                'paid_amount': str(paid_amount),
+                'pending_amount': str(pending_amount),
+                'average_commission': str(total_earned / total_commissions) if total_commissions else '0'
+            },
+            'trends': self._trends(window_days, today),
+            # Current state only, so a rebuild reproduces them; past transitions are not counted
+            'risk_inputs': {
+                'disputed_commissions': disputed,
+                'cancelled_commissions': cancelled,
+                'held_commissions': self.commission_counts.get('ON_HOLD', 0),
+                'cancelled_campaigns': self.campaign_counts.get('CANCELLED', 0),
+                'suspended': self.partner.get('status') == 'SUSPENDIDO',
+                'dispute_rate': disputed / total_commissions if total_commissions else 0,
+                'cancellation_rate': cancelled / total_commissions if total_commissions else 0
+            },
+            'freshness': {
+                'last_event_id': self.last_event_id,
+                'last_event_at': self.last_event_at,
+                'projected_at': self.projected_at,
+                'events_applied': self.events_applied
+            }
+        }
+
+    def _trends(self, window_days: int, today: date) -> Dict[str, Any]:
+        def window(start_day: int, end_day: int) -> Dict[str, Any]:
+            totals = [0, 0, Decimal('0'), Decimal('0')]
+            for day, bucket in self.daily.items():
+                if start_day <= day < end_day:
+                    for i, value in enumerate(bucket):
+                        totals[i] += value
+            return {
+                'campaigns_created': totals[_CAMPAIGNS_CREATED],
+                'campaigns_completed': totals[_CAMPAIGNS_COMPLETED],
+                'commissions_earned': str(totals[_COMMISSIONS_EARNED]),
+                'commissions_paid': str(totals[_COMMISSIONS_PAID])
+            }
+
+        end = today.toordinal() + 1
+        return {
+            'window_days': window_days,
+            'last_30_days': window(end - 30, end),
+            'previous_30_days': window(end - 60, end - 30),
+            'monthly': [
+                {'period_start': date.fromordinal(end - (i + 1) * 30).isoformat(), **window(end - (i + 1) * 30, end - i * 30)}
+                for i in reversed(range(max(window_days // 30, 1)))
+            ]
+        }
+
+
+class _ProjectionState:
+    """Views plus the ownership indexes needed for events that omit the partner id."""
+
+    def __init__(self):
+        self.views: Dict[str, PartnerProfile360View] = {}
+        self.campaign_owner: Dict[str, str] = {}
+        self.commission_owner: Dict[str, str] = {}
+
+
+class Profile360ReadModel:
+    """
+    Per-partner Profile360 documents maintained incrementally from domain events.
+
+    Each event updates counts, sums and daily trend buckets of one partner in O(1),
+    so serving the profile is a dictionary lookup. The repositories stay the source
+    of truth: `history_source` yields events equivalent to their stored state, which
+    `rebuild` replays into a fresh state that replaces the live one atomically and
+    `project` uses for partners the live state has not seen.
+
+    Rebuilding is a lossy re-projection, not an event replay. Counts, sums and risk
+    inputs only depend on current state and come out identical, but trend buckets
+    of completed campaigns and paid commissions are re-dated to the last update of
+    the stored record, and transitions the stored state no longer shows are lost.
+    """
+
+    def __init__(self, window_days: int = 180, history_source: Optional[HistorySource] = None):
+        self.window_days = window_days
+        self.history_source = history_source
+        self._state = _ProjectionState()
+        self._lock = threading.RLock()
+        self._rebuilding = False
+        self._rebuild_backlog: List[Dict[str, Any]] = []
+        self._subscribed = False
+
+    # ------------------------------------------------------------------
+    # Event intake
+    # ------------------------------------------------------------------
+
+    def subscribe(self) -> None:
+        """Connect the projection to the PyDispatcher signals of the events it consumes."""
+        if self._subscribed:
+            return
+        for event_name in PROFILE_360_EVENTS:
+            dispatcher.connect(self._handle_signal, signal=event_name, weak=False)
+        self._subscribed = True
+
+    def unsubscribe(self) -> None:
+        if not self._subscribed:
+            return
+        for event_name in PROFILE_360_EVENTS:
+            dispatcher.disconnect(self._handle_signal, signal=event_name, weak=False)
+        self._subscribed = False
+
+    def _handle_signal(self, signal=None, event=None, **kwargs):
+        try:
+            self.apply(event if event is not None else kwargs.get('evento'), event_name=signal)
+        except Exception as e:
+            # The projection never breaks the write path; a rebuild repairs it
+            logger.error(f"Failed to project {signal} into Profile360 read model: {str(e)}")
+
+    def apply(self, event: Any, event_name: Optional[str] = None) -> bool:
+        """Apply a domain event (or its to_dict() form); False if it does not concern the read model."""
+        record = self._to_record(event, event_name)
+        if record is None:
+            return False
+
+        with self._lock:
+            if self._rebuilding:
+                # Identified, so the rebuild can tell it apart from the replayed history
+                record = self._with_event_id(record)
+                self._rebuild_backlog.append(record)
+            return self._apply_record(self._state, record)
+
+    def _to_record(self, event: Any, event_name: Optional[str]) -> Optional[Dict[str, Any]]:
+        if event is None:
+            return None
+        record = event if isinstance(event, dict) else event.to_dict()
+        name = record.get('event_name') or event_name
+        if name not in PROFILE_360_EVENTS:
+            return None
+        if record.get('event_name') != name:
+            record = {**record, 'event_name': name}
+        return record
+
+    @staticmethod
+    def _with_event_id(record: Dict[str, Any]) -> Dict[str, Any]:
+        metadata = record.get('metadata') or {}
+        if metadata.get('event_id'):
+            return record
+        return {**record, 'metadata': {**metadata, 'event_id': str(uuid.uuid4())}}
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, partner_id: str) -> Optional[Dict[str, Any]]:
+        """Precomputed Profile360 document of a partner, or None if it has never been projected."""
+        with self._lock:
+            view = self._state.views.get(partner_id)
+            return view.to_document(self.window_days) if view is not None else None
+
+    def project(self, partner_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Profile360 document of one partner projected from `history_source`, or None if it does not exist.
+
+        The live state is left untouched, so this serves partners written before the
+        read model subscribed without racing the events it is applying.
+        """
+        if self.history_source is None:
+            return None
+        state = _ProjectionState()
+        for event in self.history_source(partner_id):
+            record = self._to_record(event, None)
+            if record is not None:
+                self._apply_record(state, record)
+        view = state.views.get(partner_id)
+        return view.to_document(self.window_days) if view is not None else None
+
+    def __len__(self) -> int:
+        return len(self._state.views)
+
+    # ------------------------------------------------------------------
+    # Rebuild
+    # ------------------------------------------------------------------
+
+    def rebuild(self, events: Optional[Iterable[Any]] = None, batch_size: int = 5000) -> int:
+        """
+        Replay history into a fresh state and swap it in; returns the number of events replayed.
+
+        Without `events` the history comes from `history_source`. Events applied while
+        the rebuild runs are re-applied on top of the new state before the swap, except
+        those the replayed history already contained.
+        """
+        if events is None:
+            if self.history_source is None:
+                raise ValueError("No event history to rebuild the Profile360 read model from")
+            events = self.history_source(None)
+
+        with self._lock:
+            if self._rebuilding:
+                raise RuntimeError("A Profile360 rebuild is already running")
+            self._rebuilding = True
+            self._rebuild_backlog = []
+
+        started = time.perf_counter()
+        state = _ProjectionState()
+        replayed_ids: Set[str] = set()
+        replayed = 0
+        try:
+            batch: List[Dict[str, Any]] = []
+            for event in events:
+                record = self._to_record(event, None)
+                if record is None:
+                    continue
+                batch.append(record)
+                if len(batch) >= batch_size:
+                    replayed += self._replay_batch(state, batch, replayed_ids)
+                    batch = []
+            replayed += self._replay_batch(state, batch, replayed_ids)
+
+            with self._lock:
+                for record in self._rebuild_backlog:
+                    if self._event_id(record) not in replayed_ids:
+                        self._apply_record(state, record)
+                self._state = state
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                self._rebuild_backlog = []
+
+        logger.info(
+            f"Profile360 read model rebuilt: {replayed} events, {len(state.views)} partners "
+            f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+        )
+        return replayed
+
+    def _replay_batch(self, state: _ProjectionState, batch: List[Dict[str, Any]], replayed_ids: Set[str]) -> int:
+        # The new state is private to the rebuild, so batches are applied without the lock
+        for record in batch:
+            self._apply_record(state, record)
+            event_id = self._event_id(record)
+            if event_id:
+                replayed_ids.add(event_id)
+        return len(batch)
+
+    @staticmethod
+    def _event_id(record: Dict[str, Any]) -> Optional[str]:
+        return (record.get('metadata') or {}).get('event_id')
+
+    # ------------------------------------------------------------------
+    # Projection
+    # ------------------------------------------------------------------
+
+    def _apply_record(self, state: _ProjectionState, record: Dict[str, Any]) -> bool:
+        name = record['event_name']
+        aggregate_id = record.get('aggregate_id')
+        data = record.get('event_data') or {}
+        metadata = record.get('metadata') or {}
+        occurred_on = metadata.get('occurred_on')
+        day = _event_day(occurred_on)
+
+        if name in PARTNER_EVENTS:
+            view = self._apply_partner_event(state, name, aggregate_id, data)
+        elif name in CAMPAIGN_EVENTS:
+            view = self._apply_campaign_event(state, name, aggregate_id, data, day)
+        else:
+            view = self._apply_commission_event(state, name, aggregate_id, data, day)
+        if view is None:
+            return name == 'PartnerDeleted'
+
+        view.events_applied += 1
+        view.last_event_id = metadata.get('event_id')
+        if occurred_on and (view.last_event_at is None or occurred_on > view.last_event_at):
+            view.last_event_at = occurred_on
+        view.projected_at = datetime.now(timezone.utc).isoformat()
+        view.prune(day.toordinal() - self.window_days)
+        return True
+
+    def _view(self, state: _ProjectionState, partner_id: Optional[str]) -> Optional[PartnerProfile360View]:
+        if not partner_id:
+            return None
+        view = state.views.get(partner_id)
+        if view is None:
+            view = state.views[partner_id] = PartnerProfile360View(partner_id=partner_id)
+        return view
+
+    def _apply_partner_event(self, state: _ProjectionState, name: str, partner_id: str,
+                             data: Dict[str, Any]) -> Optional[PartnerProfile360View]:
+        if name == 'PartnerDeleted':
+            view = state.views.pop(partner_id, None)
+            if view is not None:
+                for campaign_id in view.campaign_status:
+                    state.campaign_owner.pop(campaign_id, None)
+                for commission_id in view.commission_status:
+                    state.commission_owner.pop(commission_id, None)
+            return None
+
+        view = self._view(state, partner_id)
+        if name == 'PartnerCreated':
+            view.partner.update({
+                'name': data.get('business_name'),
+                'email': data.get('email'),
+                'phone': data.get('phone'),
+                'type': data.get('partner_type'),
+                'status': view.partner.get('status', 'ACTIVO')
+            })
+        elif name == 'PartnerStatusChanged':
+            view.partner['status'] = data.get('new_status')
+        elif name == 'PartnerUpdated':
+            # Partner.actualizar_informacion reports the Spanish attribute names
+            new_data = data.get('new_data') or {}
+            for key, source in (('name', 'nombre'), ('email', 'email'), ('phone', 'telefono'), ('type', 'tipo')):
+                if source in new_data:
+                    view.partner[key] = new_data[source]
+        else:
+            view.partner['status'] = _PARTNER_EVENT_STATUS[name]
+        return view
+
+    def _apply_campaign_event(self, state: _ProjectionState, name: str, campaign_id: str,
+                              data: Dict[str, Any], day: date) -> Optional[PartnerProfile360View]:
+        partner_id = data.get('partner_id') or state.campaign_owner.get(campaign_id)
+        view = self._view(state, partner_id)
+        if view is None:
+            return None
+        state.campaign_owner[campaign_id] = partner_id
+
+        if name == 'CampaignCreated':
+            budget = _to_decimal(data.get('budget_amount'))
+            view.total_budget += budget - view.campaign_budget.get(campaign_id, Decimal('0'))
+            if campaign_id not in view.campaign_budget:
+                view.bump(day, _CAMPAIGNS_CREATED)
+            view.campaign_budget[campaign_id] = budget
+
+        status = data.get('new_status') if name == 'CampaignStatusChanged' else _CAMPAIGN_EVENT_STATUS[name]
+        if status is None:
+            return view
+        old_status = view.set_campaign_status(campaign_id, status)
+        if old_status != status and status == 'COMPLETED':
+            view.bump(day, _CAMPAIGNS_COMPLETED)
+        return view
+
+    def _apply_commission_event(self, state: _ProjectionState, name: str, commission_id: str,
+                                data: Dict[str, Any], day: date) -> Optional[PartnerProfile360View]:
+        partner_id = data.get('partner_id') or state.commission_owner.get(commission_id)
+        view = self._view(state, partner_id)
+        if view is None:
+            return None
+        state.commission_owner[commission_id] = partner_id
+
+        if name == 'CommissionRecalculated':
+            amount = _to_decimal(data.get('new_amount'))
+        elif name == 'CommissionAdjusted':
+            amount = _to_decimal(data.get('adjusted_amount'))
+        elif name == 'CommissionCreated' or commission_id not in view.commission_amount:
+            amount = _to_decimal(data.get('commission_amount')) if 'commission_amount' in data else None
+        else:
+            amount = None
+        status = data.get('new_status') if name == 'CommissionStatusChanged' else _COMMISSION_EVENT_STATUS.get(name)
+
+        is_new = commission_id not in view.commission_status
+        old_status = view.set_commission(commission_id, status, amount)
+        if is_new:
+            view.bump(day, _COMMISSIONS_EARNED, view.commission_amount[commission_id])
+        if status == 'PAID' and old_status != status:
+            view.bump(day, _COMMISSIONS_PAID, view.commission_amount[commission_id])
+        return view
+
+
+# ----------------------------------------------------------------------
+# History from the repositories
+# ----------------------------------------------------------------------
+
+def _isoformat(moment: Optional[datetime]) -> Optional[str]:
+    return moment.isoformat() if moment else None
+
+
+def _history_record(name: str, aggregate_id: str, occurred_on: Optional[datetime], **data) -> Dict[str, Any]:
+    return {
+        'event_name': name,
+        'aggregate_id': aggregate_id,
+        'metadata': {'event_id': None, 'occurred_on': _isoformat(occurred_on)},
+        'event_data': data
+    }
+
+
+def partner_history(partner: Any, campaigns: Iterable[Any], commissions: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+    """
+    Events equivalent to the stored state of a partner, its campaigns and its commissions.
+
+    Creation is dated by created_at and the current status by updated_at (or the
+    payment date). Current counts and risk inputs match the live projection, the
+    completion and payment trend buckets are dated approximately, and transitions
+    that left no trace in the stored state, such as a resolved dispute, are not
+    reproduced.
+    """
+    yield _history_record(
+        'PartnerCreated', partner.id, partner.created_at,
+        business_name=partner.nombre.value, email=partner.email.value,
+        partner_type=partner.tipo.value, phone=partner.telefono.value
+    )
+    yield _history_record('PartnerStatusChanged', partner.id, partner.updated_at, new_status=partner.status.value)
+
+    for campaign in campaigns:
+        yield _history_record(
+            'CampaignCreated', campaign.id, campaign.created_at,
+            partner_id=partner.id, budget_amount=str(campaign.presupuesto.amount)
+        )
+        if campaign.status.value != 'DRAFT':
+            yield _history_record(
+                'CampaignStatusChanged', campaign.id, campaign.updated_at,
+                partner_id=partner.id, new_status=campaign.status.value
+            )
+
+    for commission in commissions:
+        yield _history_record(
+            'CommissionCreated', commission.id, commission.created_at,
+            partner_id=partner.id, commission_amount=str(commission.commission_amount.amount)
+        )
+        if commission.status.value != 'PENDING':
+            yield _history_record(
+                'CommissionStatusChanged', commission.id, commission.payment_date or commission.updated_at,
+                partner_id=partner.id, new_status=commission.status.value
+            )
+
+
+class RepositoryHistorySource:
+    """`HistorySource` reading partners, campaigns and commissions from their repositories."""
+
+    def __init__(self, partners: Any, campaigns: Optional[Any] = None, commissions: Optional[Any] = None,
+                 page_size: int = 500):
+        self.partners = partners
+        self.campaigns = campaigns
+        self.commissions = commissions
+        self.page_size = page_size
+
+    def __call__(self, partner_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        for partner in self._partners(partner_id):
+            campaigns = self.campaigns.obtener_por_partner(partner.id) if self.campaigns is not None else []
+            commissions = self.commissions.obtener_por_partner_id(partner.id) if self.commissions is not None else []
+            yield from partner_history(partner, campaigns, commissions)
+
+    def _partners(self, partner_id: Optional[str]) -> Iterator[Any]:
+        if partner_id is not None:
+            partner = self.partners.obtener_por_id(partner_id)
+            if partner is not None:
+                yield partner
+            return
+        # Keyset pages keep memory bounded by the page size, not the partner count
+        after = None
+        while True:
+            page = self.partners.obtener_pagina(limit=self.page_size, after=after, descending=False)
+            yield from page
+            if len(page) < self.page_size:
+                return
+            after = (page[-1].created_at, page[-1].id)
+
+
+def _optional_repository(getter: Callable[[], Any], name: str) -> Optional[Any]:
+    try:
+        return getter()
+    except ImportError as e:
+        logger.warning(f"Profile360 history will not include {name}: {e}")
+        return None
+
+
+def repository_history_source() -> RepositoryHistorySource:
+    """History source over the repositories registered in the dependency container."""
+    from src.partner_management.seedwork.dependencias import (
+        get_campaign_repository, get_commission_repository, get_partner_repository
+    )
+    return RepositoryHistorySource(
+        partners=get_partner_repository(),
+        campaigns=_optional_repository(get_campaign_repository, 'campaigns'),
+        commissions=_optional_repository(get_commission_repository, 'commissions')
+    )
+
+
+_profile_360_read_model: Optional[Profile360ReadModel] = None
+_profile_360_read_model_lock = threading.Lock()
+
+
+def get_profile_360_read_model() -> Profile360ReadModel:
+    """Process-wide Profile360 read model, subscribed to the domain event signals."""
+    global _profile_360_read_model
+    if _profile_360_read_model is None:
+        with _profile_360_read_model_lock:
+            if _profile_360_read_model is None:
+                read_model = Profile360ReadModel(
+                    window_days=int(os.getenv('PROFILE_360_WINDOW_DAYS', '180')),
+                    history_source=repository_history_source()
+                )
+                read_model.subscribe()
+                _profile_360_read_model = read_model
+    return _profile_360_read_model
@@ -4,17 +4,24 @@ This provides an in-memory implementation for testing and development.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 from ..dominio.entidades import Partner
 from ..dominio.repositorio import PartnerRepository
 from ..dominio.objetos_valor import PartnerStatus, PartnerType
 from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.indexed_collection import IndexedCollection
+from partner_management.seedwork.infraestructura.utils import event_dispatcher
 
 logger = logging.getLogger(__name__)
 
 
+def _ubicacion(partner: Partner, campo: str) -> Optional[str]:
+    valor = getattr(partner.direccion, campo, None) if partner.direccion else None
+    return valor.lower() if valor else None
+
+
 class MockPartnerRepository(PartnerRepository):
     """
     Mock implementation of PartnerRepository using in-memory storage.
@@ -22,7 +29,16 @@ class MockPartnerRepository(PartnerRepository):
     """
     
     def __init__(self):
-        self._partners: Dict[str, Partner] = {}
+        self._partners: IndexedCollection[Partner] = IndexedCollection(
+            hash_indexes={
+                'status': lambda p: p.status,
+                'tipo': lambda p: p.tipo,
+                'ciudad': lambda p: _ubicacion(p, 'ciudad'),
+                'pais': lambda p: _ubicacion(p, 'pais'),
+                'email_validado': lambda p: p.validation_data.email_validated if p.validation_data else None
+            },
+            sorted_indexes={'created_at': lambda p: p.created_at}
+        )
         self._email_index: Dict[str, str] = {}  # email -> partner_id mapping
         self._logger = logger
         
@@ -57,33 +73,43 @@ class MockPartnerRepository(PartnerRepository):
         offset: Optional[int] = None
     ) -> List[Partner]:
         """Get all partners with optional filtering and pagination."""
-        partners = list(self._partners.values())
-        
-        # Apply filters
-        if filtros:
-            partners = self._apply_filters(partners, filtros)
-        
-        # Apply pagination
-        if offset:
-            partners = partners[offset:]
-        
-        if limit:
-            partners = partners[:limit]
+        partners = self._partners.query(
+            where=self._apply_filters(filtros) if filtros else None,
+            offset=offset or 0,
+            limit=limit or None
+        )
         
         self._logger.debug(f"Retrieved {len(partners)} partners with filters: {filtros}")
         return partners
     
+    def obtener_pagina(
+        self,
+        filtros: Optional[Dict[str, str]] = None,
+        limit: int = 50,
+        after: Optional[Tuple[datetime, str]] = None,
+        descending: bool = True
+    ) -> List[Partner]:
+        """Get a page of partners ordered by (created_at, id), starting after the `after` keyset."""
+        partners = self._partners.query(
+            where=self._apply_filters(filtros) if filtros else None,
+            order_by='created_at',
+            descending=descending,
+            limit=limit,
+            after=after
+        )
+        self._logger.debug(f"Retrieved page of {len(partners)} partners after {after} with filters: {filtros}")
+        return partners
+    
     def contar_con_filtros(self, filtros: Optional[Dict[str, str]] = None) -> int:
         """Count partners with filters."""
-        partners = list(self._partners.values())
-        
-        if filtros:
-            partners = self._apply_filters(partners, filtros)
-        
-        count = len(partners)
+        count = self._partners.count(where=self._apply_filters(filtros) if filtros else None)
         self._logger.debug(f"Counted {count} partners with filters: {filtros}")
         return count
     
+    def contar_aproximado(self, filtros: Optional[Dict[str, str]] = None) -> int:
+        """Estimate partners matching filters from the index sizes, without intersecting them."""
+        return self._partners.estimate(where=self._apply_filters(filtros) if filtros else None)
+    
     def agregar(self, partner: Partner):
         """Add new partner."""
         if partner.id in self._partners:
@@ -92,8 +118,9 @@ class MockPartnerRepository(PartnerRepository):
         if self._email_index.get(partner.email.value.lower()):
             raise DomainException(f"Partner with email {partner.email.value} already exists")
         
-        self._partners[partner.id] = partner
+        self._partners.add(partner)
         self._email_index[partner.email.value.lower()] = partner.id
+        event_dispatcher.publish_domain_events([partner])
         
         self._logger.info(f"Partner added: {partner.id}")
     
@@ -103,7 +130,7 @@ class MockPartnerRepository(PartnerRepository):
             raise DomainException(f"Partner with ID {partner.id} does not exist")
         
         # Check if email is being changed and if new email is available
-        old_partner = self._partners[partner.id]
+        old_partner = self._partners.get(partner.id)
         if old_partner.email.value.lower() != partner.email.value.lower():
             if self._email_index.get(partner.email.value.lower()):
                 raise DomainException(f"Partner with email {partner.email.value} already exists")
@@ -114,7 +141,8 @@ class MockPartnerRepository(PartnerRepository):
         
         # Update partner
         partner.updated_at = datetime.now()
-        self._partners[partner.id] = partner
+        self._partners.add(partner)
+        event_dispatcher.publish_domain_events([partner])
         
         self._logger.info(f"Partner updated: {partner.id}")
     
@@ -127,19 +155,20 @@ class MockPartnerRepository(PartnerRepository):
         del self._email_index[partner.email.value.lower()]
         
         # Remove from partners
-        del self._partners[partner.id]
+        self._partners.remove(partner.id)
+        event_dispatcher.publish_domain_events([partner])
         
         self._logger.info(f"Partner removed: {partner.id}")
     
     def obtener_por_status(self, status: PartnerStatus) -> List[Partner]:
         """Get partners by status."""
-        partners = [p for p in self._partners.values() if p.status == status]
+        partners = self._partners.query(where={'status': status})
         self._logger.debug(f"Retrieved {len(partners)} partners with status: {status.value}")
         return partners
     
     def obtener_por_tipo(self, tipo: PartnerType) -> List[Partner]:
         """Get partners by type."""
-        partners = [p for p in self._partners.values() if p.type == tipo]
+        partners = self._partners.query(where={'tipo': tipo})
         self._logger.debug(f"Retrieved {len(partners)} partners with type: {tipo.value}")
         return partners
     
@@ -152,26 +181,19 @@ class MockPartnerRepository(PartnerRepository):
         nombre_lower = nombre_parcial.lower()
         partners = [
             p for p in self._partners.values() 
-            if nombre_lower in p.name.value.lower()
+            if nombre_lower in p.nombre.value.lower()
         ]
         self._logger.debug(f"Found {len(partners)} partners matching name: {nombre_parcial}")
         return partners
     
     def obtener_por_ubicacion(self, ciudad: Optional[str] = None, pais: Optional[str] = None) -> List[Partner]:
         """Get partners by location."""
-        partners = []
-        
-        for partner in self._partners.values():
-            match = True
-            
-            if ciudad and (not partner.ciudad or partner.ciudad.lower() != ciudad.lower()):
-                match = False
-            
-            if pais and (not partner.pais or partner.pais.lower() != pais.lower()):
-                match = False
-            
-            if match:
-                partners.append(partner)
+        where = {}
+        if ciudad:
+            where['ciudad'] = ciudad.lower()
+        if pais:
+            where['pais'] = pais.lower()
+        partners = self._partners.query(where=where)
         
         self._logger.debug(f"Retrieved {len(partners)} partners by location - city: {ciudad}, country: {pais}")
         return partners
@@ -184,45 +206,30 @@ class MockPartnerRepository(PartnerRepository):
         """Check if partner with email exists."""
         return email.lower() in self._email_index
     
-    def _apply_filters(self, partners: List[Partner], filtros: Dict[str, str]) -> List[Partner]:
-        """Apply filters to partner list."""
-        filtered_partners = partners
+    def _apply_filters(self, filtros: Dict[str, str]) -> Dict[str, Any]:
+        """Translate request filters into index lookups."""
+        where: Dict[str, Any] = {}
         
         for field, value in filtros.items():
             if field == 'status':
                 try:
-                    status = PartnerStatus(value.upper())
-                    filtered_partners = [p for p in filtered_partners if p.status == status]
+                    where['status'] = PartnerStatus(value.upper())
                 except ValueError:
                     self._logger.warning(f"Invalid status filter value: {value}")
             
             elif field == 'tipo':
                 try:
-                    tipo = PartnerType(value.upper())
-                    filtered_partners = [p for p in filtered_partners if p.type == tipo]
+                    where['tipo'] = PartnerType(value.upper())
                 except ValueError:
                     self._logger.warning(f"Invalid type filter value: {value}")
             
-            elif field == 'ciudad':
-                filtered_partners = [
-                    p for p in filtered_partners 
-                    if p.ciudad and p.ciudad.lower() == value.lower()
-                ]
-            
-            elif field == 'pais':
-                filtered_partners = [
-                    p for p in filtered_partners 
-                    if p.pais and p.pais.lower() == value.lower()
-                ]
+            elif field in ('ciudad', 'pais'):
+                where[field] = value.lower()
             
             elif field == 'email_validado':
-                email_validated = value.lower() == 'true'
-                filtered_partners = [
-                    p for p in filtered_partners 
-                    if p.validation_data and p.validation_data.email_validated == email_validated
-                ]
+                where['email_validado'] = value.lower() == 'true'
         
-        return filtered_partners
+        return where
     
     def _initialize_sample_data(self):
         """Initialize repository with sample data for testing."""
@@ -278,7 +285,7 @@ class MockPartnerRepository(PartnerRepository):
                     partner.limpiar_eventos()
                     
                     # Add to repository
-                    self._partners[partner.id] = partner
+                    self._partners.add(partner)
                     self._email_index[partner.email.value.lower()] = partner.id
                     
                 except Exception as e:
@@ -297,14 +304,16 @@ class MockPartnerRepository(PartnerRepository):
     
     def obtener_estadisticas(self) -> Dict[str, int]:
         """Get repository statistics."""
+        por_status = self._partners.distinct('status')
+        por_tipo = self._partners.distinct('tipo')
         stats = {
             'total_partners': len(self._partners),
-            'activos': len([p for p in self._partners.values() if p.status == PartnerStatus.ACTIVO]),
-            'inactivos': len([p for p in self._partners.values() if p.status == PartnerStatus.INACTIVO]),
-            'suspendidos': len([p for p in self._partners.values() if p.status == PartnerStatus.SUSPENDIDO]),
-            'individuales': len([p for p in self._partners.values() if p.type == PartnerType.INDIVIDUAL]),
-            'empresas': len([p for p in self._partners.values() if p.type == PartnerType.EMPRESA]),
-            'startups': len([p for p in self._partners.values() if p.type == PartnerType.STARTUP])
+            'activos': por_status.get(PartnerStatus.ACTIVO, 0),
+            'inactivos': por_status.get(PartnerStatus.INACTIVO, 0),
+            'suspendidos': por_status.get(PartnerStatus.SUSPENDIDO, 0),
+            'individuales': por_tipo.get(PartnerType.INDIVIDUAL, 0),
+            'empresas': por_tipo.get(PartnerType.EMPRESA, 0),
+            'startups': por_tipo.get(PartnerType.STARTUP, 0)
         }
         
         self._logger.debug(f"Repository statistics: {stats}")
@@ -0,0 +1,279 @@
+"""
+SQLAlchemy implementation of PartnerRepository over the `partners` table.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Boolean, Column, DateTime, Index, Integer, Numeric, String, Text, delete, func, select
+from sqlalchemy.exc import IntegrityError
+
+from ..dominio.entidades import Partner
+from ..dominio.repositorio import PartnerRepository
+from ..dominio.objetos_valor import (
+    PartnerName, PartnerEmail, PartnerPhone, PartnerType, PartnerStatus,
+    PartnerAddress, PartnerValidationData, PartnerMetrics
+)
+from partner_management.seedwork.dominio.excepciones import DomainException
+from partner_management.seedwork.infraestructura.repositorios_sql import Base, Keyset, SqlAlchemyRepositorio
+
+logger = logging.getLogger(__name__)
+
+
+class PartnerModel(Base):
+    __tablename__ = 'partners'
+
+    id = Column(String(36), primary_key=True)
+    nombre = Column(String(255), nullable=False)
+    email = Column(String(254), nullable=False, unique=True)
+    telefono = Column(String(50), nullable=False)
+    tipo = Column(String(50), nullable=False, index=True)
+    status = Column(String(50), nullable=False, index=True)
+    direccion = Column(Text, nullable=True)
+    ciudad = Column(String(100), nullable=True)
+    pais = Column(String(100), nullable=True)
+    codigo_postal = Column(String(20), nullable=True)
+    email_validated = Column(Boolean, default=False)
+    phone_validated = Column(Boolean, default=False)
+    identity_validated = Column(Boolean, default=False)
+    business_validated = Column(Boolean, default=False)
+    total_campaigns = Column(Integer, default=0)
+    completed_campaigns = Column(Integer, default=0)
+    success_rate = Column(Numeric(3, 2), default=0)
+    total_commissions = Column(Numeric(12, 2), default=0)
+    average_rating = Column(Numeric(2, 1), default=0)
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index('idx_partners_created_at_id', 'created_at', 'id'),
+    )
+
+
+class SqlAlchemyPartnerRepository(SqlAlchemyRepositorio, PartnerRepository):
+    """
+    PartnerRepository backed by PostgreSQL.
+    Filters, sorting, pagination and counts are pushed down to the database.
+    """
+
+    model = PartnerModel
+
+    def obtener_por_id(self, partner_id: str) -> Optional[Partner]:
+        """Get partner by ID."""
+        return self._obtener(partner_id)
+
+    def obtener_por_email(self, email: str) -> Optional[Partner]:
+        """Get partner by email."""
+        partners = self._buscar([func.lower(PartnerModel.email) == email.lower()], limit=1)
+        return partners[0] if partners else None
+
+    def obtener_todos(
+        self,
+        filtros: Optional[Dict[str, str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Partner]:
+        """Get all partners with optional filtering and pagination."""
+        return self._buscar(
+            self._condiciones(filtros),
+            order_by=(PartnerModel.created_at, PartnerModel.id),
+            limit=limit or None,
+            offset=offset
+        )
+
+    def obtener_pagina(
+        self,
+        filtros: Optional[Dict[str, str]] = None,
+        limit: int = 50,
+        after: Optional[Keyset] = None,
+        descending: bool = True
+    ) -> List[Partner]:
+        """Get a page of partners ordered by (created_at, id), starting after the `after` keyset."""
+        return self._pagina_keyset(self._condiciones(filtros), limit=limit, after=after, descending=descending)
+
+    def contar_con_filtros(self, filtros: Optional[Dict[str, str]] = None) -> int:
+        """Count partners with filters."""
+        return self._contar(self._condiciones(filtros))
+
+    def contar_aproximado(self, filtros: Optional[Dict[str, str]] = None) -> int:
+        """Estimate partners with filters; unfiltered totals come from table statistics."""
+        return self._contar_aproximado(self._condiciones(filtros))
+
+    def agregar(self, partner: Partner) -> None:
+        """Add new partner."""
+        if self.existe_con_email(partner.email.value):
+            raise DomainException(f"Partner with email {partner.email.value} already exists")
+        try:
+            self._insertar(partner)
+        except IntegrityError as e:
+            raise DomainException(f"Partner with ID {partner.id} or email {partner.email.value} already exists") from e
+        logger.info(f"Partner added: {partner.id}")
+
+    def actualizar(self, partner: Partner) -> None:
+        """Update existing partner."""
+        try:
+            updated = self._actualizar(partner)
+        except IntegrityError as e:
+            raise DomainException(f"Partner with email {partner.email.value} already exists") from e
+        if not updated:
+            raise DomainException(f"Partner with ID {partner.id} does not exist")
+        logger.info(f"Partner updated: {partner.id}")
+
+    def eliminar(self, partner: Partner) -> None:
+        """Remove partner."""
+        with self._session() as session:
+            result = session.execute(delete(PartnerModel).where(PartnerModel.id == partner.id))
+            if result.rowcount:
+                self._registrar_eventos(session, [partner])
+        if not result.rowcount:
+            raise DomainException(f"Partner with ID {partner.id} does not exist")
+        logger.info(f"Partner removed: {partner.id}")
+
+    def obtener_por_status(self, status: PartnerStatus) -> List[Partner]:
+        """Get partners by status."""
+        return self._buscar([PartnerModel.status == status.value], order_by=(PartnerModel.created_at, PartnerModel.id))
+
+    def obtener_por_tipo(self, tipo: PartnerType) -> List[Partner]:
+        """Get partners by type."""
+        return self._buscar([PartnerModel.tipo == tipo.value], order_by=(PartnerModel.created_at, PartnerModel.id))
+
+    def obtener_activos(self) -> List[Partner]:
+        """Get active partners."""
+        return self.obtener_por_status(PartnerStatus.ACTIVO)
+
+    def buscar_por_nombre(self, nombre_parcial: str) -> List[Partner]:
+        """Search partners by partial name match."""
+        return self._buscar(
+            [PartnerModel.nombre.icontains(nombre_parcial, autoescape=True)],
+            order_by=(PartnerModel.nombre,)
+        )
+
+    def obtener_por_ubicacion(self, ciudad: Optional[str] = None, pais: Optional[str] = None) -> List[Partner]:
+        """Get partners by location."""
+        return self._buscar(self._condiciones({'ciudad': ciudad, 'pais': pais}))
+
+    def contar_total(self) -> int:
+        """Count total partners."""
+        return self._contar()
+
+    def existe_con_email(self, email: str) -> bool:
+        """Check if partner with email exists."""
+        return self._existe([func.lower(PartnerModel.email) == email.lower()])
+
+    def obtener_estadisticas(self) -> Dict[str, int]:
+        """Get repository statistics with two GROUP BY queries."""
+        with self._session() as session:
+            por_status = dict(session.execute(
+                select(PartnerModel.status, func.count()).group_by(PartnerModel.status)
+            ).all())
+            por_tipo = dict(session.execute(
+                select(PartnerModel.tipo, func.count()).group_by(PartnerModel.tipo)
+            ).all())
+        return {
+            'total_partners': sum(por_status.values()),
+            'activos': por_status.get(PartnerStatus.ACTIVO.value, 0),
+            'inactivos': por_status.get(PartnerStatus.INACTIVO.value, 0),
+            'suspendidos': por_status.get(PartnerStatus.SUSPENDIDO.value, 0),
+            'individuales': por_tipo.get(PartnerType.INDIVIDUAL.value, 0),
+            'empresas': por_tipo.get(PartnerType.EMPRESA.value, 0),
+            'startups': por_tipo.get(PartnerType.STARTUP.value, 0)
+        }
+
+    def _condiciones(self, filtros: Optional[Dict[str, Any]]) -> List[Any]:
+        """Translate request filters into WHERE clauses."""
+        condiciones: List[Any] = []
+        for field, value in (filtros or {}).items():
+            if value is None or value == '':
+                continue
+
+            if field == 'status':
+                try:
+                    condiciones.append(PartnerModel.status == PartnerStatus(value.upper()).value)
+                except ValueError:
+                    logger.warning(f"Invalid status filter value: {value}")
+
+            elif field == 'tipo':
+                try:
+                    condiciones.append(PartnerModel.tipo == PartnerType(value.upper()).value)
+                except ValueError:
+                    logger.warning(f"Invalid type filter value: {value}")
+
+            elif field in ('ciudad', 'pais'):
+                condiciones.append(func.lower(getattr(PartnerModel, field)) == value.lower())
+
+            elif field == 'email_validado':
+                condiciones.append(PartnerModel.email_validated.is_(str(value).lower() == 'true'))
+
+        return condiciones
+
+    def _a_fila(self, partner: Partner) -> Dict[str, Any]:
+        direccion = partner.direccion
+        validacion = partner.validation_data
+        metricas = partner.metrics
+        return {
+            'id': partner.id,
+            'nombre': partner.nombre.value,
+            'email': partner.email.value,
+            'telefono': partner.telefono.value,
+            'tipo': partner.tipo.value,
+            'status': partner.status.value,
+            'direccion': direccion.direccion if direccion else None,
+            'ciudad': direccion.ciudad if direccion else None,
+            'pais': direccion.pais if direccion else None,
+            'codigo_postal': direccion.codigo_postal if direccion else None,
+            'email_validated': validacion.email_validated,
+            'phone_validated': validacion.phone_validated,
+            'identity_validated': validacion.identity_validated,
+            'business_validated': validacion.business_validated,
+            'total_campaigns': metricas.total_campaigns,
+            'completed_campaigns': metricas.completed_campaigns,
+            'success_rate': metricas.success_rate,
+            'total_commissions': metricas.total_commissions,
+            'average_rating': metricas.average_rating,
+            'created_at': partner.created_at,
+            'updated_at': partner.updated_at
+        }
+
+    def _a_entidad(self, registro: PartnerModel) -> Partner:
+        direccion = None
+        if registro.direccion and registro.ciudad and registro.pais:
+            direccion = PartnerAddress(
+                direccion=registro.direccion,
+                ciudad=registro.ciudad,
+                pais=registro.pais,
+                codigo_postal=registro.codigo_postal or ""
+            )
+
+        try:
+            status = PartnerStatus(registro.status)
+        except ValueError:
+            # The schema also allows PENDIENTE, which the domain models as not yet active
+            status = PartnerStatus.INACTIVO
+
+        partner = Partner(
+            nombre=PartnerName(registro.nombre),
+            email=PartnerEmail(registro.email),
+            telefono=PartnerPhone(registro.telefono),
+            tipo=PartnerType(registro.tipo),
+            partner_id=registro.id,
+            direccion=direccion,
+            status=status,
+            validation_data=PartnerValidationData(
+                email_validated=bool(registro.email_validated),
+                phone_validated=bool(registro.phone_validated),
+                identity_validated=bool(registro.identity_validated),
+                business_validated=bool(registro.business_validated)
+            ),
+            metrics=PartnerMetrics(
+                total_campaigns=registro.total_campaigns or 0,
+                completed_campaigns=registro.completed_campaigns or 0,
+                success_rate=float(registro.success_rate or 0),
+                total_commissions=float(registro.total_commissions or 0),
+                average_rating=float(registro.average_rating or 0)
+            )
+        )
+        partner._created_at = registro.created_at
+        partner._updated_at = registro.updated_at
+        # Loading is not a domain change
+        partner.limpiar_eventos()
+        return partner
@@ -53,7 +53,8 @@ class CommandContext:
         )
 
 
-@dataclass
+# Keyword-only, so concrete commands can declare required fields after the base ones
+@dataclass(kw_only=True)
 class Command:
     context: CommandContext = field(default_factory=CommandContext)
     priority: CommandPriority = CommandPriority.NORMAL
@@ -190,6 +191,10 @@ class AsyncCommandHandler(CommandHandler[T], ABC):
         return asyncio.run(self.handle_async(command))
 
 
+# Alias used by the module command bases
+ComandoHandler = CommandHandler
+
+
 @singledispatch
 def ejecutar_comando(comando: Command) -> CommandResult[Any]:
     raise DomainException(
@@ -0,0 +1,279 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .comandos import CommandStatus, ejecutar_comando
+from ..dominio.excepciones import DomainException, ErrorCategory
+
+
+class CommandQueueFullException(DomainException):
+    def __init__(self, max_depth: int):
+        super().__init__(
+            message=f"Command queue is full ({max_depth} pending commands)",
+            error_code="COMMAND_QUEUE_FULL",
+            category=ErrorCategory.TECHNICAL
+        )
+        self.max_depth = max_depth
+
+
+@dataclass
+class CommandExecution:
+    command_id: str
+    command_type: str
+    status: CommandStatus = CommandStatus.PENDING
+    submitted_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+    resource_location: Optional[str] = None
+    location_template: Optional[str] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (CommandStatus.COMPLETED, CommandStatus.FAILED, CommandStatus.CANCELLED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'command_id': self.command_id,
+            'command_type': self.command_type,
+            'status': self.status.value,
+            'submitted_at': self.submitted_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'result': self.result,
+            'error': self.error,
+            'error_code': self.error_code,
+            'resource_location': self.resource_location
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CommandExecution':
+        return cls(
+            command_id=data['command_id'],
+            command_type=data['command_type'],
+            status=CommandStatus(data['status']),
+            submitted_at=data['submitted_at'],
+            started_at=data.get('started_at'),
+            completed_at=data.get('completed_at'),
+            result=data.get('result'),
+            error=data.get('error'),
+            error_code=data.get('error_code'),
+            resource_location=data.get('resource_location'),
+            location_template=data.get('location_template')
+        )
+
+
+class CommandStatusStore:
+    """Bounded in-process command status registry; finished commands expire after `ttl_seconds`.
+
+    Statuses are only visible to the process that queued the command, so this store
+    requires a single worker process. Use RedisCommandStatusStore when the API runs
+    with several workers or replicas.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 3600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._executions: Dict[str, CommandExecution] = {}
+        # Finished commands in completion order, so eviction only looks at the front
+        self._finished: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, execution: CommandExecution) -> None:
+        with self._lock:
+            self._executions[execution.command_id] = execution
+            self._evict()
+
+    def get(self, command_id: str) -> Optional[CommandExecution]:
+        with self._lock:
+            self._evict()
+            return self._executions.get(command_id)
+
+    def mark_finished(self, command_id: str) -> None:
+        with self._lock:
+            if command_id in self._executions:
+                self._finished[command_id] = time.monotonic()
+
+    def _evict(self) -> None:
+        # Pending commands are never evicted; the queue depth bounds them
+        now = time.monotonic()
+        while self._finished:
+            command_id, finished_at = next(iter(self._finished.items()))
+            if len(self._executions) <= self.max_entries and now - finished_at <= self.ttl_seconds:
+                break
+            self._finished.popitem(last=False)
+            self._executions.pop(command_id, None)
+
+
+class RedisCommandStatusStore:
+    """Command status registry in Redis, shared by every API process.
+
+    Each state change is written through, so any worker can answer the status URL.
+    Every write refreshes the `ttl_seconds` expiry, which also reclaims commands left
+    pending by a process that died.
+    """
+
+    def __init__(self, client: Any, ttl_seconds: float = 3600, key_prefix: str = 'hexabuilders:command:'):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisCommandStatusStore':
+        import redis
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def put(self, execution: CommandExecution) -> None:
+        data = execution.to_dict()
+        data['location_template'] = execution.location_template
+        self.client.set(self._key(execution.command_id), json.dumps(data, default=str), ex=int(self.ttl_seconds))
+
+    def get(self, command_id: str) -> Optional[CommandExecution]:
+        raw = self.client.get(self._key(command_id))
+        return CommandExecution.from_dict(json.loads(raw)) if raw else None
+
+    def mark_finished(self, command_id: str) -> None:
+        self.client.expire(self._key(command_id), int(self.ttl_seconds))
+
+    def _key(self, command_id: str) -> str:
+        return f"{self.key_prefix}{command_id}"
+
+
+class CommandQueue:
+    """In-process command queue executed by a pool of worker threads.
+
+    `submit` returns as soon as the command is queued; the caller polls the status
+    store for the outcome. The queue is bounded and `submit` raises
+    CommandQueueFullException instead of blocking, so HTTP callers can apply
+    backpressure (429) without tying up request threads.
+    """
+
+    def __init__(self,
+                 workers: int = 4,
+                 max_depth: int = 1000,
+                 status_store: Optional[Union[CommandStatusStore, RedisCommandStatusStore]] = None,
+                 executor: Callable[[Any], Any] = ejecutar_comando):
+        self.workers = workers
+        self.max_depth = max_depth
+        self.status_store = status_store or CommandStatusStore()
+        self.executor = executor
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_depth)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._running = False
+
+    def submit(self, command: Any, location_template: Optional[str] = None) -> CommandExecution:
+        """Queue a command; `location_template` is formatted with the result once it completes."""
+        self._ensure_started()
+        execution = CommandExecution(
+            command_id=getattr(command, 'command_id', None) or str(uuid.uuid4()),
+            command_type=type(command).__name__,
+            location_template=location_template
+        )
+        self.status_store.put(execution)
+        try:
+            self._queue.put_nowait((execution, command))
+        except queue.Full:
+            execution.status = CommandStatus.CANCELLED
+            execution.error = "Command queue is full"
+            execution.error_code = "COMMAND_QUEUE_FULL"
+            self.status_store.put(execution)
+            self.status_store.mark_finished(execution.command_id)
+            raise CommandQueueFullException(self.max_depth)
+        return execution
+
+    def get_status(self, command_id: str) -> Optional[CommandExecution]:
+        return self.status_store.get(command_id)
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the workers after the commands already queued have run."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            for _ in self._threads:
+                self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _ensure_started(self) -> None:
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._threads = [
+                threading.Thread(target=self._worker, name=f"command-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            execution, command = item
+            execution.status = CommandStatus.EXECUTING
+            execution.started_at = datetime.now(timezone.utc).isoformat()
+            self.status_store.put(execution)
+            try:
+                execution.result = self.executor(command)
+                if execution.location_template and execution.result is not None:
+                    execution.resource_location = execution.location_template.format(result=execution.result)
+                execution.status = CommandStatus.COMPLETED
+            except Exception as e:
+                execution.error = str(e)
+                execution.error_code = getattr(e, 'error_code', 'COMMAND_EXECUTION_ERROR')
+                execution.status = CommandStatus.FAILED
+                self.logger.error(f"Command {execution.command_type} ({execution.command_id}) failed: {e}")
+            finally:
+                execution.completed_at = datetime.now(timezone.utc).isoformat()
+                self.status_store.put(execution)
+                self.status_store.mark_finished(execution.command_id)
+
+
+_command_queue: Optional[CommandQueue] = None
+_command_queue_lock = threading.Lock()
+
+
+def _create_status_store() -> Union[CommandStatusStore, RedisCommandStatusStore]:
+    """COMMAND_STATUS_REDIS_URL shares statuses across processes; without it they are per-process."""
+    ttl_seconds = float(os.getenv('COMMAND_STATUS_TTL_SECONDS', '3600'))
+    redis_url = os.getenv('COMMAND_STATUS_REDIS_URL')
+    if redis_url:
+        return RedisCommandStatusStore.from_url(redis_url, ttl_seconds=ttl_seconds)
+    return CommandStatusStore(
+        max_entries=int(os.getenv('COMMAND_STATUS_MAX_ENTRIES', '10000')),
+        ttl_seconds=ttl_seconds
+    )
+
+
+def get_command_queue() -> CommandQueue:
+    global _command_queue
+    if _command_queue is None:
+        with _command_queue_lock:
+            if _command_queue is None:
+                _command_queue = CommandQueue(
+                    workers=int(os.getenv('COMMAND_QUEUE_WORKERS', '4')),
+                    max_depth=int(os.getenv('COMMAND_QUEUE_MAX_DEPTH', '1000')),
+                    status_store=_create_status_store()
+                )
+    return _command_queue
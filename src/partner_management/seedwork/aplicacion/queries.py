@@ -2,12 +2,16 @@
 Infraestructura de consultas CQRS con patrón SingleDispatch.
 """
 
+import base64
+import binascii
+import json
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from functools import singledispatch
-from typing import Any, Dict, Optional, TypeVar, Generic, List, Union
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, TypeVar, Generic, List, Union
 from enum import Enum
 
 from ..dominio.excepciones import DomainException, ValidationException
@@ -39,13 +43,57 @@ class QueryContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+def codificar_cursor(created_at: datetime, entity_id: str) -> str:
+    """Cursor opaco para la paginación por keyset sobre (created_at, id)."""
+    payload = json.dumps([created_at.isoformat(), entity_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Recuperar el keyset (created_at, id) de un cursor emitido por `codificar_cursor`."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(created_at), str(entity_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValidationException(
+            message="Cursor de paginación inválido",
+            field_errors={"cursor": ["Cursor mal formado"]}
+        ) from e
+
+
+def iterar_por_keyset(
+    obtener_pagina: Callable[[int, Optional[Tuple[datetime, str]]], List[Any]],
+    batch_size: int = 500
+) -> Iterator[Any]:
+    """Recorrer todas las páginas por keyset sobre (created_at, id), un lote a la vez.
+
+    `obtener_pagina(limit, after)` devuelve como mucho `limit` elementos tras el
+    keyset `after`; la memoria no depende del total de filas recorridas.
+    """
+    after: Optional[Tuple[datetime, str]] = None
+    while True:
+        lote = obtener_pagina(batch_size, after)
+        yield from lote
+        if len(lote) < batch_size:
+            return
+        after = (lote[-1].created_at, lote[-1].id)
+
+
 @dataclass(frozen=True)
 class PaginationInfo:
-    """Información de paginación para consultas."""
+    """
+    Información de paginación para consultas.
+    
+    Con `cursor` la consulta continúa tras el último elemento de la página
+    anterior (paginación por keyset) y `page_number` se ignora; el coste de
+    cada página no depende de su profundidad.
+    """
     
     page_number: int = 1
     page_size: int = 20
     max_page_size: int = 100
+    cursor: Optional[str] = None
     
     def __post_init__(self):
         if self.page_number < 1:
@@ -65,6 +113,9 @@ class PaginationInfo:
                 message=f"El tamaño de página no puede exceder {self.max_page_size}",
                 field_errors={"page_size": [f"No puede exceder {self.max_page_size}"]}
             )
+        
+        if self.cursor is not None:
+            decodificar_cursor(self.cursor)
     
     @property
     def offset(self) -> int:
@@ -75,6 +126,11 @@ class PaginationInfo:
     def limit(self) -> int:
         """Obtener límite para consultas de base de datos."""
         return self.page_size
+    
+    @property
+    def keyset(self) -> Optional[Tuple[datetime, str]]:
+        """Keyset (created_at, id) tras el que empieza la página, si hay cursor."""
+        return decodificar_cursor(self.cursor) if self.cursor else None
 
 
 @dataclass(frozen=True)
@@ -92,7 +148,8 @@ class SortInfo:
             )
 
 
-@dataclass
+# Keyword-only, so concrete queries can declare required fields after the base ones
+@dataclass(kw_only=True)
 class Query:
     """
     Clase base de consulta para operaciones de lectura.
@@ -237,6 +294,8 @@ class QueryResult(Generic[T]):
     total_pages: Optional[int] = None
     has_next_page: bool = False
     has_previous_page: bool = False
+    next_cursor: Optional[str] = None
+    total_is_approximate: bool = False
     cached: bool = False
     cache_key: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
@@ -249,9 +308,16 @@ class QueryResult(Generic[T]):
         total_count: Optional[int] = None,
         execution_time_ms: Optional[float] = None,
         cached: bool = False,
-        cache_key: Optional[str] = None
+        cache_key: Optional[str] = None,
+        next_cursor: Optional[str] = None,
+        total_is_approximate: bool = False
     ) -> 'QueryResult[T]':
-        """Crear resultado de consulta exitoso."""
+        """
+        Crear resultado de consulta exitoso.
+        
+        En paginación por cursor `next_cursor` indica si hay más resultados;
+        `total_count` es opcional y puede ser una estimación.
+        """
         # Determinar si es resultado único o lista
         single_result = None
         data_list = None
@@ -272,10 +338,19 @@ class QueryResult(Generic[T]):
         has_next_page = False
         has_previous_page = False
         
-        if query.pagination and total_count is not None:
+        if query.pagination and query.pagination.cursor is not None:
+            # Keyset pages have no page number; the cursor says where the next one starts
+            page_number = None
+            has_next_page = next_cursor is not None
+            has_previous_page = True
+            if total_count is not None:
+                total_pages = (total_count + page_size - 1) // page_size
+        elif query.pagination and total_count is not None:
             total_pages = (total_count + page_size - 1) // page_size
-            has_next_page = page_number < total_pages
+            has_next_page = page_number < total_pages or next_cursor is not None
             has_previous_page = page_number > 1
+        elif next_cursor is not None:
+            has_next_page = True
         
         return cls(
             success=True,
@@ -290,6 +365,8 @@ class QueryResult(Generic[T]):
             has_next_page=has_next_page,
             has_previous_page=has_previous_page,
             execution_time_ms=execution_time_ms,
+            next_cursor=next_cursor,
+            total_is_approximate=total_is_approximate,
             cached=cached,
             cache_key=cache_key
         )
@@ -334,8 +411,10 @@ class QueryResult(Generic[T]):
                 'page_size': self.page_size,
                 'total_pages': self.total_pages,
                 'has_next_page': self.has_next_page,
-                'has_previous_page': self.has_previous_page
-            } if self.page_number else None,
+                'has_previous_page': self.has_previous_page,
+                'next_cursor': self.next_cursor,
+                'total_is_approximate': self.total_is_approximate
+            } if self.page_size else None,
             'cached': self.cached,
             'cache_key': self.cache_key,
             'metadata': self.metadata
@@ -455,26 +534,73 @@ class AsyncQueryHandler(QueryHandler[T], ABC):
         return asyncio.run(self.handle_async(query))
 
 
-@singledispatch
-def ejecutar_query(query: Query) -> QueryResult[Any]:
+# Recibe el nombre del tipo de consulta y la latencia de su ejecución en segundos
+QueryMetricsHook = Callable[[str, float], None]
+
+
+class DespachadorQueries:
     """
+    Despachador de consultas por tipo basado en singledispatch.
     
-    Este es el punto de entrada principal para ejecución de consultas.
-    Registrar handlers usando decorador @ejecutar_query.register.
+    Los handlers se registran con el decorador @ejecutar_query.register. Si
+    se inyecta un hook de métricas, cada ejecución le reporta su latencia,
+    de modo que la capa de aplicación no depende de la infraestructura de
+    monitoreo.
+    """
     
-    Args:
-        query: Consulta a ejecutar
+    def __init__(self):
+        self._despachar = singledispatch(self._sin_handler)
+        self._metrics_hook: Optional[QueryMetricsHook] = None
+    
+    @staticmethod
+    def _sin_handler(query: Query) -> QueryResult[Any]:
+        raise DomainException(
+            message=f"No hay handler registrado para el tipo de consulta: {type(query).__name__}",
+            error_code="NO_QUERY_HANDLER"
+        )
+    
+    def register(self, cls, func=None):
+        """Registrar un handler; se usa como decorador igual que singledispatch.register."""
+        return self._despachar.register(cls, func)
+    
+    def dispatch(self, cls):
+        return self._despachar.dispatch(cls)
+    
+    @property
+    def registry(self):
+        return self._despachar.registry
+    
+    def set_metrics_hook(self, hook: Optional[QueryMetricsHook]) -> None:
+        """Inyectar (o quitar con None) el hook que recibe la latencia de cada consulta."""
+        self._metrics_hook = hook
+    
+    def __call__(self, query: Query) -> QueryResult[Any]:
+        """
+        Ejecutar consulta usando el handler registrado.
         
-    Returns:
-        Resultado de ejecución de consulta
+        Este es el punto de entrada principal para ejecución de consultas.
         
-    Raises:
-        DomainException: Si no hay handler registrado para el tipo de consulta
-    """
-    raise DomainException(
-        message=f"No hay handler registrado para el tipo de consulta: {type(query).__name__}",
-        error_code="NO_QUERY_HANDLER"
-    )
+        Args:
+            query: Consulta a ejecutar
+            
+        Returns:
+            Resultado de ejecución de consulta
+            
+        Raises:
+            DomainException: Si no hay handler registrado para el tipo de consulta
+        """
+        hook = self._metrics_hook
+        if hook is None:
+            return self._despachar(query)
+        
+        start = time.perf_counter()
+        try:
+            return self._despachar(query)
+        finally:
+            hook(type(query).__name__, time.perf_counter() - start)
+
+
+ejecutar_query = DespachadorQueries()
 
 
 class ReadModel(ABC):
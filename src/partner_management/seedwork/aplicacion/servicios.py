@@ -188,6 +188,10 @@ class ApplicationService(ABC):
         return logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
 
+# Alias used by the module application services
+ServicioAplicacion = ApplicationService
+
+
 class CrudApplicationService(ApplicationService, Generic[T]):
     """
     Servicio de aplicación para operaciones CRUD básicas.
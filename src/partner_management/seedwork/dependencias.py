@@ -2,6 +2,7 @@
 """
 
 import logging
+import os
 from typing import Dict, Any, Type, Callable
 
 logger = logging.getLogger(__name__)
@@ -90,22 +91,55 @@ def setup_dependencies():
     from ..modulos.partners.dominio.repositorio import PartnerRepository
     from ..modulos.partners.infraestructura.repositorios_mock import MockPartnerRepository
     from ..modulos.partners.infraestructura.fabricas import FabricaPartner
-    from ..seedwork.infraestructura.uow import UnitOfWorkInterface, UnitOfWork
+    from ..modulos.campaigns.dominio.entidades import Campaign
+    from ..modulos.commissions.dominio.entidades import Commission
+    from ..modulos.analytics.dominio.entidades import AnalyticsReport
+    from ..seedwork.infraestructura.uow import UnitOfWork, SqlAlchemyUnitOfWork, InMemoryUnitOfWork
     
     container = get_container()
     
-    # Register repositories (using mocks for now)
-    container.register_factory(PartnerRepository, lambda: MockPartnerRepository())
+    # Register repositories (PARTNER_MANAGEMENT_REPOSITORY=mock|sql). Campaign, commission
+    # and analytics have no repository interface, so they are keyed by their aggregate.
+    if os.getenv('PARTNER_MANAGEMENT_REPOSITORY', 'mock').lower() == 'sql':
+        from ..modulos.partners.infraestructura.repositorios_sql import SqlAlchemyPartnerRepository
+        from ..modulos.campaigns.infraestructura.repositorios_sql import RepositorioCampaignsSQLAlchemy
+        from ..modulos.commissions.infraestructura.repositorios_sql import RepositorioCommissionSQLAlchemy
+        from ..modulos.analytics.infraestructura.repositorios_sql import RepositorioAnalyticsSQLAlchemy
+        from ..seedwork.infraestructura.repositorios_sql import get_session_factory
+        container.register_factory(PartnerRepository, lambda: SqlAlchemyPartnerRepository())
+        container.register_factory(Campaign, lambda: RepositorioCampaignsSQLAlchemy())
+        container.register_factory(Commission, lambda: RepositorioCommissionSQLAlchemy())
+        container.register_factory(AnalyticsReport, lambda: RepositorioAnalyticsSQLAlchemy())
+        container.register_factory(UnitOfWork, lambda: SqlAlchemyUnitOfWork(get_session_factory()))
+    else:
+        container.register_factory(PartnerRepository, lambda: MockPartnerRepository())
+        container.register_factory(Campaign, _mock_campaign_repository)
+        container.register_factory(Commission, _mock_commission_repository)
+        container.register_factory(AnalyticsReport, _mock_analytics_repository)
+        container.register_factory(UnitOfWork, lambda: InMemoryUnitOfWork())
     
     # Register factories
     container.register_factory(FabricaPartner, lambda: FabricaPartner())
     
-    # Register Unit of Work
-    container.register_factory(UnitOfWorkInterface, lambda: UnitOfWork())
-    
     logger.info("Dependency injection configured successfully")
 
 
+# The in-memory repositories are imported on first use
+def _mock_campaign_repository():
+    from ..modulos.campaigns.infraestructura.repositorios_mock import RepositorioCampaignsMock
+    return RepositorioCampaignsMock()
+
+
+def _mock_commission_repository():
+    from ..modulos.commissions.infraestructura.repositorios_mock import RepositorioCommissionMock
+    return RepositorioCommissionMock()
+
+
+def _mock_analytics_repository():
+    from ..modulos.analytics.infraestructura.repositorios_mock import RepositorioAnalyticsMock
+    return RepositorioAnalyticsMock()
+
+
 def inject(service_type: Type):
     """Decorator for dependency injection."""
     def decorator(func):
@@ -131,10 +165,28 @@ def get_partner_factory():
     return get_container().get(FabricaPartner)
 
 
+def get_campaign_repository():
+    """Get campaign repository instance."""
+    from ..modulos.campaigns.dominio.entidades import Campaign
+    return get_container().get(Campaign)
+
+
+def get_commission_repository():
+    """Get commission repository instance."""
+    from ..modulos.commissions.dominio.entidades import Commission
+    return get_container().get(Commission)
+
+
+def get_analytics_repository():
+    """Get analytics repository instance."""
+    from ..modulos.analytics.dominio.entidades import AnalyticsReport
+    return get_container().get(AnalyticsReport)
+
+
 def get_unit_of_work():
     """Get unit of work instance."""
-    from ..seedwork.infraestructura.uow import UnitOfWorkInterface
-    return get_container().get(UnitOfWorkInterface)
+    from ..seedwork.infraestructura.uow import UnitOfWork
+    return get_container().get(UnitOfWork)
 
 
 # Auto-setup dependencies when module is imported
@@ -106,6 +106,14 @@ class Factory(ABC, Generic[T]):
         return []
 
 
+class Fabrica(ABC):
+    """
+    Base de las fábricas de módulo que exponen métodos crear_* propios en lugar
+    de la creación parametrizada de Factory.
+    """
+    pass
+
+
 class Builder(ABC, Generic[T]):
     """
     Constructor fluido para agregados complejos.
@@ -51,6 +51,14 @@ class Repository(ABC, Generic[T]):
         pass
 
 
+class Repositorio(ABC):
+    """
+    Base de los repositorios de módulo que definen su propia interfaz de consulta
+    (obtener_por_partner_id, obtener_con_filtros, ...) en lugar del CRUD de Repository.
+    """
+    pass
+
+
 class SpecificationRepository(Repository[T], ABC):
     """
     Repositorio que soporta consultas usando el patrón Specification.
@@ -0,0 +1,297 @@
+"""
+IndexedCollection - Colección en memoria de agregados con índices secundarios
+Mantiene índices hash sobre campos declarados e índices ordenados (p. ej. created_at)
+que se actualizan al insertar, actualizar y eliminar. Las consultas con varios filtros
+intersectan los índices empezando por el más selectivo, de modo que el coste es
+proporcional al tamaño del resultado y no al de la colección. Los índices ordenados
+admiten paginación por keyset: `after` busca la posición de la clave con bisección,
+así que una página profunda cuesta lo mismo que la primera.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Set, Tuple, TypeVar
+
+T = TypeVar('T')
+
+KeyFunction = Callable[[Any], Any]
+
+
+class _Maximo:
+    """Centinela mayor que cualquier id, para acotar por arriba una clave del índice ordenado"""
+
+    def __lt__(self, other: Any) -> bool:
+        return False
+
+    def __gt__(self, other: Any) -> bool:
+        return True
+
+
+_MAXIMO = _Maximo()
+
+# A filter matching at least 1/N of an index slice is cheaper to scan in index order
+_DENSE_FILTER_RATIO = 8
+
+
+class IndexedCollection(Generic[T]):
+    """Colección de entidades por id con índices hash y ordenados sobre campos declarados.
+
+    Las funciones de clave reciben la entidad y devuelven el valor indexado; None
+    significa que la entidad no aparece en ese índice. Como las entidades se mutan
+    en sitio, la colección guarda las claves con las que indexó cada entidad y las
+    recalcula en `add`, que los repositorios llaman tanto al agregar como al actualizar.
+    """
+
+    def __init__(self,
+                 hash_indexes: Optional[Dict[str, KeyFunction]] = None,
+                 sorted_indexes: Optional[Dict[str, KeyFunction]] = None,
+                 id_fn: KeyFunction = lambda entity: entity.id):
+        self._hash_key_fns = dict(hash_indexes or {})
+        self._sorted_key_fns = dict(sorted_indexes or {})
+        self._id_fn = id_fn
+
+        self._entities: Dict[str, T] = {}
+        # Insertion sequence per id, so unordered queries keep the insertion order
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+
+        # field -> key -> ids
+        self._hash_indexes: Dict[str, Dict[Any, Set[str]]] = {field: {} for field in self._hash_key_fns}
+        # field -> sorted [(key, id)]; ties on the key are broken by id, like ORDER BY key, id
+        self._sorted_indexes: Dict[str, List[Tuple[Any, str]]] = {field: [] for field in self._sorted_key_fns}
+        # id -> field -> key the entity is currently indexed under
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    # Container protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def __contains__(self, entity_id: str) -> bool:
+        return entity_id in self._entities
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(list(self._entities.values()))
+
+    def get(self, entity_id: str) -> Optional[T]:
+        return self._entities.get(entity_id)
+
+    def values(self) -> List[T]:
+        with self._lock:
+            return list(self._entities.values())
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def add(self, entity: T) -> None:
+        """Inserta o reindexa una entidad"""
+        entity_id = self._id_fn(entity)
+        with self._lock:
+            if entity_id in self._entities:
+                self._unindex(entity_id)
+            else:
+                self._sequence[entity_id] = self._next_sequence
+                self._next_sequence += 1
+            self._entities[entity_id] = entity
+            self._index(entity_id, entity)
+
+    def remove(self, entity_id: str) -> Optional[T]:
+        """Elimina una entidad y sus entradas de índice"""
+        with self._lock:
+            entity = self._entities.pop(entity_id, None)
+            if entity is not None:
+                self._unindex(entity_id)
+                del self._sequence[entity_id]
+            return entity
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entities.clear()
+            self._sequence.clear()
+            self._keys.clear()
+            for index in self._hash_indexes.values():
+                index.clear()
+            for index in self._sorted_indexes.values():
+                index.clear()
+
+    def _index(self, entity_id: str, entity: T) -> None:
+        keys: Dict[str, Any] = {}
+        for field, key_fn in self._hash_key_fns.items():
+            key = key_fn(entity)
+            if key is None:
+                continue
+            keys[field] = key
+            self._hash_indexes[field].setdefault(key, set()).add(entity_id)
+        for field, key_fn in self._sorted_key_fns.items():
+            key = key_fn(entity)
+            if key is None:
+                continue
+            keys[field] = key
+            insort(self._sorted_indexes[field], (key, entity_id))
+        self._keys[entity_id] = keys
+
+    def _unindex(self, entity_id: str) -> None:
+        keys = self._keys.pop(entity_id, {})
+        for field, key in keys.items():
+            if field in self._hash_indexes:
+                posting = self._hash_indexes[field].get(key)
+                if posting is not None:
+                    posting.discard(entity_id)
+                    if not posting:
+                        del self._hash_indexes[field][key]
+            else:
+                index = self._sorted_indexes[field]
+                position = bisect_left(index, (key, entity_id))
+                if position < len(index) and index[position][1] == entity_id:
+                    del index[position]
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def query(self,
+              where: Optional[Dict[str, Any]] = None,
+              order_by: Optional[str] = None,
+              descending: bool = False,
+              lower: Any = None,
+              upper: Any = None,
+              offset: int = 0,
+              limit: Optional[int] = None,
+              after: Optional[Tuple[Any, str]] = None) -> List[T]:
+        """Entidades que cumplen todos los filtros de `where`.
+
+        Cada valor de `where` es una clave del índice hash del campo o una lista/tupla/set
+        de claves alternativas. `order_by` debe ser un índice ordenado; `lower` y `upper`
+        acotan (inclusive) su clave y `after` es el keyset (clave, id) del último elemento
+        de la página anterior, en el sentido de `descending`. Sin `order_by` se respeta el
+        orden de inserción.
+        """
+        with self._lock:
+            ids = self._matching_ids(where)
+            if order_by is None:
+                if ids is None:
+                    ordered = list(self._entities)
+                else:
+                    ordered = sorted(ids, key=self._sequence.__getitem__)
+                if descending:
+                    ordered.reverse()
+            else:
+                needed = offset + limit if limit is not None else None
+                ordered = self._ordered_ids(order_by, ids, descending, lower, upper, needed, after)
+
+            end = offset + limit if limit is not None else None
+            return [self._entities[entity_id] for entity_id in ordered[offset:end]]
+
+    def count(self,
+              where: Optional[Dict[str, Any]] = None,
+              order_by: Optional[str] = None,
+              lower: Any = None,
+              upper: Any = None) -> int:
+        """Número de entidades que cumplen los filtros, sin materializarlas"""
+        with self._lock:
+            ids = self._matching_ids(where)
+            if order_by is None or (lower is None and upper is None):
+                return len(self._entities) if ids is None else len(ids)
+            if ids is None:
+                start, end = self._range(order_by, lower, upper)
+                return end - start
+            return len(self._ordered_ids(order_by, ids, False, lower, upper, None))
+
+    def estimate(self, where: Optional[Dict[str, Any]] = None) -> int:
+        """Número aproximado de entidades que cumplen los filtros, en O(número de filtros).
+
+        Con un filtro es exacto (tamaño de la lista de ids del índice); con varios supone
+        independencia entre campos. Los índices se mantienen al escribir, así que la
+        estimación nunca recorre entidades.
+        """
+        with self._lock:
+            total = len(self._entities)
+            if not where:
+                return total
+            sizes = [len(self._postings(field, value)) for field, value in where.items()]
+            if len(sizes) == 1 or total == 0:
+                return sizes[0] if sizes else total
+            estimate = float(total)
+            for size in sizes:
+                estimate *= size / total
+            return min(round(estimate), min(sizes))
+
+    def distinct(self, field: str) -> Dict[Any, int]:
+        """Claves del índice hash de `field` con su número de entidades"""
+        with self._lock:
+            return {key: len(ids) for key, ids in self._hash_indexes[field].items()}
+
+    def _postings(self, field: str, value: Any) -> Set[str]:
+        index = self._hash_indexes[field]
+        if isinstance(value, (list, tuple, set, frozenset)):
+            postings = [index.get(key) for key in value]
+            return set().union(*[posting for posting in postings if posting])
+        return index.get(value) or set()
+
+    def _matching_ids(self, where: Optional[Dict[str, Any]]) -> Optional[Set[str]]:
+        """Ids que cumplen todos los filtros (None si no hay filtros)"""
+        if not where:
+            return None
+        postings = sorted((self._postings(field, value) for field, value in where.items()), key=len)
+        smallest, others = postings[0], postings[1:]
+        # Probe the larger postings only with the candidates of the most selective one
+        return {entity_id for entity_id in smallest if all(entity_id in posting for posting in others)}
+
+    def _ordered_ids(self, field: str, ids: Optional[Set[str]], descending: bool,
+                     lower: Any, upper: Any, needed: Optional[int],
+                     after: Optional[Tuple[Any, str]] = None) -> List[str]:
+        index = self._sorted_indexes[field]
+        start, end = self._range(field, lower, upper)
+        if after is not None:
+            # Seek past the keyset instead of skipping the previous pages
+            if descending:
+                end = min(end, bisect_left(index, tuple(after)))
+            else:
+                start = max(start, bisect_right(index, tuple(after)))
+        if start >= end:
+            return []
+
+        if ids is None:
+            # Walk the index slice; only the entries that end up returned are touched
+            span = range(end - 1, start - 1, -1) if descending else range(start, end)
+            if needed is not None:
+                span = span[:needed]
+            return [index[position][1] for position in span]
+
+        if needed is not None and len(ids) * _DENSE_FILTER_RATIO >= end - start:
+            # Dense filter and a bounded page: walk the slice until the page is full
+            span = range(end - 1, start - 1, -1) if descending else range(start, end)
+            ordered = []
+            for position in span:
+                entity_id = index[position][1]
+                if entity_id in ids:
+                    ordered.append(entity_id)
+                    if len(ordered) == needed:
+                        break
+            return ordered
+
+        # Sparse filter: order the candidates by their indexed key instead of walking the index
+        low, high = index[start], index[end - 1]
+        candidates = []
+        for entity_id in ids:
+            key = self._keys[entity_id].get(field)
+            if key is None:
+                continue
+            entry = (key, entity_id)
+            if entry < low or entry > high:
+                continue
+            candidates.append(entry)
+        candidates.sort(reverse=descending)
+        return [entity_id for _, entity_id in candidates]
+
+    def _range(self, field: str, lower: Any, upper: Any) -> Tuple[int, int]:
+        """Posiciones [start, end) del índice ordenado con clave entre lower y upper"""
+        index = self._sorted_indexes[field]
+        start = bisect_left(index, (lower,)) if lower is not None else 0
+        # Entries are (key, id); the sentinel sorts after every id of the same key
+        end = bisect_right(index, (upper, _MAXIMO)) if upper is not None else len(index)
+        return start, end
@@ -0,0 +1,260 @@
+"""
+IndexedRingBuffer - Buffer circular con índices secundarios
+Mantiene índices hash por campo y un índice temporal ordenado que se actualizan al insertar
+y se purgan junto con el buffer, de modo que las consultas filtradas solo tocan los registros
+que coinciden en lugar de recorrer todo el histórico.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+
+class IndexedRingBuffer:
+    """Buffer circular acotado con índices secundarios sobre campos declarados"""
+
+    def __init__(self,
+                 maxlen: int,
+                 indexed_fields: Sequence[str],
+                 timestamp_field: str = "timestamp"):
+        self.maxlen = maxlen
+        self.indexed_fields = tuple(indexed_fields)
+        self.timestamp_field = timestamp_field
+
+        # Records are normally appended in timestamp order (stamped under the owner's
+        # lock), so the timestamp list stays sorted and supports bisect range queries.
+        # Caller-supplied or clock-skewed timestamps can break that order; the
+        # sequences where it breaks are tracked and range queries fall back to a
+        # linear scan until those records are evicted.
+        # Records and timestamps are kept in parallel lists addressed by a global
+        # sequence number: record with sequence s lives at position s - self._offset.
+        # Evicted slots at the front are reclaimed in bulk (amortized O(1)).
+        self._records: List[Any] = []
+        self._timestamps: List[datetime] = []
+        self._offset = 0
+        self._start = 0
+
+        # field -> value -> ascending sequence numbers
+        self._indexes: Dict[str, Dict[Any, deque]] = {field: {} for field in self.indexed_fields}
+
+        # Sequences whose timestamp is older than the previous record's
+        self._inversions: deque = deque()
+
+    # ------------------------------------------------------------------
+    # Container protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._records) - self._start
+
+    def __iter__(self) -> Iterator[Any]:
+        for position in range(self._start, len(self._records)):
+            yield self._records[position]
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def first(self) -> Optional[Any]:
+        """Obtiene el registro más antiguo"""
+        return self._records[self._start] if len(self) else None
+
+    def recent(self, limit: int) -> List[Any]:
+        """Obtiene los últimos `limit` registros en orden de inserción"""
+        if limit <= 0:
+            return []
+        return self._records[max(self._start, len(self._records) - limit):]
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, record: Any):
+        """Inserta un registro actualizando los índices; purga el más antiguo si se llena"""
+        sequence = self._offset + len(self._records)
+        timestamp = getattr(record, self.timestamp_field)
+        if len(self) and timestamp < self._timestamps[-1]:
+            self._inversions.append(sequence)
+        self._records.append(record)
+        self._timestamps.append(timestamp)
+
+        for field in self.indexed_fields:
+            value = getattr(record, field)
+            if value is None:
+                continue
+            posting = self._indexes[field].get(value)
+            if posting is None:
+                posting = self._indexes[field][value] = deque()
+            posting.append(sequence)
+
+        if len(self) > self.maxlen:
+            self.popleft()
+
+    def popleft(self) -> Optional[Any]:
+        """Purga el registro más antiguo y sus entradas de índice"""
+        if not len(self):
+            return None
+
+        sequence = self._offset + self._start
+        record = self._records[self._start]
+
+        # The oldest record is at the head of every posting list it belongs to
+        for field in self.indexed_fields:
+            value = getattr(record, field)
+            if value is None:
+                continue
+            posting = self._indexes[field].get(value)
+            if posting and posting[0] == sequence:
+                posting.popleft()
+                if not posting:
+                    del self._indexes[field][value]
+
+        # An inversion only matters while the record before it is still buffered
+        while self._inversions and self._inversions[0] <= sequence + 1:
+            self._inversions.popleft()
+
+        self._records[self._start] = None
+        self._start += 1
+        self._compact_front()
+        return record
+
+    def evict_older_than(self, cutoff: datetime) -> int:
+        """Purga desde el frente todos los registros anteriores a cutoff"""
+        evicted = 0
+        while len(self) and self._timestamps[self._start] < cutoff:
+            self.popleft()
+            evicted += 1
+        return evicted
+
+    def clear(self):
+        self._records = []
+        self._timestamps = []
+        self._offset = 0
+        self._start = 0
+        self._indexes = {field: {} for field in self.indexed_fields}
+        self._inversions = deque()
+
+    @property
+    def time_ordered(self) -> bool:
+        """Indica si los timestamps del buffer están ordenados y admiten búsqueda binaria"""
+        return not self._inversions
+
+    def _compact_front(self):
+        """Libera los huecos del frente cuando superan el tamaño del buffer"""
+        if self._start >= self.maxlen or self._start == len(self._records):
+            del self._records[:self._start]
+            del self._timestamps[:self._start]
+            self._offset += self._start
+            self._start = 0
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def count(self, field: str, value: Any) -> int:
+        """Número de registros con field == value, en O(1)"""
+        posting = self._indexes[field].get(value)
+        return len(posting) if posting else 0
+
+    def count_between(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> int:
+        """Número de registros en el rango temporal, en O(log n) si los timestamps están ordenados"""
+        if not self.time_ordered:
+            return sum(
+                1 for position in range(self._start, len(self._records))
+                if self._within(self._timestamps[position], start_time, end_time)
+            )
+        low, high = self._time_range(start_time, end_time)
+        return max(high - low, 0)
+
+    def query(self,
+              filters: Optional[Dict[str, Any]] = None,
+              start_time: Optional[datetime] = None,
+              end_time: Optional[datetime] = None,
+              predicate: Optional[Callable[[Any], bool]] = None,
+              limit: Optional[int] = None) -> List[Any]:
+        """Busca registros por igualdad en campos indexados, rango temporal y un filtro residual.
+
+        Solo recorre la lista de candidatos más pequeña (posting list o rango temporal), por lo
+        que el coste depende del número de coincidencias y no del tamaño del histórico. Con
+        `limit` devuelve solo las coincidencias más recientes, recorriendo desde el final.
+        """
+        filters = {field: value for field, value in (filters or {}).items() if value not in (None, "")}
+
+        postings = []
+        for field, value in filters.items():
+            posting = self._indexes[field].get(value)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        has_time_range = start_time is not None or end_time is not None
+        # Out-of-order timestamps make bisect unsafe; the range is then checked per record
+        bisect_range = has_time_range and self.time_ordered
+        if bisect_range:
+            low, high = self._time_range(start_time, end_time)
+            if high <= low:
+                return []
+        else:
+            low, high = self._start, len(self._records)
+
+        if postings:
+            postings.sort(key=len)
+            candidates = postings[0]
+            use_range = bisect_range and (high - low) < len(candidates)
+        else:
+            use_range = True
+
+        # With a limit, walk newest-first and stop as soon as enough matches are found
+        if use_range:
+            positions = range(low, high)
+            if limit is not None:
+                positions = reversed(positions)
+        else:
+            sequences = reversed(candidates) if limit is not None else candidates
+            positions = (sequence - self._offset for sequence in sequences)
+
+        results = []
+        for position in positions:
+            if bisect_range and not use_range and not (low <= position < high):
+                continue
+            if has_time_range and not bisect_range and not self._within(self._timestamps[position], start_time, end_time):
+                continue
+            record = self._records[position]
+            if self._matches(record, filters, predicate):
+                results.append(record)
+                if limit is not None and len(results) >= limit:
+                    break
+
+        if limit is not None:
+            results.reverse()
+        return results
+
+    def _time_range(self, start_time: Optional[datetime], end_time: Optional[datetime]):
+        """Convierte un rango temporal en posiciones [low, high) sobre el buffer"""
+        low = self._start
+        high = len(self._records)
+        if start_time is not None:
+            low = bisect_left(self._timestamps, start_time, lo=self._start)
+        if end_time is not None:
+            high = bisect_right(self._timestamps, end_time, lo=self._start)
+        return low, high
+
+    @staticmethod
+    def _within(timestamp: datetime, start_time: Optional[datetime], end_time: Optional[datetime]) -> bool:
+        return (start_time is None or timestamp >= start_time) and (end_time is None or timestamp <= end_time)
+
+    @staticmethod
+    def _matches(record: Any, filters: Dict[str, Any], predicate: Optional[Callable[[Any], bool]]) -> bool:
+        for field, value in filters.items():
+            if getattr(record, field) != value:
+                return False
+        return predicate(record) if predicate else True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Obtiene el número de valores distintos por índice"""
+        return {
+            "records": len(self),
+            "maxlen": self.maxlen,
+            "time_ordered": self.time_ordered,
+            "indexes": {field: len(values) for field, values in self._indexes.items()}
+        }
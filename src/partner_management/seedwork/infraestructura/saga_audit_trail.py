@@ -5,8 +5,8 @@ Proporciona un historial completo y trazabilidad de eventos para debugging y com
 
 import json
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timezone, timedelta
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from uuid import uuid4
 import os
@@ -14,6 +14,8 @@ import threading
 from collections import defaultdict
 
 from .saga_log import SagaLog, SagaLogEntry, SagaEventType, SagaLogLevel, get_saga_log
+from .segmented_log_store import SegmentedLogStore, FsyncPolicy
+from .indexed_ring_buffer import IndexedRingBuffer
 
 @dataclass
 class SagaAuditRecord:
@@ -39,6 +41,26 @@ class SagaAuditRecord:
         data['timestamp'] = self.timestamp.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SagaAuditRecord':
+        """Reconstruye un registro a partir de su diccionario"""
+        return cls(
+            id=data['id'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            saga_id=data['saga_id'],
+            partner_id=data['partner_id'],
+            event_type=data['event_type'],
+            step_name=data.get('step_name'),
+            service_name=data['service_name'],
+            correlation_id=data['correlation_id'],
+            causation_id=data['causation_id'],
+            event_data=data['event_data'],
+            result=data['result'],
+            error_details=data.get('error_details'),
+            duration_ms=data.get('duration_ms'),
+            metadata=data.get('metadata')
+        )
+
 @dataclass
 class SagaTimeline:
     """Línea de tiempo de una Saga"""
@@ -53,23 +75,81 @@ class SagaTimeline:
     status: str
     error_summary: Optional[Dict[str, Any]] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convierte la línea de tiempo a diccionario"""
+        error_summary = None
+        if self.error_summary:
+            error_summary = dict(self.error_summary, error_types=dict(self.error_summary["error_types"]))
+        return {
+            "saga_id": self.saga_id,
+            "partner_id": self.partner_id,
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "total_duration_ms": self.total_duration_ms,
+            "steps": self.steps,
+            "events": self.events,
+            "compensations": self.compensations,
+            "status": self.status,
+            "error_summary": error_summary
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SagaTimeline':
+        """Reconstruye una línea de tiempo a partir de su diccionario"""
+        error_summary = data.get('error_summary')
+        if error_summary:
+            error_summary = dict(error_summary, error_types=defaultdict(int, error_summary.get("error_types", {})))
+        return cls(
+            saga_id=data['saga_id'],
+            partner_id=data['partner_id'],
+            start_time=datetime.fromisoformat(data['start_time']),
+            end_time=datetime.fromisoformat(data['end_time']) if data.get('end_time') else None,
+            total_duration_ms=data.get('total_duration_ms', 0.0),
+            steps=data.get('steps', []),
+            events=data.get('events', []),
+            compensations=data.get('compensations', []),
+            status=data['status'],
+            error_summary=error_summary
+        )
+
 class SagaAuditTrail:
     """Sistema de auditoría y trazabilidad para Sagas"""
     
     def __init__(self, 
                  audit_file_path: str = "/app/logs/saga_audit.json",
                  max_records: int = 50000,
-                 enable_persistence: bool = True):
+                 enable_persistence: bool = True,
+                 retention_days: int = 30,
+                 checkpoint_every_records: int = 5000,
+                 maintenance_interval_seconds: float = 300.0,
+                 segment_max_bytes: int = 16 * 1024 * 1024,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL):
         self.audit_file_path = audit_file_path
         self.max_records = max_records
         self.enable_persistence = enable_persistence
+        self.retention_days = retention_days
+        self.checkpoint_every_records = checkpoint_every_records
+        self.maintenance_interval_seconds = maintenance_interval_seconds
+        
+        # Write-ahead log segments and timeline checkpoint live next to the legacy file
+        base_path = os.path.splitext(self.audit_file_path)[0]
+        self.wal_directory = base_path
+        self.checkpoint_path = f"{base_path}.checkpoint.json"
         
         # Storage
-        self._audit_records: List[SagaAuditRecord] = []
+        self._audit_records = IndexedRingBuffer(
+            maxlen=max_records,
+            indexed_fields=("saga_id", "partner_id", "event_type", "service_name", "result")
+        )
         self._saga_timelines: Dict[str, SagaTimeline] = {}
+        self._wal: Optional[SegmentedLogStore] = None
+        self._records_since_checkpoint = 0
+        self._last_checkpoint: Optional[Dict[str, Any]] = None
+        self._record_listeners: List[Callable[[SagaAuditRecord], None]] = []
         
         # Threading
         self._lock = threading.RLock()
+        self._maintenance_wakeup = threading.Event()
         
         # Logger
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -77,59 +157,177 @@ class SagaAuditTrail:
         # SagaLog instance
         self.saga_log = get_saga_log()
         
-        # Ensure audit directory exists
         if self.enable_persistence:
-            os.makedirs(os.path.dirname(self.audit_file_path), exist_ok=True)
+            self._wal = SegmentedLogStore(
+                directory=self.wal_directory,
+                prefix=os.path.basename(self.wal_directory),
+                max_segment_bytes=segment_max_bytes,
+                fsync_policy=fsync_policy
+            )
         
         # Load existing audit records
         self._load_existing_audit()
+        
+        if self._wal and self.maintenance_interval_seconds > 0:
+            self._start_maintenance_thread()
     
     def _load_existing_audit(self):
-        """Carga registros de auditoría existentes"""
-        if not os.path.exists(self.audit_file_path):
-            self.logger.info("No audit file found, starting fresh")
+        """Restaura las timelines del último checkpoint y la cola reciente del WAL"""
+        if not self._wal:
             return
         
+        self._migrate_legacy_file()
+        
+        replay_from = self._load_checkpoint()
+        replayed = 0
+        
         try:
-            with open(self.audit_file_path, 'r') as f:
-                audit_data = json.load(f)
-                self.logger.info(f"Loading {len(audit_data)} audit records from {self.audit_file_path}")
-                
-                for record_data in audit_data:
-                    record = SagaAuditRecord(
-                        id=record_data['id'],
-                        timestamp=datetime.fromisoformat(record_data['timestamp']),
-                        saga_id=record_data['saga_id'],
-                        partner_id=record_data['partner_id'],
-                        event_type=record_data['event_type'],
-                        step_name=record_data.get('step_name'),
-                        service_name=record_data['service_name'],
-                        correlation_id=record_data['correlation_id'],
-                        causation_id=record_data['causation_id'],
-                        event_data=record_data['event_data'],
-                        result=record_data['result'],
-                        error_details=record_data.get('error_details'),
-                        duration_ms=record_data.get('duration_ms'),
-                        metadata=record_data.get('metadata')
-                    )
-                    self._audit_records.append(record)
-                    # Reconstruir timeline al cargar cada registro
+            # Timelines: only the segments written after the checkpoint are replayed
+            for record_data in self._wal.iter_records(start_sequence=replay_from):
+                record = self._parse_record(record_data)
+                if record is not None:
                     self._update_saga_timeline(record)
-                
-                self.logger.info(f"Successfully loaded {len(self._audit_records)} audit records and {len(self._saga_timelines)} timelines")
+                    replayed += 1
+            
+            # Ring buffer: newest segments first, stopping once max_records are loaded
+            newest_first: List[SagaAuditRecord] = []
+            for record_data in self._wal.iter_records_reverse():
+                if len(newest_first) >= self.max_records:
+                    break
+                record = self._parse_record(record_data)
+                if record is not None:
+                    newest_first.append(record)
+            for record in reversed(newest_first):
+                self._audit_records.append(record)
+            
+            self._records_since_checkpoint = replayed
+            self.logger.info(
+                f"Loaded {len(self._audit_records)} audit records and {len(self._saga_timelines)} timelines "
+                f"({replayed} records replayed after checkpoint)"
+            )
         except Exception as e:
             self.logger.warning(f"Failed to load existing audit records: {e}")
     
-    def _save_audit_records(self):
-        """Guarda registros de auditoría al archivo"""
-        if not self.enable_persistence:
+    def _parse_record(self, record_data: Dict[str, Any]) -> Optional[SagaAuditRecord]:
+        try:
+            return SagaAuditRecord.from_dict(record_data)
+        except (KeyError, ValueError) as e:
+            self.logger.warning(f"Skipping malformed audit record: {e}")
+            return None
+    
+    def _load_checkpoint(self) -> Optional[int]:
+        """Restaura las timelines del checkpoint y devuelve el segmento desde el que reproducir"""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.load(f)
+            for timeline_data in checkpoint.get("timelines", []):
+                timeline = SagaTimeline.from_dict(timeline_data)
+                self._saga_timelines[timeline.saga_id] = timeline
+            self._last_checkpoint = {
+                "created_at": checkpoint.get("created_at"),
+                "wal_sequence": checkpoint["wal_sequence"],
+                "timelines": len(self._saga_timelines)
+            }
+            return checkpoint["wal_sequence"]
+        except Exception as e:
+            self.logger.warning(f"Failed to load audit checkpoint, replaying full log: {e}")
+            self._saga_timelines.clear()
+            return None
+    
+    def _migrate_legacy_file(self):
+        """Migra el archivo JSON monolítico anterior al WAL"""
+        if not os.path.exists(self.audit_file_path):
             return
         
         try:
-            with open(self.audit_file_path, 'w') as f:
-                json.dump([record.to_dict() for record in self._audit_records], f, indent=2)
+            with open(self.audit_file_path, 'r') as f:
+                audit_data = json.load(f)
+            for record_data in audit_data:
+                self._wal.append(record_data)
+            self._wal.flush(fsync=True)
+            os.replace(self.audit_file_path, f"{self.audit_file_path}.migrated")
+            self.logger.info(f"Migrated {len(audit_data)} legacy audit records to {self.wal_directory}")
         except Exception as e:
-            self.logger.error(f"Failed to save audit records: {e}")
+            self.logger.warning(f"Failed to migrate legacy audit file: {e}")
+    
+    def _start_maintenance_thread(self):
+        """Inicia el hilo de checkpoints y compactación"""
+        def maintenance_worker():
+            while True:
+                self._maintenance_wakeup.wait(self.maintenance_interval_seconds)
+                self._maintenance_wakeup.clear()
+                try:
+                    if self._records_since_checkpoint > 0:
+                        self.checkpoint()
+                    self.compact()
+                except Exception as e:
+                    self.logger.error(f"Error in audit maintenance thread: {e}")
+        
+        maintenance_thread = threading.Thread(target=maintenance_worker, name="saga-audit-maintenance", daemon=True)
+        maintenance_thread.start()
+    
+    def checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Escribe un checkpoint de las timelines alineado con un límite de segmento del WAL"""
+        if not self._wal:
+            return None
+        
+        with self._lock:
+            # Records from the new segment on are not covered by this checkpoint
+            wal_sequence = self._wal.roll()
+            timelines = [timeline.to_dict() for timeline in self._saga_timelines.values()]
+            self._records_since_checkpoint = 0
+        
+        checkpoint = {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "wal_sequence": wal_sequence,
+            "timelines": timelines
+        }
+        
+        try:
+            tmp_path = f"{self.checkpoint_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(checkpoint, f, separators=(',', ':'))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+        except Exception as e:
+            self.logger.error(f"Failed to write audit checkpoint: {e}")
+            return None
+        
+        self._last_checkpoint = {
+            "created_at": checkpoint["created_at"],
+            "wal_sequence": wal_sequence,
+            "timelines": len(timelines)
+        }
+        return self._last_checkpoint
+    
+    def compact(self, retention_days: Optional[int] = None) -> int:
+        """Elimina registros fuera de la ventana de retención sin reescribir segmentos vivos"""
+        retention_days = self.retention_days if retention_days is None else retention_days
+        cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        
+        with self._lock:
+            # Records are time-ordered, so expired ones are at the front of the ring
+            self._audit_records.evict_older_than(cutoff)
+            
+            expired = [
+                saga_id for saga_id, timeline in self._saga_timelines.items()
+                if timeline.end_time and timeline.end_time < cutoff
+            ]
+            for saga_id in expired:
+                del self._saga_timelines[saga_id]
+        
+        if not self._wal or not self._last_checkpoint:
+            return 0
+        
+        # Segments not yet covered by a checkpoint are needed for replay and are kept
+        removed = self._wal.drop_segments_older_than(cutoff, max_sequence=self._last_checkpoint["wal_sequence"])
+        if removed:
+            self.logger.info(f"Compacted {removed} audit segments older than {retention_days} days")
+        return removed
     
     def _add_audit_record(self, 
                          saga_id: str,
@@ -164,18 +362,35 @@ class SagaAuditTrail:
                 metadata=metadata
             )
             
+            # Ring buffer: the oldest record and its index entries are evicted once max_records is reached
             self._audit_records.append(record)
             
-            # Keep only recent records
-            if len(self._audit_records) > self.max_records:
-                self._audit_records = self._audit_records[-self.max_records:]
-            
             # Update timeline
             self._update_saga_timeline(record)
             
-            # Save to file
-            if self.enable_persistence:
-                self._save_audit_records()
+            # Write-ahead log: append only, flushed in the background
+            if self._wal:
+                self._wal.append(record.to_dict())
+                self._records_since_checkpoint += 1
+                if self._records_since_checkpoint >= self.checkpoint_every_records:
+                    self._maintenance_wakeup.set()
+        
+        # Listeners run outside the lock so they never extend the write path's critical section
+        for listener in self._record_listeners:
+            try:
+                listener(record)
+            except Exception as e:
+                self.logger.error(f"Error in audit record listener: {e}")
+    
+    def add_record_listener(self, listener: Callable[[SagaAuditRecord], None]):
+        """Registra un callback invocado por cada registro de auditoría nuevo"""
+        with self._lock:
+            self._record_listeners.append(listener)
+    
+    def get_record_count(self) -> int:
+        """Número de registros de auditoría en memoria"""
+        with self._lock:
+            return len(self._audit_records)
     
     def _update_saga_timeline(self, record: SagaAuditRecord):
         """Actualiza la línea de tiempo de la Saga"""
@@ -451,24 +666,17 @@ class SagaAuditTrail:
                          end_time: Optional[datetime] = None) -> List[SagaAuditRecord]:
         """Busca registros de auditoría con filtros"""
         with self._lock:
-            results = self._audit_records.copy()
-            
-            if saga_id:
-                results = [record for record in results if record.saga_id == saga_id]
-            if partner_id:
-                results = [record for record in results if record.partner_id == partner_id]
-            if event_type:
-                results = [record for record in results if record.event_type == event_type]
-            if result:
-                results = [record for record in results if record.result == result]
-            if service_name:
-                results = [record for record in results if record.service_name == service_name]
-            if start_time:
-                results = [record for record in results if record.timestamp >= start_time]
-            if end_time:
-                results = [record for record in results if record.timestamp <= end_time]
-            
-            return results
+            return self._audit_records.query(
+                filters={
+                    "saga_id": saga_id,
+                    "partner_id": partner_id,
+                    "event_type": event_type,
+                    "result": result,
+                    "service_name": service_name
+                },
+                start_time=start_time,
+                end_time=end_time
+            )
     
     def get_failed_sagas(self) -> List[SagaTimeline]:
         """Obtiene todas las Sagas que han fallado"""
@@ -537,7 +745,11 @@ class SagaAuditTrail:
                 "compensation_rate": stats["compensation_rate"],
                 "audit_file_path": self.audit_file_path,
                 "max_records": self.max_records,
-                "persistence_enabled": self.enable_persistence
+                "persistence_enabled": self.enable_persistence,
+                "retention_days": self.retention_days,
+                "records_since_checkpoint": self._records_since_checkpoint,
+                "last_checkpoint": self._last_checkpoint,
+                "storage": self._wal.get_stats() if self._wal else None
             }
 
 # Singleton instance
@@ -547,5 +759,8 @@ def get_saga_audit_trail() -> SagaAuditTrail:
     """Obtiene la instancia singleton del SagaAuditTrail"""
     global _saga_audit_trail_instance
     if _saga_audit_trail_instance is None:
-        _saga_audit_trail_instance = SagaAuditTrail()
+        _saga_audit_trail_instance = SagaAuditTrail(
+            retention_days=int(os.getenv('SAGA_AUDIT_RETENTION_DAYS', '30')),
+            fsync_policy=FsyncPolicy(os.getenv('SAGA_AUDIT_FSYNC_POLICY', FsyncPolicy.INTERVAL.value))
+        )
     return _saga_audit_trail_instance
@@ -12,7 +12,9 @@ from dataclasses import dataclass, asdict
 from uuid import uuid4
 import os
 import threading
-from collections import deque
+
+from .segmented_log_store import SegmentedLogStore, FsyncPolicy
+from .indexed_ring_buffer import IndexedRingBuffer
 
 class SagaLogLevel(Enum):
     """Niveles de logging para Saga"""
@@ -67,6 +69,27 @@ class SagaLogEntry:
         data['event_type'] = self.event_type.value
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'SagaLogEntry':
+        """Reconstruye una entrada a partir de su diccionario"""
+        return cls(
+            id=data['id'],
+            timestamp=datetime.fromisoformat(data['timestamp']),
+            level=SagaLogLevel(data['level']),
+            event_type=SagaEventType(data['event_type']),
+            saga_id=data['saga_id'],
+            partner_id=data['partner_id'],
+            step_name=data.get('step_name'),
+            message=data.get('message', ''),
+            correlation_id=data.get('correlation_id'),
+            causation_id=data.get('causation_id'),
+            service_name=data.get('service_name'),
+            event_data=data.get('event_data'),
+            error_details=data.get('error_details'),
+            duration_ms=data.get('duration_ms'),
+            metadata=data.get('metadata')
+        )
+
 @dataclass
 class SagaMetrics:
     """Métricas de performance de la Saga"""
@@ -91,16 +114,27 @@ class SagaLog:
                  log_file_path: str = "/app/logs/saga_logs.json",
                  max_entries: int = 10000,
                  enable_console_logging: bool = True,
-                 enable_file_logging: bool = True):
+                 enable_file_logging: bool = True,
+                 segment_max_bytes: int = 16 * 1024 * 1024,
+                 max_segments: Optional[int] = 20,
+                 flush_interval_seconds: float = 0.5,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL):
         self.log_file_path = log_file_path
         self.max_entries = max_entries
         self.enable_console_logging = enable_console_logging
         self.enable_file_logging = enable_file_logging
         
+        # Segments live next to the legacy file: /app/logs/saga_logs/saga_logs-00000001.jsonl
+        self.segment_directory = os.path.splitext(self.log_file_path)[0]
+        
         # Storage
-        self._entries: deque = deque(maxlen=max_entries)
+        self._entries = IndexedRingBuffer(
+            maxlen=max_entries,
+            indexed_fields=("saga_id", "partner_id", "event_type", "service_name", "level")
+        )
         self._saga_metrics: Dict[str, SagaMetrics] = {}
         self._step_timers: Dict[str, Dict[str, datetime]] = {}
+        self._store: Optional[SegmentedLogStore] = None
         
         # Threading
         self._lock = threading.RLock()
@@ -108,53 +142,61 @@ class SagaLog:
         # Logger
         self.logger = logging.getLogger(self.__class__.__name__)
         
-        # Ensure log directory exists
         if self.enable_file_logging:
-            os.makedirs(os.path.dirname(self.log_file_path), exist_ok=True)
+            self._store = SegmentedLogStore(
+                directory=self.segment_directory,
+                prefix=os.path.basename(self.segment_directory),
+                max_segment_bytes=segment_max_bytes,
+                max_segments=max_segments,
+                flush_interval_seconds=flush_interval_seconds,
+                fsync_policy=fsync_policy
+            )
         
-        # Load existing logs if file exists
+        # Load existing logs
         self._load_existing_logs()
     
     def _load_existing_logs(self):
-        """Carga logs existentes del archivo"""
-        if not os.path.exists(self.log_file_path):
+        """Carga los logs más recientes recorriendo los segmentos hacia atrás"""
+        if not self._store:
             return
         
+        self._migrate_legacy_file()
+        
         try:
-            with open(self.log_file_path, 'r', encoding='utf-8') as f:
-                logs = json.load(f)
-                for log_data in logs:
-                    entry = SagaLogEntry(
-                        id=log_data['id'],
-                        timestamp=datetime.fromisoformat(log_data['timestamp']),
-                        level=SagaLogLevel(log_data['level']),
-                        event_type=SagaEventType(log_data['event_type']),
-                        saga_id=log_data['saga_id'],
-                        partner_id=log_data['partner_id'],
-                        step_name=log_data.get('step_name'),
-                        message=log_data.get('message', ''),
-                        correlation_id=log_data.get('correlation_id'),
-                        causation_id=log_data.get('causation_id'),
-                        service_name=log_data.get('service_name'),
-                        event_data=log_data.get('event_data'),
-                        error_details=log_data.get('error_details'),
-                        duration_ms=log_data.get('duration_ms'),
-                        metadata=log_data.get('metadata')
-                    )
-                    self._entries.append(entry)
+            # Newest segments first: only the entries that fit in the ring buffer are parsed
+            newest_first: List[SagaLogEntry] = []
+            for log_data in self._store.iter_records_reverse():
+                if len(newest_first) >= self.max_entries:
+                    break
+                try:
+                    newest_first.append(SagaLogEntry.from_dict(log_data))
+                except (KeyError, ValueError) as e:
+                    self.logger.warning(f"Skipping malformed log entry: {e}")
+            for entry in reversed(newest_first):
+                self._entries.append(entry)
         except Exception as e:
             self.logger.warning(f"Failed to load existing logs: {e}")
     
-    def _save_logs(self):
-        """Guarda logs al archivo"""
-        if not self.enable_file_logging:
+    def _migrate_legacy_file(self):
+        """Migra el archivo JSON monolítico anterior al store segmentado"""
+        if not os.path.exists(self.log_file_path):
             return
         
         try:
-            with open(self.log_file_path, 'w', encoding='utf-8') as f:
-                json.dump([entry.to_dict() for entry in self._entries], f, indent=2)
+            with open(self.log_file_path, 'r', encoding='utf-8') as f:
+                logs = json.load(f)
+            for log_data in logs:
+                self._store.append(log_data)
+            self._store.flush(fsync=True)
+            os.replace(self.log_file_path, f"{self.log_file_path}.migrated")
+            self.logger.info(f"Migrated {len(logs)} legacy log entries to {self.segment_directory}")
         except Exception as e:
-            self.logger.error(f"Failed to save logs: {e}")
+            self.logger.warning(f"Failed to migrate legacy log file: {e}")
+    
+    def flush(self, fsync: bool = False):
+        """Fuerza la escritura a disco de las entradas pendientes"""
+        if self._store:
+            self._store.flush(fsync=fsync)
     
     def _log(self, 
              level: SagaLogLevel,
@@ -212,9 +254,10 @@ class SagaLog:
                 elif level == SagaLogLevel.CRITICAL:
                     self.logger.critical(log_message)
             
-            # File logging
-            if self.enable_file_logging:
-                self._save_logs()
+            # File logging: append-only, flushed in the background. Appending under the
+            # lock keeps the segment order identical to the ring buffer order
+            if self._store:
+                self._store.append(entry.to_dict())
     
     def saga_started(self, saga_id: str, partner_id: str, correlation_id: str, service_name: str, event_data: Dict[str, Any] = None):
         """Registra el inicio de una Saga"""
@@ -262,8 +305,8 @@ class SagaLog:
                 self._step_timers[saga_id] = {}
             self._step_timers[saga_id][step_name] = datetime.now(timezone.utc)
     
-    def step_completed(self, saga_id: str, partner_id: str, step_name: str, correlation_id: str, service_name: str, duration_ms: float = None):
-        """Registra la finalización exitosa de un paso"""
+    def step_completed(self, saga_id: str, partner_id: str, step_name: str, correlation_id: str, service_name: str, duration_ms: float = None) -> Optional[float]:
+        """Registra la finalización exitosa de un paso y devuelve su duración en ms"""
         if duration_ms is None:
             # Calculate duration
             with self._lock:
@@ -292,6 +335,8 @@ class SagaLog:
                 if duration_ms:
                     metrics.total_duration_ms += duration_ms
                     metrics.average_step_duration_ms = metrics.total_duration_ms / metrics.completed_steps
+        
+        return duration_ms
     
     def step_failed(self, saga_id: str, partner_id: str, step_name: str, correlation_id: str, service_name: str, error: Exception, duration_ms: float = None):
         """Registra el fallo de un paso"""
@@ -521,12 +566,12 @@ class SagaLog:
     def get_saga_logs(self, saga_id: str) -> List[SagaLogEntry]:
         """Obtiene todos los logs de una Saga específica"""
         with self._lock:
-            return [entry for entry in self._entries if entry.saga_id == saga_id]
+            return self._entries.query({"saga_id": saga_id})
     
     def get_partner_logs(self, partner_id: str) -> List[SagaLogEntry]:
         """Obtiene todos los logs de un Partner específico"""
         with self._lock:
-            return [entry for entry in self._entries if entry.partner_id == partner_id]
+            return self._entries.query({"partner_id": partner_id})
     
     def get_saga_metrics(self, saga_id: str) -> Optional[SagaMetrics]:
         """Obtiene las métricas de una Saga específica"""
@@ -541,7 +586,7 @@ class SagaLog:
     def get_recent_logs(self, limit: int = 100) -> List[SagaLogEntry]:
         """Obtiene los logs más recientes"""
         with self._lock:
-            return list(self._entries)[-limit:]
+            return self._entries.recent(limit)
     
     def search_logs(self, 
                    saga_id: Optional[str] = None,
@@ -551,39 +596,30 @@ class SagaLog:
                    step_name: Optional[str] = None,
                    service_name: Optional[str] = None,
                    start_time: Optional[datetime] = None,
-                   end_time: Optional[datetime] = None) -> List[SagaLogEntry]:
-        """Busca logs con filtros específicos"""
+                   end_time: Optional[datetime] = None,
+                   limit: Optional[int] = None) -> List[SagaLogEntry]:
+        """Busca logs con filtros específicos (con limit, solo los más recientes)"""
         with self._lock:
-            results = list(self._entries)
-            
-            if saga_id:
-                results = [entry for entry in results if entry.saga_id == saga_id]
-            if partner_id:
-                results = [entry for entry in results if entry.partner_id == partner_id]
-            if event_type:
-                results = [entry for entry in results if entry.event_type == event_type]
-            if level:
-                results = [entry for entry in results if entry.level == level]
-            if step_name:
-                results = [entry for entry in results if entry.step_name == step_name]
-            if service_name:
-                results = [entry for entry in results if entry.service_name == service_name]
-            if start_time:
-                results = [entry for entry in results if entry.timestamp >= start_time]
-            if end_time:
-                results = [entry for entry in results if entry.timestamp <= end_time]
-            
-            return results
+            return self._entries.query(
+                filters={
+                    "saga_id": saga_id,
+                    "partner_id": partner_id,
+                    "event_type": event_type,
+                    "level": level,
+                    "service_name": service_name
+                },
+                start_time=start_time,
+                end_time=end_time,
+                predicate=(lambda entry: entry.step_name == step_name) if step_name else None,
+                limit=limit
+            )
     
     def clear_logs(self, older_than_days: int = 30):
         """Limpia logs más antiguos que el número de días especificado"""
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=older_than_days)
         
         with self._lock:
-            self._entries = deque(
-                [entry for entry in self._entries if entry.timestamp >= cutoff_date],
-                maxlen=self.max_entries
-            )
+            self._entries.evict_older_than(cutoff_date)
             
             # Remove old metrics
             old_sagas = [
@@ -593,13 +629,14 @@ class SagaLog:
             for saga_id in old_sagas:
                 del self._saga_metrics[saga_id]
             
-            # Save updated logs
-            if self.enable_file_logging:
-                self._save_logs()
+        # Drop whole closed segments instead of rewriting the log
+        if self._store:
+            self._store.drop_segments_older_than(cutoff_date)
     
     def export_logs(self, file_path: str, saga_id: Optional[str] = None):
         """Exporta logs a un archivo JSON"""
-        logs_to_export = self.get_saga_logs(saga_id) if saga_id else list(self._entries)
+        with self._lock:
+            logs_to_export = self.get_saga_logs(saga_id) if saga_id else list(self._entries)
         
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump([entry.to_dict() for entry in logs_to_export], f, indent=2)
@@ -620,8 +657,10 @@ class SagaLog:
                 "failed_sagas": failed_sagas,
                 "log_file_path": self.log_file_path,
                 "max_entries": self.max_entries,
+                "indexes": self._entries.get_stats()["indexes"],
                 "console_logging_enabled": self.enable_console_logging,
-                "file_logging_enabled": self.enable_file_logging
+                "file_logging_enabled": self.enable_file_logging,
+                "storage": self._store.get_stats() if self._store else None
             }
 
 # Singleton instance
@@ -631,5 +670,7 @@ def get_saga_log() -> SagaLog:
     """Obtiene la instancia singleton del SagaLog"""
     global _saga_log_instance
     if _saga_log_instance is None:
-        _saga_log_instance = SagaLog()
+        _saga_log_instance = SagaLog(
+            fsync_policy=FsyncPolicy(os.getenv('SAGA_LOG_FSYNC_POLICY', FsyncPolicy.INTERVAL.value))
+        )
     return _saga_log_instance
@@ -10,9 +10,11 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict, deque
 import statistics
 import threading
+import time
 
 from .saga_log import SagaLog, SagaMetrics as BaseSagaMetrics, get_saga_log
 from .saga_audit_trail import SagaAuditTrail, get_saga_audit_trail
+from .utils import performance_monitor
 
 @dataclass
 class PerformanceMetrics:
@@ -26,6 +28,7 @@ class PerformanceMetrics:
     fastest_step: Optional[str] = None
     fastest_step_duration_ms: Optional[float] = None
     step_durations: Dict[str, float] = None
+    step_latency_percentiles: Dict[str, Dict[str, float]] = None
     error_count: int = 0
     compensation_count: int = 0
     retry_count: int = 0
@@ -75,6 +78,54 @@ class Alert:
     resolved: bool = False
     resolved_at: Optional[datetime] = None
 
+class SlidingWindowCounter:
+    """Contador de eventos en una ventana deslizante, agrupado en buckets de tiempo fijos"""
+    
+    def __init__(self, window_seconds: int = 3600, bucket_seconds: int = 60):
+        self.window_seconds = window_seconds
+        self.bucket_seconds = bucket_seconds
+        self._buckets: deque = deque()  # [bucket_id, count], oldest first
+        self._total = 0
+        self._lock = threading.Lock()
+    
+    def add(self, count: int = 1, at: Optional[float] = None):
+        """Suma eventos en el bucket correspondiente al instante `at` (epoch, por defecto ahora)"""
+        now = time.time()
+        bucket_id = int((now if at is None else at) // self.bucket_seconds)
+        with self._lock:
+            self._expire(now)
+            if bucket_id <= int((now - self.window_seconds) // self.bucket_seconds):
+                return
+            if self._buckets and self._buckets[-1][0] == bucket_id:
+                self._buckets[-1][1] += count
+            elif not self._buckets or self._buckets[-1][0] < bucket_id:
+                self._buckets.append([bucket_id, count])
+            else:
+                # Late event (e.g. seeding from history): buckets are few, find its slot
+                for bucket in self._buckets:
+                    if bucket[0] == bucket_id:
+                        bucket[1] += count
+                        break
+                else:
+                    self._buckets.append([bucket_id, count])
+                    self._buckets = deque(sorted(self._buckets))
+            self._total += count
+    
+    def total(self) -> int:
+        """Número de eventos en la ventana actual"""
+        with self._lock:
+            self._expire(time.time())
+            return self._total
+    
+    def rate_per_second(self) -> float:
+        """Eventos por segundo promediados sobre la ventana"""
+        return self.total() / self.window_seconds
+    
+    def _expire(self, now: float):
+        oldest_valid = int((now - self.window_seconds) // self.bucket_seconds) + 1
+        while self._buckets and self._buckets[0][0] < oldest_valid:
+            self._total -= self._buckets.popleft()[1]
+
 class SagaMetrics:
     """Sistema de métricas y análisis de performance para Sagas"""
     
@@ -93,8 +144,16 @@ class SagaMetrics:
         self._alerts: List[Alert] = []
         self._alert_thresholds: List[AlertThreshold] = []
         
+        # Streaming aggregates, updated as sagas and audit records arrive so that
+        # a system snapshot is O(1) and never rescans _saga_metrics or the audit trail
+        self._status_counts: Dict[str, int] = defaultdict(int)
+        self._duration_sum_ms = 0.0
+        self._total_events = 0
+        self._event_rate = SlidingWindowCounter(window_seconds=3600, bucket_seconds=60)
+        
         # Threading
         self._lock = threading.RLock()
+        self._counters_lock = threading.Lock()
         
         # Logger
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -102,6 +161,8 @@ class SagaMetrics:
         # Dependencies
         self.saga_log = get_saga_log()
         self.audit_trail = get_saga_audit_trail()
+        self._seed_event_counters()
+        self.audit_trail.add_record_listener(self._on_audit_record)
         
         # Initialize default thresholds
         self._initialize_default_thresholds()
@@ -139,48 +200,33 @@ class SagaMetrics:
         monitoring_thread.start()
         self.logger.info("Real-time monitoring thread started")
     
+    def _seed_event_counters(self):
+        """Inicializa los contadores de eventos con los registros ya cargados del audit trail"""
+        one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        for record in self.audit_trail.get_audit_records(start_time=one_hour_ago):
+            self._event_rate.add(at=record.timestamp.timestamp())
+        with self._counters_lock:
+            self._total_events = self.audit_trail.get_record_count()
+    
+    def _on_audit_record(self, record):
+        """Actualiza los contadores de eventos con cada registro de auditoría nuevo"""
+        self._event_rate.add()
+        with self._counters_lock:
+            self._total_events += 1
+    
+    def _update_status_counters(self, old_status: Optional[str], new_status: str,
+                                old_duration_ms: float = 0, new_duration_ms: float = 0):
+        """Mueve una saga entre contadores de estado y ajusta la suma de duraciones"""
+        with self._counters_lock:
+            if old_status is not None:
+                self._status_counts[old_status] -= 1
+            self._status_counts[new_status] += 1
+            self._duration_sum_ms += max(new_duration_ms, 0) - max(old_duration_ms, 0)
+    
     def _collect_system_metrics(self):
         """Recolecta métricas del sistema"""
+        system_metrics = self.get_current_system_metrics()
         with self._lock:
-            # Calculate metrics from _saga_metrics
-            total_sagas = len(self._saga_metrics)
-            active_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "IN_PROGRESS"])
-            completed_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "COMPLETED"])
-            failed_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "FAILED"])
-            compensated_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "COMPENSATED"])
-            
-            # Calculate average duration
-            total_duration = sum(m["total_duration_ms"] for m in self._saga_metrics.values() if m["total_duration_ms"] > 0)
-            avg_duration = total_duration / max(completed_sagas, 1)
-            
-            # Calculate events per second (last hour)
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-            recent_records = self.audit_trail.get_audit_records(start_time=one_hour_ago)
-            events_per_second = len(recent_records) / 3600 if recent_records else 0
-            
-            # Calculate rates
-            success_rate = (completed_sagas / max(total_sagas, 1)) * 100
-            failure_rate = (failed_sagas / max(total_sagas, 1)) * 100
-            compensation_rate = (compensated_sagas / max(total_sagas, 1)) * 100
-            
-            # System metrics
-            system_metrics = SystemMetrics(
-                total_sagas=total_sagas,
-                active_sagas=active_sagas,
-                completed_sagas=completed_sagas,
-                failed_sagas=failed_sagas,
-                compensated_sagas=compensated_sagas,
-                average_saga_duration_ms=avg_duration,
-                total_events_processed=len(self.audit_trail.get_audit_records()),
-                events_per_second=events_per_second,
-                error_rate_percent=failure_rate,
-                compensation_rate_percent=compensation_rate,
-                success_rate_percent=success_rate,
-                system_uptime_hours=0,  # Would need to track system start time
-                memory_usage_mb=0,  # Would need system monitoring
-                cpu_usage_percent=0  # Would need system monitoring
-            )
-            
             self._system_metrics_history.append(system_metrics)
     
     def _check_alerts(self):
@@ -251,12 +297,15 @@ class SagaMetrics:
                     "errors": 0,
                     "compensations": 0
                 }
+                self._update_status_counters(None, "IN_PROGRESS")
                 self.logger.info(f"Saga {saga_id} started for partner {partner_id}")
     
     def record_saga_completion(self, saga_id: str, status: str = "COMPLETED"):
         """Registra la finalización de una saga"""
         with self._lock:
             if saga_id in self._saga_metrics:
+                old_status = self._saga_metrics[saga_id]["status"]
+                old_duration = self._saga_metrics[saga_id]["total_duration_ms"]
                 self._saga_metrics[saga_id]["status"] = status
                 self._saga_metrics[saga_id]["end_time"] = datetime.now(timezone.utc)
                 
@@ -265,6 +314,7 @@ class SagaMetrics:
                 end_time = self._saga_metrics[saga_id]["end_time"]
                 duration = (end_time - start_time).total_seconds() * 1000
                 self._saga_metrics[saga_id]["total_duration_ms"] = duration
+                self._update_status_counters(old_status, status, old_duration, duration)
                 
                 self.logger.info(f"Saga {saga_id} completed with status {status}")
     
@@ -279,6 +329,10 @@ class SagaMetrics:
                     self._saga_metrics[saga_id]["errors"] += 1
                 
                 self.logger.debug(f"Saga {saga_id} step {step_name} {'completed' if success else 'failed'} in {duration_ms}ms")
+        
+        # Latency histogram per step (shared across sagas) for tail percentiles
+        if duration_ms and duration_ms > 0:
+            performance_monitor.record_metric(f"saga_step.{step_name}", duration_ms)
     
     def record_saga_event(self, saga_id: str):
         """Registra un evento procesado por una saga"""
@@ -320,6 +374,12 @@ class SagaMetrics:
                     fastest_step = step_name
                     fastest_duration = duration
             
+            # Tail latency of each step across all sagas
+            step_latency_percentiles = {
+                step_name: performance_monitor.get_statistics(f"saga_step.{step_name}")
+                for step_name in step_durations
+            }
+            
             # Calculate throughput (events per second)
             if base_metrics.total_duration_ms > 0:
                 total_events = len(audit_records)
@@ -338,6 +398,7 @@ class SagaMetrics:
                 fastest_step=fastest_step,
                 fastest_step_duration_ms=fastest_duration if fastest_duration < float('inf') else None,
                 step_durations=step_durations,
+                step_latency_percentiles=step_latency_percentiles,
                 error_count=base_metrics.error_count,
                 compensation_count=base_metrics.compensation_count,
                 retry_count=0,  # Would need to track retries
@@ -382,46 +443,44 @@ class SagaMetrics:
             return self._system_metrics_history[-1] if self._system_metrics_history else None
     
     def get_current_system_metrics(self) -> SystemMetrics:
-        """Calcula las métricas actuales del sistema en tiempo real"""
-        with self._lock:
-            # Calculate metrics from _saga_metrics
-            total_sagas = len(self._saga_metrics)
-            active_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "IN_PROGRESS"])
-            completed_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "COMPLETED"])
-            failed_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "FAILED"])
-            compensated_sagas = len([m for m in self._saga_metrics.values() if m["status"] == "COMPENSATED"])
-            
-            # Calculate average duration
-            total_duration = sum(m["total_duration_ms"] for m in self._saga_metrics.values() if m["total_duration_ms"] > 0)
-            avg_duration = total_duration / max(completed_sagas, 1)
-            
-            # Calculate events per second (last hour)
-            one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-            recent_records = self.audit_trail.get_audit_records(start_time=one_hour_ago)
-            events_per_second = len(recent_records) / 3600 if recent_records else 0
-            
-            # Calculate rates
-            success_rate = (completed_sagas / max(total_sagas, 1)) * 100
-            failure_rate = (failed_sagas / max(total_sagas, 1)) * 100
-            compensation_rate = (compensated_sagas / max(total_sagas, 1)) * 100
-            
-            # System metrics
-            return SystemMetrics(
-                total_sagas=total_sagas,
-                active_sagas=active_sagas,
-                completed_sagas=completed_sagas,
-                failed_sagas=failed_sagas,
-                compensated_sagas=compensated_sagas,
-                average_saga_duration_ms=avg_duration,
-                total_events_processed=len(self.audit_trail.get_audit_records()),
-                events_per_second=events_per_second,
-                error_rate_percent=failure_rate,
-                compensation_rate_percent=compensation_rate,
-                success_rate_percent=success_rate,
-                system_uptime_hours=0,  # Would need to track system start time
-                memory_usage_mb=0,  # Would need system monitoring
-                cpu_usage_percent=0  # Would need system monitoring
-            )
+        """Calcula las métricas actuales del sistema en O(1) a partir de los contadores"""
+        with self._counters_lock:
+            total_sagas = sum(self._status_counts.values())
+            active_sagas = self._status_counts["IN_PROGRESS"]
+            completed_sagas = self._status_counts["COMPLETED"]
+            failed_sagas = self._status_counts["FAILED"]
+            compensated_sagas = self._status_counts["COMPENSATED"]
+            duration_sum_ms = self._duration_sum_ms
+            total_events = self._total_events
+        
+        # Calculate average duration
+        avg_duration = duration_sum_ms / max(completed_sagas, 1)
+        
+        # Calculate events per second (last hour)
+        events_per_second = self._event_rate.rate_per_second()
+        
+        # Calculate rates
+        success_rate = (completed_sagas / max(total_sagas, 1)) * 100
+        failure_rate = (failed_sagas / max(total_sagas, 1)) * 100
+        compensation_rate = (compensated_sagas / max(total_sagas, 1)) * 100
+        
+        # System metrics
+        return SystemMetrics(
+            total_sagas=total_sagas,
+            active_sagas=active_sagas,
+            completed_sagas=completed_sagas,
+            failed_sagas=failed_sagas,
+            compensated_sagas=compensated_sagas,
+            average_saga_duration_ms=avg_duration,
+            total_events_processed=total_events,
+            events_per_second=events_per_second,
+            error_rate_percent=failure_rate,
+            compensation_rate_percent=compensation_rate,
+            success_rate_percent=success_rate,
+            system_uptime_hours=0,  # Would need to track system start time
+            memory_usage_mb=0,  # Would need system monitoring
+            cpu_usage_percent=0  # Would need system monitoring
+        )
     
     def get_system_metrics_history(self, hours: int = 24) -> List[SystemMetrics]:
         """Obtiene el historial de métricas del sistema"""
@@ -529,6 +588,33 @@ class SagaMetrics:
         
         return recommendations
     
+    def get_latency_percentiles(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Obtiene p50/p90/p99/p999 por paso de saga, handler de eventos y tipo de consulta"""
+        return {
+            "saga_steps": performance_monitor.get_all_metrics(prefix="saga_step."),
+            "event_handlers": performance_monitor.get_all_metrics(prefix="event_handler."),
+            "queries": performance_monitor.get_all_metrics(prefix="query.")
+        }
+    
+    def render_prometheus(self) -> str:
+        """Exporta contadores de sagas e histogramas de latencia en formato de texto Prometheus"""
+        current = self.get_current_system_metrics()
+        gauges = [
+            ("hexabuilders_sagas_total", "Sagas tracked", current.total_sagas),
+            ("hexabuilders_sagas_active", "Sagas in progress", current.active_sagas),
+            ("hexabuilders_sagas_completed", "Sagas completed", current.completed_sagas),
+            ("hexabuilders_sagas_failed", "Sagas failed", current.failed_sagas),
+            ("hexabuilders_sagas_compensated", "Sagas compensated", current.compensated_sagas),
+            ("hexabuilders_saga_events_per_second", "Audit events per second over the last hour", current.events_per_second),
+            ("hexabuilders_saga_average_duration_seconds", "Average saga duration in seconds", current.average_saga_duration_ms / 1000)
+        ]
+        lines = []
+        for name, help_text, value in gauges:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n" + performance_monitor.render_prometheus()
+    
     def get_health_status(self) -> Dict[str, Any]:
         """Obtiene el estado de salud del sistema de métricas"""
         with self._lock:
@@ -0,0 +1,206 @@
+"""
+SagaTimerWheel - Rueda de temporizadores jerárquica para los timeouts de Saga
+Un único hilo avanza la rueda tick a tick; programar y cancelar son O(1) y los
+callbacks vencidos se despachan por lotes a un pool de workers, de modo que el
+número de hilos y la memoria no crecen con las sagas en curso.
+"""
+
+import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class _Timer:
+    """Temporizador programado en la rueda"""
+
+    __slots__ = ("timer_id", "deadline_tick", "callback", "args", "level", "slot")
+
+    def __init__(self, timer_id: str, deadline_tick: int, callback: Callable[..., Any], args: Tuple[Any, ...]):
+        self.timer_id = timer_id
+        self.deadline_tick = deadline_tick
+        self.callback = callback
+        self.args = args
+        self.level = 0
+        self.slot = 0
+
+
+class SagaTimerWheel:
+    """Rueda de temporizadores jerárquica compartida por todas las sagas"""
+
+    def __init__(self,
+                 tick_ms: int = 100,
+                 wheel_sizes: Sequence[int] = (512, 64, 64),
+                 max_workers: int = 4,
+                 batch_size: int = 256):
+        self.tick_seconds = tick_ms / 1000.0
+        self.wheel_sizes = tuple(wheel_sizes)
+        self.batch_size = batch_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        # Ticks covered by one slot of each level and by each whole level
+        self._slot_spans: List[int] = []
+        span = 1
+        for size in self.wheel_sizes:
+            self._slot_spans.append(span)
+            span *= size
+        self._horizon = span
+
+        # Each slot maps timer_id -> timer so cancel is a dict delete
+        self._wheels: List[List[Dict[str, _Timer]]] = [
+            [{} for _ in range(size)] for size in self.wheel_sizes
+        ]
+        self._timers: Dict[str, _Timer] = {}
+        self._lock = threading.Lock()
+
+        self._started_at = time.monotonic()
+        self._current_tick = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._wakeup = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="saga-timer")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def schedule(self, timer_id: str, delay_seconds: float, callback: Callable[..., Any], *args: Any) -> str:
+        """Programa `callback(*args)` dentro de `delay_seconds`; reprograma si el id ya existe"""
+        self._ensure_started()
+        elapsed = time.monotonic() - self._started_at + max(delay_seconds, 0.0)
+        deadline_tick = math.ceil(elapsed / self.tick_seconds)
+
+        with self._lock:
+            self._remove(timer_id)
+            timer = _Timer(timer_id, max(deadline_tick, self._current_tick + 1), callback, args)
+            self._timers[timer_id] = timer
+            self._place(timer)
+        return timer_id
+
+    def schedule_at(self, timer_id: str, deadline: float, callback: Callable[..., Any], *args: Any) -> str:
+        """Programa un temporizador para un instante absoluto (epoch en segundos)"""
+        return self.schedule(timer_id, deadline - time.time(), callback, *args)
+
+    def cancel(self, timer_id: str) -> bool:
+        """Cancela un temporizador; devuelve False si ya había vencido o no existía"""
+        with self._lock:
+            return self._remove(timer_id)
+
+    def pending(self) -> int:
+        """Número de temporizadores programados"""
+        return len(self._timers)
+
+    def stop(self, wait: bool = True):
+        """Detiene el hilo de la rueda y el pool de workers"""
+        self._running = False
+        self._wakeup.set()
+        if self._thread and wait:
+            self._thread.join(timeout=5.0)
+        self._executor.shutdown(wait=wait)
+
+    # ------------------------------------------------------------------
+    # Wheel internals (callers hold self._lock)
+    # ------------------------------------------------------------------
+
+    def _place(self, timer: _Timer):
+        delta = max(timer.deadline_tick - self._current_tick, 0)
+        for level, size in enumerate(self.wheel_sizes):
+            if delta < self._slot_spans[level] * size or level == len(self.wheel_sizes) - 1:
+                # Beyond the horizon the timer parks in the farthest slot and is
+                # re-placed by its real deadline when that slot cascades
+                tick = min(timer.deadline_tick, self._current_tick + self._horizon - 1)
+                timer.level = level
+                timer.slot = (tick // self._slot_spans[level]) % size
+                self._wheels[level][timer.slot][timer.timer_id] = timer
+                return
+
+    def _remove(self, timer_id: str) -> bool:
+        timer = self._timers.pop(timer_id, None)
+        if timer is None:
+            return False
+        self._wheels[timer.level][timer.slot].pop(timer_id, None)
+        return True
+
+    def _advance(self) -> List[_Timer]:
+        """Avanza un tick: baja los niveles superiores que tocan y recoge los vencidos"""
+        self._current_tick += 1
+        tick = self._current_tick
+
+        # Cascade from the top so timers can drop several levels in one tick
+        for level in range(len(self.wheel_sizes) - 1, 0, -1):
+            if tick % self._slot_spans[level] == 0:
+                slot = (tick // self._slot_spans[level]) % self.wheel_sizes[level]
+                bucket = self._wheels[level][slot]
+                self._wheels[level][slot] = {}
+                for timer in bucket.values():
+                    self._place(timer)
+
+        slot = tick % self.wheel_sizes[0]
+        bucket = self._wheels[0][slot]
+        self._wheels[0][slot] = {}
+        expired = []
+        for timer in bucket.values():
+            if timer.deadline_tick <= tick:
+                del self._timers[timer.timer_id]
+                expired.append(timer)
+            else:
+                # Placed by the clamp above; still in the future
+                self._place(timer)
+        return expired
+
+    # ------------------------------------------------------------------
+    # Ticker thread
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self):
+        if self._running:
+            return
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="saga-timer-wheel", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while self._running:
+            target_tick = int((time.monotonic() - self._started_at) / self.tick_seconds)
+            expired: List[_Timer] = []
+            with self._lock:
+                # Catch up on every tick missed while sleeping or dispatching
+                while self._current_tick < target_tick:
+                    expired.extend(self._advance())
+
+            for start in range(0, len(expired), self.batch_size):
+                self._executor.submit(self._fire_batch, expired[start:start + self.batch_size])
+
+            next_tick_at = self._started_at + (self._current_tick + 1) * self.tick_seconds
+            self._wakeup.wait(max(next_tick_at - time.monotonic(), 0.0))
+
+    def _fire_batch(self, timers: List[_Timer]):
+        for timer in timers:
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                self.logger.error(f"Timer {timer.timer_id} callback failed: {e}")
+
+
+# Global instance
+_saga_timer_wheel_instance = None
+_saga_timer_wheel_lock = threading.Lock()
+
+
+def get_saga_timer_wheel() -> SagaTimerWheel:
+    """Obtiene la instancia singleton de la rueda de temporizadores"""
+    global _saga_timer_wheel_instance
+    if _saga_timer_wheel_instance is None:
+        with _saga_timer_wheel_lock:
+            if _saga_timer_wheel_instance is None:
+                _saga_timer_wheel_instance = SagaTimerWheel(
+                    tick_ms=int(os.getenv('SAGA_TIMER_TICK_MS', '100')),
+                    max_workers=int(os.getenv('SAGA_TIMER_WORKERS', '4'))
+                )
+    return _saga_timer_wheel_instance
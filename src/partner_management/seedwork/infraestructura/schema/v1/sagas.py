@@ -0,0 +1,189 @@
+from typing import Dict, Any, List, Optional
+
+
+SAGA_EVENT_NAMESPACE = "com.hexabuilders.partners.events.saga"
+
+
+# Correlation fields carried by every saga event
+SAGA_EVENT_COMMON_FIELDS = [
+    {
+        "name": "saga_id",
+        "type": ["null", "string"],
+        "doc": "Saga instance identifier",
+        "default": None
+    },
+    {
+        "name": "partner_id",
+        "type": ["null", "string"],
+        "doc": "Partner the saga is onboarding",
+        "default": None
+    },
+    {
+        "name": "correlation_id",
+        "type": ["null", "string"],
+        "doc": "Correlation ID shared by every event of the saga",
+        "default": None
+    },
+    {
+        "name": "causation_id",
+        "type": ["null", "string"],
+        "doc": "ID of the message that caused this event",
+        "default": None
+    }
+]
+
+
+# Fields of compensation requests and their confirmations
+SAGA_COMPENSATION_FIELDS = [
+    {
+        "name": "step",
+        "type": ["null", "string"],
+        "doc": "Saga step being compensated",
+        "default": None
+    },
+    {
+        "name": "error",
+        "type": ["null", "string"],
+        "doc": "Error raised while executing or compensating the step",
+        "default": None
+    },
+    {
+        "name": "skipped",
+        "type": ["null", "boolean"],
+        "doc": "Compensation skipped because the step never ran",
+        "default": None
+    }
+]
+
+
+# Payload keys without a typed field travel JSON-encoded, so schemas never lose data
+SAGA_EVENT_ATTRIBUTES_FIELD = {
+    "name": "attributes",
+    "type": {
+        "type": "map",
+        "values": "string"
+    },
+    "doc": "JSON-encoded values of payload keys without a typed field",
+    "default": {}
+}
+
+
+def _saga_event_schema(event_type: str, doc: str, extra_fields: List[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Build the schema of a saga event: dispatcher envelope plus typed payload."""
+    return {
+        "type": "record",
+        "name": f"{event_type}SagaEvent",
+        "namespace": SAGA_EVENT_NAMESPACE,
+        "doc": doc,
+        "fields": [
+            {"name": "event_type", "type": "string", "doc": "Saga event type"},
+            {"name": "source", "type": "string", "doc": "Service that published the event"},
+            {"name": "timestamp", "type": "double", "doc": "Unix timestamp in seconds when the event was published"},
+            {
+                "name": "event_data",
+                "type": {
+                    "type": "record",
+                    "name": f"{event_type}Payload",
+                    "fields": SAGA_EVENT_COMMON_FIELDS + (extra_fields or []) + [SAGA_EVENT_ATTRIBUTES_FIELD]
+                },
+                "doc": "Event payload"
+            }
+        ]
+    }
+
+
+def _string_field(name: str, doc: str) -> Dict[str, Any]:
+    return {"name": name, "type": ["null", "string"], "doc": doc, "default": None}
+
+
+# Saga events exchanged through PulsarEventDispatcher, keyed by event type
+SAGA_EVENT_SCHEMAS = {
+    # Forward steps
+    "PartnerOnboardingInitiated": _saga_event_schema(
+        "PartnerOnboardingInitiated", "Partner onboarding saga started"
+    ),
+    "PartnerRegistrationCompleted": _saga_event_schema(
+        "PartnerRegistrationCompleted", "Partner registered by onboarding"
+    ),
+    "ContractCreationRequested": _saga_event_schema(
+        "ContractCreationRequested", "Contract creation requested by the saga"
+    ),
+    "ContractCreated": _saga_event_schema(
+        "ContractCreated", "Contract created for the partner",
+        [_string_field("contract_id", "Created contract identifier")]
+    ),
+    "DocumentVerificationRequested": _saga_event_schema(
+        "DocumentVerificationRequested", "Document verification requested by the saga",
+        [{
+            "name": "document_types",
+            "type": ["null", {"type": "array", "items": "string"}],
+            "doc": "Document types to verify",
+            "default": None
+        }]
+    ),
+    "DocumentsVerified": _saga_event_schema(
+        "DocumentsVerified", "Partner documents verified",
+        [_string_field("package_id", "Verified document package identifier")]
+    ),
+    "CampaignsEnabled": _saga_event_schema(
+        "CampaignsEnabled", "Campaign permissions requested for the partner"
+    ),
+    "CampaignsEnabledConfirmed": _saga_event_schema(
+        "CampaignsEnabledConfirmed", "Campaign permissions configured",
+        [_string_field("configuration_status", "Campaign configuration status")]
+    ),
+    "CampaignsEnabledFailed": _saga_event_schema(
+        "CampaignsEnabledFailed", "Campaign configuration failed",
+        [_string_field("error", "Failure reason")]
+    ),
+    "RecruitmentSetupCompleted": _saga_event_schema(
+        "RecruitmentSetupCompleted", "Recruitment setup requested for the partner"
+    ),
+    "RecruitmentSetupConfirmed": _saga_event_schema(
+        "RecruitmentSetupConfirmed", "Recruitment setup configured",
+        [_string_field("setup_status", "Recruitment setup status")]
+    ),
+    "RecruitmentSetupFailed": _saga_event_schema(
+        "RecruitmentSetupFailed", "Recruitment setup failed",
+        [_string_field("error", "Failure reason")]
+    ),
+
+    # Compensation requests
+    "RecruitmentSetupCompensationRequested": _saga_event_schema(
+        "RecruitmentSetupCompensationRequested", "Recruitment setup compensation requested", SAGA_COMPENSATION_FIELDS
+    ),
+    "CampaignsDisableRequested": _saga_event_schema(
+        "CampaignsDisableRequested", "Campaign permissions compensation requested", SAGA_COMPENSATION_FIELDS
+    ),
+    "DocumentVerificationRevertRequested": _saga_event_schema(
+        "DocumentVerificationRevertRequested", "Document verification compensation requested", SAGA_COMPENSATION_FIELDS
+    ),
+    "ContractCancellationRequested": _saga_event_schema(
+        "ContractCancellationRequested", "Contract compensation requested", SAGA_COMPENSATION_FIELDS
+    ),
+    "PartnerRegistrationRevertRequested": _saga_event_schema(
+        "PartnerRegistrationRevertRequested", "Partner registration compensation requested", SAGA_COMPENSATION_FIELDS
+    ),
+
+    # Compensation confirmations
+    "RecruitmentSetupCompensated": _saga_event_schema(
+        "RecruitmentSetupCompensated", "Recruitment setup compensated", SAGA_COMPENSATION_FIELDS
+    ),
+    "CampaignsDisabled": _saga_event_schema(
+        "CampaignsDisabled", "Campaign permissions compensated", SAGA_COMPENSATION_FIELDS
+    ),
+    "DocumentVerificationReverted": _saga_event_schema(
+        "DocumentVerificationReverted", "Document verification compensated", SAGA_COMPENSATION_FIELDS
+    ),
+    "ContractCancelled": _saga_event_schema(
+        "ContractCancelled", "Contract compensated", SAGA_COMPENSATION_FIELDS
+    ),
+    "PartnerRegistrationReverted": _saga_event_schema(
+        "PartnerRegistrationReverted", "Partner registration compensated", SAGA_COMPENSATION_FIELDS
+    )
+}
+
+
+def get_saga_event_schema(event_type: str) -> Optional[Dict[str, Any]]:
+    """Get the schema of a saga event type, if one is registered."""
+    return SAGA_EVENT_SCHEMAS.get(event_type)
@@ -0,0 +1,363 @@
+"""
+SegmentedLogStore - Almacenamiento append-only en segmentos JSON-lines
+Persiste registros de forma incremental con rotación por tamaño, flush en segundo plano
+y política de fsync configurable. La carga al arrancar se hace en streaming por segmento.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import atexit
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class FsyncPolicy(Enum):
+    """Política de sincronización a disco"""
+    ALWAYS = "always"       # fsync después de cada flush
+    INTERVAL = "interval"   # fsync como máximo cada fsync_interval_seconds
+    NEVER = "never"         # se delega en el sistema operativo
+
+
+class SegmentedLogStore:
+    """Store append-only de registros JSON, uno por línea, repartido en segmentos rotados por tamaño"""
+
+    SEGMENT_SUFFIX = ".jsonl"
+
+    def __init__(self,
+                 directory: str,
+                 prefix: str,
+                 max_segment_bytes: int = 16 * 1024 * 1024,
+                 max_segments: Optional[int] = None,
+                 flush_interval_seconds: float = 0.5,
+                 fsync_policy: FsyncPolicy = FsyncPolicy.INTERVAL,
+                 fsync_interval_seconds: float = 5.0,
+                 max_pending_records: int = 10000):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.flush_interval_seconds = flush_interval_seconds
+        self.fsync_policy = FsyncPolicy(fsync_policy)
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.max_pending_records = max_pending_records
+
+        # Pending buffer (protected by _lock) and file handle (protected by _io_lock)
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+
+        self._segment_pattern = re.compile(rf"^{re.escape(prefix)}-(\d+){re.escape(self.SEGMENT_SUFFIX)}$")
+        self._active_file = None
+        self._active_sequence = 0
+        self._active_size = 0
+        self._last_fsync = datetime.now(timezone.utc)
+
+        # Stats
+        self._records_written = 0
+        self._flush_count = 0
+        self._corrupt_lines = 0
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._open_active_segment()
+
+        self._flusher_thread = None
+        if self.flush_interval_seconds > 0:
+            self._flusher_thread = threading.Thread(
+                target=self._flusher_worker,
+                name=f"{prefix}-flusher",
+                daemon=True
+            )
+            self._flusher_thread.start()
+
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Segments
+    # ------------------------------------------------------------------
+
+    def _segment_path(self, sequence: int) -> str:
+        return os.path.join(self.directory, f"{self.prefix}-{sequence:08d}{self.SEGMENT_SUFFIX}")
+
+    def _list_sequences(self) -> List[int]:
+        sequences = []
+        for name in os.listdir(self.directory):
+            match = self._segment_pattern.match(name)
+            if match:
+                sequences.append(int(match.group(1)))
+        return sorted(sequences)
+
+    def segments(self) -> List[str]:
+        """Obtiene las rutas de los segmentos, del más antiguo al más reciente"""
+        return [self._segment_path(sequence) for sequence in self._list_sequences()]
+
+    def _open_active_segment(self):
+        """Abre el último segmento para seguir escribiendo, o crea el primero"""
+        sequences = self._list_sequences()
+        self._active_sequence = sequences[-1] if sequences else 1
+        path = self._segment_path(self._active_sequence)
+        self._active_file = open(path, 'a', encoding='utf-8')
+        self._active_size = self._active_file.tell()
+
+    def _rotate(self):
+        """Cierra el segmento activo y abre uno nuevo (requiere _io_lock)"""
+        self._sync_active(force=True)
+        self._active_file.close()
+        self._active_sequence += 1
+        self._active_file = open(self._segment_path(self._active_sequence), 'a', encoding='utf-8')
+        self._active_size = 0
+        self._enforce_retention()
+
+    def _enforce_retention(self):
+        """Elimina los segmentos más antiguos si se supera max_segments"""
+        if not self.max_segments:
+            return
+        sequences = self._list_sequences()
+        for sequence in sequences[:-self.max_segments]:
+            self._remove_segment(sequence)
+
+    def _remove_segment(self, sequence: int):
+        try:
+            os.remove(self._segment_path(sequence))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Failed to remove segment {sequence}: {e}")
+
+    # ------------------------------------------------------------------
+    # Write path
+    # ------------------------------------------------------------------
+
+    def append(self, record: Dict[str, Any]):
+        """Añade un registro al buffer; el coste no depende del tamaño del histórico"""
+        line = json.dumps(record, separators=(',', ':'), ensure_ascii=False, default=str)
+
+        if self._flusher_thread is None:
+            # Synchronous mode: write straight through
+            with self._io_lock:
+                self._write_lines([line])
+            return
+
+        with self._lock:
+            self._pending.append(line)
+            pending_count = len(self._pending)
+
+        if pending_count >= self.max_pending_records:
+            # Backpressure: the caller drains the buffer instead of letting it grow
+            self.flush()
+
+    def flush(self, fsync: Optional[bool] = None):
+        """Escribe los registros pendientes en el segmento activo"""
+        # The swap happens under _io_lock so concurrent flushes write their batches in append order
+        with self._io_lock:
+            with self._lock:
+                lines, self._pending = self._pending, []
+
+            if self._active_file is None:
+                return
+            if lines:
+                self._write_lines(lines)
+            if fsync:
+                self._sync_active(force=True)
+
+    def _write_lines(self, lines: List[str]):
+        """Escribe un lote de líneas rotando cuando el segmento se llena (requiere _io_lock)"""
+        if self._active_file is None:
+            return
+        chunk: List[str] = []
+        chunk_size = 0
+        for line in lines:
+            line_size = len(line.encode('utf-8')) + 1
+            used = self._active_size + chunk_size
+            if used > 0 and used + line_size > self.max_segment_bytes:
+                if chunk:
+                    self._active_file.write('\n'.join(chunk) + '\n')
+                    self._active_size += chunk_size
+                    chunk, chunk_size = [], 0
+                self._rotate()
+            chunk.append(line)
+            chunk_size += line_size
+
+        if chunk:
+            self._active_file.write('\n'.join(chunk) + '\n')
+            self._active_size += chunk_size
+
+        self._active_file.flush()
+        self._records_written += len(lines)
+        self._flush_count += 1
+        self._sync_active()
+
+    def _sync_active(self, force: bool = False):
+        """Aplica la política de fsync sobre el segmento activo (requiere _io_lock)"""
+        if self._active_file is None:
+            return
+        now = datetime.now(timezone.utc)
+        if not force:
+            if self.fsync_policy == FsyncPolicy.NEVER:
+                return
+            if (self.fsync_policy == FsyncPolicy.INTERVAL and
+                    (now - self._last_fsync).total_seconds() < self.fsync_interval_seconds):
+                return
+        try:
+            self._active_file.flush()
+            os.fsync(self._active_file.fileno())
+            self._last_fsync = now
+        except Exception as e:
+            self.logger.error(f"Failed to fsync segment {self._active_sequence}: {e}")
+
+    def _flusher_worker(self):
+        """Hilo de flush periódico en segundo plano"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval_seconds)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Error in segment flusher: {e}")
+
+    # ------------------------------------------------------------------
+    # Read path
+    # ------------------------------------------------------------------
+
+    def iter_records(self, start_sequence: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Recorre en streaming todos los registros persistidos, en orden de escritura"""
+        for _, record in self.iter_records_with_sequence(start_sequence):
+            yield record
+
+    def iter_records_with_sequence(self, start_sequence: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Igual que iter_records, indicando el segmento de origen de cada registro"""
+        self.flush()
+        for sequence in self._list_sequences():
+            if start_sequence is not None and sequence < start_sequence:
+                continue
+            for record in self._iter_segment(self._segment_path(sequence)):
+                yield sequence, record
+
+    def iter_records_reverse(self) -> Iterator[Dict[str, Any]]:
+        """Recorre los registros del más reciente al más antiguo, leyendo cada segmento hacia atrás
+
+        Permite cargar solo la cola del histórico: quien consume deja de iterar al tener suficiente.
+        """
+        self.flush()
+        for sequence in reversed(self._list_sequences()):
+            yield from self._iter_segment_reverse(self._segment_path(sequence))
+
+    def _iter_segment(self, path: str) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                for line in f:
+                    record = self._decode_line(line)
+                    if record is not None:
+                        yield record
+        except FileNotFoundError:
+            return
+
+    def _iter_segment_reverse(self, path: str, block_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+        try:
+            with open(path, 'rb') as f:
+                position = f.seek(0, os.SEEK_END)
+                head = b''
+                while position > 0:
+                    read_size = min(block_size, position)
+                    position -= read_size
+                    f.seek(position)
+                    lines = (f.read(read_size) + head).split(b'\n')
+                    # The first line may continue in the previous block
+                    head = lines.pop(0)
+                    for line in reversed(lines):
+                        record = self._decode_line(line)
+                        if record is not None:
+                            yield record
+                record = self._decode_line(head)
+                if record is not None:
+                    yield record
+        except FileNotFoundError:
+            return
+
+    def _decode_line(self, line: bytes) -> Optional[Dict[str, Any]]:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            # Torn write at the tail of a segment after a crash
+            self._corrupt_lines += 1
+            return None
+
+    @property
+    def active_sequence(self) -> int:
+        return self._active_sequence
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def drop_segments_older_than(self, cutoff: datetime, max_sequence: Optional[int] = None) -> int:
+        """Elimina los segmentos cerrados cuya última escritura es anterior a cutoff.
+
+        Los segmentos con secuencia >= max_sequence (si se indica) se conservan siempre.
+        """
+        cutoff_ts = cutoff.timestamp()
+        limit = self._active_sequence if max_sequence is None else min(max_sequence, self._active_sequence)
+        removed = 0
+        with self._io_lock:
+            for sequence in self._list_sequences():
+                if sequence >= limit:
+                    break
+                path = self._segment_path(sequence)
+                try:
+                    if os.path.getmtime(path) < cutoff_ts:
+                        self._remove_segment(sequence)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+        return removed
+
+    def roll(self) -> int:
+        """Fuerza la rotación del segmento activo y devuelve la secuencia del nuevo segmento"""
+        self.flush()
+        with self._io_lock:
+            if self._active_file is not None and self._active_size > 0:
+                self._rotate()
+            return self._active_sequence
+
+    def close(self):
+        """Vacía el buffer, sincroniza y cierra el segmento activo"""
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        try:
+            self.flush(fsync=self.fsync_policy != FsyncPolicy.NEVER)
+        except Exception as e:
+            self.logger.error(f"Failed to flush segment store on close: {e}")
+        with self._io_lock:
+            if self._active_file is not None:
+                self._active_file.close()
+                self._active_file = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Obtiene estadísticas del store"""
+        with self._lock:
+            pending = len(self._pending)
+        sequences = self._list_sequences()
+        return {
+            "directory": self.directory,
+            "segments": len(sequences),
+            "active_segment": self._active_sequence,
+            "active_segment_bytes": self._active_size,
+            "pending_records": pending,
+            "records_written": self._records_written,
+            "flush_count": self._flush_count,
+            "corrupt_lines_skipped": self._corrupt_lines,
+            "fsync_policy": self.fsync_policy.value,
+            "max_segment_bytes": self.max_segment_bytes
+        }
@@ -4,11 +4,13 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Set, Callable, TypeVar
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from flask import session
+from flask import has_request_context, session
 
 from ..dominio.entidades import AggregateRoot
 from ..dominio.eventos import DomainEvent
 from ..dominio.excepciones import DomainException
+from .repositorios_sql import descartar_eventos_pendientes, publicar_eventos_confirmados
+from .utils import event_dispatcher
 
 
 T = TypeVar('T', bound=AggregateRoot)
@@ -236,6 +238,9 @@ class UnitOfWork(ABC):
                 message=f"Transaction commit failed: {str(e)}",
                 error_code="TRANSACTION_COMMIT_FAILED"
             ) from e
+        
+        # Publicar fuera del try: un suscriptor que falla no revierte lo ya confirmado
+        self._publish_domain_events()
     
     def rollback(self) -> None:
         """
@@ -292,7 +297,7 @@ class UnitOfWork(ABC):
             
             self._serialized_state = pickle.dumps(state)
             
-            if session is not None:
+            if has_request_context():
                 session[self._session_key] = self._serialized_state
                 
         except Exception as e:
@@ -302,7 +307,7 @@ class UnitOfWork(ABC):
     def _restore_from_session(self) -> bool:
         """Método interno para restaurar el estado desde la sesión."""
         try:
-            if session is None or self._session_key not in session:
+            if not has_request_context() or self._session_key not in session:
                 return False
             
             serialized_data = session[self._session_key]
@@ -326,7 +331,7 @@ class UnitOfWork(ABC):
             return False
     
     def _clear_session_state(self) -> None:
-        if session is not None and self._session_key in session:
+        if has_request_context() and self._session_key in session:
             del session[self._session_key]
         self._serialized_state = None
     
@@ -358,6 +363,13 @@ class UnitOfWork(ABC):
                     error_code="BATCH_OPERATION_FAILED"
                 ) from e
     
+    def _publish_domain_events(self) -> None:
+        """Publicar los eventos pendientes de los agregados registrados en la transacción."""
+        aggregates = {id(operation.entity): operation.entity for operation in self._batch_operations}
+        for aggregate in self._aggregates_with_events:
+            aggregates.setdefault(id(aggregate), aggregate)
+        event_dispatcher.publish_domain_events(aggregates.values())
+    
     def _track_entity_events(self, entity: AggregateRoot) -> None:
         if hasattr(entity, 'has_events') and entity.has_events:
             self._aggregates_with_events.add(entity)
@@ -419,10 +431,13 @@ class SqlAlchemyUnitOfWork(UnitOfWork):
     def _commit_transaction(self) -> None:
         if self._session:
             self._session.commit()
+            # Aggregates written directly through repositories sharing this session
+            publicar_eventos_confirmados(self._session)
     
     def _rollback_transaction(self) -> None:
         if self._session:
             self._session.rollback()
+            descartar_eventos_pendientes(self._session)
     
     def __enter__(self):
         return self
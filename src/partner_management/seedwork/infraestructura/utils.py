@@ -1,9 +1,10 @@
 import json
 import logging
+import math
 import os
 import pickle
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Callable, Union
+from typing import Any, Dict, Iterable, List, Optional, Type, Callable, Union
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from contextlib import contextmanager
@@ -117,6 +118,22 @@ class EventDispatcher:
         except Exception as e:
             self._logger.error(f"Error in PyDispatcher send: {str(e)}")
     
+    def publish_domain_events(self, aggregates: Iterable[Any]) -> int:
+        """
+        Publish and clear the pending domain events of persisted aggregates.
+        
+        Called once their changes are committed, so subscribers such as read models
+        never see events of a rolled back write. Returns the number of events published.
+        """
+        published = 0
+        for aggregate in aggregates:
+            events = aggregate.obtener_eventos()
+            aggregate.limpiar_eventos()
+            for event in events:
+                self.publish(event)
+            published += len(events)
+        return published
+    
     def get_handlers(self, event_type: Union[str, Type]) -> List[Callable]:
         """Get all handlers for event type."""
         event_key = self._get_event_key(event_type)
@@ -381,6 +398,98 @@ class ConfigurationManager:
         return value
 
 
+class LatencyHistogram:
+    """
+    Mergeable, fixed-memory latency histogram (DDSketch-style).
+    
+    Values are mapped to logarithmic buckets so every reported quantile is
+    within `relative_accuracy` of the true value. Memory is bounded by
+    `max_buckets`; when exceeded, the lowest buckets are collapsed, which
+    keeps tail quantiles (p99/p999) exact to the configured accuracy.
+    """
+    
+    QUANTILES = {'p50': 0.5, 'p90': 0.9, 'p99': 0.99, 'p999': 0.999}
+    
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048, min_value: float = 1e-3):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+    
+    def record(self, value: float) -> None:
+        """Record a single observation."""
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        
+        if value <= self.min_value:
+            self._zero_count += 1
+            return
+        
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+        if len(self._buckets) > self.max_buckets:
+            self._collapse_lowest()
+    
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Merge another histogram with the same accuracy into this one."""
+        if not math.isclose(self._gamma, other._gamma):
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        for key, bucket_count in other._buckets.items():
+            self._buckets[key] = self._buckets.get(key, 0) + bucket_count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._buckets) > self.max_buckets:
+            self._collapse_lowest()
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the q-quantile (0 <= q <= 1)."""
+        if self.count == 0:
+            return None
+        
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return max(self.min, 0.0)
+        
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+    
+    def percentiles(self) -> Dict[str, Optional[float]]:
+        """Get p50/p90/p99/p999."""
+        return {name: self.quantile(q) for name, q in self.QUANTILES.items()}
+    
+    def count_at_most(self, value: float) -> int:
+        """Number of observations <= value, to the histogram's relative accuracy."""
+        count = self._zero_count if value >= 0 else 0
+        for key, bucket_count in self._buckets.items():
+            if 2 * self._gamma ** key / (self._gamma + 1) <= value:
+                count += bucket_count
+        return count
+    
+    def _collapse_lowest(self) -> None:
+        keys = sorted(self._buckets)
+        lowest, next_lowest = keys[0], keys[1]
+        self._buckets[next_lowest] += self._buckets.pop(lowest)
+
+
 class PerformanceMonitor:
     """
     Performance monitoring utilities.
@@ -388,12 +497,15 @@ class PerformanceMonitor:
     Features:
     - Method execution timing
     - Memory usage tracking
-    - Performance metrics collection
+    - Latency histograms with tail percentiles, fixed memory per metric
     - Alert thresholds
+    - Prometheus text exposition
     """
     
-    def __init__(self):
-        self._metrics: Dict[str, List[float]] = {}
+    def __init__(self, relative_accuracy: float = 0.01):
+        self._relative_accuracy = relative_accuracy
+        self._metrics: Dict[str, LatencyHistogram] = {}
+        self._latest: Dict[str, float] = {}
         self._thresholds: Dict[str, float] = {}
         self._lock = Lock()
         self._logger = logging.getLogger(__name__ + ".PerformanceMonitor")
@@ -405,55 +517,101 @@ class PerformanceMonitor:
     @contextmanager
     def measure(self, operation_name: str):
         """Context manager to measure operation time."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             yield
         finally:
-            execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+            execution_time = (time.perf_counter() - start_time) * 1000  # Convert to milliseconds
             self.record_metric(operation_name, execution_time)
     
     def record_metric(self, metric_name: str, value: float) -> None:
         """Record performance metric."""
         with self._lock:
-            if metric_name not in self._metrics:
-                self._metrics[metric_name] = []
-            
-            self._metrics[metric_name].append(value)
-            
-            # Keep only last 1000 measurements
-            if len(self._metrics[metric_name]) > 1000:
-                self._metrics[metric_name] = self._metrics[metric_name][-1000:]
+            histogram = self._metrics.get(metric_name)
+            if histogram is None:
+                histogram = self._metrics[metric_name] = LatencyHistogram(self._relative_accuracy)
+            histogram.record(value)
+            self._latest[metric_name] = value
         
         # Check threshold
         if metric_name in self._thresholds and value > self._thresholds[metric_name]:
             self._logger.warning(f"Performance threshold exceeded for {metric_name}: {value:.2f}ms > {self._thresholds[metric_name]:.2f}ms")
     
+    def get_histogram(self, metric_name: str) -> Optional[LatencyHistogram]:
+        """Get a merged copy of the histogram for metric."""
+        with self._lock:
+            histogram = self._metrics.get(metric_name)
+            if histogram is None:
+                return None
+            snapshot = LatencyHistogram(self._relative_accuracy)
+            snapshot.merge(histogram)
+            return snapshot
+    
     def get_statistics(self, metric_name: str) -> Dict[str, float]:
         """Get statistics for metric."""
         with self._lock:
-            if metric_name not in self._metrics or not self._metrics[metric_name]:
+            histogram = self._metrics.get(metric_name)
+            if histogram is None or histogram.count == 0:
                 return {}
             
-            values = self._metrics[metric_name]
-            return {
-                'count': len(values),
-                'avg': sum(values) / len(values),
-                'min': min(values),
-                'max': max(values),
-                'latest': values[-1]
+            statistics = {
+                'count': histogram.count,
+                'avg': histogram.sum / histogram.count,
+                'min': histogram.min,
+                'max': histogram.max,
+                'latest': self._latest[metric_name]
             }
+            statistics.update(histogram.percentiles())
+            return statistics
     
-    def get_all_metrics(self) -> Dict[str, Dict[str, float]]:
-        """Get statistics for all metrics."""
-        return {name: self.get_statistics(name) for name in self._metrics.keys()}
+    def get_all_metrics(self, prefix: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Get statistics for all metrics, optionally only those starting with prefix."""
+        with self._lock:
+            names = [name for name in self._metrics if not prefix or name.startswith(prefix)]
+        return {name: self.get_statistics(name) for name in names}
     
     def clear_metrics(self, metric_name: Optional[str] = None) -> None:
         """Clear metrics."""
         with self._lock:
             if metric_name:
                 self._metrics.pop(metric_name, None)
+                self._latest.pop(metric_name, None)
             else:
                 self._metrics.clear()
+                self._latest.clear()
+    
+    # Prometheus default buckets, in seconds
+    PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    
+    def render_prometheus(self, metric_family: str = "hexabuilders_operation_latency_seconds") -> str:
+        """Render all histograms as Prometheus histograms in seconds (text exposition format).
+        
+        Metrics are recorded in milliseconds and converted to the Prometheus base unit here.
+        """
+        lines = [
+            f"# HELP {metric_family} Operation latency in seconds",
+            f"# TYPE {metric_family} histogram"
+        ]
+        with self._lock:
+            names = sorted(self._metrics)
+        for name in names:
+            histogram = self.get_histogram(name)
+            if histogram is None or histogram.count == 0:
+                continue
+            label = _prometheus_label_value(name)
+            for bound in self.PROMETHEUS_BUCKETS:
+                lines.append(
+                    f'{metric_family}_bucket{{operation="{label}",le="{bound}"}} {histogram.count_at_most(bound * 1000)}'
+                )
+            lines.append(f'{metric_family}_bucket{{operation="{label}",le="+Inf"}} {histogram.count}')
+            lines.append(f'{metric_family}_sum{{operation="{label}"}} {histogram.sum / 1000}')
+            lines.append(f'{metric_family}_count{{operation="{label}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+
+def _prometheus_label_value(value: str) -> str:
+    """Escape a value for use inside a Prometheus label."""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
 
 
 class HealthChecker:
@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Callable, Type, Union
 from functools import wraps
 
-from flask import Flask, request, jsonify, g, current_app
+from flask import Flask, Response, request, jsonify, g, current_app
 from flask_cors import CORS
 from werkzeug.exceptions import HTTPException
 
@@ -58,9 +58,15 @@ def create_app(config: Optional[Dict[str, Any]] = None) -> Flask:
     # Registrar endpoints de verificación de salud
     register_health_endpoints(app)
     
+    # Inyectar métricas de latencia en el despacho de consultas
+    register_query_metrics()
+    
     # Registrar blueprints CQRS
     register_cqrs_blueprints(app)
     
+    # Registrar blueprints de comisiones
+    register_commission_blueprints(app)
+    
     # Registrar blueprints de Saga
     register_saga_blueprints(app)
     
@@ -238,15 +244,32 @@ def register_cqrs_blueprints(app: Flask) -> None:
         logger.info("Command handlers registered successfully")
         
         # Registrar blueprint CQRS
-        from src.partner_management.api.partners_cqrs import bp as partners_bp
+        from src.partner_management.api.partners_cqrs import bp as partners_bp, bp_v2 as partners_v2_bp
         app.register_blueprint(partners_bp)
+        app.register_blueprint(partners_v2_bp)
         logger.info("Partners CQRS blueprint registered successfully")
+
+        # Subscribe the Profile360 read model before any domain event is published
+        from src.partner_management.modulos.partners.infraestructura.profile_360_read_model import get_profile_360_read_model
+        get_profile_360_read_model()
     except ImportError as e:
         logger.warning(f"Could not register Partners CQRS blueprint: {e}")
     except Exception as e:
         logger.error(f"Error registering CQRS blueprints: {e}")
 
 
+def register_commission_blueprints(app: Flask) -> None:
+    """
+    Registrar blueprints del módulo de comisiones.
+    
+    Import errors propagate, so a broken import chain fails startup instead of
+    leaving the report routes unmounted.
+    """
+    from src.partner_management.api.commissions_reports import bp as commissions_reports_bp
+    app.register_blueprint(commissions_reports_bp)
+    logger.info("Commission report blueprint registered successfully")
+
+
 def register_saga_blueprints(app: Flask) -> None:
     """Registrar blueprints de Saga de la aplicación."""
     try:
@@ -303,14 +326,19 @@ def register_health_endpoints(app: Flask) -> None:
     
     @app.route('/metrics', methods=['GET'])
     def metrics():
-        """Endpoint básico de métricas."""
-        # Esto se integraría con colección real de métricas
-        return jsonify({
-            'requests_total': 0,  # Reemplazar con métrica real
-            'requests_duration_seconds': 0,  # Reemplazar con métrica real
-            'active_connections': 0,  # Reemplazar con métrica real
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        })
+        """Histogramas de latencia (consultas, pasos de saga, handlers) en formato Prometheus."""
+        from src.partner_management.seedwork.infraestructura.utils import performance_monitor
+        return Response(performance_monitor.render_prometheus(), mimetype='text/plain; version=0.0.4')
+
+
+def register_query_metrics() -> None:
+    """Inyectar en el despachador de consultas el hook que alimenta los histogramas `query.<TipoConsulta>`."""
+    from src.partner_management.seedwork.aplicacion.queries import ejecutar_query
+    from src.partner_management.seedwork.infraestructura.utils import performance_monitor
+    
+    ejecutar_query.set_metrics_hook(
+        lambda query_type, seconds: performance_monitor.record_metric(f"query.{query_type}", seconds * 1000)
+    )
 
 
 def setup_logging(app: Flask) -> None:
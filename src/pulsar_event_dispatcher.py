@@ -1,18 +1,53 @@
-import json
 import logging
 import os
 import time
+import queue
 import threading
 import uuid
-from typing import Dict, Any, List, Callable
-from pulsar import Client, Consumer, Producer, Message
+import zlib
+from collections import deque
+from functools import partial
+from typing import Dict, Any, List, Callable, Optional
+from pulsar import (
+    Client, Consumer, Producer, Message, CompressionType, Result,
+    ConsumerBatchReceivePolicy, ConsumerType, BatchingType
+)
 import traceback
 
+try:
+    from .saga_event_codec import SagaEventCodec
+except ImportError:
+    # Imported as a top-level module with src/ on sys.path
+    from saga_event_codec import SagaEventCodec
+
 class PulsarEventDispatcher:
-    """Event dispatcher using Apache Pulsar for real distributed communication"""
+    """Event dispatcher using Apache Pulsar for real distributed communication.
+    
+    Each event type has its own topic ({topic_prefix}-{event_type}). A service only
+    consumes the topics of the event types it subscribed to, through a stable Key_Shared
+    subscription, so replicas of the same service split the stream by partner.
+    """
     
-    def __init__(self, service_name: str):
+    def __init__(self,
+                 service_name: str,
+                 latency_recorder: Optional[Callable[[str, float], None]] = None,
+                 async_publish: Optional[bool] = None,
+                 batching_max_messages: Optional[int] = None,
+                 batching_max_bytes: Optional[int] = None,
+                 batching_max_delay_ms: Optional[int] = None,
+                 compression: Optional[str] = None,
+                 max_retry_queue: int = 1000,
+                 max_publish_retries: int = 3,
+                 retry_backoff_seconds: float = 0.2,
+                 consumer_workers: Optional[int] = None,
+                 max_queued_messages: Optional[int] = None,
+                 receive_batch_size: int = 100,
+                 topic_prefix: Optional[str] = None,
+                 subscription_name: Optional[str] = None,
+                 codec: Optional[SagaEventCodec] = None):
         self.service_name = service_name
+        # Optional sink for per-handler latency, called as (metric_name, duration_ms)
+        self.latency_recorder = latency_recorder
         self.logger = logging.getLogger(self.__class__.__name__)
         self._handlers: Dict[str, List[Callable]] = {}
         self._running = False
@@ -20,104 +55,333 @@ class PulsarEventDispatcher:
         # Pulsar configuration
         self.pulsar_url = os.getenv('PULSAR_BROKER_URL', 'pulsar://localhost:6650')
         self.admin_url = os.getenv('PULSAR_ADMIN_URL', 'http://localhost:8080')
+        self.topic_prefix = topic_prefix or os.getenv('PULSAR_TOPIC_PREFIX', 'persistent://public/default/saga-events')
+        # Shared by every replica of the service so Pulsar load-balances between them
+        self.subscription_name = subscription_name or os.getenv('PULSAR_SUBSCRIPTION_NAME', f"{service_name}-saga-events")
+        # JSON by default: for these small events the C json module is about twice as fast as
+        # fastavro. PULSAR_EVENT_ENCODING=avro trades that CPU for smaller frames; decoding accepts both
+        self.codec = codec or SagaEventCodec(use_avro=os.getenv('PULSAR_EVENT_ENCODING', 'json').lower() == 'avro')
+        
+        # Publishing configuration (explicit arguments win over environment)
+        if async_publish is None:
+            async_publish = os.getenv('PULSAR_ASYNC_PUBLISH', 'true').lower() in ('1', 'true', 'yes')
+        self.async_publish = async_publish
+        self.batching_max_messages = batching_max_messages or int(os.getenv('PULSAR_BATCHING_MAX_MESSAGES', '1000'))
+        self.batching_max_bytes = batching_max_bytes or int(os.getenv('PULSAR_BATCHING_MAX_BYTES', str(128 * 1024)))
+        self.batching_max_delay_ms = batching_max_delay_ms or int(os.getenv('PULSAR_BATCHING_MAX_DELAY_MS', '10'))
+        self.compression = (compression or os.getenv('PULSAR_COMPRESSION', 'LZ4')).upper()
+        self.max_publish_retries = max_publish_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        
+        # Consumer pool configuration
+        self.consumer_workers = consumer_workers or int(os.getenv('PULSAR_CONSUMER_WORKERS', str(os.cpu_count() or 4)))
+        self.max_queued_messages = max_queued_messages or int(os.getenv('PULSAR_CONSUMER_QUEUE_SIZE', '1000'))
+        self.receive_batch_size = receive_batch_size
+        self._lanes: List[queue.Queue] = []
+        self._workers: List[threading.Thread] = []
+        self._receiver_thread = None
+        self._consumed_count = 0
+        self._subscriptions_changed = threading.Event()
+        
+        # In-flight async sends and failed sends waiting to be retried (bounded)
+        self._publish_condition = threading.Condition()
+        self._in_flight = 0
+        self._retry_queue: deque = deque()
+        self._max_retry_queue = max_retry_queue
+        self._published_count = 0
+        self._failed_count = 0
+        self._failed_at_last_flush = 0
+        self._retried_count = 0
         
-        # Initialize Pulsar client
+        # Initialize Pulsar client; producers are created per topic on first publish and
+        # the consumer once handlers are registered
         self.client = None
-        self.producer = None
         self.consumer = None
+        self._producers: Dict[str, Producer] = {}
+        self._producers_lock = threading.Lock()
         self._init_pulsar()
         
         # Start event processing
         self._start_event_loop()
     
     def _init_pulsar(self):
-        """Initialize Pulsar client and create producer/consumer"""
+        """Initialize Pulsar client"""
         try:
             self.client = Client(self.pulsar_url)
             self.logger.info(f"Pulsar client initialized for service {self.service_name}")
-            
-            # Create producer for publishing events
-            self.producer = self.client.create_producer(
-                topic=f"persistent://public/default/saga-events",
-                producer_name=f"{self.service_name}-producer-{str(uuid.uuid4())[:8]}"
-            )
-            
-            # Create consumer for subscribing to events
-            self.consumer = self.client.subscribe(
-                topic=f"persistent://public/default/saga-events",
-                subscription_name=f"{self.service_name}-subscription-{str(uuid.uuid4())[:8]}"
-            )
-            
-            self.logger.info(f"Pulsar producer and consumer created for service {self.service_name}")
-            
         except Exception as e:
             self.logger.error(f"Failed to initialize Pulsar: {str(e)}")
             self.logger.error(f"Traceback: {traceback.format_exc()}")
             raise
     
+    def topic_for(self, event_type: str) -> str:
+        """Topic that carries a given event type"""
+        return f"{self.topic_prefix}-{event_type}"
+    
+    def _producer_for(self, event_type: str) -> Producer:
+        """Get or lazily create the producer for an event type's topic"""
+        topic = self.topic_for(event_type)
+        producer = self._producers.get(topic)
+        if producer is not None:
+            return producer
+        with self._producers_lock:
+            producer = self._producers.get(topic)
+            if producer is None:
+                producer_options = {}
+                if self.async_publish:
+                    producer_options = {
+                        "batching_enabled": True,
+                        "batching_max_messages": self.batching_max_messages,
+                        "batching_max_allowed_size_in_bytes": self.batching_max_bytes,
+                        "batching_max_publish_delay_ms": self.batching_max_delay_ms,
+                        # One key per batch, required for Key_Shared dispatch
+                        "batching_type": BatchingType.KeyBased,
+                        "compression_type": self._compression_type(),
+                        "block_if_queue_full": True
+                    }
+                producer = self.client.create_producer(
+                    topic=topic,
+                    producer_name=f"{self.service_name}-producer-{event_type}-{str(uuid.uuid4())[:8]}",
+                    **producer_options
+                )
+                self._producers[topic] = producer
+                self.logger.info(f"Pulsar producer created for topic {topic}")
+        return producer
+    
+    def _resubscribe(self, consumer: Optional[Consumer]) -> Optional[Consumer]:
+        """Replace the consumer with one covering every subscribed event type.
+        
+        Handlers are registered at startup, so this normally runs once; the durable
+        subscription keeps unacknowledged messages for the new consumer.
+        """
+        self._subscriptions_changed.clear()
+        topics = [self.topic_for(event_type) for event_type in list(self._handlers)]
+        if consumer is not None:
+            try:
+                consumer.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing previous consumer: {str(e)}")
+        if not topics:
+            self.consumer = None
+            return None
+        try:
+            self.consumer = self.client.subscribe(
+                topic=topics,
+                subscription_name=self.subscription_name,
+                consumer_type=ConsumerType.KeyShared,
+                receiver_queue_size=self.max_queued_messages,
+                batch_receive_policy=ConsumerBatchReceivePolicy(self.receive_batch_size, -1, 100)
+            )
+            self.logger.info(f"Service {self.service_name} consuming {len(topics)} topics as {self.subscription_name}")
+        except Exception as e:
+            self.logger.error(f"Failed to subscribe to {topics}: {str(e)}")
+            self.consumer = None
+            # Try again on the next loop iteration
+            self._subscriptions_changed.set()
+            time.sleep(1.0)
+        return self.consumer
+    
+    def _compression_type(self):
+        """Map the configured compression name to the Pulsar enum"""
+        try:
+            return getattr(CompressionType, self.compression)
+        except AttributeError:
+            self.logger.warning(f"Unknown Pulsar compression '{self.compression}', publishing uncompressed")
+            return CompressionType.NONE
+    
     def _start_event_loop(self):
-        """Start the event processing loop in a separate thread"""
+        """Start the receiver thread and the pool of handler workers"""
         if self._running:
             return
         self._running = True
-        thread = threading.Thread(target=self._event_loop_worker, daemon=True)
-        thread.start()
-        self.logger.info(f"Event loop started for service {self.service_name}")
+        
+        # One bounded queue per worker: events for a partner always land in the same
+        # lane, so they are handled in order while other partners run in parallel
+        lane_size = max(1, self.max_queued_messages // self.consumer_workers)
+        self._lanes = [queue.Queue(maxsize=lane_size) for _ in range(self.consumer_workers)]
+        self._workers = []
+        for index, lane in enumerate(self._lanes):
+            worker = threading.Thread(
+                target=self._consumer_worker,
+                args=(lane,),
+                name=f"{self.service_name}-consumer-{index}",
+                daemon=True
+            )
+            worker.start()
+            self._workers.append(worker)
+        
+        self._receiver_thread = threading.Thread(target=self._receiver_worker, name=f"{self.service_name}-receiver", daemon=True)
+        self._receiver_thread.start()
+        if self.async_publish:
+            retry_thread = threading.Thread(target=self._retry_worker, daemon=True)
+            retry_thread.start()
+        self.logger.info(f"Event loop started for service {self.service_name} with {self.consumer_workers} consumer workers")
     
-    def _event_loop_worker(self):
-        """Worker thread that processes incoming Pulsar messages"""
+    def _receiver_worker(self):
+        """Pull message batches from Pulsar and route them to worker lanes by partner"""
+        consumer = None
         while self._running:
+            if self._subscriptions_changed.is_set():
+                consumer = self._resubscribe(consumer)
+            if consumer is None:
+                self._subscriptions_changed.wait(timeout=1.0)
+                continue
             try:
-                # Wait for messages with timeout
-                msg = self.consumer.receive(timeout_millis=1000)
-                if msg:
-                    self._process_message(msg)
-                    self.consumer.acknowledge(msg)
+                messages = consumer.batch_receive()
             except Exception as e:
                 if "timeout" not in str(e).lower():
                     self.logger.error(f"Error in event loop: {str(e)}")
-                time.sleep(0.1)  # Small delay to prevent busy waiting
-    
-    def _process_message(self, message: Message):
-        """Process a received Pulsar message"""
-        try:
-            # Parse message data
-            event_data = json.loads(message.data().decode('utf-8'))
-            event_type = event_data.get('event_type')
-            event_payload = event_data.get('event_data', {})
-            source = event_data.get('source', 'unknown')
-            
-            # Skip messages from our own service to avoid loops
-            if source == self.service_name:
-                return
-            
-            self.logger.info(f"Service {self.service_name} received event: {event_type} from {source}")
+                    time.sleep(0.1)  # Small delay to prevent busy waiting
+                continue
             
-            # Process event if we have handlers
-            if event_type in self._handlers:
-                for handler in self._handlers[event_type]:
+            for msg in messages:
+                event = self._decode_message(msg)
+                if event is None:
+                    # Undecodable or our own event: nothing to handle
+                    consumer.acknowledge(msg)
+                    continue
+                lane = self._lanes[self._lane_index(msg, event)]
+                # Blocks when the lane is full, which stops pulling from the broker (backpressure)
+                while True:
                     try:
-                        self.logger.info(f"Service {self.service_name} processing event: {event_type} with handler {handler.__name__}")
-                        handler(event_payload)
-                    except Exception as e:
-                        self.logger.error(f"Error in event handler {handler.__name__}: {str(e)}")
-                        self.logger.error(f"Traceback: {traceback.format_exc()}")
+                        lane.put((consumer, msg, event), timeout=1.0)
+                        break
+                    except queue.Full:
+                        if not self._running:
+                            return
+    
+    def _lane_index(self, message: Message, event: Dict[str, Any]) -> int:
+        """Stable lane for the event's partner; unkeyed events are spread by message id"""
+        key = message.partition_key()
+        if not key and isinstance(event["event_data"], dict):
+            key = event["event_data"].get("partner_id")
+        if not key:
+            key = str(message.message_id())
+        return zlib.crc32(str(key).encode('utf-8')) % len(self._lanes)
+    
+    def _consumer_worker(self, lane: queue.Queue):
+        """Run handlers for one lane and acknowledge each message after its handlers finish"""
+        # In async mode, consumed messages are acknowledged only after the events their
+        # handlers published have been flushed, so a crash cannot lose the follow-up events.
+        # Any send dropped while the batch was open negatively acks the whole batch.
+        unacked: List[tuple] = []
+        window_failed = 0
+        while self._running or not lane.empty():
+            try:
+                # While acks are pending, wait only as long as the batching delay
+                timeout = self.batching_max_delay_ms / 1000 if unacked else 1.0
+                consumer, msg, event = lane.get(timeout=timeout)
+            except queue.Empty:
+                if unacked:
+                    self._commit_consumed(unacked, window_failed)
+                continue
             
+            if not unacked:
+                window_failed = self._failed_sends()
+            handled = self._handle_event(event)
+            with self._publish_condition:
+                self._consumed_count += 1
+            if not handled:
+                self._acknowledge(consumer, msg, negative=True)
+            elif self.async_publish:
+                unacked.append((consumer, msg))
+                if len(unacked) >= self.batching_max_messages:
+                    self._commit_consumed(unacked, window_failed)
+            else:
+                self._acknowledge(consumer, msg, negative=self._failed_sends() > window_failed)
+        
+        if unacked:
+            self._commit_consumed(unacked, window_failed)
+    
+    def _failed_sends(self) -> int:
+        with self._publish_condition:
+            return self._failed_count
+    
+    def _commit_consumed(self, messages: List[tuple], failed_since: int):
+        """Flush published events, then acknowledge the messages that produced them.
+        
+        If the flush times out or any send failed since the batch started, the messages
+        are negatively acknowledged so the broker redelivers them and their handlers
+        publish the follow-up events again (at least once).
+        """
+        flushed = self.flush(failed_since=failed_since)
+        for consumer, msg in messages:
+            self._acknowledge(consumer, msg, negative=not flushed)
+        messages.clear()
+    
+    def _acknowledge(self, consumer: Consumer, message: Message, negative: bool = False):
+        """Ack through the consumer that delivered the message"""
+        try:
+            if negative:
+                consumer.negative_acknowledge(message)
+            else:
+                consumer.acknowledge(message)
+        except Exception as e:
+            # Consumer replaced or closed: the broker redelivers the message
+            self.logger.debug(f"Could not acknowledge message: {str(e)}")
+    
+    def _decode_message(self, message: Message) -> Optional[Dict[str, Any]]:
+        """Decode a Pulsar message; returns None if it should not be handled here"""
+        # Skip our own events from the message properties, without decoding the payload
+        if message.properties().get('source') == self.service_name:
+            return None
+        try:
+            event_data = self.codec.decode(message.data())
         except Exception as e:
             self.logger.error(f"Error processing message: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            return None
+        
+        # Skip messages from our own service to avoid loops
+        if event_data.get('source', 'unknown') == self.service_name:
+            return None
+        return {
+            "event_type": event_data.get('event_type'),
+            "event_data": event_data.get('event_data', {}),
+            "source": event_data.get('source', 'unknown')
+        }
+    
+    def _handle_event(self, event: Dict[str, Any]) -> bool:
+        """Run every handler subscribed to the event type; False if any of them raised.
+        
+        A failed message is negatively acknowledged so the broker redelivers it, which
+        reruns the failed handler; idempotent handlers skip the ones that succeeded.
+        """
+        event_type = event["event_type"]
+        event_payload = event["event_data"]
+        self.logger.info(f"Service {self.service_name} received event: {event_type} from {event['source']}")
+        
+        handled = True
+        for handler in self._handlers.get(event_type, []):
+            try:
+                self.logger.debug(f"Service {self.service_name} processing event: {event_type} with handler {handler.__name__}")
+                start = time.perf_counter()
+                handler(event_payload)
+                if self.latency_recorder:
+                    duration_ms = (time.perf_counter() - start) * 1000
+                    self.latency_recorder(f"event_handler.{event_type}.{handler.__name__}", duration_ms)
+            except Exception as e:
+                self.logger.error(f"Error in event handler {handler.__name__}: {str(e)}")
+                self.logger.error(f"Traceback: {traceback.format_exc()}")
+                handled = False
+        return handled
     
     def subscribe(self, event_type: str, handler: Callable):
         """Subscribe to a specific event type"""
         if event_type not in self._handlers:
             self._handlers[event_type] = []
+            # The receiver picks up the new topic before its next batch
+            self._subscriptions_changed.set()
         self._handlers[event_type].append(handler)
         self.logger.info(f"Service {self.service_name} subscribed to {event_type}")
     
     def publish(self, event_type: str, event_data: Dict[str, Any]):
-        """Publish an event to Pulsar"""
+        """Publish an event to Pulsar.
+        
+        In async mode the event is handed to the batching producer and this returns
+        immediately; call flush() at commit boundaries to wait for the broker acks.
+        """
         try:
-            self.logger.info(f"Service {self.service_name} publishing event: {event_type} for partner {event_data.get('partner_id', 'unknown')}")
+            self.logger.debug(f"Service {self.service_name} publishing event: {event_type} for partner {event_data.get('partner_id', 'unknown')}")
             
             # Create event message
             event_message = {
@@ -126,25 +390,151 @@ class PulsarEventDispatcher:
                 "timestamp": time.time(),
                 "source": self.service_name
             }
+            message_data = self.codec.encode(event_message)
+            # Keyed by partner so Key_Shared keeps each partner's events ordered
+            partner_id = event_data.get('partner_id')
+            partition_key = str(partner_id) if partner_id else None
             
-            # Send to Pulsar
-            message_data = json.dumps(event_message).encode('utf-8')
-            self.producer.send(message_data)
-            
-            self.logger.info(f"Event {event_type} published to Pulsar successfully")
+            if self.async_publish:
+                self._send_async(event_type, message_data, partition_key, attempt=0)
+            else:
+                self._producer_for(event_type).send(
+                    message_data,
+                    partition_key=partition_key,
+                    properties=self._message_properties(event_type)
+                )
+                self._published_count += 1
             
         except Exception as e:
+            with self._publish_condition:
+                self._failed_count += 1
             self.logger.error(f"Error publishing event to Pulsar: {str(e)}")
             self.logger.error(f"Traceback: {traceback.format_exc()}")
     
+    def _message_properties(self, event_type: str) -> Dict[str, str]:
+        return {"event_type": event_type, "source": self.service_name}
+    
+    def _send_async(self, event_type: str, message_data: bytes, partition_key: Optional[str], attempt: int):
+        """Hand a message to the batching producer, tracking it until the broker acks"""
+        with self._publish_condition:
+            self._in_flight += 1
+        try:
+            self._producer_for(event_type).send_async(
+                message_data,
+                partial(self._on_send_complete, event_type, message_data, partition_key, attempt),
+                partition_key=partition_key,
+                properties=self._message_properties(event_type)
+            )
+        except Exception as e:
+            self._on_send_complete(event_type, message_data, partition_key, attempt, e, None)
+    
+    def _on_send_complete(self, event_type: str, message_data: bytes, partition_key: Optional[str], attempt: int, result, message_id):
+        """Producer callback: count the ack or queue the message for retry"""
+        with self._publish_condition:
+            self._in_flight -= 1
+            if result == Result.Ok:
+                self._published_count += 1
+            elif attempt < self.max_publish_retries and len(self._retry_queue) < self._max_retry_queue:
+                self._retry_queue.append((event_type, message_data, partition_key, attempt + 1))
+                self.logger.warning(f"Publish of {event_type} failed ({result}), queued retry {attempt + 1}/{self.max_publish_retries}")
+            else:
+                self._failed_count += 1
+                self.logger.error(f"Dropping event {event_type} after {attempt + 1} attempts: {result}")
+            self._publish_condition.notify_all()
+    
+    def _retry_worker(self):
+        """Re-send failed messages with exponential backoff"""
+        while self._running or self._retry_queue:
+            with self._publish_condition:
+                while self._running and not self._retry_queue:
+                    self._publish_condition.wait(timeout=1.0)
+                if not self._retry_queue:
+                    continue
+                event_type, message_data, partition_key, attempt = self._retry_queue.popleft()
+                # Counted as in flight while backing off so flush() keeps waiting for it
+                self._in_flight += 1
+            
+            time.sleep(self.retry_backoff_seconds * (2 ** (attempt - 1)))
+            with self._publish_condition:
+                self._in_flight -= 1
+                self._retried_count += 1
+            self._send_async(event_type, message_data, partition_key, attempt)
+    
+    def flush(self, timeout_seconds: Optional[float] = 30.0, failed_since: Optional[int] = None) -> bool:
+        """Wait until every published event has been acknowledged or given up on.
+        
+        Returns False if the timeout expires with sends still pending, or if any send
+        was dropped in the flushed window: since the failed count `failed_since`, or
+        since the previous flush when it is not given.
+        """
+        with self._publish_condition:
+            if failed_since is None:
+                failed_since = self._failed_at_last_flush
+        
+        if not self.async_publish:
+            return self._settle_flush(failed_since)
+        for topic, producer in list(self._producers.items()):
+            try:
+                producer.flush()
+            except Exception as e:
+                self.logger.error(f"Error flushing Pulsar producer for {topic}: {str(e)}")
+        
+        deadline = None if timeout_seconds is None else time.monotonic() + timeout_seconds
+        with self._publish_condition:
+            while self._in_flight or self._retry_queue:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.logger.warning(f"Flush timed out with {self._in_flight} in flight and {len(self._retry_queue)} queued for retry")
+                    return False
+                self._publish_condition.wait(timeout=remaining)
+        return self._settle_flush(failed_since)
+    
+    def _settle_flush(self, failed_since: int) -> bool:
+        with self._publish_condition:
+            dropped = self._failed_count - failed_since
+            self._failed_at_last_flush = self._failed_count
+        if dropped > 0:
+            self.logger.warning(f"Flush completed with {dropped} events dropped")
+            return False
+        return True
+    
+    def get_publish_stats(self) -> Dict[str, Any]:
+        """Publishing counters and queue depths"""
+        with self._publish_condition:
+            return {
+                "async_publish": self.async_publish,
+                "published": self._published_count,
+                "failed": self._failed_count,
+                "retried": self._retried_count,
+                "in_flight": self._in_flight,
+                "retry_queue": len(self._retry_queue),
+                "max_retry_queue": self._max_retry_queue,
+                "batching_max_messages": self.batching_max_messages,
+                "batching_max_bytes": self.batching_max_bytes,
+                "batching_max_delay_ms": self.batching_max_delay_ms,
+                "compression": self.compression if self.async_publish else "NONE",
+                "consumed": self._consumed_count,
+                "consumer_workers": self.consumer_workers,
+                "queued_per_worker": [lane.qsize() for lane in self._lanes],
+                "subscription": self.subscription_name,
+                "subscribed_topics": [self.topic_for(event_type) for event_type in self._handlers],
+                "producer_topics": list(self._producers)
+            }
+    
     def close(self):
         """Close Pulsar connections"""
+        # Stop receiving, let the workers drain their lanes and ack, then settle pending sends
         self._running = False
+        for worker in self._workers:
+            worker.join(timeout=5.0)
+        self.flush(timeout_seconds=5.0)
+        with self._publish_condition:
+            self._publish_condition.notify_all()
         try:
             if self.consumer:
                 self.consumer.close()
-            if self.producer:
-                self.producer.close()
+            for producer in self._producers.values():
+                producer.close()
             if self.client:
                 self.client.close()
             self.logger.info(f"Pulsar connections closed for service {self.service_name}")
@@ -4,56 +4,100 @@ from datetime import datetime
 matching_bp = Blueprint('matching', __name__)
 
 
+def _list_arg(name):
+    """Read a list query parameter given repeated or comma separated"""
+    values = []
+    for value in request.args.getlist(name):
+        values.extend(v.strip() for v in value.split(',') if v.strip())
+    return values
+
+
+def _float_arg(name):
+    value = request.args.get(name)
+    return float(value) if value not in (None, '') else None
+
+
 @matching_bp.route('/candidates-for-job/<job_id>', methods=['GET'])
 def find_candidates_for_job(job_id):
     """Find matching candidates for a job"""
     try:
+        from recruitment.modulos.candidates.dominio.entidades import AvailabilityStatus
+        from recruitment.modulos.candidates.dominio.indice_habilidades import get_skill_index
+        from recruitment.modulos.matching.dominio.entidades import MatchingEngine
+        from recruitment.modulos.matching.infraestructura.cache_puntuaciones import get_match_score_cache
+
         # Get query parameters
         limit = int(request.args.get('limit', 20))
         min_match_score = float(request.args.get('min_match_score', 70.0))
         include_unavailable = request.args.get('include_unavailable', 'false').lower() == 'true'
-        
-        # TODO: Implement candidate matching algorithm
-        
+        minimum_should_match = int(request.args.get('minimum_should_match', 1))
+
+        job_data = {
+            'id': job_id,
+            'required_skills': _list_arg('required_skills'),
+            'preferred_skills': _list_arg('preferred_skills'),
+            'location': request.args.get('location'),
+            'salary_min': _float_arg('salary_min'),
+            'salary_max': _float_arg('salary_max'),
+            'required_experience_years': int(request.args.get('required_experience_years', 0))
+        }
+
+        if not job_data['required_skills']:
+            return jsonify({
+                'error': 'Missing required parameter: required_skills',
+                'timestamp': datetime.utcnow().isoformat()
+            }), 400
+
+        # Only candidates holding the required skills reach the matching engine
+        skill_index = get_skill_index()
+        shortlist = skill_index.shortlist(job_data['required_skills'], minimum_should_match)
+        if not include_unavailable:
+            shortlist = [c for c in shortlist if c.availability == AvailabilityStatus.AVAILABLE]
+        candidates_by_id = {c.id: c for c in shortlist}
+
+        engine = MatchingEngine(score_cache=get_match_score_cache())
+        results = engine.batch_evaluate_candidates(
+            job_data, [c.to_matching_profile() for c in shortlist], max_results=limit
+        )
+
+        required = {skill.lower() for skill in job_data['required_skills']}
+        matches = []
+        for result in results:
+            match_score = round(result.overall_score * 100, 2)
+            if match_score < min_match_score:
+                continue
+            candidate = candidates_by_id[result.candidate_id]
+            matches.append({
+                'candidate_id': candidate.id,
+                'match_score': match_score,
+                'name': candidate.name,
+                'skills_match': [s.name for s in candidate.skills if s.name.lower() in required],
+                'experience_years': candidate.total_experience_years,
+                'availability': candidate.availability.value,
+                'reasons': [result.explanation] + result.recommendations
+            })
+
         return jsonify({
             'job_id': job_id,
-            'matches': [
-                {
-                    'candidate_id': 'candidate-1',
-                    'match_score': 95.5,
-                    'name': 'Alice Johnson',
-                    'skills_match': ['Python', 'Django', 'PostgreSQL'],
-                    'experience_years': 7,
-                    'availability': 'AVAILABLE',
-                    'reasons': [
-                        'Perfect skill match',
-                        'Experience level matches',
-                        'Location compatible'
-                    ]
-                },
-                {
-                    'candidate_id': 'candidate-2',
-                    'match_score': 87.2,
-                    'name': 'Bob Smith',
-                    'skills_match': ['Python', 'PostgreSQL'],
-                    'experience_years': 5,
-                    'availability': 'AVAILABLE',
-                    'reasons': [
-                        'Good skill overlap',
-                        'Meets experience requirements'
-                    ]
-                }
-            ],
-            'total_candidates': 150,
-            'matched_candidates': 25,
+            'matches': matches,
+            'total_candidates': len(skill_index),
+            'matched_candidates': len(shortlist),
             'parameters': {
                 'limit': limit,
                 'min_match_score': min_match_score,
-                'include_unavailable': include_unavailable
+                'include_unavailable': include_unavailable,
+                'minimum_should_match': minimum_should_match
             },
             'timestamp': datetime.utcnow().isoformat()
         }), 200
         
+    except ValueError as e:
+        return jsonify({
+            'error': 'Invalid parameter',
+            'message': str(e),
+            'timestamp': datetime.utcnow().isoformat()
+        }), 400
+
     except Exception as e:
         return jsonify({
             'error': 'Internal server error',
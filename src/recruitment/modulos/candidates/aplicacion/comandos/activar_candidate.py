@@ -5,9 +5,10 @@ Command to activate a candidate.
 import logging
 from dataclasses import dataclass
 
-from recruitment.seedwork.aplicacion.comandos import ejecutar_comando
-from recruitment.seedwork.infraestructura.uow import UnitOfWork
-from recruitment.seedwork.dominio.excepciones import DomainException
+from recruitment.seedwork.dominio.excepciones import CandidateNotFoundException, InvalidCandidateDataException
+from ...dominio.entidades import AvailabilityStatus
+from ...dominio.indice_habilidades import get_skill_index
+from ...infraestructura.repositorios import get_candidate_repository
 
 logger = logging.getLogger(__name__)
 
@@ -20,27 +21,25 @@ class ActivarCandidate:
     activated_by: str
 
 
-@ejecutar_comando.register
 def handle_activar_candidate(comando: ActivarCandidate) -> None:
     """Handle ActivateCandidate command."""
     logger.info(f"Executing ActivateCandidate command for candidate: {comando.candidate_id}")
     
     try:
         if not comando.candidate_id or not comando.activated_by:
-            raise DomainException("Candidate ID and activated by are required")
+            raise InvalidCandidateDataException("Candidate ID and activated by are required")
         
-        with UnitOfWork() as uow:
-            repo = uow.candidates
-            candidate = repo.obtener_por_id(comando.candidate_id)
-            if not candidate:
-                raise DomainException(f"Candidate not found: {comando.candidate_id}")
-            
-            candidate.activar(activated_by=comando.activated_by)
-            
-            repo.actualizar(candidate)
-            uow.commit()
-            
-            logger.info(f"Candidate activated successfully: {candidate.id}")
+        repo = get_candidate_repository()
+        candidate = repo.obtener_por_id(comando.candidate_id)
+        if not candidate:
+            raise CandidateNotFoundException(f"Candidate not found: {comando.candidate_id}")
+        
+        candidate.update_availability(AvailabilityStatus.AVAILABLE, reason=f"Activated by {comando.activated_by}")
+        
+        repo.actualizar(candidate)
+        get_skill_index().add(candidate)
+        
+        logger.info(f"Candidate activated successfully: {candidate.id}")
     
     except Exception as e:
         logger.error(f"Failed to activate candidate {comando.candidate_id}: {str(e)}")
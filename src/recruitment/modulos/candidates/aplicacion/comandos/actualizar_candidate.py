@@ -6,9 +6,11 @@ import logging
 from dataclasses import dataclass
 from typing import Optional, List
 
-from recruitment.seedwork.aplicacion.comandos import ejecutar_comando
-from recruitment.seedwork.infraestructura.uow import UnitOfWork
-from recruitment.seedwork.dominio.excepciones import DomainException
+from recruitment.modulos.matching.infraestructura.cache_puntuaciones import get_match_score_cache
+from recruitment.seedwork.dominio.excepciones import CandidateNotFoundException, InvalidCandidateDataException
+from ...dominio.indice_habilidades import get_skill_index
+from ...infraestructura.repositorios import get_candidate_repository
+from .base import skills_desde_nombres
 
 logger = logging.getLogger(__name__)
 
@@ -28,42 +30,43 @@ class ActualizarCandidate:
     notes: Optional[str] = None
 
 
-@ejecutar_comando.register
 def handle_actualizar_candidate(comando: ActualizarCandidate) -> None:
     """Handle UpdateCandidate command."""
     logger.info(f"Executing UpdateCandidate command for candidate: {comando.candidate_id}")
     
     try:
         if not comando.candidate_id:
-            raise DomainException("Candidate ID is required")
+            raise InvalidCandidateDataException("Candidate ID is required")
         
-        with UnitOfWork() as uow:
-            repo = uow.candidates
-            candidate = repo.obtener_por_id(comando.candidate_id)
-            if not candidate:
-                raise DomainException(f"Candidate not found: {comando.candidate_id}")
-            
-            if comando.name:
-                candidate.actualizar_name(comando.name)
-            if comando.phone:
-                candidate.actualizar_phone(comando.phone)
-            if comando.skills:
-                candidate.actualizar_skills(comando.skills)
-            if comando.experience_years is not None:
-                candidate.actualizar_experience_years(comando.experience_years)
-            if comando.current_position is not None:
-                candidate.actualizar_current_position(comando.current_position)
-            if comando.current_company is not None:
-                candidate.actualizar_current_company(comando.current_company)
-            if comando.resume_url is not None:
-                candidate.actualizar_resume_url(comando.resume_url)
-            if comando.notes is not None:
-                candidate.actualizar_notes(comando.notes)
-            
-            repo.actualizar(candidate)
-            uow.commit()
-            
-            logger.info(f"Candidate updated successfully: {candidate.id}")
+        repo = get_candidate_repository()
+        candidate = repo.obtener_por_id(comando.candidate_id)
+        if not candidate:
+            raise CandidateNotFoundException(f"Candidate not found: {comando.candidate_id}")
+        
+        if comando.name:
+            candidate.actualizar_name(comando.name)
+        if comando.phone:
+            candidate.actualizar_phone(comando.phone)
+        if comando.skills:
+            candidate.actualizar_skills(skills_desde_nombres(comando.skills, candidate.skills))
+        if comando.experience_years is not None:
+            candidate.actualizar_experience_years(comando.experience_years)
+        if comando.current_position is not None:
+            candidate.actualizar_current_position(comando.current_position)
+        if comando.current_company is not None:
+            candidate.actualizar_current_company(comando.current_company)
+        if comando.resume_url is not None:
+            candidate.actualizar_resume_url(comando.resume_url)
+        if comando.notes is not None:
+            candidate.actualizar_notes(comando.notes)
+        
+        repo.actualizar(candidate)
+        # Attaches the loaded instance and re-indexes its skills
+        get_skill_index().add(candidate)
+        # Scores computed for the previous version can no longer hit
+        get_match_score_cache().invalidate_candidate(candidate.id)
+        
+        logger.info(f"Candidate updated successfully: {candidate.id}")
     
     except Exception as e:
         logger.error(f"Failed to update candidate {comando.candidate_id}: {str(e)}")
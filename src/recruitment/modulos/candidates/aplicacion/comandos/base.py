@@ -5,9 +5,10 @@ Base classes for candidate commands.
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterable, List
 
 from recruitment.seedwork.aplicacion.comandos import Command
+from ...dominio.entidades import Skill
 from recruitment.seedwork.infraestructura.uow import UnitOfWork
 
 logger = logging.getLogger(__name__)
@@ -41,4 +42,13 @@ class ComandoHandlerCandidate(ABC):
     
     def _log_command_error(self, comando: CommandCandidate, error: Exception):
         """Log command execution error."""
-        self._logger.error(f"Command execution failed: {comando.__class__.__name__} - {str(error)}")
\ No newline at end of file
+        self._logger.error(f"Command execution failed: {comando.__class__.__name__} - {str(error)}")
+
+
+def skills_desde_nombres(names: Iterable[str], existing: Iterable[Skill] = ()) -> List[Skill]:
+    """Skills for the given names, keeping level and experience of skills the candidate already has."""
+    current = {skill.name.lower(): skill for skill in existing}
+    return [
+        current.get(name.lower()) or Skill(name=name, level=1, years_experience=0, category="technical")
+        for name in names
+    ]
@@ -6,9 +6,11 @@ import logging
 from dataclasses import dataclass
 from typing import Optional
 
-from recruitment.seedwork.aplicacion.comandos import ejecutar_comando
-from recruitment.seedwork.infraestructura.uow import UnitOfWork
-from recruitment.seedwork.dominio.excepciones import DomainException
+from recruitment.modulos.matching.infraestructura.cache_puntuaciones import get_match_score_cache
+from recruitment.seedwork.dominio.excepciones import CandidateNotFoundException, InvalidCandidateDataException
+from ...dominio.entidades import AvailabilityStatus
+from ...dominio.indice_habilidades import get_skill_index
+from ...infraestructura.repositorios import get_candidate_repository
 
 logger = logging.getLogger(__name__)
 
@@ -22,30 +24,30 @@ class DesactivarCandidate:
     reason: Optional[str] = None
 
 
-@ejecutar_comando.register
 def handle_desactivar_candidate(comando: DesactivarCandidate) -> None:
     """Handle DeactivateCandidate command."""
     logger.info(f"Executing DeactivateCandidate command for candidate: {comando.candidate_id}")
     
     try:
         if not comando.candidate_id or not comando.deactivated_by:
-            raise DomainException("Candidate ID and deactivated by are required")
+            raise InvalidCandidateDataException("Candidate ID and deactivated by are required")
         
-        with UnitOfWork() as uow:
-            repo = uow.candidates
-            candidate = repo.obtener_por_id(comando.candidate_id)
-            if not candidate:
-                raise DomainException(f"Candidate not found: {comando.candidate_id}")
-            
-            candidate.desactivar(
-                deactivated_by=comando.deactivated_by,
-                reason=comando.reason
-            )
-            
-            repo.actualizar(candidate)
-            uow.commit()
-            
-            logger.info(f"Candidate deactivated successfully: {candidate.id}")
+        repo = get_candidate_repository()
+        candidate = repo.obtener_por_id(comando.candidate_id)
+        if not candidate:
+            raise CandidateNotFoundException(f"Candidate not found: {comando.candidate_id}")
+        
+        candidate.update_availability(
+            AvailabilityStatus.NOT_LOOKING,
+            reason=comando.reason or f"Deactivated by {comando.deactivated_by}"
+        )
+        
+        repo.actualizar(candidate)
+        # Deactivated candidates are no longer shortlisted, so their cached scores go too
+        get_skill_index().remove(candidate.id)
+        get_match_score_cache().invalidate_candidate(candidate.id)
+        
+        logger.info(f"Candidate deactivated successfully: {candidate.id}")
     
     except Exception as e:
         logger.error(f"Failed to deactivate candidate {comando.candidate_id}: {str(e)}")
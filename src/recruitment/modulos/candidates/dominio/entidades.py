@@ -1,10 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from enum import Enum
 
 from recruitment.seedwork.dominio.entidades import BaseEntity, ValueObject
 from recruitment.seedwork.dominio.excepciones import InvalidCandidateDataException
+from recruitment.modulos.candidates.dominio.indice_habilidades import SkillIndex
 
 
 class AvailabilityStatus(Enum):
@@ -138,6 +139,13 @@ class Candidate(BaseEntity):
     languages: List[Dict[str, str]] = field(default_factory=list)  # [{"name": "English", "level": "Native"}]
     preferences: Dict[str, Any] = field(default_factory=dict)
     total_experience_years: int = 0
+    # Years the candidate reports; the work history can only raise the total
+    reported_experience_years: int = 0
+    current_position: Optional[str] = None
+    current_company: Optional[str] = None
+    resume_url: Optional[str] = None
+    notes: str = ""
+    _skill_index: Optional[SkillIndex] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if not self.name:
@@ -158,7 +166,40 @@ class Candidate(BaseEntity):
             duration = end_date - experience.start_date
             total_days += duration.days
         
-        self.total_experience_years = max(0, total_days // 365)
+        self.total_experience_years = max(0, self.reported_experience_years, total_days // 365)
+    
+    def actualizar_name(self, name: str):
+        if not name or not name.strip():
+            raise InvalidCandidateDataException("Candidate name is required")
+        self.name = name
+        self.update_timestamp()
+    
+    def actualizar_phone(self, phone: str):
+        self.contact_info = replace(self.contact_info, phone=phone)
+        self.update_timestamp()
+    
+    def actualizar_experience_years(self, years: int):
+        if not 0 <= years <= 50:
+            raise InvalidCandidateDataException("Experience years must be between 0 and 50")
+        self.reported_experience_years = years
+        self._calculate_total_experience()
+        self.update_timestamp()
+    
+    def actualizar_current_position(self, position: str):
+        self.current_position = position
+        self.update_timestamp()
+    
+    def actualizar_current_company(self, company: str):
+        self.current_company = company
+        self.update_timestamp()
+    
+    def actualizar_resume_url(self, resume_url: str):
+        self.resume_url = resume_url
+        self.update_timestamp()
+    
+    def actualizar_notes(self, notes: str):
+        self.notes = notes
+        self.update_timestamp()
     
     def add_skill(self, skill: Skill):
         """Add a skill to the candidate"""
@@ -166,6 +207,7 @@ class Candidate(BaseEntity):
         self.skills = [s for s in self.skills if s.name.lower() != skill.name.lower()]
         self.skills.append(skill)
         self.update_timestamp()
+        self._notify_skill_index()
     
     def update_skill_level(self, skill_name: str, new_level: int, new_experience: int):
         """Update skill level and experience"""
@@ -174,10 +216,25 @@ class Candidate(BaseEntity):
                 skill.level = new_level
                 skill.years_experience = new_experience
                 self.update_timestamp()
+                self._notify_skill_index()
                 return
         
         raise InvalidCandidateDataException(f"Skill '{skill_name}' not found")
     
+    def actualizar_skills(self, skills: List[Skill]):
+        """Replace the candidate's skills"""
+        self.skills = list(skills)
+        self.update_timestamp()
+        self._notify_skill_index()
+    
+    def attach_skill_index(self, index: Optional[SkillIndex]):
+        """Keep `index` up to date with this candidate's skills (None detaches it)"""
+        self._skill_index = index
+    
+    def _notify_skill_index(self):
+        if self._skill_index is not None:
+            self._skill_index.update(self)
+    
     def add_work_experience(self, experience: WorkExperience):
         """Add work experience"""
         if experience.is_current:
@@ -338,6 +395,23 @@ class Candidate(BaseEntity):
             'is_available': self.availability == AvailabilityStatus.AVAILABLE
         }
     
+    def to_matching_profile(self) -> Dict[str, Any]:
+        """Convert candidate to the candidate data expected by the MatchingEngine"""
+        return {
+            'id': self.id,
+            'version': self.updated_at.isoformat(),
+            'skills': [{'name': skill.name, 'level': skill.level} for skill in self.skills],
+            'location': self.address.city if self.address else None,
+            'preferences': {
+                'willing_to_relocate': self.preferences.get('willing_to_relocate', False),
+                'remote_work': self.address.is_remote_friendly if self.address else True
+            },
+            'expected_salary': self.salary_expectation.max_salary if self.salary_expectation else None,
+            'min_salary': self.salary_expectation.min_salary if self.salary_expectation else None,
+            'years_of_experience': self.total_experience_years,
+            'work_history': []
+        }
+    
     def to_search_document(self) -> Dict[str, Any]:
         """Convert candidate to search document for indexing"""
         return {
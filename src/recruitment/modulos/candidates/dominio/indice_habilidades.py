@@ -0,0 +1,187 @@
+"""
+In-process inverted index from skill name to candidates.
+
+Each candidate gets a dense slot and every normalized skill name keeps a
+bitmap posting (a Python int with one bit per slot), so AND/OR queries are
+single bitwise operations and minimum-should-match uses a bit-sliced count.
+Candidates attached to the index keep it current from `add_skill`,
+`update_skill_level` and `actualizar_skills`.
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set
+
+if TYPE_CHECKING:
+    from recruitment.modulos.candidates.dominio.entidades import Candidate
+
+
+def normalize_skill(name: str) -> str:
+    return (name or "").strip().lower()
+
+
+class SkillIndex:
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._slots: Dict[str, int] = {}  # candidate id -> slot
+        self._candidates: List[Optional['Candidate']] = []  # slot -> candidate
+        self._free_slots: List[int] = []
+        self._skills_by_slot: Dict[int, Set[str]] = {}
+        self._postings: Dict[str, int] = {}  # normalized skill -> bitmap of slots
+        self._all = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._slots
+
+    def add(self, candidate: 'Candidate'):
+        """Index a candidate and attach the index so skill changes are applied incrementally."""
+        with self._lock:
+            slot = self._slots.get(candidate.id)
+            if slot is None:
+                slot = self._free_slots.pop() if self._free_slots else len(self._candidates)
+                if slot == len(self._candidates):
+                    self._candidates.append(None)
+                self._slots[candidate.id] = slot
+                self._skills_by_slot[slot] = set()
+                self._all |= 1 << slot
+            self._candidates[slot] = candidate
+            candidate.attach_skill_index(self)
+            self._reindex(slot, candidate)
+
+    def rebuild(self, candidates: Iterable['Candidate']) -> int:
+        """Replace the index contents with `candidates`, e.g. everything in the repository at startup."""
+        with self._lock:
+            for candidate in self._candidates:
+                if candidate is not None:
+                    candidate.attach_skill_index(None)
+            self._slots = {}
+            self._candidates = []
+            self._free_slots = []
+            self._skills_by_slot = {}
+            self._postings = {}
+            self._all = 0
+            for candidate in candidates:
+                self.add(candidate)
+            return len(self._slots)
+
+    def update(self, candidate: 'Candidate'):
+        """Apply the candidate's current skills; only the changed postings are touched."""
+        with self._lock:
+            slot = self._slots.get(candidate.id)
+            if slot is None:
+                return
+            self._reindex(slot, candidate)
+
+    def remove(self, candidate_id: str):
+        with self._lock:
+            slot = self._slots.pop(candidate_id, None)
+            if slot is None:
+                return
+            bit = 1 << slot
+            for skill in self._skills_by_slot.pop(slot):
+                self._clear(skill, bit)
+            self._all &= ~bit
+            candidate = self._candidates[slot]
+            self._candidates[slot] = None
+            self._free_slots.append(slot)
+            if candidate is not None:
+                candidate.attach_skill_index(None)
+
+    def match_any(self, skills: Iterable[str]) -> int:
+        """Bitmap of candidates holding at least one of the skills (OR)."""
+        bitmap = 0
+        for skill in {normalize_skill(s) for s in skills}:
+            bitmap |= self._postings.get(skill, 0)
+        return bitmap
+
+    def match_all(self, skills: Iterable[str]) -> int:
+        """Bitmap of candidates holding every one of the skills (AND)."""
+        normalized = {normalize_skill(s) for s in skills}
+        if not normalized:
+            return self._all
+        # Intersect the shortest postings first so the bitmap shrinks early
+        bitmap = self._all
+        for posting in sorted((self._postings.get(s, 0) for s in normalized), key=int.bit_count):
+            bitmap &= posting
+            if not bitmap:
+                break
+        return bitmap
+
+    def match_at_least(self, skills: Iterable[str], minimum_should_match: int) -> int:
+        """Bitmap of candidates holding at least `minimum_should_match` of the skills."""
+        normalized = {normalize_skill(s) for s in skills}
+        if minimum_should_match <= 0:
+            return self._all
+        if minimum_should_match > len(normalized):
+            return 0
+        if minimum_should_match == 1:
+            return self.match_any(normalized)
+        if minimum_should_match == len(normalized):
+            return self.match_all(normalized)
+
+        # at_least[j] holds the candidates seen with j or more of the skills so far
+        at_least = [self._all] + [0] * minimum_should_match
+        for skill in normalized:
+            posting = self._postings.get(skill, 0)
+            for j in range(minimum_should_match, 0, -1):
+                at_least[j] |= at_least[j - 1] & posting
+        return at_least[minimum_should_match]
+
+    def candidate_ids(self, bitmap: int) -> List[str]:
+        return [candidate.id for candidate in self.candidates(bitmap)]
+
+    def candidates(self, bitmap: int) -> List['Candidate']:
+        """Decode a bitmap into candidates, in slot order."""
+        result = []
+        while bitmap:
+            low = bitmap & -bitmap
+            candidate = self._candidates[low.bit_length() - 1]
+            if candidate is not None:
+                result.append(candidate)
+            bitmap ^= low
+        return result
+
+    def shortlist(self, required_skills: Iterable[str], minimum_should_match: int = 1) -> List['Candidate']:
+        """Candidates holding at least `minimum_should_match` of the required skills."""
+        return self.candidates(self.match_at_least(required_skills, minimum_should_match))
+
+    def match_criteria(self, criteria: Dict[str, Any], minimum_should_match: int = 1) -> List[Dict[str, Any]]:
+        """Run `Candidate.matches_criteria` on the shortlist for `criteria['required_skills']` only."""
+        required_skills = criteria.get('required_skills') or []
+        shortlist = self.shortlist(required_skills, minimum_should_match) if required_skills else self.candidates(self._all)
+        return [
+            {'candidate_id': candidate.id, **candidate.matches_criteria(criteria)}
+            for candidate in shortlist
+        ]
+
+    def _reindex(self, slot: int, candidate: 'Candidate'):
+        bit = 1 << slot
+        current = self._skills_by_slot[slot]
+        wanted = {normalize_skill(skill.name) for skill in candidate.skills}
+        for skill in current - wanted:
+            self._clear(skill, bit)
+        for skill in wanted - current:
+            self._postings[skill] = self._postings.get(skill, 0) | bit
+        self._skills_by_slot[slot] = wanted
+
+    def _clear(self, skill: str, bit: int):
+        posting = self._postings.get(skill, 0) & ~bit
+        if posting:
+            self._postings[skill] = posting
+        else:
+            self._postings.pop(skill, None)
+
+
+_default_index: Optional[SkillIndex] = None
+_default_index_lock = threading.Lock()
+
+
+def get_skill_index() -> SkillIndex:
+    """Process-wide skill index used by the candidate commands and the matching API."""
+    global _default_index
+    with _default_index_lock:
+        if _default_index is None:
+            _default_index = SkillIndex()
+        return _default_index
@@ -0,0 +1,76 @@
+"""
+Candidate repository.
+
+`RepositorioCandidatesMemoria` keeps candidates in process memory; it is the
+repository the candidate commands use and the source the skill index is
+rebuilt from at startup.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from recruitment.modulos.candidates.dominio.entidades import Candidate
+
+
+class RepositorioCandidatesMemoria:
+    """Thread-safe in-memory candidate repository"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._candidates: Dict[str, Candidate] = {}
+
+    def obtener_por_id(self, candidate_id: str) -> Optional[Candidate]:
+        with self._lock:
+            return self._candidates.get(candidate_id)
+
+    def obtener_por_email(self, email: str) -> Optional[Candidate]:
+        email = (email or "").lower()
+        with self._lock:
+            for candidate in self._candidates.values():
+                if candidate.contact_info and candidate.contact_info.email.lower() == email:
+                    return candidate
+        return None
+
+    def obtener_todos(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Candidate]:
+        """Candidates in insertion order, optionally filtered by availability `status`"""
+        status = (filters or {}).get('status')
+        with self._lock:
+            candidates = [
+                candidate for candidate in self._candidates.values()
+                if not status or candidate.availability.value == status
+            ]
+        end = offset + limit if limit is not None else None
+        return candidates[offset:end]
+
+    def contar(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        return len(self.obtener_todos(filters))
+
+    def agregar(self, candidate: Candidate):
+        with self._lock:
+            self._candidates[candidate.id] = candidate
+
+    def actualizar(self, candidate: Candidate):
+        with self._lock:
+            self._candidates[candidate.id] = candidate
+
+    def eliminar(self, candidate_id: str):
+        with self._lock:
+            self._candidates.pop(candidate_id, None)
+
+
+_default_repository: Optional[RepositorioCandidatesMemoria] = None
+_default_repository_lock = threading.Lock()
+
+
+def get_candidate_repository() -> RepositorioCandidatesMemoria:
+    """Process-wide candidate repository used by the candidate commands"""
+    global _default_repository
+    with _default_repository_lock:
+        if _default_repository is None:
+            _default_repository = RepositorioCandidatesMemoria()
+        return _default_repository
@@ -283,8 +283,6 @@ class Interview(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         self.publicar_evento(InterviewConfirmed(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=self.id,
             candidate_id=self._candidate_id,
             interviewer_id=self._interviewer_id,
@@ -335,8 +333,6 @@ class Interview(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         self.publicar_evento(InterviewCompleted(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=self.id,
             job_id=self._job_id,
             candidate_id=self._candidate_id,
@@ -354,8 +350,6 @@ class Interview(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         self.publicar_evento(InterviewCancelled(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=self.id,
             cancelled_by=cancelled_by,
             cancellation_reason=reason,
@@ -381,8 +375,6 @@ class Interview(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         self.publicar_evento(InterviewRescheduled(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=self.id,
             old_datetime=old_datetime,
             new_datetime=new_datetime,
@@ -401,8 +393,6 @@ class Interview(AggregateRoot):
         self._updated_at = datetime.utcnow()
 
         self.publicar_evento(InterviewNoShow(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=self.id,
             candidate_id=self._candidate_id,
             job_id=self._job_id,
@@ -555,8 +545,6 @@ class InterviewScheduler(AggregateRoot):
         self._interviews.append(interview)
 
         self.publicar_evento(InterviewScheduled(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             interview_id=interview.id,
             job_id=self._job_id,
             candidate_id=candidate_id,
@@ -1,11 +1,17 @@
+import hashlib
+import json
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set
+from typing import Deque, List, Dict, Any, Optional, Sequence, Set
 from uuid import uuid4
 
+import numpy as np
+
 from recruitment.seedwork.dominio.entidades import AggregateRoot
 from recruitment.seedwork.dominio.eventos import DomainEvent
+from recruitment.modulos.matching.dominio import puntuacion_vectorizada
 
 
 class MatchingAlgorithm(Enum):
@@ -157,14 +163,23 @@ class MatchingEngine(AggregateRoot):
     def __init__(
         self,
         algorithm: MatchingAlgorithm = MatchingAlgorithm.WEIGHTED_CRITERIA,
-        default_criteria: List[MatchingCriteria] = None
+        default_criteria: List[MatchingCriteria] = None,
+        candidate_scorer: Any = None,
+        score_cache: Any = None,
+        max_match_results: int = 1000
     ):
         super().__init__()
         self.id = str(uuid4())
         self._algorithm = algorithm
         self._matching_criteria = default_criteria or self._get_default_criteria()
-        self._match_results: List[MatchResult] = []
+        self._criteria_hash = self._hash_criteria(self._matching_criteria)
+        # Only the latest results are kept on the aggregate
+        self._match_results: Deque[MatchResult] = deque(maxlen=max_match_results)
         self._performance_metrics: Dict[str, Any] = {}
+        # Anything exposing puntuacion_vectorizada.top_candidates, e.g. a ParallelCandidateScorer
+        self._candidate_scorer = candidate_scorer or puntuacion_vectorizada
+        # Optional MatchScoreCache; candidates need an id and a version to be cached
+        self._score_cache = score_cache
         self._created_at = datetime.utcnow()
         self._last_updated = datetime.utcnow()
 
@@ -178,7 +193,7 @@ class MatchingEngine(AggregateRoot):
 
     @property
     def match_results(self) -> List[MatchResult]:
-        return self._match_results.copy()
+        return list(self._match_results)
 
     def configure_criteria(self, criteria: List[MatchingCriteria]):
         total_weight = sum(c.weight for c in criteria)
@@ -186,6 +201,7 @@ class MatchingEngine(AggregateRoot):
             raise ValueError(f"Total criteria weights must sum to 1.0, got {total_weight}")
         
         self._matching_criteria = criteria
+        self._criteria_hash = self._hash_criteria(criteria)
         self._last_updated = datetime.utcnow()
 
     def evaluate_candidate_match(
@@ -272,8 +288,6 @@ class MatchingEngine(AggregateRoot):
 
         # Publish events
         self.publicar_evento(CandidateMatched(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             match_id=match_result.match_id,
             job_id=job_id,
             candidate_id=candidate_id,
@@ -285,8 +299,6 @@ class MatchingEngine(AggregateRoot):
         # Publish high-quality match event if applicable
         if match_quality in [MatchQuality.EXCELLENT, MatchQuality.GOOD]:
             self.publicar_evento(HighQualityMatchFound(
-                event_id=str(uuid4()),
-                occurred_on=datetime.utcnow(),
                 match_id=match_result.match_id,
                 job_id=job_id,
                 candidate_id=candidate_id,
@@ -310,8 +322,6 @@ class MatchingEngine(AggregateRoot):
         start_time = datetime.utcnow()
 
         self.publicar_evento(MatchingProcessStarted(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             process_id=process_id,
             job_id=job_data.get("id"),
             algorithm=self._algorithm,
@@ -319,26 +329,39 @@ class MatchingEngine(AggregateRoot):
             criteria_count=len(self._matching_criteria)
         ))
 
-        matches = []
-        for candidate_data in candidates_data:
-            try:
-                match_result = self.evaluate_candidate_match(job_data, candidate_data)
-                matches.append(match_result)
-            except Exception as e:
-                # Log error but continue processing other candidates
-                continue
+        # Score every candidate at once; full results and events only for the top-k
+        skills_only = self._algorithm == MatchingAlgorithm.BASIC_SKILLS
+        if self._score_cache is not None and job_data.get("id"):
+            scores = self._cached_scores(job_data, candidates_data, skills_only)
+            rank = lambda k: puntuacion_vectorizada.select_top_k(scores, k)
+        else:
+            rank = lambda k: self._candidate_scorer.top_candidates(
+                job_data, candidates_data, k, skills_only=skills_only
+            )
 
-        # Sort by overall score and limit results
-        matches.sort(key=lambda x: x.overall_score, reverse=True)
-        top_matches = matches[:max_results]
+        top_matches = []
+        evaluated = 0
+        wanted = max_results
+        while True:
+            top_indexes = rank(wanted)
+            for index in top_indexes[evaluated:]:
+                try:
+                    top_matches.append(self.evaluate_candidate_match(job_data, candidates_data[index]))
+                except Exception as e:
+                    # Log error but continue processing other candidates
+                    continue
+            evaluated = len(top_indexes)
+            # Ties resolve by input order, so a wider top-k extends the previous one;
+            # refill the slots of candidates the scalar evaluation rejected
+            if len(top_matches) >= max_results or evaluated < wanted:
+                break
+            wanted = evaluated + max_results - len(top_matches)
 
         # Calculate processing time
         processing_time = (datetime.utcnow() - start_time).total_seconds()
         successful_matches = len([m for m in top_matches if m.match_quality != MatchQuality.NOT_SUITABLE])
 
         self.publicar_evento(MatchingProcessCompleted(
-            event_id=str(uuid4()),
-            occurred_on=datetime.utcnow(),
             process_id=process_id,
             job_id=job_data.get("id"),
             total_candidates_evaluated=len(candidates_data),
@@ -348,6 +371,57 @@ class MatchingEngine(AggregateRoot):
 
         return top_matches
 
+    def _cached_scores(
+        self,
+        job_data: Dict[str, Any],
+        candidates_data: Sequence[Dict[str, Any]],
+        skills_only: bool
+    ) -> np.ndarray:
+        # Only candidates without a valid cached score are rescored
+        job_id = job_data["id"]
+        job_version = self._job_version(job_data)
+        algorithm = self._algorithm.value
+
+        keys = [(c.get("id"), c.get("version")) for c in candidates_data]
+        cacheable = [i for i, (candidate_id, version) in enumerate(keys) if candidate_id and version is not None]
+        cached = self._score_cache.get_many(
+            job_id, job_version, algorithm, self._criteria_hash,
+            [(keys[i][0], str(keys[i][1])) for i in cacheable]
+        )
+
+        # Candidates without an id are never matched, see evaluate_candidate_match
+        scores = np.full(len(candidates_data), -np.inf)
+        missing = np.array([bool(candidate_id) for candidate_id, _ in keys], dtype=bool)
+        for i, score in zip(cacheable, cached):
+            if score is not None:
+                scores[i] = score
+                missing[i] = False
+
+        missing_rows = np.flatnonzero(missing)
+        if len(missing_rows):
+            scores[missing_rows] = self._candidate_scorer.score_candidates(
+                job_data, [candidates_data[i] for i in missing_rows], skills_only=skills_only
+            )
+            self._score_cache.put_many(
+                job_id, job_version, algorithm, self._criteria_hash,
+                [(keys[i][0], str(keys[i][1]), scores[i]) for i in cacheable if missing[i]]
+            )
+        return scores
+
+    def _job_version(self, job_data: Dict[str, Any]) -> str:
+        # Without an explicit version the job content itself identifies it
+        if job_data.get("version") is not None:
+            return str(job_data["version"])
+        content = json.dumps(job_data, sort_keys=True, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _hash_criteria(self, criteria: List[MatchingCriteria]) -> str:
+        content = json.dumps([
+            [c.criteria_id, c.weight, c.preference_type.value, c.evaluation_function]
+            for c in criteria
+        ])
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
     def _evaluate_skills_match(
         self,
         required_skills: List[str],
@@ -755,7 +829,7 @@ class MatchingEngine(AggregateRoot):
         return {
             "algorithm": self._algorithm.value,
             "total_criteria": len(self._matching_criteria),
-            "total_matches_processed": len(self._match_results),
+            "total_matches_processed": self._performance_metrics.get("total_matches", 0),
             "performance_metrics": self._performance_metrics,
             "last_updated": self._last_updated.isoformat()
         }
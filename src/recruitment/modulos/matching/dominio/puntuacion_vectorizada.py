@@ -0,0 +1,336 @@
+"""
+Vectorized scoring for batch candidate matching.
+
+Candidates are encoded once as NumPy feature arrays (a skill-level matrix
+over the jobs' skill vocabulary plus salary, experience and location
+columns) and each job is bound to that encoding. Every sub-score and the overall score are then
+computed for the whole batch at once, reproducing the rules of
+`MatchingEngine._evaluate_*` and `_calculate_overall_score`.
+"""
+
+import numbers
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Mirrors the fixed values used by the scalar evaluation
+REQUIRED_SKILL_LEVEL = 3
+SKILLS_WEIGHT = 0.4
+LOCATION_WEIGHT = 0.2
+SALARY_WEIGHT = 0.2
+EXPERIENCE_WEIGHT = 0.2
+
+
+# Location code of candidates without a location
+NO_LOCATION = -1
+
+
+@dataclass
+class CandidateFeatures:
+    """
+    Job-independent candidate features; several jobs can be scored against one encoding.
+
+    `skill_vocabulary` and `location_vocabulary` map lowercase names to
+    skill columns and location codes. Only the arrays are needed to score,
+    so the features can be rebuilt from shared memory without them.
+    """
+
+    skill_levels: np.ndarray  # (candidates, vocabulary) candidate level per skill, 0 when missing
+    location_codes: np.ndarray
+    willing_to_relocate: np.ndarray
+    remote_work: np.ndarray
+    salary_requirement: np.ndarray  # min salary or expected salary, NaN when unknown
+    experience_years: np.ndarray
+    valid: np.ndarray  # candidates the scalar evaluation would accept
+    candidate_ids: List[Optional[str]] = field(default_factory=list)
+    skill_vocabulary: Dict[str, int] = field(default_factory=dict)
+    location_vocabulary: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def rows(self, start: int, end: int) -> 'CandidateFeatures':
+        """View of the candidates in [start, end) sharing the same arrays."""
+        return CandidateFeatures(
+            skill_levels=self.skill_levels[start:end],
+            location_codes=self.location_codes[start:end],
+            willing_to_relocate=self.willing_to_relocate[start:end],
+            remote_work=self.remote_work[start:end],
+            salary_requirement=self.salary_requirement[start:end],
+            experience_years=self.experience_years[start:end],
+            valid=self.valid[start:end]
+        )
+
+
+@dataclass
+class JobProfile:
+    """A job bound to the vocabularies of the `CandidateFeatures` it is scored against."""
+
+    job_id: Optional[str]
+    required_skill_columns: np.ndarray  # vocabulary column of each required skill, in listed order
+    required_skill_total: int
+    has_preferred_skills: bool
+    location: str  # lowercase, "" when the job has no location
+    location_code: int  # candidates with this code share the job location
+    salary_min: Optional[float]
+    salary_max: Optional[float]
+    required_experience_years: float
+
+
+def skill_vocabulary(jobs_data: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Columns for the required skills of the jobs; other candidate skills never affect a score."""
+    vocabulary: Dict[str, int] = {}
+    for job_data in jobs_data:
+        for skill in job_data.get("required_skills", []) or []:
+            vocabulary.setdefault(skill.lower(), len(vocabulary))
+    return vocabulary
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, numbers.Real)
+
+
+def encode_candidates(
+    candidates_data: Sequence[Dict[str, Any]],
+    vocabulary: Dict[str, int],
+    locations: Optional[Dict[str, int]] = None
+) -> CandidateFeatures:
+    """
+    Encode the candidates' features over the skill vocabulary.
+
+    Rows the scalar evaluation would raise on (no id, non-numeric experience,
+    salary or required skill level, malformed skills, preferences or location)
+    are marked invalid, so they score -inf instead of taking a top-k slot.
+    `locations` extends an existing location vocabulary in place, so rows
+    encoded in separate calls share location codes.
+    """
+    size = len(candidates_data)
+
+    skill_levels = np.zeros((size, len(vocabulary)), dtype=np.float64)
+    location_codes = np.full(size, NO_LOCATION, dtype=np.int32)
+    willing_to_relocate = np.zeros(size, dtype=bool)
+    remote_work = np.zeros(size, dtype=bool)
+    salary_requirement = np.full(size, np.nan, dtype=np.float64)
+    experience_years = np.zeros(size, dtype=np.float64)
+    valid = np.zeros(size, dtype=bool)
+    candidate_ids: List[Optional[str]] = []
+    locations = {} if locations is None else locations
+
+    for row, candidate in enumerate(candidates_data):
+        candidate_id = candidate.get("id")
+        candidate_ids.append(candidate_id)
+        is_valid = bool(candidate_id)
+
+        # Later duplicates win, as in the scalar lookup dict
+        skills = candidate.get("skills", [])
+        levels: Dict[int, Any] = {}
+        if isinstance(skills, (list, tuple)):
+            for skill in skills:
+                name = skill.get("name", "") if isinstance(skill, dict) else None
+                if not isinstance(name, str):
+                    is_valid = False
+                    continue
+                column = vocabulary.get(name.lower())
+                if column is not None:
+                    levels[column] = skill.get("level", 1)
+        else:
+            is_valid = False
+        for column, level in levels.items():
+            if _is_number(level):
+                skill_levels[row, column] = level
+            else:
+                is_valid = False
+
+        location = candidate.get("location")
+        if isinstance(location, str):
+            if location:
+                location_codes[row] = locations.setdefault(location.lower(), len(locations))
+        elif location:
+            is_valid = False
+        preferences = candidate.get("preferences", {})
+        if isinstance(preferences, dict):
+            willing_to_relocate[row] = bool(preferences.get("willing_to_relocate", False))
+            remote_work[row] = bool(preferences.get("remote_work", False))
+        else:
+            is_valid = False
+
+        requirement = candidate.get("min_salary") or candidate.get("expected_salary")
+        if _is_number(requirement):
+            if requirement:
+                salary_requirement[row] = requirement
+        elif requirement:
+            is_valid = False
+
+        years = candidate.get("years_of_experience", 0)
+        if _is_number(years):
+            experience_years[row] = years
+        else:
+            is_valid = False
+
+        valid[row] = is_valid
+
+    return CandidateFeatures(
+        skill_levels=skill_levels,
+        location_codes=location_codes,
+        willing_to_relocate=willing_to_relocate,
+        remote_work=remote_work,
+        salary_requirement=salary_requirement,
+        experience_years=experience_years,
+        valid=valid,
+        candidate_ids=candidate_ids,
+        skill_vocabulary=vocabulary,
+        location_vocabulary=locations
+    )
+
+
+def encode_job(job_data: Dict[str, Any], features: CandidateFeatures) -> JobProfile:
+    required_skills = job_data.get("required_skills", []) or []
+    # Skills outside the vocabulary still count towards the mean, with score 0
+    columns = [features.skill_vocabulary.get(skill.lower()) for skill in required_skills]
+
+    location = (job_data.get("location") or "").lower()
+    return JobProfile(
+        job_id=job_data.get("id"),
+        required_skill_columns=np.array([c for c in columns if c is not None], dtype=np.intp),
+        required_skill_total=len(required_skills),
+        has_preferred_skills=bool(job_data.get("preferred_skills")),
+        location=location,
+        location_code=features.location_vocabulary.get(location, NO_LOCATION - 1),
+        salary_min=job_data.get("salary_min"),
+        salary_max=job_data.get("salary_max"),
+        required_experience_years=job_data.get("required_experience_years", 0) or 0
+    )
+
+
+def skills_scores(job: JobProfile, features: CandidateFeatures, skills_only: bool = False) -> np.ndarray:
+    size = len(features)
+    if job.required_skill_total == 0:
+        # Preferred skills never reach the overall score, only whether any skill was listed
+        fallback = 0.5 if job.has_preferred_skills and not skills_only else 0.0
+        return np.full(size, fallback)
+
+    # Summed one required skill at a time, in the scalar order, so the result does
+    # not depend on how many other skills the vocabulary holds
+    total = np.zeros(size)
+    for column in job.required_skill_columns:
+        levels = features.skill_levels[:, column]
+        total += np.where(levels == 0, 0.0, np.minimum(levels / REQUIRED_SKILL_LEVEL, 1.0))
+    return total / job.required_skill_total
+
+
+def location_scores(job: JobProfile, features: CandidateFeatures) -> np.ndarray:
+    size = len(features)
+    if not job.location or job.location == "remote":
+        return np.ones(size)
+
+    return np.select(
+        [features.location_codes == job.location_code, features.willing_to_relocate, features.remote_work],
+        [1.0, 0.7, 0.8],
+        default=0.3
+    )
+
+
+def salary_scores(job: JobProfile, features: CandidateFeatures) -> np.ndarray:
+    size = len(features)
+    if not job.salary_min and not job.salary_max:
+        return np.ones(size)
+
+    job_max = job.salary_max or job.salary_min
+    job_min = job.salary_min or job.salary_max
+    requirement = features.salary_requirement
+
+    with np.errstate(invalid="ignore"):
+        overage = (requirement - job_max) / job_max
+        return np.select(
+            [
+                np.isnan(requirement),
+                requirement <= job_max,
+                overage <= 0.1,
+                overage <= 0.2
+            ],
+            [
+                0.8,
+                np.where(requirement >= job_min, 1.0, 0.9),
+                0.7,
+                0.5
+            ],
+            default=0.2
+        )
+
+
+def experience_scores(job: JobProfile, features: CandidateFeatures) -> np.ndarray:
+    required = job.required_experience_years
+    years = features.experience_years
+    under_qualified = np.maximum(years / max(required, 1) * 0.8, 0.1)
+    return np.where(
+        years >= required,
+        np.where(years <= required * 1.5, 1.0, 0.9),
+        under_qualified
+    )
+
+
+def overall_scores(job: JobProfile, features: CandidateFeatures, skills_only: bool = False) -> np.ndarray:
+    """
+    Overall score per candidate; candidates the scalar path would reject score -inf.
+
+    `skills_only` selects the BASIC_SKILLS score, otherwise the weighted criteria are combined.
+    """
+    skills = skills_scores(job, features, skills_only)
+    if skills_only:
+        scores = skills
+    else:
+        scores = np.clip(
+            skills * SKILLS_WEIGHT +
+            location_scores(job, features) * LOCATION_WEIGHT +
+            salary_scores(job, features) * SALARY_WEIGHT +
+            experience_scores(job, features) * EXPERIENCE_WEIGHT,
+            0.0,
+            1.0
+        )
+
+    if not job.job_id:
+        return np.full(len(features), -np.inf)
+    return np.where(features.valid, scores, -np.inf)
+
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indexes of the k best finite scores, best first.
+
+    Ties keep input order, like the stable sort of the scalar batch, so the
+    boundary is resolved explicitly instead of by `argpartition`'s pick.
+    """
+    candidates = np.flatnonzero(np.isfinite(scores))
+    k = min(k, len(candidates))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    finite = scores[candidates]
+    kth = finite[np.argpartition(-finite, k - 1)[k - 1]]
+    above = candidates[finite > kth]
+    at_boundary = candidates[finite == kth][:k - len(above)]
+    selected = np.concatenate([above, at_boundary])
+
+    order = np.lexsort((selected, -scores[selected]))
+    return selected[order]
+
+
+def score_candidates(
+    job_data: Dict[str, Any],
+    candidates_data: Sequence[Dict[str, Any]],
+    skills_only: bool = False
+) -> np.ndarray:
+    """Overall score of every candidate for the job, scored in-process."""
+    features = encode_candidates(candidates_data, skill_vocabulary([job_data]))
+    return overall_scores(encode_job(job_data, features), features, skills_only)
+
+
+def top_candidates(
+    job_data: Dict[str, Any],
+    candidates_data: Sequence[Dict[str, Any]],
+    k: int,
+    skills_only: bool = False
+) -> np.ndarray:
+    """Indexes of the k best candidates for the job, best first, scored in-process."""
+    return select_top_k(score_candidates(job_data, candidates_data, skills_only), k)
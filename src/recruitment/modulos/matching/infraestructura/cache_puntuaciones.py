@@ -0,0 +1,232 @@
+"""
+Match-score cache for the matching engine.
+
+Scores are stored per (job_id, candidate_id, algorithm, criteria hash) slot
+together with the job and candidate versions they were computed from, so a
+lookup only hits when both versions still match and a new version simply
+overwrites the stale score. A bounded LRU keeps the hot scores in memory and
+an optional SQLite file keeps them across restarts.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (job_id, candidate_id, algorithm, criteria_hash)
+Slot = Tuple[str, str, str, str]
+# (job_version, candidate_version, score)
+Entry = Tuple[str, str, float]
+
+# Candidate ids per IN (...) lookup, well under SQLite's bound-parameter limit
+SQLITE_LOOKUP_CHUNK = 500
+
+
+class SqliteScoreStore:
+    """On-disk tier of the match-score cache."""
+
+    def __init__(self, path: str):
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS match_scores ("
+                " job_id TEXT NOT NULL, candidate_id TEXT NOT NULL, algorithm TEXT NOT NULL,"
+                " criteria_hash TEXT NOT NULL, job_version TEXT NOT NULL, candidate_version TEXT NOT NULL,"
+                " score REAL NOT NULL,"
+                " PRIMARY KEY (job_id, candidate_id, algorithm, criteria_hash))"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_match_scores_candidate ON match_scores (candidate_id)"
+            )
+
+    def get(self, slot: Slot) -> Optional[Entry]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT job_version, candidate_version, score FROM match_scores"
+                " WHERE job_id = ? AND candidate_id = ? AND algorithm = ? AND criteria_hash = ?",
+                slot
+            ).fetchone()
+
+    def get_many(
+        self,
+        job_id: str,
+        algorithm: str,
+        criteria_hash: str,
+        candidate_ids: Sequence[str]
+    ) -> Dict[str, Entry]:
+        """Stored entry per candidate id of the job, one IN (...) query per chunk."""
+        entries: Dict[str, Entry] = {}
+        with self._lock:
+            for start in range(0, len(candidate_ids), SQLITE_LOOKUP_CHUNK):
+                chunk = candidate_ids[start:start + SQLITE_LOOKUP_CHUNK]
+                rows = self._connection.execute(
+                    "SELECT candidate_id, job_version, candidate_version, score FROM match_scores"
+                    " WHERE job_id = ? AND algorithm = ? AND criteria_hash = ?"
+                    f" AND candidate_id IN ({', '.join('?' * len(chunk))})",
+                    (job_id, algorithm, criteria_hash, *chunk)
+                )
+                for candidate_id, job_version, candidate_version, score in rows:
+                    entries[candidate_id] = (job_version, candidate_version, score)
+        return entries
+
+    def put_many(self, items: Iterable[Tuple[Slot, Entry]]):
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO match_scores VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [slot + entry for slot, entry in items]
+            )
+
+    def delete_candidate(self, candidate_id: str):
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM match_scores WHERE candidate_id = ?", (candidate_id,))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+class MatchScoreCache:
+    """
+    Bounded LRU of match scores with an optional on-disk tier.
+
+    `get_many` returns the scores whose versions still match, so re-ranking a
+    job after one candidate changes only rescores that candidate.
+    """
+
+    def __init__(self, max_entries: int = 500_000, disk_store: Optional[SqliteScoreStore] = None):
+        self.max_entries = max_entries
+        self.disk_store = disk_store
+        self._entries: "OrderedDict[Slot, Entry]" = OrderedDict()
+        self._slots_by_candidate: Dict[str, Set[Slot]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(
+        self,
+        job_id: str,
+        job_version: str,
+        algorithm: str,
+        criteria_hash: str,
+        candidates: Iterable[Tuple[str, str]]
+    ) -> List[Optional[float]]:
+        """Cached score for each (candidate_id, candidate_version), None on a miss.
+
+        Memory misses are read from the disk tier in batched queries outside
+        the cache lock, then promoted to memory.
+        """
+        candidates = list(candidates)
+        entries: List[Optional[Entry]] = []
+        with self._lock:
+            for candidate_id, _ in candidates:
+                slot = (job_id, candidate_id, algorithm, criteria_hash)
+                entry = self._entries.get(slot)
+                if entry is not None:
+                    self._entries.move_to_end(slot)
+                entries.append(entry)
+
+        stored: Dict[str, Entry] = {}
+        if self.disk_store is not None:
+            missing = list({candidate_id: None for (candidate_id, _), entry in zip(candidates, entries) if entry is None})
+            if missing:
+                try:
+                    stored = self.disk_store.get_many(job_id, algorithm, criteria_hash, missing)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not read {len(missing)} match scores: {e}")
+
+        scores: List[Optional[float]] = []
+        with self._lock:
+            for i, (candidate_id, candidate_version) in enumerate(candidates):
+                entry = entries[i]
+                if entry is None and candidate_id in stored:
+                    entry = tuple(stored[candidate_id])
+                    slot = (job_id, candidate_id, algorithm, criteria_hash)
+                    # A score put while the disk was read is newer than the stored one
+                    if slot in self._entries:
+                        entry = self._entries[slot]
+                    else:
+                        self._remember(slot, entry)
+
+                if entry is not None and entry[0] == job_version and entry[1] == candidate_version:
+                    scores.append(entry[2])
+                    self.hits += 1
+                else:
+                    scores.append(None)
+                    self.misses += 1
+        return scores
+
+    def put_many(
+        self,
+        job_id: str,
+        job_version: str,
+        algorithm: str,
+        criteria_hash: str,
+        scores: Iterable[Tuple[str, str, float]]
+    ):
+        """Store (candidate_id, candidate_version, score) computed for the job version."""
+        items = [
+            ((job_id, candidate_id, algorithm, criteria_hash), (job_version, candidate_version, float(score)))
+            for candidate_id, candidate_version, score in scores
+        ]
+        with self._lock:
+            for slot, entry in items:
+                self._remember(slot, entry)
+
+        if self.disk_store is not None and items:
+            try:
+                self.disk_store.put_many(items)
+            except sqlite3.Error as e:
+                # The memory tier still holds the scores
+                logger.warning(f"Could not persist {len(items)} match scores: {e}")
+
+    def invalidate_candidate(self, candidate_id: str):
+        """Drop every score of the candidate, e.g. once it is updated or deactivated"""
+        with self._lock:
+            for slot in self._slots_by_candidate.pop(candidate_id, set()):
+                self._entries.pop(slot, None)
+        if self.disk_store is not None:
+            self.disk_store.delete_candidate(candidate_id)
+
+    def _remember(self, slot: Slot, entry: Entry):
+        self._entries[slot] = entry
+        self._entries.move_to_end(slot)
+        self._slots_by_candidate.setdefault(slot[1], set()).add(slot)
+        while len(self._entries) > self.max_entries:
+            self._forget(next(iter(self._entries)))
+
+    def _forget(self, slot: Slot):
+        self._entries.pop(slot, None)
+        slots = self._slots_by_candidate.get(slot[1])
+        if slots is not None:
+            slots.discard(slot)
+            if not slots:
+                del self._slots_by_candidate[slot[1]]
+
+
+_default_cache: Optional[MatchScoreCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_match_score_cache() -> MatchScoreCache:
+    """Process-wide match-score cache used by the matching API.
+
+    MATCH_SCORE_CACHE_PATH enables the on-disk tier (a SQLite file).
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            path = os.getenv('MATCH_SCORE_CACHE_PATH')
+            _default_cache = MatchScoreCache(
+                max_entries=int(os.getenv('MATCH_SCORE_CACHE_MAX_ENTRIES', '500000')),
+                disk_store=SqliteScoreStore(path) if path else None
+            )
+        return _default_cache
@@ -0,0 +1,341 @@
+"""
+Parallel candidate scoring across a process pool.
+
+Candidate features are encoded in the parent and published to a single
+`multiprocessing.shared_memory` block that outlives the call: later calls
+re-encode only new or changed candidates (keyed by id and version) and
+rewrite the block in place. Each task only carries the bound job, the block
+layout and a row range, so candidate dicts are never pickled; the workers
+score their shard in place and return its top-k, which the parent merges.
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from recruitment.modulos.matching.dominio import puntuacion_vectorizada
+from recruitment.modulos.matching.dominio.puntuacion_vectorizada import CandidateFeatures, JobProfile
+
+logger = logging.getLogger(__name__)
+
+SHARED_ARRAYS = (
+    'skill_levels', 'location_codes', 'willing_to_relocate', 'remote_work',
+    'salary_requirement', 'experience_years', 'valid'
+)
+ALIGNMENT = 64
+MIN_SHARD_SIZE = 10_000
+# Skill columns kept across calls before the vocabulary is reset to the current jobs
+MAX_VOCABULARY = 512
+
+
+@dataclass(frozen=True)
+class SharedFeaturesLayout:
+    """Picklable description of the arrays in a shared memory block."""
+    name: str
+    arrays: Tuple[Tuple[str, str, Tuple[int, ...], int], ...]  # (field, dtype, shape, offset)
+
+
+def _array_layout(features: CandidateFeatures) -> Tuple[Tuple[Tuple[str, str, Tuple[int, ...], int], ...], int]:
+    arrays = []
+    offset = 0
+    for name in SHARED_ARRAYS:
+        array = np.ascontiguousarray(getattr(features, name))
+        arrays.append((name, array.dtype.str, array.shape, offset))
+        offset += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+    return tuple(arrays), offset
+
+
+class SharedCandidateFeatures:
+    """Candidate feature arrays copied into shared memory; unlinked on close."""
+
+    def __init__(self, features: CandidateFeatures):
+        arrays, size = _array_layout(features)
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.layout = SharedFeaturesLayout(name=self._shm.name, arrays=arrays)
+        self.write(features)
+
+    def fits(self, features: CandidateFeatures) -> bool:
+        """Whether `features` has the same array shapes, so it can be written in place."""
+        return self._shm is not None and _array_layout(features)[0] == self.layout.arrays
+
+    def write(self, features: CandidateFeatures):
+        """Overwrite the block; workers attached to it see the new rows without remapping."""
+        for name, dtype, shape, start in self.layout.arrays:
+            np.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=start)[...] = getattr(features, name)
+
+    def close(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _candidate_key(candidate: Dict[str, Any]) -> Optional[Hashable]:
+    """(id, version) of a candidate whose encoding can be reused, None otherwise."""
+    candidate_id, version = candidate.get("id"), candidate.get("version")
+    if not candidate_id or version is None:
+        return None
+    try:
+        hash(version)
+    except TypeError:
+        return None
+    return candidate_id, version
+
+
+class PublishedCandidateFeatures:
+    """
+    Candidate encoding kept between calls and published to one shared block.
+
+    Rows are keyed by candidate (id, version): `update` gathers unchanged
+    candidates from the previous encoding and encodes only new or changed
+    ones; candidates without a version are always re-encoded. The skill
+    vocabulary grows with the jobs seen (a growth re-encodes every row) and is
+    reset to the current jobs once it would exceed `max_vocabulary` columns.
+    """
+
+    def __init__(self, max_vocabulary: int = MAX_VOCABULARY):
+        self._max_vocabulary = max_vocabulary
+        self._features: Optional[CandidateFeatures] = None
+        self._keys: List[Optional[Hashable]] = []
+        self._rows: Dict[Hashable, int] = {}
+        self._shared: Optional[SharedCandidateFeatures] = None
+        self._published = False
+
+    def update(
+        self,
+        candidates_data: Sequence[Dict[str, Any]],
+        jobs_data: Sequence[Dict[str, Any]]
+    ) -> CandidateFeatures:
+        """Encoding of `candidates_data`, in input order, covering the jobs' required skills."""
+        keys = [_candidate_key(candidate) for candidate in candidates_data]
+        previous = self._features
+        vocabulary = dict(previous.skill_vocabulary) if previous is not None else {}
+        for skill in puntuacion_vectorizada.skill_vocabulary(jobs_data):
+            vocabulary.setdefault(skill, len(vocabulary))
+
+        if previous is None or not len(previous) or len(vocabulary) > len(previous.skill_vocabulary):
+            if len(vocabulary) > self._max_vocabulary:
+                vocabulary = puntuacion_vectorizada.skill_vocabulary(jobs_data)
+            features = puntuacion_vectorizada.encode_candidates(candidates_data, vocabulary)
+        elif keys == self._keys and None not in keys:
+            return previous
+        else:
+            features = self._reuse(previous, candidates_data, keys)
+
+        self._features = features
+        self._keys = keys
+        self._rows = {key: row for row, key in enumerate(keys) if key is not None}
+        self._published = False
+        return features
+
+    def layout(self) -> SharedFeaturesLayout:
+        """Layout of the shared block holding the current encoding, written only when it changed."""
+        if not self._published:
+            if self._shared is not None and self._shared.fits(self._features):
+                self._shared.write(self._features)
+            else:
+                self.close()
+                self._shared = SharedCandidateFeatures(self._features)
+            self._published = True
+        return self._shared.layout
+
+    def close(self):
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
+        self._published = False
+
+    def _reuse(
+        self,
+        previous: CandidateFeatures,
+        candidates_data: Sequence[Dict[str, Any]],
+        keys: List[Optional[Hashable]]
+    ) -> CandidateFeatures:
+        previous_rows = [self._rows.get(key) if key is not None else None for key in keys]
+        fresh = [row for row, previous_row in enumerate(previous_rows) if previous_row is None]
+        gather = np.array([row if row is not None else 0 for row in previous_rows], dtype=np.intp)
+
+        arrays = {name: getattr(previous, name)[gather] for name in SHARED_ARRAYS}
+        locations = previous.location_vocabulary
+        if fresh:
+            encoded = puntuacion_vectorizada.encode_candidates(
+                [candidates_data[row] for row in fresh], previous.skill_vocabulary, locations
+            )
+            for name in SHARED_ARRAYS:
+                arrays[name][fresh] = getattr(encoded, name)
+
+        return CandidateFeatures(
+            **arrays,
+            candidate_ids=[candidate.get("id") for candidate in candidates_data],
+            skill_vocabulary=previous.skill_vocabulary,
+            location_vocabulary=locations
+        )
+
+
+# Worker-side attachments, so each process maps a block once
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, CandidateFeatures]] = {}
+
+
+def _attach(layout: SharedFeaturesLayout) -> CandidateFeatures:
+    attached = _attached.get(layout.name)
+    if attached is None:
+        # A new block means earlier batches are finished; drop their mappings
+        for shm, _ in _attached.values():
+            shm.close()
+        _attached.clear()
+        try:
+            # The parent owns the block; keep the resource tracker out of it (Python 3.13+)
+            shm = shared_memory.SharedMemory(name=layout.name, track=False)
+        except TypeError:
+            shm = shared_memory.SharedMemory(name=layout.name)
+        arrays = {
+            name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            for name, dtype, shape, offset in layout.arrays
+        }
+        attached = _attached[layout.name] = (shm, CandidateFeatures(**arrays))
+    return attached[1]
+
+
+def _score_rows(
+    layout: SharedFeaturesLayout,
+    job: JobProfile,
+    start: int,
+    end: int,
+    skills_only: bool
+) -> np.ndarray:
+    """Scores of rows [start, end)."""
+    return puntuacion_vectorizada.overall_scores(job, _attach(layout).rows(start, end), skills_only)
+
+
+def _score_shard(
+    layout: SharedFeaturesLayout,
+    job: JobProfile,
+    start: int,
+    end: int,
+    k: int,
+    skills_only: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Top-k of rows [start, end) as global indexes and their scores."""
+    features = _attach(layout).rows(start, end)
+    scores = puntuacion_vectorizada.overall_scores(job, features, skills_only)
+    top = puntuacion_vectorizada.select_top_k(scores, k)
+    return top + start, scores[top]
+
+
+class ParallelCandidateScorer:
+    """
+    Drop-in `candidate_scorer` for MatchingEngine that shards scoring across processes.
+
+    `top_candidates_for_jobs` scores many jobs against one published encoding,
+    which is where the pool pays off; small batches are scored in-process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, min_shard_size: int = MIN_SHARD_SIZE):
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._min_shard_size = min_shard_size
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # The published block is rewritten in place, so calls are serialized
+        self._lock = threading.Lock()
+        self._published = PublishedCandidateFeatures()
+
+    def top_candidates(
+        self,
+        job_data: Dict[str, Any],
+        candidates_data: Sequence[Dict[str, Any]],
+        k: int,
+        skills_only: bool = False
+    ) -> np.ndarray:
+        return self.top_candidates_for_jobs([job_data], candidates_data, k, skills_only)[0]
+
+    def score_candidates(
+        self,
+        job_data: Dict[str, Any],
+        candidates_data: Sequence[Dict[str, Any]],
+        skills_only: bool = False
+    ) -> np.ndarray:
+        """Overall score of every candidate for the job."""
+        with self._lock:
+            features = self._published.update(candidates_data, [job_data])
+            job = puntuacion_vectorizada.encode_job(job_data, features)
+
+            shards = self._shards(len(features))
+            if len(shards) <= 1:
+                return puntuacion_vectorizada.overall_scores(job, features, skills_only)
+
+            layout = self._published.layout()
+            executor = self._get_executor()
+            futures = [
+                executor.submit(_score_rows, layout, job, start, end, skills_only)
+                for start, end in shards
+            ]
+            return np.concatenate([future.result() for future in futures])
+
+    def top_candidates_for_jobs(
+        self,
+        jobs_data: Sequence[Dict[str, Any]],
+        candidates_data: Sequence[Dict[str, Any]],
+        k: int,
+        skills_only: bool = False
+    ) -> List[np.ndarray]:
+        """Indexes of the k best candidates for each job, best first."""
+        with self._lock:
+            features = self._published.update(candidates_data, jobs_data)
+            jobs = [puntuacion_vectorizada.encode_job(job_data, features) for job_data in jobs_data]
+
+            shards = self._shards(len(features))
+            if len(shards) * len(jobs) <= 1:
+                return [
+                    puntuacion_vectorizada.select_top_k(puntuacion_vectorizada.overall_scores(job, features, skills_only), k)
+                    for job in jobs
+                ]
+
+            layout = self._published.layout()
+            executor = self._get_executor()
+            futures = [
+                [executor.submit(_score_shard, layout, job, start, end, k, skills_only) for start, end in shards]
+                for job in jobs
+            ]
+            # Shards are merged in row order, so ties still resolve by input order
+            results = []
+            for job_futures in futures:
+                parts = [future.result() for future in job_futures]
+                indexes = np.concatenate([part[0] for part in parts])
+                scores = np.concatenate([part[1] for part in parts])
+                results.append(indexes[puntuacion_vectorizada.select_top_k(scores, k)])
+            return results
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        with self._lock:
+            self._published.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _shards(self, size: int) -> List[Tuple[int, int]]:
+        count = max(1, min(self._max_workers, size // self._min_shard_size))
+        bounds = np.linspace(0, size, count + 1, dtype=int)
+        return [(int(bounds[i]), int(bounds[i + 1])) for i in range(count)]
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            logger.info(f"Starting candidate scoring pool with {self._max_workers} workers")
+            self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        return self._executor
@@ -13,26 +13,32 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '../../../..'))
 from src.pulsar_event_dispatcher import PulsarEventDispatcher
+from src.idempotency_store import IdempotencyStore, create_idempotency_store
 
 
 class RecruitmentSagaIntegration:
     """Integración de Saga para el servicio de Recruitment usando Apache Pulsar"""
     
-    def __init__(self, event_dispatcher: PulsarEventDispatcher):
+    def __init__(self, event_dispatcher: PulsarEventDispatcher, processed_events: IdempotencyStore = None):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.event_dispatcher = event_dispatcher
+        self.processed_events = processed_events or create_idempotency_store("recruitment")  # Para evitar procesar eventos duplicados
         self._subscribe_to_events()
     
     def _subscribe_to_events(self):
         """Suscribirse a eventos relevantes"""
         # Eventos normales
-        self.event_dispatcher.subscribe("RecruitmentSetupCompleted", self._handle_recruitment_setup)
+        self._subscribe("RecruitmentSetupCompleted", self._handle_recruitment_setup)
         
         # Eventos de compensación
-        self.event_dispatcher.subscribe("RecruitmentSetupCompensationRequested", self._handle_recruitment_compensation_requested)
+        self._subscribe("RecruitmentSetupCompensationRequested", self._handle_recruitment_compensation_requested)
         
         self.logger.info("Recruitment service subscribed to saga events")
     
+    def _subscribe(self, event_type: str, handler):
+        """Suscribe un handler que ignora las entregas duplicadas del evento"""
+        self.event_dispatcher.subscribe(event_type, self.processed_events.idempotent(event_type, handler))
+    
     def _handle_recruitment_setup(self, event_data: Dict[str, Any]):
         """Maneja el evento de configuración de reclutamiento completada"""
         partner_id = event_data["partner_id"]
@@ -15,6 +15,29 @@ class BaseEntity:
         self.updated_at = datetime.utcnow()
 
 
+class AggregateRoot(ABC):
+    """Aggregate that records the domain events it publishes until they are dispatched"""
+
+    def __init__(self):
+        self.id: str = str(uuid.uuid4())
+        self._eventos: List['DomainEvent'] = []
+
+    @property
+    def eventos(self) -> List['DomainEvent']:
+        return self._eventos.copy()
+
+    def publicar_evento(self, evento: 'DomainEvent'):
+        self._eventos.append(evento)
+
+    def marcar_eventos_como_procesados(self):
+        self._eventos.clear()
+
+    @classmethod
+    @abstractmethod
+    def from_events(cls, events: List['DomainEvent']) -> 'AggregateRoot':
+        pass
+
+
 @dataclass
 class ValueObject(ABC):
     def __post_init__(self):
@@ -50,6 +73,11 @@ class SearchRepository(ABC):
     async def index_document(self, document_id: str, document: Dict[str, Any]):
         pass
     
+    @abstractmethod
+    async def bulk_index(self, documents, index: str = None) -> Any:
+        """Index many (document_id, document) pairs in as few round trips as possible"""
+        pass
+    
     @abstractmethod
     async def search_documents(
         self, 
@@ -69,7 +97,8 @@ class SearchRepository(ABC):
         pass
 
 
-@dataclass
+# Keyword-only, so subclasses can declare fields without defaults after the base ones
+@dataclass(kw_only=True)
 class DomainEvent:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     timestamp: datetime = field(default_factory=datetime.utcnow)
@@ -1,17 +1,80 @@
+import asyncio
 import json
-from typing import Dict, Any, List, Optional
-from elasticsearch import Elasticsearch, NotFoundError
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Union, Iterable, AsyncIterable, Tuple
+from elasticsearch import AsyncElasticsearch, NotFoundError
 from datetime import datetime
 
 from recruitment.seedwork.dominio.entidades import SearchRepository
 from recruitment.seedwork.dominio.excepciones import SearchIndexException, InvalidSearchQueryException
 
+logger = logging.getLogger(__name__)
+
+# Refresh policy of a write: False (next periodic refresh), True (refresh now) or "wait_for"
+RefreshPolicy = Union[bool, str]
+
+# (document_id, document) pairs, from a list, a generator or an async generator
+BulkDocuments = Union[Iterable[Tuple[str, Dict[str, Any]]], AsyncIterable[Tuple[str, Dict[str, Any]]]]
+
+DEFAULT_CONNECTIONS_PER_NODE = 25
+DEFAULT_BULK_CHUNK_SIZE = 1000
+DEFAULT_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+DEFAULT_BULK_MAX_IN_FLIGHT = 4
+
+# An AsyncElasticsearch is bound to the event loop it first ran on, so clients are shared per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, AsyncElasticsearch]]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client(elasticsearch_url: str, connections_per_node: int = DEFAULT_CONNECTIONS_PER_NODE) -> AsyncElasticsearch:
+    """Shared client per cluster URL on the running event loop, so repositories on that loop reuse one connection pool."""
+    clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(elasticsearch_url)
+    if client is None:
+        client = clients[elasticsearch_url] = AsyncElasticsearch(
+            [elasticsearch_url],
+            connections_per_node=connections_per_node,
+            # Bulk backfills hit 429 under load; let the transport back off and retry
+            retry_on_status=(429, 502, 503, 504),
+            max_retries=5
+        )
+    return client
+
+
+async def close_async_clients():
+    """Close the running loop's shared clients, e.g. on application shutdown or before the loop ends."""
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+@dataclass
+class BulkIndexResult:
+    indexed: int = 0
+    failed: int = 0
+    chunks: int = 0
+    errors: List[Dict[str, Any]] = field(default_factory=list)  # first failures, capped
+
 
 class ElasticsearchRepository(SearchRepository):
-    def __init__(self, elasticsearch_url: str):
-        self.es = Elasticsearch([elasticsearch_url])
+    def __init__(
+        self,
+        elasticsearch_url: str,
+        client: Optional[AsyncElasticsearch] = None,
+        refresh: RefreshPolicy = False
+    ):
+        self.elasticsearch_url = elasticsearch_url
+        self._client = client
         self.candidates_index = "candidates"
         self.jobs_index = "jobs"
+        # Default refresh policy of writes; every write can override it
+        self.refresh = refresh
+    
+    @property
+    def es(self) -> AsyncElasticsearch:
+        """The injected client, or the shared client of the running event loop."""
+        return self._client or get_async_client(self.elasticsearch_url)
     
     async def setup_indices(self):
         """Setup Elasticsearch indices with mappings"""
@@ -133,37 +196,148 @@ class ElasticsearchRepository(SearchRepository):
             }
             
             # Create indices
-            if not self.es.indices.exists(index=self.candidates_index):
-                self.es.indices.create(index=self.candidates_index, body=candidates_mapping)
+            if not await self.es.indices.exists(index=self.candidates_index):
+                await self.es.indices.create(index=self.candidates_index, **candidates_mapping)
             
-            if not self.es.indices.exists(index=self.jobs_index):
-                self.es.indices.create(index=self.jobs_index, body=jobs_mapping)
+            if not await self.es.indices.exists(index=self.jobs_index):
+                await self.es.indices.create(index=self.jobs_index, **jobs_mapping)
                 
         except Exception as e:
             raise SearchIndexException(f"Failed to setup indices: {str(e)}")
     
-    async def index_document(self, document_id: str, document: Dict[str, Any], index: str = None):
+    async def index_document(
+        self,
+        document_id: str,
+        document: Dict[str, Any],
+        index: str = None,
+        refresh: Optional[RefreshPolicy] = None
+    ):
         """Index a document"""
         try:
-            if not index:
-                # Determine index based on document type
-                if 'skills' in document and 'availability' in document:
-                    index = self.candidates_index
-                elif 'title' in document and 'partner_id' in document:
-                    index = self.jobs_index
-                else:
-                    raise InvalidSearchQueryException("Cannot determine document type")
+            index = index or self._index_for(document)
             
-            response = self.es.index(
+            response = await self.es.index(
                 index=index,
                 id=document_id,
-                body=document
+                document=document,
+                refresh=self._refresh(refresh)
             )
             return response
             
         except Exception as e:
             raise SearchIndexException(f"Failed to index document: {str(e)}")
     
+    async def bulk_index(
+        self,
+        documents: BulkDocuments,
+        index: str = None,
+        chunk_size: int = DEFAULT_BULK_CHUNK_SIZE,
+        max_chunk_bytes: int = DEFAULT_BULK_MAX_CHUNK_BYTES,
+        max_in_flight: int = DEFAULT_BULK_MAX_IN_FLIGHT,
+        refresh: Optional[RefreshPolicy] = None,
+        max_errors: int = 100
+    ) -> BulkIndexResult:
+        """
+        Index (document_id, document) pairs through the bulk API.
+        
+        Documents are streamed into chunks of at most `chunk_size` documents or
+        `max_chunk_bytes`, with up to `max_in_flight` bulk requests running at
+        once, so memory stays bounded whatever the number of documents. The
+        chunks never refresh; the refresh policy is applied once at the end.
+        """
+        result = BulkIndexResult()
+        in_flight = asyncio.Semaphore(max_in_flight)
+        tasks = set()
+        
+        async def send(payload: bytes, count: int):
+            try:
+                response = await self.es.bulk(operations=payload, refresh=False)
+                self._collect_bulk_response(response, result, max_errors)
+            except Exception as e:
+                result.failed += count
+                if len(result.errors) < max_errors:
+                    result.errors.append({"error": str(e), "documents": count})
+            finally:
+                in_flight.release()
+        
+        async def flush(lines: List[bytes], count: int):
+            await in_flight.acquire()
+            result.chunks += 1
+            task = asyncio.create_task(send(b"".join(lines), count))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        
+        lines: List[bytes] = []
+        count = 0
+        size = 0
+        try:
+            async for document_id, document in self._iterate(documents):
+                try:
+                    target = index or self._index_for(document)
+                except InvalidSearchQueryException as e:
+                    # An unclassifiable document fails alone; the rest are still indexed
+                    result.failed += 1
+                    if len(result.errors) < max_errors:
+                        result.errors.append({"id": document_id, "error": str(e)})
+                    continue
+                action = json.dumps({"index": {"_index": target, "_id": document_id}})
+                source = json.dumps(document, default=str)
+                line = f"{action}\n{source}\n".encode("utf-8")
+                
+                if count and (count >= chunk_size or size + len(line) > max_chunk_bytes):
+                    await flush(lines, count)
+                    lines, count, size = [], 0, 0
+                lines.append(line)
+                count += 1
+                size += len(line)
+            
+            if count:
+                await flush(lines, count)
+        finally:
+            if tasks:
+                await asyncio.gather(*tasks)
+        
+        refresh = self._refresh(refresh)
+        if refresh and result.chunks:
+            indices = {index} if index else {self.candidates_index, self.jobs_index}
+            await self.es.indices.refresh(index=",".join(sorted(indices)))
+        
+        logger.info(f"Bulk indexed {result.indexed} documents in {result.chunks} chunks ({result.failed} failed)")
+        return result
+    
+    def _collect_bulk_response(self, response: Dict[str, Any], result: BulkIndexResult, max_errors: int):
+        if not response["errors"]:
+            result.indexed += len(response["items"])
+            return
+        for item in response["items"]:
+            outcome = next(iter(item.values()))
+            if outcome.get("status", 500) < 300:
+                result.indexed += 1
+            else:
+                result.failed += 1
+                if len(result.errors) < max_errors:
+                    result.errors.append({"id": outcome.get("_id"), "error": outcome.get("error")})
+    
+    @staticmethod
+    async def _iterate(documents: BulkDocuments):
+        if hasattr(documents, "__aiter__"):
+            async for item in documents:
+                yield item
+        else:
+            for item in documents:
+                yield item
+    
+    def _index_for(self, document: Dict[str, Any]) -> str:
+        """Determine index based on document type"""
+        if 'skills' in document and 'availability' in document:
+            return self.candidates_index
+        elif 'title' in document and 'partner_id' in document:
+            return self.jobs_index
+        raise InvalidSearchQueryException("Cannot determine document type")
+    
+    def _refresh(self, refresh: Optional[RefreshPolicy]) -> RefreshPolicy:
+        return self.refresh if refresh is None else refresh
+    
     async def search_documents(
         self, 
         query: str, 
@@ -181,16 +355,16 @@ class ElasticsearchRepository(SearchRepository):
             search_body = {
                 "query": self._build_query(query, filters),
                 "size": size,
-                "from": offset,
+                "from_": offset,
                 "sort": [
                     {"_score": {"order": "desc"}},
                     {"updated_at": {"order": "desc"}}
                 ]
             }
             
-            response = self.es.search(
+            response = await self.es.search(
                 index=index,
-                body=search_body
+                **search_body
             )
             
             return {
@@ -319,42 +493,43 @@ class ElasticsearchRepository(SearchRepository):
         else:
             return {"match_all": {}}
     
-    async def update_document(self, document_id: str, document: Dict[str, Any], index: str = None):
+    async def update_document(
+        self,
+        document_id: str,
+        document: Dict[str, Any],
+        index: str = None,
+        refresh: Optional[RefreshPolicy] = None
+    ):
         """Update a document"""
         try:
-            if not index:
-                # Try to determine index
-                if 'skills' in document and 'availability' in document:
-                    index = self.candidates_index
-                elif 'title' in document and 'partner_id' in document:
-                    index = self.jobs_index
-                else:
-                    raise InvalidSearchQueryException("Cannot determine document type")
+            index = index or self._index_for(document)
             
-            response = self.es.update(
+            response = await self.es.update(
                 index=index,
                 id=document_id,
-                body={"doc": document}
+                doc=document,
+                refresh=self._refresh(refresh)
             )
             return response
             
         except NotFoundError:
             # Document doesn't exist, create it
-            return await self.index_document(document_id, document, index)
+            return await self.index_document(document_id, document, index, refresh=refresh)
         except Exception as e:
             raise SearchIndexException(f"Failed to update document: {str(e)}")
     
-    async def delete_document(self, document_id: str, index: str = None):
+    async def delete_document(self, document_id: str, index: str = None, refresh: Optional[RefreshPolicy] = None):
         """Delete a document"""
+        refresh = self._refresh(refresh)
         try:
             if not index:
                 # Try both indices
                 try:
-                    self.es.delete(index=self.candidates_index, id=document_id)
+                    await self.es.delete(index=self.candidates_index, id=document_id, refresh=refresh)
                 except NotFoundError:
-                    self.es.delete(index=self.jobs_index, id=document_id)
+                    await self.es.delete(index=self.jobs_index, id=document_id, refresh=refresh)
             else:
-                self.es.delete(index=index, id=document_id)
+                await self.es.delete(index=index, id=document_id, refresh=refresh)
                 
         except NotFoundError:
             pass  # Document doesn't exist, which is fine
@@ -408,7 +583,7 @@ class ElasticsearchRepository(SearchRepository):
                 }
             }
             
-            response = self.es.search(index=index, body=search_body)
+            response = await self.es.search(index=index, **search_body)
             return response["aggregations"][f"{field}_agg"]["buckets"]
             
         except Exception as e:
@@ -0,0 +1,195 @@
+"""
+In-memory stand-in for Elasticsearch, for tests.
+
+`InMemoryElasticsearch` implements the subset of the `AsyncElasticsearch`
+API and query DSL used by `ElasticsearchRepository`, so the repository's own
+chunking, refresh and query building run unchanged against it.
+"""
+
+import json
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from elastic_transport import ApiResponseMeta, HttpHeaders, NodeConfig
+from elasticsearch import NotFoundError
+
+from recruitment.seedwork.infraestructura.elasticsearch import ElasticsearchRepository, RefreshPolicy
+
+
+def _not_found(index: str, document_id: str) -> NotFoundError:
+    meta = ApiResponseMeta(
+        status=404, http_version="1.1", headers=HttpHeaders(), duration=0.0,
+        node=NodeConfig("http", "localhost", 9200)
+    )
+    return NotFoundError("document_missing_exception", meta, {"_index": index, "_id": document_id, "found": False})
+
+
+def _values(document: Any, path: str) -> List[Any]:
+    """Values at a dotted path, flattening lists (nested objects and keyword arrays)."""
+    values = [document]
+    for part in path.split("."):
+        next_values = []
+        for value in values:
+            if isinstance(value, list):
+                value = [v.get(part) for v in value if isinstance(v, dict)]
+                next_values.extend(v for v in value if v is not None)
+            elif isinstance(value, dict) and value.get(part) is not None:
+                next_values.append(value[part])
+        values = next_values
+    flat = []
+    for value in values:
+        flat.extend(value if isinstance(value, list) else [value])
+    return flat
+
+
+class _Indices:
+    def __init__(self, client: 'InMemoryElasticsearch'):
+        self._client = client
+
+    async def exists(self, index: str) -> bool:
+        return index in self._client.documents
+
+    async def create(self, index: str, **settings):
+        self._client.documents.setdefault(index, {})
+        self._client.mappings[index] = settings.get("mappings", {})
+
+    async def refresh(self, index: str):
+        self._client.calls["refresh"] += 1
+
+
+class InMemoryElasticsearch:
+    """Dict-backed `AsyncElasticsearch` double; documents are searchable as soon as they are written."""
+
+    def __init__(self):
+        self.documents: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.mappings: Dict[str, Dict[str, Any]] = {}
+        self.indices = _Indices(self)
+        self.calls: Counter = Counter()
+
+    async def index(self, index: str, id: str, document: Dict[str, Any], refresh: RefreshPolicy = None, **kwargs):
+        self.calls["index"] += 1
+        created = id not in self.documents.get(index, {})
+        self.documents.setdefault(index, {})[id] = json.loads(json.dumps(document, default=str))
+        return {"_index": index, "_id": id, "result": "created" if created else "updated"}
+
+    async def update(self, index: str, id: str, doc: Dict[str, Any], refresh: RefreshPolicy = None, **kwargs):
+        self.calls["update"] += 1
+        current = self.documents.get(index, {}).get(id)
+        if current is None:
+            raise _not_found(index, id)
+        current.update(json.loads(json.dumps(doc, default=str)))
+        return {"_index": index, "_id": id, "result": "updated"}
+
+    async def delete(self, index: str, id: str, refresh: RefreshPolicy = None, **kwargs):
+        self.calls["delete"] += 1
+        if self.documents.get(index, {}).pop(id, None) is None:
+            raise _not_found(index, id)
+        return {"_index": index, "_id": id, "result": "deleted"}
+
+    async def bulk(self, operations: Any, refresh: RefreshPolicy = None, **kwargs):
+        self.calls["bulk"] += 1
+        if isinstance(operations, (bytes, str)):
+            text = operations.decode("utf-8") if isinstance(operations, bytes) else operations
+            operations = [json.loads(line) for line in text.splitlines() if line]
+
+        items = []
+        lines = iter(operations)
+        for action in lines:
+            (op, meta), = action.items()
+            source = next(lines)
+            index, document_id = meta["_index"], meta["_id"]
+            created = document_id not in self.documents.get(index, {})
+            self.documents.setdefault(index, {})[document_id] = source
+            items.append({op: {"_index": index, "_id": document_id, "status": 201 if created else 200}})
+        return {"errors": False, "items": items}
+
+    async def search(
+        self,
+        index: str,
+        query: Optional[Dict[str, Any]] = None,
+        size: int = 10,
+        from_: int = 0,
+        sort: Optional[List[Dict[str, Any]]] = None,
+        aggs: Optional[Dict[str, Any]] = None,
+        **kwargs
+    ):
+        self.calls["search"] += 1
+        hits = []
+        for document_id, document in self.documents.get(index, {}).items():
+            score = self._score(query or {"match_all": {}}, document)
+            if score is not None:
+                hits.append({"_index": index, "_id": document_id, "_score": score, "_source": document})
+
+        # The repository sorts by _score then updated_at, both descending
+        hits.sort(key=lambda hit: (hit["_score"], hit["_source"].get("updated_at") or ""), reverse=True)
+        response = {"hits": {"total": {"value": len(hits)}, "hits": hits[from_:from_ + size]}}
+
+        if aggs:
+            response["aggregations"] = {
+                name: self._terms(hits, agg["terms"]["field"], agg["terms"].get("size", 10))
+                for name, agg in aggs.items()
+            }
+        return response
+
+    async def close(self):
+        pass
+
+    def _score(self, query: Dict[str, Any], document: Dict[str, Any]) -> Optional[float]:
+        """Relevance of the document, or None when it does not match."""
+        (kind, body), = query.items()
+        if kind == "match_all":
+            return 1.0
+        if kind == "term":
+            (field, value), = body.items()
+            return 0.0 if value in _values(document, field) else None
+        if kind == "terms":
+            (field, values), = body.items()
+            return 0.0 if set(values) & set(_values(document, field)) else None
+        if kind == "range":
+            (field, bounds), = body.items()
+            values = [v for v in _values(document, field) if isinstance(v, (int, float))]
+            matches = any(
+                ("gte" not in bounds or v >= bounds["gte"]) and ("lte" not in bounds or v <= bounds["lte"])
+                for v in values
+            )
+            return 0.0 if matches else None
+        if kind == "multi_match":
+            tokens = body["query"].lower().split()
+            text = " ".join(
+                str(v) for field in body["fields"] for v in _values(document, field.split("^")[0])
+            ).lower()
+            score = float(sum(1 for token in tokens if token in text))
+            return score if score else None
+        if kind == "bool":
+            return self._bool(body, document)
+        raise ValueError(f"Unsupported query in InMemoryElasticsearch: {kind}")
+
+    def _bool(self, body: Dict[str, Any], document: Dict[str, Any]) -> Optional[float]:
+        score = 0.0
+        for clause in body.get("must", []):
+            clause_score = self._score(clause, document)
+            if clause_score is None:
+                return None
+            score += clause_score
+        for clause in body.get("filter", []):
+            if self._score(clause, document) is None:
+                return None
+        should = body.get("should", [])
+        if should:
+            scores = [s for s in (self._score(clause, document) for clause in should) if s is not None]
+            if not scores:
+                return None
+            score += sum(scores)
+        return score
+
+    @staticmethod
+    def _terms(hits: Iterable[Dict[str, Any]], field: str, size: int) -> Dict[str, Any]:
+        counts = Counter(value for hit in hits for value in set(_values(hit["_source"], field)))
+        return {"buckets": [{"key": key, "doc_count": count} for key, count in counts.most_common(size)]}
+
+
+class InMemorySearchRepository(ElasticsearchRepository):
+    """`ElasticsearchRepository` backed by an `InMemoryElasticsearch` client."""
+
+    def __init__(self, refresh: RefreshPolicy = False):
+        super().__init__("memory://", client=InMemoryElasticsearch(), refresh=refresh)
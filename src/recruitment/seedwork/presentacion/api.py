@@ -38,6 +38,15 @@ def crear_app():
     app.register_blueprint(search_bp, url_prefix='/search')
     app.register_blueprint(matching_bp, url_prefix='/matching')
     
+    # Build the skill index the matching API shortlists from
+    try:
+        from recruitment.modulos.candidates.dominio.indice_habilidades import get_skill_index
+        from recruitment.modulos.candidates.infraestructura.repositorios import get_candidate_repository
+        indexed = get_skill_index().rebuild(get_candidate_repository().obtener_todos())
+        logging.info(f"Skill index built with {indexed} candidates")
+    except Exception as e:
+        logging.error(f"Error building skill index: {str(e)}")
+    
     # Inicializar integración de saga
     try:
         logging.info("Attempting to initialize Recruitment saga integration...")
@@ -0,0 +1,144 @@
+import io
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from fastavro import parse_schema, schemaless_reader, schemaless_writer
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+
+try:
+    from .partner_management.seedwork.infraestructura.schema.v1.sagas import SAGA_EVENT_SCHEMAS
+except ImportError:
+    # Imported as a top-level module with src/ on sys.path
+    from partner_management.seedwork.infraestructura.schema.v1.sagas import SAGA_EVENT_SCHEMAS
+
+
+def _field_check(avro_type: Any) -> Optional[Callable[[Any], bool]]:
+    """Python type check for a payload field, or None if the value must go to attributes"""
+    if isinstance(avro_type, list):
+        # Optional fields are ["null", T]
+        non_null = [t for t in avro_type if t != "null"]
+        return _field_check(non_null[0]) if len(non_null) == 1 else None
+    if avro_type == "string":
+        return lambda value: isinstance(value, str)
+    if avro_type == "boolean":
+        return lambda value: isinstance(value, bool)
+    if avro_type == "long" or avro_type == "int":
+        return lambda value: isinstance(value, int) and not isinstance(value, bool)
+    if avro_type == "double":
+        return lambda value: isinstance(value, (int, float)) and not isinstance(value, bool)
+    if isinstance(avro_type, dict) and avro_type.get("type") == "array" and avro_type.get("items") == "string":
+        return lambda value: isinstance(value, list) and all(isinstance(item, str) for item in value)
+    return None
+
+
+class _CompiledSchema:
+    """Parsed schema of one event type with its wire header and payload field checks"""
+
+    def __init__(self, event_type: str, schema: Dict[str, Any]):
+        self.event_type = event_type
+        self.parsed = parse_schema(schema)
+        self.fingerprint = bytes.fromhex(fingerprint(to_parsing_canonical_form(self.parsed), "CRC-64-AVRO"))
+        self.header = SagaEventCodec.MAGIC + self.fingerprint
+
+        payload_schema = next(f["type"] for f in schema["fields"] if f["name"] == "event_data")
+        self.field_checks: Dict[str, Callable[[Any], bool]] = {}
+        for field in payload_schema["fields"]:
+            if field["name"] == "attributes":
+                continue
+            check = _field_check(field["type"])
+            if check is not None:
+                self.field_checks[field["name"]] = check
+
+
+class SagaEventCodec:
+    """Binary Avro codec for saga events with JSON fallback.
+
+    Registered event types are written as an Avro single-object style frame: the
+    two magic bytes, the 8-byte CRC-64-AVRO schema fingerprint and the schemaless
+    binary body. Event types without a schema are written as compact JSON. Decoding
+    tells both formats apart by the leading bytes, so producers and consumers can be
+    upgraded independently of which event types have schemas.
+
+    Avro encoding is opt-in: it makes frames 20-50% smaller, but fastavro takes about
+    twice as long as the json module to encode and decode these records.
+    """
+
+    MAGIC = b"\xc3\x01"
+    HEADER_SIZE = 10
+
+    def __init__(self, schemas: Optional[Dict[str, Dict[str, Any]]] = None, use_avro: bool = False):
+        self.use_avro = use_avro
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._by_type: Dict[str, _CompiledSchema] = {}
+        self._by_fingerprint: Dict[bytes, _CompiledSchema] = {}
+        for event_type, schema in (SAGA_EVENT_SCHEMAS if schemas is None else schemas).items():
+            self.register(event_type, schema)
+
+    def register(self, event_type: str, schema: Dict[str, Any]):
+        """Parse and register the schema of an event type"""
+        compiled = _CompiledSchema(event_type, schema)
+        self._by_type[event_type] = compiled
+        self._by_fingerprint[compiled.fingerprint] = compiled
+
+    def has_schema(self, event_type: str) -> bool:
+        return event_type in self._by_type
+
+    def encode(self, event_message: Dict[str, Any]) -> bytes:
+        """Encode a dispatcher message ({event_type, event_data, timestamp, source})"""
+        compiled = self._by_type.get(event_message.get("event_type")) if self.use_avro else None
+        if compiled is not None and isinstance(event_message.get("event_data"), dict):
+            try:
+                return self._encode_avro(compiled, event_message)
+            except Exception as e:
+                self.logger.warning(f"Avro encoding failed for {compiled.event_type}, falling back to JSON: {e}")
+        return json.dumps(event_message, separators=(',', ':'), default=str).encode('utf-8')
+
+    def _encode_avro(self, compiled: _CompiledSchema, event_message: Dict[str, Any]) -> bytes:
+        payload: Dict[str, Any] = dict.fromkeys(compiled.field_checks)
+        attributes: Dict[str, str] = {}
+        for key, value in event_message["event_data"].items():
+            check = compiled.field_checks.get(key)
+            if check is not None and value is not None and check(value):
+                payload[key] = value
+            else:
+                # Untyped keys, mismatched types and explicit None values round-trip through JSON
+                attributes[key] = json.dumps(value, separators=(',', ':'), default=str)
+        payload["attributes"] = attributes
+
+        record = {
+            "event_type": compiled.event_type,
+            "source": str(event_message.get("source", "unknown")),
+            "timestamp": float(event_message.get("timestamp", 0.0)),
+            "event_data": payload
+        }
+        buffer = io.BytesIO()
+        buffer.write(compiled.header)
+        schemaless_writer(buffer, compiled.parsed, record)
+        return buffer.getvalue()
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """Decode either format back into a dispatcher message"""
+        if data[:2] != self.MAGIC:
+            return json.loads(data.decode('utf-8'))
+
+        compiled = self._by_fingerprint.get(data[2:self.HEADER_SIZE])
+        if compiled is None:
+            raise ValueError(f"Unknown saga event schema fingerprint {data[2:self.HEADER_SIZE].hex()}")
+
+        buffer = io.BytesIO(data)
+        buffer.seek(self.HEADER_SIZE)
+        record = schemaless_reader(buffer, compiled.parsed)
+
+        payload = record["event_data"]
+        attributes = payload.pop("attributes", None) or {}
+        event_data = {key: value for key, value in payload.items() if value is not None}
+        for key, value in attributes.items():
+            event_data[key] = json.loads(value)
+
+        return {
+            "event_type": record["event_type"],
+            "event_data": event_data,
+            "timestamp": record["timestamp"],
+            "source": record["source"]
+        }
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark de carga de contratos con y sin snapshots del event store
+"""
+
+import sys
+import os
+import asyncio
+import time
+import uuid
+
+# Add repository root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.onboarding.seedwork.dominio.eventos import ContractCreated, ContractTermsUpdated
+from src.onboarding.seedwork.infraestructura.event_store import Base, SqlAlchemyEventStore, SnapshotPolicy
+from src.onboarding.seedwork.infraestructura.repositories import SqlAlchemyContractRepository
+
+EVENT_COUNTS = [10, 1000, 10000]
+SNAPSHOT_EVERY = 100
+ROUNDS = 5
+
+
+def create_store():
+    # SQLite has no schemas; map onboarding.contract_snapshots to a plain table
+    engine = create_engine("sqlite:///:memory:", execution_options={"schema_translate_map": {"onboarding": None}})
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    registry = {
+        'ContractCreated': ContractCreated,
+        'ContractTermsUpdated': ContractTermsUpdated
+    }
+    return SqlAlchemyEventStore(session, registry)
+
+
+async def seed_contract(event_store, event_count: int) -> str:
+    contract_id = str(uuid.uuid4())
+    events = [ContractCreated(
+        contract_id=contract_id,
+        partner_id="partner-benchmark",
+        contract_type="STANDARD",
+        template_id="template-benchmark"
+    )]
+    events += [
+        ContractTermsUpdated(contract_id=contract_id, updated_terms={"commission_rate": i / 1000})
+        for i in range(event_count - 1)
+    ]
+    await event_store.save_events(contract_id, events, expected_version=0)
+    return contract_id
+
+
+async def time_load(repository, contract_id: str) -> float:
+    best = float('inf')
+    for _ in range(ROUNDS):
+        started = time.perf_counter()
+        contract = await repository.get_by_id(contract_id)
+        best = min(best, time.perf_counter() - started)
+    assert contract is not None and contract.id == contract_id
+    return best * 1000
+
+
+async def benchmark():
+    print("📊 Contract load time (best of %d runs)" % ROUNDS)
+    print("=" * 60)
+    print(f"{'events':>8} {'full replay (ms)':>18} {'snapshot (ms)':>15} {'speedup':>9}")
+
+    for event_count in EVENT_COUNTS:
+        event_store = create_store()
+        contract_id = await seed_contract(event_store, event_count)
+
+        # Automatic snapshots disabled: every load replays the whole stream
+        full_replay = SqlAlchemyContractRepository(event_store.session, event_store, SnapshotPolicy(every_n_events=0))
+        full_ms = await time_load(full_replay, contract_id)
+
+        # First load snapshots the contract, later loads replay only newer events
+        snapshotting = SqlAlchemyContractRepository(event_store.session, event_store, SnapshotPolicy(SNAPSHOT_EVERY))
+        await snapshotting.get_by_id(contract_id)
+        expected_version = (await full_replay.get_by_id(contract_id)).version
+        assert (await snapshotting.get_by_id(contract_id)).version == expected_version
+
+        # A handful of events appended after the snapshot are still replayed
+        await event_store.save_events(
+            contract_id,
+            [ContractTermsUpdated(contract_id=contract_id, updated_terms={}) for _ in range(5)],
+            expected_version=expected_version
+        )
+        snapshot_ms = await time_load(snapshotting, contract_id)
+        assert (await snapshotting.get_by_id(contract_id)).version == expected_version + 5
+
+        print(f"{event_count:>8} {full_ms:>18.2f} {snapshot_ms:>15.2f} {full_ms / snapshot_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(benchmark())
@@ -0,0 +1,99 @@
+"""
+GET /api/v1/commissions-query/report through the Flask test client: the
+streaming formats return every commission in the period, oldest first.
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from flask import Flask
+
+from partner_management.api.commissions_reports import bp
+from partner_management.modulos.commissions.aplicacion import servicios_aplicacion
+from partner_management.modulos.commissions.infraestructura.repositorios_mock import RepositorioCommissionMock
+from src.partner_management.seedwork.presentacion.api import create_app
+
+
+class TestReporteComisiones:
+
+    @pytest.fixture
+    def repositorio(self, monkeypatch):
+        repositorio = RepositorioCommissionMock()
+        monkeypatch.setattr(servicios_aplicacion, "get_commission_repository", lambda: repositorio)
+        return repositorio
+
+    @pytest.fixture
+    def client(self, repositorio):
+        app = Flask(__name__)
+        app.register_blueprint(bp)
+        return app.test_client()
+
+    @pytest.fixture
+    def periodo(self, repositorio):
+        fechas = sorted(c.created_at for c in repositorio.obtener_todos())
+        return fechas[2], fechas[9]
+
+    def esperadas(self, repositorio, periodo, partner_id=None):
+        desde, hasta = periodo
+        return [
+            c.id for c in sorted(repositorio.obtener_todos(), key=lambda c: (c.created_at, c.id))
+            if desde <= c.created_at <= hasta and partner_id in (None, c.partner_id)
+        ]
+
+    def pedir(self, client, periodo, **parametros):
+        desde, hasta = periodo
+        parametros.update(start_date=desde.isoformat(), end_date=hasta.isoformat())
+        return client.get('/api/v1/commissions-query/report', query_string=parametros)
+
+    def test_streams_ndjson(self, client, repositorio, periodo):
+        response = self.pedir(client, periodo, format='ndjson')
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.mimetype == 'application/x-ndjson'
+        assert 'attachment; filename="commissions_' in response.headers['Content-Disposition']
+        registros = [json.loads(linea) for linea in response.get_data(as_text=True).splitlines()]
+        assert [r['data']['id'] for r in registros[:-1]] == self.esperadas(repositorio, periodo)
+        assert registros[-1]['type'] == 'summary'
+        assert registros[-1]['data']['total_commissions'] == 8
+
+    def test_streams_csv(self, client, repositorio, periodo):
+        response = self.pedir(client, periodo, format='csv', partner_id='partner-001')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        filas = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+        assert filas[0][:2] == ['id', 'partner_id']
+        assert [fila[0] for fila in filas[1:]] == self.esperadas(repositorio, periodo, 'partner-001')
+
+    def test_json_returns_the_aggregates(self, client, periodo):
+        response = self.pedir(client, periodo)
+
+        assert response.status_code == 200
+        assert response.get_json()['total_commissions'] == 8
+        assert 'commissions' not in response.get_json()
+
+    def test_inverted_period_is_rejected(self, client, periodo):
+        response = self.pedir(client, (periodo[1], periodo[0]), format='csv')
+
+        assert response.status_code == 400
+        assert 'start date' in response.get_json()['error']
+
+    def test_unknown_format_is_rejected(self, client, periodo):
+        assert self.pedir(client, periodo, format='xml').status_code == 400
+
+    def test_dates_are_required(self, client):
+        response = client.get('/api/v1/commissions-query/report')
+
+        assert response.status_code == 400
+        assert 'start_date' in response.get_json()['error']
+
+
+class TestRegistroBlueprint:
+
+    def test_create_app_mounts_the_report_route(self):
+        app = create_app({'TESTING': True})
+
+        assert '/api/v1/commissions-query/report' in {rule.rule for rule in app.url_map.iter_rules()}
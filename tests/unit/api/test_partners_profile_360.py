@@ -0,0 +1,68 @@
+"""
+GET /partners-query/<id>/profile-360 through the Flask test client: v1 keeps its
+original response contract, v2 serves the materialized Profile360 document.
+"""
+
+import pytest
+from flask import Flask
+
+from src.partner_management.api.partners_cqrs import bp, bp_v2
+from src.partner_management.modulos.partners.aplicacion.queries import obtener_profile_360, obtener_profile_360_materializado
+from src.partner_management.modulos.partners.infraestructura.profile_360_read_model import (
+    Profile360ReadModel, RepositoryHistorySource
+)
+from src.partner_management.modulos.partners.infraestructura.repositorios_mock import MockPartnerRepository
+
+
+class TestProfile360Endpoints:
+
+    @pytest.fixture
+    def repositorio(self, monkeypatch):
+        repositorio = MockPartnerRepository()
+        monkeypatch.setattr(obtener_profile_360, "get_partner_repository", lambda: repositorio)
+        return repositorio
+
+    @pytest.fixture
+    def read_model(self, repositorio, monkeypatch):
+        read_model = Profile360ReadModel(history_source=RepositoryHistorySource(repositorio))
+        monkeypatch.setattr(obtener_profile_360_materializado, "get_profile_360_read_model", lambda: read_model)
+        return read_model
+
+    @pytest.fixture
+    def client(self, read_model):
+        app = Flask(__name__)
+        app.register_blueprint(bp)
+        app.register_blueprint(bp_v2)
+        return app.test_client()
+
+    @pytest.fixture
+    def partner(self, repositorio):
+        return repositorio.obtener_todos()[0]
+
+    def test_v1_keeps_the_profile_contract(self, client, partner):
+        response = client.get(f'/api/v1/partners-query/{partner.id}/profile-360')
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert set(body) == {
+            'partner', 'metricas', 'campanas_activas', 'campanas_completadas',
+            'comisiones_pendientes', 'comisiones_pagadas', 'historial_actividad'
+        }
+        assert body['partner']['id'] == partner.id
+
+    def test_v2_serves_the_materialized_document(self, client, partner, read_model):
+        response = client.get(f'/api/v2/partners-query/{partner.id}/profile-360')
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert set(body) == {'partner_id', 'partner', 'campaigns', 'commissions', 'trends', 'risk_inputs', 'freshness'}
+        assert body['partner']['name'] == partner.nombre.value
+        assert response.headers['X-Profile-Last-Event-At'] == body['freshness']['last_event_at']
+        # Projected on demand, the live read model is untouched
+        assert len(read_model) == 0
+
+    @pytest.mark.parametrize("version", ["v1", "v2"])
+    def test_unknown_partner(self, client, version):
+        response = client.get(f'/api/{version}/partners-query/desconocido/profile-360')
+
+        assert response.status_code == 404
@@ -0,0 +1,52 @@
+"""
+Profile360Loader tests: each entity type is read from its repository once per
+partner, through the method that repository exposes, and shared by every section.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from partner_management.modulos.analytics.aplicacion.queries.obtener_profile_360 import Profile360Loader
+from partner_management.modulos.analytics.infraestructura.repositorios_mock import RepositorioAnalyticsMock
+from partner_management.modulos.campaigns.infraestructura.repositorios_mock import RepositorioCampaignsMock
+from partner_management.modulos.commissions.infraestructura.repositorios_mock import RepositorioCommissionMock
+
+
+class TestProfile360Loader:
+
+    @pytest.fixture
+    def uow(self):
+        return SimpleNamespace(
+            campaigns=RepositorioCampaignsMock(),
+            commissions=RepositorioCommissionMock(),
+            analytics=RepositorioAnalyticsMock()
+        )
+
+    @pytest.fixture
+    def loader(self, uow):
+        return Profile360Loader(uow)
+
+    def test_loads_each_entity_type_from_its_repository(self, loader, uow):
+        assert loader.campaigns('partner-001') == uow.campaigns.obtener_por_partner('partner-001')
+        assert loader.commissions('partner-001') == uow.commissions.obtener_por_partner_id('partner-001')
+        assert loader.reports('partner-001') == uow.analytics.obtener_por_partner_id('partner-001')
+        assert loader.campaigns('partner-001')
+        assert loader.commissions('partner-001')
+
+    def test_prime_memoizes_one_round_trip_per_entity_type(self, loader):
+        loader.prime('partner-001')
+
+        campaigns = loader.campaigns('partner-001')
+        commissions = loader.commissions('partner-001')
+
+        assert loader.round_trips == 2
+        assert loader.campaigns('partner-001') is campaigns
+        assert loader.commissions('partner-001') is commissions
+
+    def test_partners_are_cached_separately(self, loader):
+        loader.campaigns('partner-001')
+        loader.campaigns('partner-002')
+
+        assert loader.round_trips == 2
+        assert all(c.partner_id == 'partner-002' for c in loader.campaigns('partner-002'))
@@ -0,0 +1,67 @@
+"""
+RepositorioAnalyticsMock tests: filtered queries answered from the indexes match a
+plain scan of the sample reports, newest first.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from partner_management.modulos.analytics.dominio.objetos_valor import ReportStatus, ReportType
+from partner_management.modulos.analytics.infraestructura.repositorios_mock import RepositorioAnalyticsMock
+
+
+def recientes_primero(reports):
+    return sorted(reports, key=lambda r: (r.created_at, r.id), reverse=True)
+
+
+class TestRepositorioAnalyticsMock:
+
+    @pytest.fixture
+    def repositorio(self):
+        return RepositorioAnalyticsMock()
+
+    def test_filtered_query_matches_a_scan(self, repositorio):
+        filtros = {'status': 'COMPLETED', 'report_type': 'CAMPAIGN_ANALYTICS'}
+
+        reports = repositorio.obtener_todos_con_filtros(filtros)
+
+        esperados = [
+            r for r in repositorio.obtener_todos()
+            if r.status == ReportStatus.COMPLETED and r.report_type == ReportType.CAMPAIGN_ANALYTICS
+        ]
+        assert reports == recientes_primero(esperados)
+        assert repositorio.contar_con_filtros(filtros) == len(esperados) == 3
+
+    def test_date_range_and_pagination(self, repositorio):
+        fechas = sorted(r.created_at for r in repositorio.obtener_todos())
+        filtros = {'start_date': fechas[3], 'end_date': fechas[10]}
+
+        reports = repositorio.obtener_todos_con_filtros(filtros, limit=3, offset=1)
+
+        esperados = [r for r in repositorio.obtener_todos() if fechas[3] <= r.created_at <= fechas[10]]
+        assert reports == recientes_primero(esperados)[1:4]
+        assert repositorio.contar_con_filtros(filtros) == 8
+
+    def test_recent_reports_of_a_partner(self, repositorio):
+        reports = repositorio.obtener_reportes_recientes('partner-003', days=30)
+
+        limite = datetime.now() - timedelta(days=30)
+        esperados = [r for r in repositorio.obtener_por_partner_id('partner-003') if r.created_at >= limite]
+        assert reports == recientes_primero(esperados)
+        assert len(reports) == 1
+
+    def test_platform_statistics_count_from_the_indexes(self, repositorio):
+        estadisticas = repositorio.obtener_estadisticas_plataforma()
+
+        assert estadisticas['total_reports'] == 15
+        assert estadisticas['status_breakdown'] == {'COMPLETED': 9, 'PENDING': 3, 'FAILED': 3}
+        assert estadisticas['unique_partners_analyzed'] == 5
+
+    def test_deleted_report_leaves_the_indexes(self, repositorio):
+        report = repositorio.obtener_por_tipo(ReportType.PROFILE_360)[0]
+
+        repositorio.eliminar(report)
+
+        assert repositorio.obtener_por_id(report.id) is None
+        assert repositorio.contar_con_filtros({'report_type': 'PROFILE_360'}) == 2
@@ -0,0 +1,70 @@
+"""
+RepositorioCampaignsMock tests: filtered, sorted and paged queries answered from the
+indexes match a plain scan of the sample campaigns.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from partner_management.modulos.campaigns.dominio.objetos_valor import CampaignStatus
+from partner_management.modulos.campaigns.infraestructura.repositorios_mock import RepositorioCampaignsMock
+
+
+class TestRepositorioCampaignsMock:
+
+    @pytest.fixture
+    def repositorio(self):
+        return RepositorioCampaignsMock()
+
+    def test_index_only_filters_page_off_created_at(self, repositorio):
+        campaigns, total = repositorio.obtener_con_filtros({'partner_id': 'partner-001'}, page=1, page_size=1)
+
+        esperadas = sorted(
+            (c for c in repositorio.obtener_todos() if c.partner_id == 'partner-001'),
+            key=lambda c: c.created_at, reverse=True
+        )
+        assert total == 2
+        assert campaigns == esperadas[:1]
+        assert repositorio.obtener_con_filtros({'partner_id': 'partner-001'}, page=2, page_size=1)[0] == esperadas[1:]
+
+    def test_start_date_and_budget_filters(self, repositorio):
+        filtros = {
+            'fecha_inicio_desde': '2024-05-01T00:00:00',
+            'fecha_inicio_hasta': '2024-12-31T00:00:00',
+            'presupuesto_min': Decimal('4000')
+        }
+
+        campaigns, total = repositorio.obtener_con_filtros(filtros, sort_by='start_date', sort_order='asc')
+
+        assert total == 2
+        assert [c.nombre.value for c in campaigns] == ["Summer Sales Boost", "Brand Awareness Q3"]
+
+    def test_approval_filter_with_non_indexed_sort(self, repositorio):
+        campaigns, total = repositorio.obtener_con_filtros({'is_approved': True}, sort_by='nombre', sort_order='asc')
+
+        esperadas = sorted(
+            (c for c in repositorio.obtener_todos() if c.approval.is_approved),
+            key=lambda c: c.nombre.value
+        )
+        assert total == len(esperadas) == 2
+        assert campaigns == esperadas
+
+    def test_status_change_is_reindexed_on_update(self, repositorio):
+        campaign = repositorio.obtener_por_status(CampaignStatus.DRAFT)[0]
+        campaign._status = CampaignStatus.ACTIVE
+
+        repositorio.actualizar(campaign)
+
+        assert repositorio.obtener_por_status(CampaignStatus.DRAFT) == []
+        assert campaign in repositorio.obtener_activas_por_partner(campaign.partner_id)
+        assert repositorio.contar_por_status(CampaignStatus.ACTIVE) == 2
+
+    def test_deleted_campaign_leaves_the_indexes(self, repositorio):
+        campaign = repositorio.obtener_por_partner('partner-002')[0]
+
+        repositorio.eliminar(campaign.id)
+
+        assert repositorio.obtener_con_filtros({'partner_id': 'partner-002'}) == ([], 0)
+        with pytest.raises(ValueError):
+            repositorio.eliminar(campaign.id)
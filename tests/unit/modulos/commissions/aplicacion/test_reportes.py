@@ -0,0 +1,81 @@
+"""
+Commission report tests: the summary folds commissions one at a time and the
+streamed NDJSON and CSV lines carry every commission plus the aggregates.
+"""
+
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from partner_management.modulos.commissions.aplicacion.reportes import (
+    CSV_COLUMNS, FORMATO_CSV, FORMATO_NDJSON, ResumenReporteComisiones, generar_lineas_reporte, linea_reporte
+)
+from partner_management.modulos.commissions.infraestructura.repositorios_mock import RepositorioCommissionMock
+
+
+class TestReportesComisiones:
+
+    @pytest.fixture
+    def commissions(self):
+        return RepositorioCommissionMock().obtener_todos()
+
+    @pytest.fixture
+    def resumen(self):
+        return ResumenReporteComisiones(datetime(2024, 1, 1), datetime(2024, 3, 31))
+
+    def test_summary_folds_every_commission(self, commissions, resumen):
+        for commission in commissions:
+            resumen.agregar(commission)
+
+        reporte = resumen.to_dict()
+        assert reporte['report_period'] == {'start_date': '2024-01-01T00:00:00', 'end_date': '2024-03-31T00:00:00'}
+        assert reporte['total_commissions'] == len(commissions)
+        assert reporte['total_amount'] == str(sum((c.commission_amount.amount for c in commissions), Decimal('0')))
+        assert sum(reporte['status_breakdown'].values()) == len(commissions)
+        assert reporte['type_breakdown'] == {
+            t: sum(1 for c in commissions if c.commission_type.value == t)
+            for t in {c.commission_type.value for c in commissions}
+        }
+
+    def test_empty_summary(self, resumen):
+        reporte = resumen.to_dict()
+
+        assert reporte['total_commissions'] == 0
+        assert reporte['total_amount'] == '0'
+        assert reporte['status_breakdown'] == {}
+
+    def test_ndjson_lines_end_with_the_summary(self, commissions, resumen):
+        registros = [json.loads(linea) for linea in ''.join(generar_lineas_reporte(commissions, resumen)).splitlines()]
+
+        assert [r['data'] for r in registros[:-1]] == [linea_reporte(c) for c in commissions]
+        assert {r['type'] for r in registros[:-1]} == {'commission'}
+        assert registros[-1] == {'type': 'summary', 'data': resumen.to_dict()}
+        assert resumen.total_commissions == len(commissions)
+
+    def test_csv_rows_follow_the_header(self, commissions, resumen):
+        filas = list(csv.reader(io.StringIO(''.join(generar_lineas_reporte(commissions, resumen, FORMATO_CSV)))))
+
+        assert filas[0] == CSV_COLUMNS
+        assert [fila[0] for fila in filas[1:]] == [c.id for c in commissions]
+        assert resumen.total_commissions == len(commissions)
+
+    def test_lines_are_flushed_in_chunks(self, commissions, resumen):
+        chunks = list(generar_lineas_reporte(commissions, resumen, FORMATO_NDJSON, chunk_size=1))
+
+        # One chunk per commission, then the summary
+        assert len(chunks) == len(commissions) + 1
+
+    def test_commissions_are_read_lazily(self, commissions, resumen):
+        chunks = generar_lineas_reporte(iter(commissions), resumen, FORMATO_NDJSON, chunk_size=1)
+
+        next(chunks)
+
+        assert resumen.total_commissions == 1
+
+    def test_unknown_format(self, commissions, resumen):
+        with pytest.raises(ValueError):
+            next(generar_lineas_reporte(commissions, resumen, 'xml'))
@@ -0,0 +1,73 @@
+"""
+RepositorioCommissionMock tests: filtered queries answered from the indexes match a
+plain scan of the sample data, newest first, and keep up with adds and deletes.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from partner_management.modulos.commissions.infraestructura.repositorios_mock import RepositorioCommissionMock
+
+
+def recientes_primero(commissions):
+    return sorted(commissions, key=lambda c: (c.created_at, c.id), reverse=True)
+
+
+class TestRepositorioCommissionMock:
+
+    @pytest.fixture
+    def repositorio(self):
+        return RepositorioCommissionMock()
+
+    def test_filtered_query_matches_a_scan(self, repositorio):
+        filtros = {'partner_id': 'partner-001', 'status': 'PAID'}
+
+        commissions = repositorio.obtener_todos_con_filtros(filtros)
+
+        esperadas = [
+            c for c in repositorio.obtener_todos()
+            if c.partner_id == 'partner-001' and c.status.value == 'PAID'
+        ]
+        assert commissions == recientes_primero(esperadas)
+        assert repositorio.contar_con_filtros(filtros) == len(esperadas)
+
+    def test_date_range_bounds_the_created_at_index(self, repositorio):
+        fechas = sorted(c.created_at for c in repositorio.obtener_todos())
+        desde, hasta = fechas[5], fechas[14]
+
+        commissions = repositorio.obtener_todos_con_filtros({'start_date': desde, 'end_date': hasta}, limit=4, offset=2)
+
+        esperadas = [c for c in repositorio.obtener_todos() if desde <= c.created_at <= hasta]
+        assert commissions == recientes_primero(esperadas)[2:6]
+        assert repositorio.contar_con_filtros({'start_date': desde, 'end_date': hasta}) == 10
+
+    def test_keyset_pages_cover_every_commission_once(self, repositorio):
+        vistas, after = [], None
+        while True:
+            pagina = repositorio.obtener_pagina({'commission_type': 'SALE_COMMISSION'}, limit=2, after=after)
+            if not pagina:
+                break
+            vistas.extend(pagina)
+            after = (pagina[-1].created_at, pagina[-1].id)
+
+        esperadas = [c for c in repositorio.obtener_todos() if c.commission_type.value == 'SALE_COMMISSION']
+        assert vistas == recientes_primero(esperadas)
+
+    def test_deleted_commissions_leave_the_indexes(self, repositorio):
+        commission = repositorio.obtener_por_partner_id('partner-002')[0]
+
+        repositorio.eliminar(commission)
+
+        assert commission not in repositorio.obtener_todos_con_filtros({'partner_id': 'partner-002'})
+        assert repositorio.contar_con_filtros({'partner_id': 'partner-002'}) == 3
+
+    def test_added_commission_is_found_by_transaction(self, repositorio):
+        commission = repositorio.obtener_todos()[0]
+        repositorio._commissions.remove(commission.id)
+        commission._created_at = max(c.created_at for c in repositorio.obtener_todos()) + timedelta(days=1)
+
+        repositorio.agregar(commission)
+
+        assert repositorio.obtener_por_transaction_id(commission.transaction_reference.transaction_id) is commission
+        assert repositorio.obtener_todos_con_filtros(limit=1) == [commission]
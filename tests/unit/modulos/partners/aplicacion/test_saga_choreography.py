@@ -0,0 +1,143 @@
+"""
+Redelivery of saga events: a handler that fails leaves its event unmarked so the
+redelivered message retries the step, duplicates of a handled event are skipped,
+and the dispatcher negatively acknowledges messages whose handlers raised.
+"""
+
+import queue
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.idempotency_store import IdempotencyStore
+from src.partner_management.modulos.partners.aplicacion import saga_choreography
+from src.partner_management.modulos.partners.aplicacion.saga_choreography import (
+    ChoreographySagaOrchestrator, ChoreographySagaStatus, SagaStateRepository
+)
+from src.partner_management.seedwork.infraestructura.saga_state_store import ShardedMemorySagaStateStore
+from src.pulsar_event_dispatcher import PulsarEventDispatcher
+
+
+class DispatcherMemoria:
+    """Keeps the subscribed handlers and the published events instead of talking to Pulsar"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.publicados = []
+
+    def subscribe(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def publish(self, event_type, event_data):
+        self.publicados.append(event_type)
+
+    def entregar(self, event_type, event_data):
+        for handler in self.handlers[event_type]:
+            handler(event_data)
+
+
+def evento(partner_id: str, causation_id: str = "causa-1"):
+    return {"partner_id": partner_id, "correlation_id": "corr-1", "causation_id": causation_id}
+
+
+class TestRedeliveryOfSagaEvents:
+
+    @pytest.fixture(autouse=True)
+    def observabilidad(self, monkeypatch):
+        for nombre in ("get_saga_log", "get_saga_audit_trail", "get_saga_metrics"):
+            monkeypatch.setattr(saga_choreography, nombre, MagicMock)
+
+    @pytest.fixture
+    def dispatcher(self):
+        return DispatcherMemoria()
+
+    @pytest.fixture
+    def repositorio(self):
+        return SagaStateRepository(store=ShardedMemorySagaStateStore())
+
+    @pytest.fixture
+    def orquestador(self, repositorio, dispatcher):
+        return ChoreographySagaOrchestrator(
+            repositorio, dispatcher, timer_wheel=MagicMock(), processed_events=IdempotencyStore("pruebas")
+        )
+
+    def test_failed_step_is_retried_on_redelivery(self, orquestador, repositorio, dispatcher, monkeypatch):
+        partner_id = orquestador.start_partner_onboarding({"partner_id": "p-1"}, "corr-1")
+        actualizar = repositorio.update
+        monkeypatch.setattr(repositorio, "update", MagicMock(side_effect=RuntimeError("store down")))
+
+        with pytest.raises(RuntimeError):
+            dispatcher.entregar("PartnerRegistrationCompleted", evento(partner_id))
+
+        monkeypatch.setattr(repositorio, "update", actualizar)
+        dispatcher.entregar("PartnerRegistrationCompleted", evento(partner_id))
+
+        estado = repositorio.get(partner_id)
+        assert estado["status"] == ChoreographySagaStatus.PARTNER_REGISTERED
+        assert estado["completed_steps"] == ["partner_registration"]
+        assert dispatcher.publicados.count("ContractCreationRequested") == 1
+
+    def test_duplicate_of_a_handled_event_is_skipped(self, orquestador, dispatcher):
+        partner_id = orquestador.start_partner_onboarding({"partner_id": "p-1"}, "corr-1")
+
+        dispatcher.entregar("PartnerRegistrationCompleted", evento(partner_id))
+        dispatcher.entregar("PartnerRegistrationCompleted", evento(partner_id))
+
+        assert dispatcher.publicados.count("ContractCreationRequested") == 1
+        assert orquestador.processed_events.duplicates == 1
+
+
+class TestDispatcherAcknowledgement:
+
+    @pytest.fixture
+    def dispatcher(self):
+        # Only the handler bookkeeping is exercised, so the Pulsar client is never built
+        dispatcher = PulsarEventDispatcher.__new__(PulsarEventDispatcher)
+        dispatcher.service_name = "pruebas"
+        dispatcher.logger = MagicMock()
+        dispatcher.latency_recorder = None
+        dispatcher._handlers = {}
+        return dispatcher
+
+    def suscribir(self, dispatcher, event_type, handler):
+        dispatcher._handlers.setdefault(event_type, []).append(handler)
+
+    def consumir(self, dispatcher, consumer, mensaje):
+        """Run one synchronous consumer lane over a single message until it drains"""
+        dispatcher.async_publish = False
+        dispatcher._publish_condition = threading.Condition()
+        dispatcher._consumed_count = 0
+        dispatcher._failed_count = 0
+        dispatcher._running = False
+        lane = queue.Queue()
+        lane.put((consumer, mensaje, {"event_type": "ContractCreated", "event_data": {}, "source": "otro"}))
+        dispatcher._consumer_worker(lane)
+
+    def test_failing_handler_marks_the_event_unhandled(self, dispatcher):
+        llamadas = []
+
+        def falla(event_data):
+            raise RuntimeError("boom")
+
+        self.suscribir(dispatcher, "ContractCreated", falla)
+        self.suscribir(dispatcher, "ContractCreated", llamadas.append)
+
+        handled = dispatcher._handle_event({"event_type": "ContractCreated", "event_data": {"a": 1}, "source": "otro"})
+
+        assert handled is False
+        assert llamadas == [{"a": 1}]
+
+    def test_successful_handlers_mark_the_event_handled(self, dispatcher):
+        self.suscribir(dispatcher, "ContractCreated", lambda event_data: None)
+
+        assert dispatcher._handle_event({"event_type": "ContractCreated", "event_data": {}, "source": "otro"})
+
+    def test_unhandled_message_is_negatively_acknowledged(self, dispatcher, monkeypatch):
+        consumer, mensaje = MagicMock(), MagicMock()
+        monkeypatch.setattr(dispatcher, "_handle_event", lambda event: False)
+
+        self.consumir(dispatcher, consumer, mensaje)
+
+        consumer.negative_acknowledge.assert_called_once_with(mensaje)
+        consumer.acknowledge.assert_not_called()
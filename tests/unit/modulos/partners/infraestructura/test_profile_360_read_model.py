@@ -0,0 +1,178 @@
+"""
+Write -> read tests for the Profile360 read model: domain events written through the
+partner repository or the unit of work reach the materialized documents on commit.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from partner_management.modulos.partners.dominio.entidades import Partner
+from partner_management.modulos.partners.dominio.objetos_valor import PartnerEmail, PartnerName, PartnerPhone, PartnerType
+from partner_management.modulos.partners.infraestructura.profile_360_read_model import (
+    Profile360ReadModel, RepositoryHistorySource
+)
+from partner_management.modulos.partners.infraestructura.repositorios_sql import PartnerModel, SqlAlchemyPartnerRepository
+from partner_management.seedwork.infraestructura.uow import SqlAlchemyUnitOfWork
+
+
+def crear_partner(nombre: str = "Acme Partners") -> Partner:
+    slug = nombre.lower().replace(" ", "-")
+    return Partner(
+        nombre=PartnerName(nombre),
+        email=PartnerEmail(f"{slug}@example.com"),
+        telefono=PartnerPhone("+573001234567"),
+        tipo=PartnerType.EMPRESA
+    )
+
+
+class TestProfile360ReadModel:
+
+    @pytest.fixture
+    def session_factory(self):
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        PartnerModel.__table__.create(engine)
+        return sessionmaker(bind=engine, expire_on_commit=False)
+
+    @pytest.fixture
+    def repositorio(self, session_factory):
+        return SqlAlchemyPartnerRepository(session_factory=session_factory)
+
+    @pytest.fixture
+    def read_model(self, repositorio):
+        read_model = Profile360ReadModel(history_source=RepositoryHistorySource(repositorio))
+        read_model.subscribe()
+        yield read_model
+        read_model.unsubscribe()
+
+    def test_partner_added_through_repository_is_materialized(self, repositorio, read_model):
+        partner = crear_partner()
+
+        repositorio.agregar(partner)
+
+        documento = read_model.get(partner.id)
+        assert documento["partner"]["name"] == "Acme Partners"
+        assert documento["partner"]["status"] == "ACTIVO"
+        assert not partner.has_events
+
+    def test_partner_update_reaches_read_model(self, repositorio, read_model):
+        partner = crear_partner()
+        repositorio.agregar(partner)
+
+        partner.desactivar("Sin actividad")
+        repositorio.actualizar(partner)
+
+        assert read_model.get(partner.id)["partner"]["status"] == "INACTIVO"
+
+    def test_unit_of_work_publishes_only_after_commit(self, session_factory, read_model):
+        uow = SqlAlchemyUnitOfWork(session_factory)
+        repositorio = SqlAlchemyPartnerRepository(session=uow.get_session())
+        partner = crear_partner()
+
+        repositorio.agregar(partner)
+        assert read_model.get(partner.id) is None
+
+        uow.commit()
+        assert read_model.get(partner.id)["partner"]["name"] == "Acme Partners"
+
+    def test_rolled_back_write_is_not_materialized(self, session_factory, read_model):
+        uow = SqlAlchemyUnitOfWork(session_factory)
+        repositorio = SqlAlchemyPartnerRepository(session=uow.get_session())
+        partner = crear_partner()
+
+        repositorio.agregar(partner)
+        uow.rollback()
+
+        assert read_model.get(partner.id) is None
+        assert read_model.project(partner.id) is None
+
+    def test_projection_matches_live_document(self, repositorio, read_model):
+        read_model.unsubscribe()
+        anterior = crear_partner("Partner Anterior")
+        repositorio.agregar(anterior)
+        read_model.subscribe()
+        nuevo = crear_partner("Partner Nuevo")
+        repositorio.agregar(nuevo)
+
+        assert read_model.get(anterior.id) is None
+        proyectado = read_model.project(anterior.id)
+        vivo = read_model.get(nuevo.id)
+        assert proyectado.keys() == vivo.keys()
+        assert proyectado["campaigns"].keys() == vivo["campaigns"].keys()
+        assert proyectado["partner"]["name"] == "Partner Anterior"
+
+    def test_rebuild_replays_repository_state(self, repositorio, read_model):
+        read_model.unsubscribe()
+        partners = [crear_partner(f"Partner {i}") for i in range(3)]
+        for partner in partners:
+            repositorio.agregar(partner)
+        partners[0].desactivar()
+        repositorio.actualizar(partners[0])
+
+        replayed = read_model.rebuild()
+
+        assert replayed == 6
+        assert len(read_model) == 3
+        assert read_model.get(partners[0].id)["partner"]["status"] == "INACTIVO"
+
+    def test_backlog_event_without_id_is_applied_once(self, read_model):
+        evento = {
+            "event_name": "CommissionCreated",
+            "aggregate_id": "commission-1",
+            "metadata": {"occurred_on": "2026-01-10T00:00:00"},
+            "event_data": {"partner_id": "partner-1", "commission_amount": "100"}
+        }
+
+        def historia(partner_id):
+            # The event arrives while the history is being replayed
+            read_model.apply(evento)
+            yield from ()
+
+        read_model.history_source = historia
+        read_model.rebuild()
+
+        comisiones = read_model.get("partner-1")["commissions"]
+        assert comisiones["total"] == 1
+        assert comisiones["total_earned"] == "100"
+
+    def test_rebuild_reproduces_the_live_risk_inputs(self, read_model):
+        def evento(nombre, **datos):
+            return {
+                "event_name": nombre,
+                "aggregate_id": "commission-1",
+                "metadata": {"occurred_on": "2026-01-10T00:00:00"},
+                "event_data": {"partner_id": "partner-1", **datos}
+            }
+
+        # Live: disputed, then released
+        for registro in (
+            evento("CommissionCreated", commission_amount="100"),
+            evento("CommissionDisputed"),
+            evento("CommissionReleased")
+        ):
+            read_model.apply(registro)
+        vivo = read_model.get("partner-1")["risk_inputs"]
+
+        # Stored state only shows the pending commission
+        read_model.rebuild([evento("CommissionCreated", commission_amount="100")])
+
+        assert read_model.get("partner-1")["risk_inputs"] == vivo
+        assert vivo["disputed_commissions"] == 0
+        assert vivo["dispute_rate"] == 0
+
+    def test_risk_inputs_follow_current_state(self, read_model):
+        for nombre, comision in (("CommissionCreated", "c-1"), ("CommissionCreated", "c-2"), ("CommissionDisputed", "c-1")):
+            read_model.apply({
+                "event_name": nombre,
+                "aggregate_id": comision,
+                "metadata": {"occurred_on": "2026-01-10T00:00:00"},
+                "event_data": {"partner_id": "partner-1", "commission_amount": "50"}
+            })
+        read_model.apply({"event_name": "PartnerSuspended", "aggregate_id": "partner-1", "event_data": {}})
+
+        riesgo = read_model.get("partner-1")["risk_inputs"]
+
+        assert riesgo["disputed_commissions"] == 1
+        assert riesgo["dispute_rate"] == 0.5
+        assert riesgo["suspended"] is True
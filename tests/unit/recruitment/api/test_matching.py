@@ -0,0 +1,98 @@
+"""
+GET /matching/candidates-for-job through the Flask test client: candidates created
+by the commands are shortlisted from the skill index and ranked by the matching engine.
+"""
+
+import pytest
+from flask import Flask
+
+from recruitment.api.matching import matching_bp
+from recruitment.modulos.candidates.aplicacion.comandos.crear_candidate import CrearCandidate, handle_crear_candidate
+from recruitment.modulos.candidates.aplicacion.comandos.desactivar_candidate import (
+    DesactivarCandidate, handle_desactivar_candidate
+)
+from recruitment.modulos.candidates.dominio.entidades import Skill
+
+
+def crear_candidate(repositorio, nombre: str, skills, experiencia: int = 5) -> str:
+    candidate_id = handle_crear_candidate(CrearCandidate(
+        name=nombre,
+        email=f"{nombre.lower().replace(' ', '.')}@example.com",
+        phone="+573001234567",
+        skills=list(skills),
+        experience_years=experiencia
+    ))
+    candidate = repositorio.obtener_por_id(candidate_id)
+    for nombre_skill, nivel in skills.items():
+        candidate.add_skill(Skill(name=nombre_skill, level=nivel, years_experience=2, category="technical"))
+    return candidate_id
+
+
+class TestCandidatesForJob:
+
+    @pytest.fixture
+    def client(self, repositorio, indice, cache):
+        app = Flask(__name__)
+        app.register_blueprint(matching_bp, url_prefix='/matching')
+        return app.test_client()
+
+    @pytest.fixture
+    def candidatos(self, repositorio, indice):
+        return {
+            "experta": crear_candidate(repositorio, "Ana Experta", {"Python": 5, "SQL": 4}),
+            "parcial": crear_candidate(repositorio, "Beto Parcial", {"Python": 3, "Java": 5}, experiencia=1),
+            "ajena": crear_candidate(repositorio, "Carla Ajena", {"Go": 5})
+        }
+
+    def buscar(self, client, **parametros):
+        parametros.setdefault("required_skills", "python,sql")
+        parametros.setdefault("min_match_score", 0)
+        parametros.setdefault("required_experience_years", 4)
+        return client.get('/matching/candidates-for-job/job-1', query_string=parametros)
+
+    def test_ranks_the_shortlisted_candidates(self, client, candidatos):
+        response = self.buscar(client)
+
+        assert response.status_code == 200
+        body = response.get_json()
+        assert [m["candidate_id"] for m in body["matches"]] == [candidatos["experta"], candidatos["parcial"]]
+        assert body["total_candidates"] == 3
+        assert body["matched_candidates"] == 2
+        experta = body["matches"][0]
+        assert experta["match_score"] == 100.0
+        assert experta["skills_match"] == ["Python", "SQL"]
+        assert experta["experience_years"] == 5
+
+    def test_minimum_should_match_narrows_the_shortlist(self, client, candidatos):
+        body = self.buscar(client, minimum_should_match=2).get_json()
+
+        assert [m["candidate_id"] for m in body["matches"]] == [candidatos["experta"]]
+        assert body["matched_candidates"] == 1
+
+    def test_min_match_score_filters_results(self, client, candidatos):
+        body = self.buscar(client, min_match_score=90).get_json()
+
+        assert [m["candidate_id"] for m in body["matches"]] == [candidatos["experta"]]
+
+    def test_deactivated_candidates_are_not_matched(self, client, candidatos):
+        handle_desactivar_candidate(DesactivarCandidate(candidate_id=candidatos["experta"], deactivated_by="admin"))
+
+        body = self.buscar(client).get_json()
+
+        assert [m["candidate_id"] for m in body["matches"]] == [candidatos["parcial"]]
+
+    def test_scores_are_cached_per_candidate_version(self, client, candidatos, cache):
+        self.buscar(client)
+        self.buscar(client)
+
+        assert cache.hits == 2
+        assert cache.misses == 2
+
+    def test_required_skills_are_mandatory(self, client):
+        response = client.get('/matching/candidates-for-job/job-1')
+
+        assert response.status_code == 400
+        assert "required_skills" in response.get_json()["error"]
+
+    def test_invalid_parameter(self, client):
+        assert self.buscar(client, limit="muchos").status_code == 400
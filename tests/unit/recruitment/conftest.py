@@ -0,0 +1,35 @@
+"""
+Fixtures shared by the recruitment unit tests: the candidate commands, the
+skill index and the matching API use process-wide singletons, which each test
+gets fresh.
+"""
+
+import pytest
+
+from recruitment.modulos.candidates.dominio import indice_habilidades
+from recruitment.modulos.candidates.dominio.indice_habilidades import SkillIndex
+from recruitment.modulos.candidates.infraestructura import repositorios
+from recruitment.modulos.candidates.infraestructura.repositorios import RepositorioCandidatesMemoria
+from recruitment.modulos.matching.infraestructura import cache_puntuaciones
+from recruitment.modulos.matching.infraestructura.cache_puntuaciones import MatchScoreCache
+
+
+@pytest.fixture
+def indice(monkeypatch):
+    indice = SkillIndex()
+    monkeypatch.setattr(indice_habilidades, "_default_index", indice)
+    return indice
+
+
+@pytest.fixture
+def repositorio(monkeypatch):
+    repositorio = RepositorioCandidatesMemoria()
+    monkeypatch.setattr(repositorios, "_default_repository", repositorio)
+    return repositorio
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = MatchScoreCache()
+    monkeypatch.setattr(cache_puntuaciones, "_default_cache", cache)
+    return cache
@@ -0,0 +1,140 @@
+"""
+Candidate command tests: commands write through the candidate repository and keep
+the skill index and the match-score cache in sync.
+"""
+
+import pytest
+
+from recruitment.modulos.candidates.aplicacion.comandos.activar_candidate import ActivarCandidate, handle_activar_candidate
+from recruitment.modulos.candidates.aplicacion.comandos.actualizar_candidate import (
+    ActualizarCandidate, handle_actualizar_candidate
+)
+from recruitment.modulos.candidates.aplicacion.comandos.crear_candidate import CrearCandidate, handle_crear_candidate
+from recruitment.modulos.candidates.aplicacion.comandos.desactivar_candidate import (
+    DesactivarCandidate, handle_desactivar_candidate
+)
+from recruitment.modulos.candidates.dominio.entidades import AvailabilityStatus
+from recruitment.seedwork.dominio.excepciones import (
+    CandidateAlreadyExistsException, CandidateNotFoundException, InvalidCandidateDataException
+)
+
+
+def crear_comando(email: str = "ana@example.com", **campos) -> CrearCandidate:
+    datos = dict(
+        name="Ana Torres",
+        email=email,
+        phone="+573001234567",
+        skills=["Python", "SQL"],
+        experience_years=6,
+        current_position="Backend Developer",
+        current_company="Acme",
+        resume_url="https://example.com/ana.pdf",
+        notes="Referida"
+    )
+    datos.update(campos)
+    return CrearCandidate(**datos)
+
+
+class TestComandosCandidate:
+
+    def test_create_keeps_profile_data(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+
+        candidate = repositorio.obtener_por_id(candidate_id)
+        assert candidate.total_experience_years == 6
+        assert candidate.to_matching_profile()["years_of_experience"] == 6
+        assert candidate.current_position == "Backend Developer"
+        assert candidate.current_company == "Acme"
+        assert candidate.resume_url == "https://example.com/ana.pdf"
+        assert candidate.notes == "Referida"
+        assert indice.shortlist(["python"]) == [candidate]
+
+    def test_create_rejects_duplicate_email(self, repositorio, indice):
+        handle_crear_candidate(crear_comando())
+
+        with pytest.raises(CandidateAlreadyExistsException):
+            handle_crear_candidate(crear_comando(name="Otra Persona"))
+
+    def test_update_every_field(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+        version = repositorio.obtener_por_id(candidate_id).to_matching_profile()["version"]
+
+        handle_actualizar_candidate(ActualizarCandidate(
+            candidate_id=candidate_id,
+            name="Ana María Torres",
+            phone="+573009999999",
+            skills=["python", "Go"],
+            experience_years=8,
+            current_position="Tech Lead",
+            current_company="Globex",
+            resume_url="https://example.com/ana-2.pdf",
+            notes="Entrevista pendiente"
+        ))
+
+        candidate = repositorio.obtener_por_id(candidate_id)
+        assert candidate.name == "Ana María Torres"
+        assert candidate.contact_info.phone == "+573009999999"
+        assert candidate.contact_info.email == "ana@example.com"
+        assert candidate.total_experience_years == 8
+        assert (candidate.current_position, candidate.current_company) == ("Tech Lead", "Globex")
+        assert candidate.resume_url == "https://example.com/ana-2.pdf"
+        assert candidate.notes == "Entrevista pendiente"
+        assert candidate.to_matching_profile()["version"] != version
+
+    def test_update_reindexes_skills(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+
+        handle_actualizar_candidate(ActualizarCandidate(candidate_id=candidate_id, skills=["python", "Go"]))
+
+        assert [c.id for c in indice.shortlist(["go"])] == [candidate_id]
+        assert indice.shortlist(["sql"]) == []
+
+    def test_update_keeps_existing_skill_levels(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+        repositorio.obtener_por_id(candidate_id).update_skill_level("python", 7, 5)
+
+        handle_actualizar_candidate(ActualizarCandidate(candidate_id=candidate_id, skills=["Python", "Go"]))
+
+        niveles = {s.name.lower(): s.level for s in repositorio.obtener_por_id(candidate_id).skills}
+        assert niveles == {"python": 7, "go": 1}
+
+    def test_update_rejects_invalid_experience(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+
+        with pytest.raises(InvalidCandidateDataException):
+            handle_actualizar_candidate(ActualizarCandidate(candidate_id=candidate_id, experience_years=80))
+
+    def test_update_unknown_candidate(self, repositorio, indice):
+        with pytest.raises(CandidateNotFoundException):
+            handle_actualizar_candidate(ActualizarCandidate(candidate_id="desconocido", name="Nadie"))
+
+    def test_deactivate_removes_and_activate_re_adds(self, repositorio, indice):
+        candidate_id = handle_crear_candidate(crear_comando())
+
+        handle_desactivar_candidate(DesactivarCandidate(candidate_id=candidate_id, deactivated_by="admin"))
+
+        candidate = repositorio.obtener_por_id(candidate_id)
+        assert candidate.availability == AvailabilityStatus.NOT_LOOKING
+        assert candidate_id not in indice
+        # A detached candidate no longer reaches the index
+        candidate.actualizar_skills(candidate.skills)
+        assert indice.shortlist(["python"]) == []
+
+        handle_activar_candidate(ActivarCandidate(candidate_id=candidate_id, activated_by="admin"))
+
+        assert repositorio.obtener_por_id(candidate_id).availability == AvailabilityStatus.AVAILABLE
+        assert [c.id for c in indice.shortlist(["python"])] == [candidate_id]
+
+    def test_update_and_deactivate_drop_cached_scores(self, repositorio, indice, cache):
+        candidate_id = handle_crear_candidate(crear_comando())
+        otro_id = handle_crear_candidate(crear_comando(email="beto@example.com", name="Beto Ruiz"))
+        clave = ("job-1", "v1", "WEIGHTED_CRITERIA", "criterios")
+        cache.put_many(*clave, [(candidate_id, "1", 0.9), (otro_id, "1", 0.4)])
+
+        handle_actualizar_candidate(ActualizarCandidate(candidate_id=candidate_id, notes="Actualizada"))
+
+        assert cache.get_many(*clave, [(candidate_id, "1"), (otro_id, "1")]) == [None, 0.4]
+
+        handle_desactivar_candidate(DesactivarCandidate(candidate_id=otro_id, deactivated_by="admin"))
+
+        assert len(cache) == 0
@@ -0,0 +1,114 @@
+"""
+SkillIndex tests: AND/OR/minimum-should-match over the skill postings and the
+incremental updates applied by attached candidates.
+"""
+
+import pytest
+
+from recruitment.modulos.candidates.dominio.entidades import Candidate, ContactInfo, Skill
+from recruitment.modulos.candidates.dominio.indice_habilidades import SkillIndex
+
+
+def crear_skill(nombre: str, nivel: int = 5) -> Skill:
+    return Skill(name=nombre, level=nivel, years_experience=2, category="technical")
+
+
+def crear_candidate(nombre: str, *skills: str) -> Candidate:
+    return Candidate(
+        name=nombre,
+        contact_info=ContactInfo(email=f"{nombre.lower()}@example.com"),
+        skills=[crear_skill(skill) for skill in skills]
+    )
+
+
+def nombres(candidates):
+    return [candidate.name for candidate in candidates]
+
+
+class TestSkillIndex:
+
+    @pytest.fixture
+    def candidatos(self):
+        return [
+            crear_candidate("Ana", "Python", "SQL", "Docker"),
+            crear_candidate("Beto", "python", "Java"),
+            crear_candidate("Carla", "SQL", "Docker"),
+            crear_candidate("Dario", "Go")
+        ]
+
+    @pytest.fixture
+    def indice(self, candidatos):
+        indice = SkillIndex()
+        indice.rebuild(candidatos)
+        return indice
+
+    def test_match_any_is_a_case_insensitive_or(self, indice):
+        assert nombres(indice.candidates(indice.match_any(["PYTHON", "go"]))) == ["Ana", "Beto", "Dario"]
+
+    def test_match_all_is_an_and(self, indice):
+        assert nombres(indice.candidates(indice.match_all(["sql", "docker"]))) == ["Ana", "Carla"]
+        assert indice.match_all(["sql", "rust"]) == 0
+
+    @pytest.mark.parametrize('minimo, esperado', [
+        (0, ["Ana", "Beto", "Carla", "Dario"]),
+        (1, ["Ana", "Beto", "Carla"]),
+        (2, ["Ana", "Carla"]),
+        (3, ["Ana"]),
+        (4, [])
+    ])
+    def test_minimum_should_match(self, indice, minimo, esperado):
+        assert nombres(indice.shortlist(["python", "sql", "docker"], minimo)) == esperado
+
+    def test_minimum_should_match_agrees_with_counting(self, indice, candidatos):
+        skills = ["python", "sql", "docker", "java", "go"]
+        for minimo in range(1, len(skills) + 1):
+            esperado = [
+                c.name for c in candidatos
+                if sum(s.name.lower() in skills for s in c.skills) >= minimo
+            ]
+            assert nombres(indice.shortlist(skills, minimo)) == esperado
+
+    def test_add_skill_updates_postings(self, indice, candidatos):
+        dario = candidatos[3]
+
+        dario.add_skill(crear_skill("Python"))
+
+        assert "Dario" in nombres(indice.shortlist(["python"]))
+
+    def test_update_skill_level_keeps_candidate_indexed(self, indice, candidatos):
+        candidatos[0].update_skill_level("python", 9, 6)
+
+        assert nombres(indice.shortlist(["python"])) == ["Ana", "Beto"]
+        assert indice.shortlist(["python"])[0].skills[0].level == 9
+
+    def test_actualizar_skills_drops_removed_skills(self, indice, candidatos):
+        candidatos[0].actualizar_skills([crear_skill("Rust")])
+
+        assert nombres(indice.shortlist(["python"])) == ["Beto"]
+        assert nombres(indice.shortlist(["rust"])) == ["Ana"]
+
+    def test_removed_candidate_is_detached(self, indice, candidatos):
+        ana = candidatos[0]
+
+        indice.remove(ana.id)
+        ana.add_skill(crear_skill("Go"))
+
+        assert ana.id not in indice
+        assert nombres(indice.shortlist(["go", "python"])) == ["Beto", "Dario"]
+
+    def test_re_added_candidate_reuses_a_free_slot(self, indice, candidatos):
+        indice.remove(candidatos[1].id)
+        nuevo = crear_candidate("Elena", "Java")
+
+        indice.add(nuevo)
+        indice.add(candidatos[1])
+
+        assert len(indice) == 5
+        assert set(nombres(indice.shortlist(["java"]))) == {"Beto", "Elena"}
+
+    def test_rebuild_detaches_previous_candidates(self, indice, candidatos):
+        indice.rebuild(candidatos[2:])
+        candidatos[0].add_skill(crear_skill("Go"))
+
+        assert len(indice) == 2
+        assert nombres(indice.shortlist(["go"])) == ["Dario"]
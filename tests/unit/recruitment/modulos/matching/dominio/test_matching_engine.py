@@ -0,0 +1,179 @@
+"""
+MatchingEngine batch evaluation: the vectorized top-k feeds the scalar evaluation,
+rejected candidates are refilled from the ranking, only the latest results are
+kept on the aggregate and cached scores are reused while versions match.
+"""
+
+import numpy as np
+import pytest
+
+from recruitment.modulos.matching.dominio import puntuacion_vectorizada as pv
+from recruitment.modulos.matching.dominio.entidades import (
+    CandidateMatched, MatchingAlgorithm, MatchingEngine, MatchingProcessCompleted, MatchingProcessStarted
+)
+from recruitment.modulos.matching.infraestructura.cache_puntuaciones import MatchScoreCache
+
+VACANTE = {
+    "id": "job-1",
+    "required_skills": ["python", "sql"],
+    "location": "Bogota",
+    "salary_min": 100,
+    "salary_max": 200,
+    "required_experience_years": 3
+}
+
+
+def crear_candidato(i: int, nivel: int = 3, **campos):
+    candidato = {
+        "id": f"cand-{i}",
+        "skills": [{"name": "python", "level": nivel}, {"name": "sql", "level": nivel}],
+        "location": "bogota",
+        "expected_salary": 150,
+        "years_of_experience": 3
+    }
+    candidato.update(campos)
+    return candidato
+
+
+class PuntuadorSinValidacion:
+    """Ranks by score alone, like a scorer unaware of the rows the scalar path rejects"""
+
+    def top_candidates(self, job_data, candidates_data, k, skills_only=False):
+        safe = [dict(c, years_of_experience=3) for c in candidates_data]
+        return pv.top_candidates(job_data, safe, k, skills_only)
+
+
+class PuntuadorContador:
+    """Vectorized scorer that records the candidate ids of every scoring call"""
+
+    def __init__(self):
+        self.llamadas = []
+
+    def score_candidates(self, job_data, candidates_data, skills_only=False):
+        self.llamadas.append([c["id"] for c in candidates_data])
+        return pv.score_candidates(job_data, candidates_data, skills_only)
+
+
+class TestBatchEvaluate:
+
+    def test_returns_best_candidates_first(self):
+        candidatos = [crear_candidato(i, nivel=1 + i % 3) for i in range(9)]
+
+        resultados = MatchingEngine().batch_evaluate_candidates(VACANTE, candidatos, max_results=3)
+
+        assert [r.candidate_id for r in resultados] == ["cand-2", "cand-5", "cand-8"]
+        assert all(r.overall_score == pytest.approx(1.0) for r in resultados)
+
+    def test_rejected_candidates_are_refilled(self):
+        # The strongest candidates are malformed and fail the scalar evaluation
+        candidatos = [crear_candidato(i, nivel=5, years_of_experience=None) for i in range(4)]
+        candidatos += [crear_candidato(i, nivel=2) for i in range(4, 10)]
+        motor = MatchingEngine(candidate_scorer=PuntuadorSinValidacion())
+
+        resultados = motor.batch_evaluate_candidates(VACANTE, candidatos, max_results=3)
+
+        assert [r.candidate_id for r in resultados] == ["cand-4", "cand-5", "cand-6"]
+
+    def test_refill_stops_when_candidates_run_out(self):
+        candidatos = [crear_candidato(i, years_of_experience=None) for i in range(3)]
+        candidatos.append(crear_candidato(3))
+        motor = MatchingEngine(candidate_scorer=PuntuadorSinValidacion())
+
+        resultados = motor.batch_evaluate_candidates(VACANTE, candidatos, max_results=3)
+
+        assert [r.candidate_id for r in resultados] == ["cand-3"]
+
+    def test_events_are_published_for_the_top_k_only(self):
+        candidatos = [crear_candidato(i) for i in range(10)]
+        motor = MatchingEngine()
+
+        motor.batch_evaluate_candidates(VACANTE, candidatos, max_results=2)
+
+        tipos = [type(evento) for evento in motor.eventos]
+        assert tipos[0] is MatchingProcessStarted
+        assert tipos[-1] is MatchingProcessCompleted
+        assert tipos.count(CandidateMatched) == 2
+        assert motor.eventos[-1].total_candidates_evaluated == 10
+
+    def test_match_results_are_bounded(self):
+        motor = MatchingEngine(max_match_results=4)
+
+        for lote in range(3):
+            candidatos = [crear_candidato(lote * 10 + i) for i in range(3)]
+            motor.batch_evaluate_candidates(VACANTE, candidatos, max_results=3)
+
+        assert [r.candidate_id for r in motor.match_results] == ["cand-12", "cand-20", "cand-21", "cand-22"]
+
+    def test_job_without_id_matches_nobody(self):
+        resultados = MatchingEngine().batch_evaluate_candidates(
+            dict(VACANTE, id=None), [crear_candidato(0)], max_results=3
+        )
+
+        assert resultados == []
+        assert np.isneginf(pv.score_candidates(dict(VACANTE, id=None), [crear_candidato(0)])).all()
+
+
+class TestPuntuacionesEnCache:
+
+    @pytest.fixture
+    def puntuador(self):
+        return PuntuadorContador()
+
+    @pytest.fixture
+    def cache(self):
+        return MatchScoreCache()
+
+    @pytest.fixture
+    def candidatos(self):
+        return [crear_candidato(i, nivel=1 + i % 5, version="1") for i in range(20)]
+
+    def evaluar(self, cache, puntuador, candidatos, vacante=VACANTE, **opciones):
+        motor = MatchingEngine(candidate_scorer=puntuador, score_cache=cache, **opciones)
+        return motor.batch_evaluate_candidates(vacante, candidatos, max_results=5)
+
+    def test_second_ranking_is_served_from_cache(self, cache, puntuador, candidatos):
+        primero = self.evaluar(cache, puntuador, candidatos)
+        segundo = self.evaluar(cache, puntuador, candidatos)
+
+        assert len(puntuador.llamadas) == 1
+        assert [r.candidate_id for r in segundo] == [r.candidate_id for r in primero]
+
+    def test_one_changed_candidate_is_the_only_rescore(self, cache, puntuador, candidatos):
+        self.evaluar(cache, puntuador, candidatos)
+        candidatos[7] = crear_candidato(7, nivel=5, version="2")
+
+        resultados = self.evaluar(cache, puntuador, candidatos)
+
+        assert puntuador.llamadas[-1] == ["cand-7"]
+        assert "cand-7" in [r.candidate_id for r in resultados]
+
+    def test_cached_ranking_matches_uncached_ranking(self, cache, puntuador, candidatos):
+        self.evaluar(cache, puntuador, candidatos)
+        candidatos[3] = crear_candidato(3, nivel=5, version="2")
+
+        con_cache = self.evaluar(cache, puntuador, candidatos)
+        sin_cache = MatchingEngine().batch_evaluate_candidates(VACANTE, candidatos, max_results=5)
+
+        assert [r.candidate_id for r in con_cache] == [r.candidate_id for r in sin_cache]
+
+    def test_job_change_rescores_everyone(self, cache, puntuador, candidatos):
+        self.evaluar(cache, puntuador, candidatos)
+
+        self.evaluar(cache, puntuador, candidatos, vacante=dict(VACANTE, salary_max=300))
+
+        assert len(puntuador.llamadas[-1]) == 20
+
+    def test_algorithms_do_not_share_scores(self, cache, puntuador, candidatos):
+        self.evaluar(cache, puntuador, candidatos)
+
+        self.evaluar(cache, puntuador, candidatos, algorithm=MatchingAlgorithm.BASIC_SKILLS)
+
+        assert len(puntuador.llamadas) == 2
+
+    def test_candidates_without_version_are_always_rescored(self, cache, puntuador, candidatos):
+        candidatos[0].pop("version")
+        self.evaluar(cache, puntuador, candidatos)
+
+        self.evaluar(cache, puntuador, candidatos)
+
+        assert puntuador.llamadas[-1] == ["cand-0"]
@@ -0,0 +1,177 @@
+"""
+Vectorized batch scoring: the NumPy scores reproduce the scalar rules of
+`MatchingEngine`, reject the rows the scalar evaluation would raise on and keep
+the scalar batch order when selecting the top k.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from recruitment.modulos.matching.dominio import puntuacion_vectorizada as pv
+from recruitment.modulos.matching.dominio.entidades import MatchingAlgorithm, MatchingEngine
+
+VACANTE = {
+    "id": "job-1",
+    "required_skills": ["Python", "SQL", "Kubernetes"],
+    "preferred_skills": ["Go"],
+    "location": "Bogota",
+    "salary_min": 100,
+    "salary_max": 200,
+    "required_experience_years": 4
+}
+
+
+def crear_candidatos(cantidad: int, semilla: int = 7):
+    aleatorio = random.Random(semilla)
+    candidatos = []
+    for i in range(cantidad):
+        candidatos.append({
+            "id": f"cand-{i}",
+            "skills": [
+                {"name": nombre, "level": aleatorio.randint(0, 5)}
+                for nombre in aleatorio.sample(["python", "SQL", "go", "kubernetes", "java"], 3)
+            ],
+            "location": aleatorio.choice(["bogota", "Lima", "", None]),
+            "preferences": {
+                "willing_to_relocate": aleatorio.random() < 0.3,
+                "remote_work": aleatorio.random() < 0.3
+            },
+            "expected_salary": aleatorio.choice([None, 80, 150, 210, 235, 300]),
+            "min_salary": aleatorio.choice([None, None, 120]),
+            "years_of_experience": aleatorio.randint(0, 10)
+        })
+    return candidatos
+
+
+def puntuar(vacante, candidatos, skills_only=False):
+    return pv.score_candidates(vacante, candidatos, skills_only=skills_only)
+
+
+class TestReglasEscalares:
+
+    def test_known_scores(self):
+        candidatos = [
+            # skills (1 + 0 + 2/3) / 3, same city, salary in range, experience in range
+            {"id": "a", "skills": [{"name": "python", "level": 5}, {"name": "kubernetes", "level": 2}],
+             "location": "BOGOTA", "expected_salary": 150, "years_of_experience": 5},
+            # no skills, relocates, 10% over budget, under-qualified: 2 / 4 * 0.8
+            {"id": "b", "skills": [], "location": "Lima", "preferences": {"willing_to_relocate": True},
+             "expected_salary": 220, "years_of_experience": 2},
+            # no salary info, remote, overqualified
+            {"id": "c", "skills": [{"name": "SQL", "level": 3}], "location": "Lima",
+             "preferences": {"remote_work": True}, "years_of_experience": 7}
+        ]
+
+        scores = puntuar(VACANTE, candidatos)
+
+        esperado = [
+            (5 / 9) * 0.4 + 1.0 * 0.2 + 1.0 * 0.2 + 1.0 * 0.2,
+            0.0 * 0.4 + 0.7 * 0.2 + 0.7 * 0.2 + 0.4 * 0.2,
+            (1 / 3) * 0.4 + 0.8 * 0.2 + 0.8 * 0.2 + 0.9 * 0.2
+        ]
+        assert scores == pytest.approx(esperado)
+
+    def test_skills_only_uses_required_skills(self):
+        candidatos = [{"id": "a", "skills": [{"name": "python", "level": 3}, {"name": "go", "level": 5}]}]
+
+        assert puntuar(VACANTE, candidatos, skills_only=True) == pytest.approx([1 / 3])
+
+    def test_job_without_required_skills(self):
+        candidatos = [{"id": "a", "skills": []}]
+        vacante = {"id": "job-2", "preferred_skills": ["go"]}
+
+        assert puntuar(vacante, candidatos, skills_only=True) == pytest.approx([0.0])
+        # Only whether preferred skills were listed reaches the weighted score
+        assert puntuar(vacante, candidatos) == pytest.approx([0.5 * 0.4 + 0.2 + 0.2 + 0.2])
+
+    def test_scores_do_not_depend_on_the_vocabulary(self):
+        candidatos = crear_candidatos(60)
+        otra = {"required_skills": ["java", "go", "rust"]}
+
+        solo = pv.encode_candidates(candidatos, pv.skill_vocabulary([VACANTE]))
+        compartida = pv.encode_candidates(candidatos, pv.skill_vocabulary([otra, VACANTE]))
+
+        assert np.array_equal(
+            pv.overall_scores(pv.encode_job(VACANTE, solo), solo),
+            pv.overall_scores(pv.encode_job(VACANTE, compartida), compartida)
+        )
+
+    @pytest.mark.parametrize('campo, valor', [
+        ("id", None),
+        ("years_of_experience", None),
+        ("years_of_experience", "diez"),
+        ("min_salary", "mucho"),
+        ("skills", None),
+        ("skills", [{"name": "python", "level": None}]),
+        ("skills", [{"name": 3, "level": 5}]),
+        ("skills", ["python"]),
+        ("preferences", None),
+        ("location", 42)
+    ])
+    def test_malformed_rows_are_rejected(self, campo, valor):
+        candidatos = crear_candidatos(3)
+        candidatos[1][campo] = valor
+
+        scores = puntuar(VACANTE, candidatos)
+
+        assert scores[1] == -np.inf
+        assert np.isfinite(scores[[0, 2]]).all()
+        assert 1 not in pv.select_top_k(scores, 3)
+
+    def test_job_without_id_rejects_every_candidate(self):
+        vacante = dict(VACANTE, id=None)
+
+        assert (puntuar(vacante, crear_candidatos(4)) == -np.inf).all()
+
+
+class TestSelectTopK:
+
+    def test_matches_stable_sort(self):
+        scores = np.round(puntuar(VACANTE, crear_candidatos(300)), 1)
+        scores[::17] = -np.inf
+
+        for k in (1, 5, 40, 400):
+            estable = sorted(
+                (i for i in range(len(scores)) if np.isfinite(scores[i])),
+                key=lambda i: -scores[i]
+            )
+            assert pv.select_top_k(scores, k).tolist() == estable[:k]
+
+    def test_nothing_to_select(self):
+        assert pv.select_top_k(np.full(3, -np.inf), 2).size == 0
+        assert pv.select_top_k(np.array([0.5]), 0).size == 0
+
+
+class TestParidadConMotorEscalar:
+
+    def puntuar_escalar(self, motor, vacante, candidato):
+        try:
+            return motor.evaluate_candidate_match(vacante, candidato).overall_score
+        except Exception:
+            return -np.inf
+
+    @pytest.mark.parametrize('algoritmo', [MatchingAlgorithm.WEIGHTED_CRITERIA, MatchingAlgorithm.BASIC_SKILLS])
+    def test_scores_match_scalar_engine(self, algoritmo):
+        motor = MatchingEngine(algorithm=algoritmo)
+        candidatos = crear_candidatos(200)
+        candidatos[3]["years_of_experience"] = None
+        candidatos[8]["skills"] = [{"name": "python", "level": "alto"}]
+
+        vectorizado = puntuar(VACANTE, candidatos, skills_only=algoritmo == MatchingAlgorithm.BASIC_SKILLS)
+
+        escalar = [self.puntuar_escalar(motor, VACANTE, candidato) for candidato in candidatos]
+        assert vectorizado.tolist() == escalar
+
+    def test_batch_top_k_matches_scalar_ranking(self):
+        motor = MatchingEngine()
+        candidatos = crear_candidatos(120)
+        escalar = sorted(
+            ((self.puntuar_escalar(motor, VACANTE, c), c["id"]) for c in candidatos),
+            key=lambda par: -par[0]
+        )
+
+        resultados = motor.batch_evaluate_candidates(VACANTE, candidatos, max_results=25)
+
+        assert [r.candidate_id for r in resultados] == [candidate_id for _, candidate_id in escalar[:25]]
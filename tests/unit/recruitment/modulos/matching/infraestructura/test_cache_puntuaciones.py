@@ -0,0 +1,124 @@
+"""
+MatchScoreCache tests: scores hit only while the job and candidate versions match,
+the LRU stays bounded and the SQLite tier is read in batches and promoted to memory.
+"""
+
+import pytest
+
+from recruitment.modulos.matching.infraestructura import cache_puntuaciones
+from recruitment.modulos.matching.infraestructura.cache_puntuaciones import MatchScoreCache, SqliteScoreStore
+
+CLAVE = ("job-1", "v1", "WEIGHTED_CRITERIA", "criterios")
+
+
+def guardar(cache, *puntuaciones, clave=CLAVE):
+    cache.put_many(*clave, puntuaciones)
+
+
+def leer(cache, *candidatos, clave=CLAVE):
+    return cache.get_many(*clave, candidatos)
+
+
+class TestMatchScoreCache:
+
+    @pytest.fixture
+    def cache(self):
+        return MatchScoreCache()
+
+    def test_hit_only_for_the_stored_versions(self, cache):
+        guardar(cache, ("a", "1", 0.8), ("b", "1", 0.5))
+
+        assert leer(cache, ("a", "1"), ("b", "2"), ("c", "1")) == [0.8, None, None]
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_new_job_version_misses(self, cache):
+        guardar(cache, ("a", "1", 0.8))
+
+        assert leer(cache, ("a", "1"), clave=("job-1", "v2", "WEIGHTED_CRITERIA", "criterios")) == [None]
+
+    def test_algorithm_and_criteria_have_their_own_slots(self, cache):
+        guardar(cache, ("a", "1", 0.8))
+        guardar(cache, ("a", "1", 0.3), clave=("job-1", "v1", "BASIC_SKILLS", "criterios"))
+
+        assert leer(cache, ("a", "1")) == [0.8]
+        assert leer(cache, ("a", "1"), clave=("job-1", "v1", "BASIC_SKILLS", "criterios")) == [0.3]
+        assert leer(cache, ("a", "1"), clave=("job-1", "v1", "WEIGHTED_CRITERIA", "otros")) == [None]
+
+    def test_new_version_overwrites_the_slot(self, cache):
+        guardar(cache, ("a", "1", 0.8))
+        guardar(cache, ("a", "2", 0.6))
+
+        assert len(cache) == 1
+        assert leer(cache, ("a", "1"), ("a", "2")) == [None, 0.6]
+
+    def test_least_recently_used_scores_are_evicted(self):
+        cache = MatchScoreCache(max_entries=2)
+        guardar(cache, ("a", "1", 0.1), ("b", "1", 0.2))
+        leer(cache, ("a", "1"))
+
+        guardar(cache, ("c", "1", 0.3))
+
+        assert len(cache) == 2
+        assert leer(cache, ("a", "1"), ("b", "1"), ("c", "1")) == [0.1, None, 0.3]
+
+    def test_invalidate_candidate(self, cache):
+        guardar(cache, ("a", "1", 0.8), ("b", "1", 0.5))
+        guardar(cache, ("a", "1", 0.7), clave=("job-2", "v1", "WEIGHTED_CRITERIA", "criterios"))
+
+        cache.invalidate_candidate("a")
+
+        assert len(cache) == 1
+        assert leer(cache, ("a", "1"), ("b", "1")) == [None, 0.5]
+
+
+class TestDiskTier:
+
+    @pytest.fixture
+    def ruta(self, tmp_path):
+        return str(tmp_path / "scores.sqlite")
+
+    @pytest.fixture
+    def store(self, ruta):
+        store = SqliteScoreStore(ruta)
+        yield store
+        store.close()
+
+    def test_scores_survive_a_new_memory_tier(self, ruta, store):
+        guardar(MatchScoreCache(disk_store=store), ("a", "1", 0.8), ("b", "1", 0.5))
+
+        reiniciada = MatchScoreCache(disk_store=SqliteScoreStore(ruta))
+
+        assert len(reiniciada) == 0
+        assert leer(reiniciada, ("a", "1"), ("b", "2")) == [0.8, None]
+
+    def test_disk_hits_are_promoted_to_memory(self, store, monkeypatch):
+        guardar(MatchScoreCache(disk_store=store), ("a", "1", 0.8), ("b", "1", 0.5))
+        cache = MatchScoreCache(disk_store=store)
+        leer(cache, ("a", "1"), ("b", "1"))
+
+        lecturas = []
+        monkeypatch.setattr(store, "get_many", lambda *args: lecturas.append(args) or {})
+
+        assert leer(cache, ("a", "1"), ("b", "1")) == [0.8, 0.5]
+        assert lecturas == []
+
+    def test_memory_misses_are_read_in_chunks(self, store, monkeypatch):
+        monkeypatch.setattr(cache_puntuaciones, "SQLITE_LOOKUP_CHUNK", 3)
+        candidatos = [(f"cand-{i}", "1") for i in range(8)]
+        guardar(MatchScoreCache(disk_store=store), *[(c, v, i / 10) for i, (c, v) in enumerate(candidatos)])
+
+        consultas = []
+        conexion = store._connection
+        conexion.set_trace_callback(lambda sql: consultas.append(sql) if sql.startswith("SELECT") else None)
+
+        assert leer(MatchScoreCache(disk_store=store), *candidatos) == pytest.approx([i / 10 for i in range(8)])
+        assert len(consultas) == 3
+
+    def test_invalidate_candidate_deletes_stored_rows(self, ruta, store):
+        cache = MatchScoreCache(disk_store=store)
+        guardar(cache, ("a", "1", 0.8), ("b", "1", 0.5))
+
+        cache.invalidate_candidate("a")
+
+        reiniciada = MatchScoreCache(disk_store=SqliteScoreStore(ruta))
+        assert leer(reiniciada, ("a", "1"), ("b", "1")) == [None, 0.5]
@@ -0,0 +1,103 @@
+"""
+Bulk indexing through `ElasticsearchRepository.bulk_index`, run against the
+in-memory Elasticsearch double so the repository's chunking, error accounting
+and single trailing refresh are exercised unchanged.
+"""
+
+import asyncio
+
+import pytest
+
+from recruitment.seedwork.infraestructura.elasticsearch_memoria import InMemorySearchRepository
+
+
+def crear_candidato(i: int):
+    return f"cand-{i}", {
+        "id": f"cand-{i}",
+        "name": f"Candidate {i}",
+        "skills": [{"name": "python", "level": 1 + i % 5}],
+        "availability": "AVAILABLE"
+    }
+
+
+def crear_vacante(i: int):
+    return f"job-{i}", {"id": f"job-{i}", "title": f"Backend engineer {i}", "partner_id": "partner-1"}
+
+
+async def generar(documentos):
+    for documento in documentos:
+        yield documento
+
+
+class TestBulkIndex:
+
+    @pytest.fixture
+    def repositorio(self):
+        return InMemorySearchRepository(refresh=True)
+
+    def test_documents_are_routed_and_chunked(self, repositorio):
+        documentos = [crear_candidato(i) for i in range(7)] + [crear_vacante(i) for i in range(3)]
+
+        resultado = asyncio.run(repositorio.bulk_index(documentos, chunk_size=4))
+
+        assert resultado.indexed == 10
+        assert resultado.failed == 0
+        assert resultado.chunks == 3
+        assert repositorio.es.calls["bulk"] == 3
+        assert set(repositorio.es.documents["candidates"]) == {f"cand-{i}" for i in range(7)}
+        assert set(repositorio.es.documents["jobs"]) == {f"job-{i}" for i in range(3)}
+
+    def test_chunks_are_bounded_by_bytes(self, repositorio):
+        documentos = [crear_candidato(i) for i in range(6)]
+
+        resultado = asyncio.run(repositorio.bulk_index(documentos, max_chunk_bytes=1))
+
+        # A document larger than the limit still goes out, alone in its chunk
+        assert resultado.indexed == 6
+        assert resultado.chunks == 6
+
+    def test_async_iterables_are_accepted(self, repositorio):
+        documentos = generar(crear_candidato(i) for i in range(5))
+
+        resultado = asyncio.run(repositorio.bulk_index(documentos, chunk_size=2, max_in_flight=1))
+
+        assert resultado.indexed == 5
+        assert resultado.chunks == 3
+
+    def test_unclassifiable_document_fails_alone(self, repositorio):
+        documentos = [crear_candidato(0), ("desconocido", {"foo": "bar"}), crear_candidato(1)]
+
+        resultado = asyncio.run(repositorio.bulk_index(documentos))
+
+        assert resultado.indexed == 2
+        assert resultado.failed == 1
+        assert resultado.errors == [{"id": "desconocido", "error": "Cannot determine document type"}]
+        assert set(repositorio.es.documents["candidates"]) == {"cand-0", "cand-1"}
+
+    def test_explicit_index_skips_classification(self, repositorio):
+        documentos = [("desconocido", {"foo": "bar"})]
+
+        resultado = asyncio.run(repositorio.bulk_index(documentos, index="misc"))
+
+        assert resultado.indexed == 1
+        assert repositorio.es.documents["misc"] == {"desconocido": {"foo": "bar"}}
+
+    def test_refresh_runs_once_after_all_chunks(self, repositorio):
+        documentos = [crear_candidato(i) for i in range(9)]
+
+        asyncio.run(repositorio.bulk_index(documentos, chunk_size=2))
+
+        assert repositorio.es.calls["bulk"] == 5
+        assert repositorio.es.calls["refresh"] == 1
+
+    def test_refresh_can_be_disabled_per_call(self, repositorio):
+        asyncio.run(repositorio.bulk_index([crear_candidato(0)], refresh=False))
+
+        assert repositorio.es.calls["refresh"] == 0
+
+    def test_nothing_to_index_does_not_refresh(self, repositorio):
+        resultado = asyncio.run(repositorio.bulk_index([("desconocido", {})]))
+
+        assert resultado.chunks == 0
+        assert resultado.failed == 1
+        assert repositorio.es.calls["refresh"] == 0
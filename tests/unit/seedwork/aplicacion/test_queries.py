@@ -0,0 +1,103 @@
+"""
+Keyset pagination helpers: opaque cursors round-trip the (created_at, id) keyset and
+`iterar_por_keyset` walks every page exactly once.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from partner_management.seedwork.aplicacion.queries import (
+    codificar_cursor, decodificar_cursor, iterar_por_keyset
+)
+from partner_management.seedwork.dominio.excepciones import ValidationException
+
+
+@dataclass
+class Fila:
+    id: str
+    created_at: datetime
+
+
+def crear_filas(cantidad: int):
+    inicio = datetime(2026, 3, 1, 8, 30)
+    # Every timestamp is shared by two rows so the id breaks the tie
+    return [Fila(id=f"fila-{i:04d}", created_at=inicio + timedelta(seconds=i // 2)) for i in range(cantidad)]
+
+
+class TestCursor:
+
+    @pytest.mark.parametrize('created_at', [
+        datetime(2026, 3, 1, 8, 30),
+        datetime(2026, 3, 1, 8, 30, 15, 123456),
+        datetime(2026, 3, 1, 8, 30, tzinfo=timezone.utc),
+        datetime(2026, 3, 1, 8, 30, tzinfo=timezone(timedelta(hours=-5)))
+    ])
+    def test_cursor_round_trip(self, created_at):
+        cursor = codificar_cursor(created_at, "partner-1")
+
+        assert decodificar_cursor(cursor) == (created_at, "partner-1")
+
+    def test_cursor_is_url_safe(self):
+        cursor = codificar_cursor(datetime(2026, 3, 1), "id/con+caracteres?raros&más")
+
+        assert "=" not in cursor
+        assert not set(cursor) & set("+/?&")
+        assert decodificar_cursor(cursor)[1] == "id/con+caracteres?raros&más"
+
+    @pytest.mark.parametrize('cursor', [
+        "",
+        "no-es-base64!",
+        "bm8tanNvbg",  # base64 of "no-json"
+        "WyIyMDI2LTAzLTAxIl0",  # a single-element list
+        "WyJheWVyIiwiaWQiXQ",  # an invalid date
+    ])
+    def test_malformed_cursor_raises_validation_exception(self, cursor):
+        with pytest.raises(ValidationException) as error:
+            decodificar_cursor(cursor)
+
+        assert "cursor" in error.value.field_errors
+
+
+class TestIterarPorKeyset:
+
+    def obtener_pagina(self, filas, llamadas):
+        def pagina(limit, after):
+            llamadas.append((limit, after))
+            restantes = [f for f in filas if after is None or (f.created_at, f.id) > after]
+            return restantes[:limit]
+        return pagina
+
+    @pytest.mark.parametrize('cantidad', [0, 1, 4, 5, 23])
+    def test_walks_every_row_once(self, cantidad):
+        filas = crear_filas(cantidad)
+        llamadas = []
+
+        recorridas = list(iterar_por_keyset(self.obtener_pagina(filas, llamadas), batch_size=5))
+
+        assert recorridas == filas
+        assert len(llamadas) == cantidad // 5 + 1
+        assert all(limit == 5 for limit, _ in llamadas)
+
+    def test_resumes_after_last_row_of_each_page(self):
+        filas = crear_filas(10)
+        llamadas = []
+
+        list(iterar_por_keyset(self.obtener_pagina(filas, llamadas), batch_size=4))
+
+        assert [after for _, after in llamadas] == [
+            None,
+            (filas[3].created_at, filas[3].id),
+            (filas[7].created_at, filas[7].id)
+        ]
+
+    def test_is_lazy(self):
+        filas = crear_filas(12)
+        llamadas = []
+
+        iterador = iterar_por_keyset(self.obtener_pagina(filas, llamadas), batch_size=4)
+        assert llamadas == []
+
+        assert next(iterador) is filas[0]
+        assert len(llamadas) == 1
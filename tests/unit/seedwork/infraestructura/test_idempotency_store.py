@@ -0,0 +1,211 @@
+"""
+IdempotencyStore tests: the bounded LRU with TTL, the rotating Bloom filter in front
+of it, the durable SQL tier shared by replicas and the idempotent handler wrapper.
+"""
+
+import pytest
+from sqlalchemy import create_engine
+
+from src import idempotency_store
+from src.idempotency_store import (
+    BloomFilter, IdempotencyStore, SqlIdempotencyBackend, _RotatingBloomFilter, event_key
+)
+
+
+class Reloj:
+    """Stands in for the time module; wall and monotonic clocks move together"""
+
+    def __init__(self):
+        self.ahora = 1_000_000.0
+
+    def time(self):
+        return self.ahora
+
+    def monotonic(self):
+        return self.ahora
+
+
+@pytest.fixture
+def reloj(monkeypatch):
+    reloj = Reloj()
+    monkeypatch.setattr(idempotency_store, "time", reloj)
+    return reloj
+
+
+@pytest.fixture
+def backend(tmp_path, reloj):
+    return SqlIdempotencyBackend(engine=create_engine(f"sqlite:///{tmp_path / 'idempotency.db'}"))
+
+
+class TestMemoryTier:
+
+    def test_duplicates_are_rejected(self, reloj):
+        store = IdempotencyStore("pruebas")
+
+        assert store.check_and_mark("k")
+        assert not store.check_and_mark("k")
+        assert store.duplicates == 1
+        assert store.seen("k")
+
+    def test_keys_expire_after_the_ttl(self, reloj):
+        store = IdempotencyStore("pruebas", ttl_seconds=10)
+        store.check_and_mark("k")
+
+        reloj.ahora += 11
+
+        assert not store.seen("k")
+        assert store.check_and_mark("k")
+
+    def test_least_recently_used_key_is_evicted(self, reloj):
+        store = IdempotencyStore("pruebas", max_entries=2)
+        store.check_and_mark("a")
+        store.check_and_mark("b")
+        store.check_and_mark("a")
+
+        store.check_and_mark("c")
+
+        assert len(store) == 2
+        assert not store.seen("b")
+        assert store.seen("a") and store.seen("c")
+
+    def test_expired_keys_are_dropped_on_write(self, reloj):
+        store = IdempotencyStore("pruebas", ttl_seconds=10)
+        store.check_and_mark("a")
+        store.check_and_mark("b")
+
+        reloj.ahora += 11
+        store.check_and_mark("c")
+
+        assert len(store) == 1
+
+    def test_namespaces_are_independent(self, reloj):
+        partners, onboarding = IdempotencyStore("partners"), IdempotencyStore("onboarding")
+        partners.check_and_mark("k")
+
+        assert onboarding.check_and_mark("k")
+
+
+class TestBloomFilter:
+
+    def test_added_keys_are_always_found(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.001)
+        claves = [f"clave-{i}" for i in range(1000)]
+
+        for clave in claves:
+            bloom.add(clave)
+
+        assert all(clave in bloom for clave in claves)
+
+    def test_false_positive_rate_is_near_the_target(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"clave-{i}")
+
+        falsos = sum(f"otra-{i}" in bloom for i in range(10000))
+
+        assert falsos < 300
+
+    def test_rotation_forgets_keys_after_two_windows(self, reloj):
+        bloom = _RotatingBloomFilter(capacity=100, window_seconds=10)
+        bloom.add("k")
+
+        reloj.ahora += 10
+        assert "k" in bloom
+        reloj.ahora += 10
+        assert "k" not in bloom
+
+    def test_store_rules_out_unseen_keys(self, reloj):
+        store = IdempotencyStore("pruebas", use_bloom_filter=True, bloom_capacity=100)
+        store.check_and_mark("k")
+
+        assert store.seen("k")
+        assert not store.seen("otra")
+        assert not store.check_and_mark("k")
+
+
+class TestDurableTier:
+
+    def test_replicas_share_processed_keys(self, backend):
+        replica_a = IdempotencyStore("pruebas", durable=backend)
+        replica_b = IdempotencyStore("pruebas", durable=backend)
+
+        assert replica_a.check_and_mark("k")
+        assert not replica_b.check_and_mark("k")
+        assert replica_b.seen("k")
+
+    def test_expired_record_is_taken_over(self, backend, reloj):
+        assert backend.add_if_absent("pruebas:k", reloj.ahora + 10)
+        assert not backend.add_if_absent("pruebas:k", reloj.ahora + 10)
+
+        reloj.ahora += 11
+
+        assert backend.add_if_absent("pruebas:k", reloj.ahora + 10)
+        assert backend.contains("pruebas:k")
+
+    def test_purge_removes_expired_records(self, backend, reloj):
+        backend.add_if_absent("pruebas:viejo", reloj.ahora + 5)
+        backend.add_if_absent("pruebas:nuevo", reloj.ahora + 50)
+
+        reloj.ahora += 10
+        backend.purge_expired()
+
+        assert list(backend.live_keys("pruebas:")) == ["pruebas:nuevo"]
+        with backend._session_factory() as session:
+            assert session.query(idempotency_store.ProcessedEventRecord).count() == 1
+
+    def test_bloom_filter_is_warmed_from_the_durable_tier(self, backend):
+        IdempotencyStore("pruebas", durable=backend).check_and_mark("k")
+
+        reiniciado = IdempotencyStore("pruebas", use_bloom_filter=True, durable=backend)
+
+        assert not reiniciado.check_and_mark("k")
+
+    def test_durable_failure_falls_back_to_memory(self, backend, monkeypatch):
+        store = IdempotencyStore("pruebas", durable=backend)
+
+        def caido(*args):
+            raise RuntimeError("database down")
+
+        monkeypatch.setattr(backend, "add_if_absent", caido)
+
+        assert store.check_and_mark("k")
+        assert not store.check_and_mark("k")
+
+
+class TestIdempotentHandler:
+
+    @pytest.fixture
+    def store(self, backend):
+        return IdempotencyStore("pruebas", durable=backend)
+
+    def test_redelivered_event_is_skipped(self, store):
+        llamadas = []
+        handler = store.idempotent("ContractCreated", llamadas.append)
+        evento = {"event_id": "e-1"}
+
+        handler(evento)
+        handler(evento)
+
+        assert llamadas == [evento]
+
+    def test_failed_handler_is_forgotten_in_every_tier(self, store, backend):
+        intentos = []
+
+        def falla_una_vez(evento):
+            intentos.append(evento)
+            if len(intentos) == 1:
+                raise RuntimeError("boom")
+
+        handler = store.idempotent("ContractCreated", falla_una_vez)
+
+        with pytest.raises(RuntimeError):
+            handler({"event_id": "e-1"})
+        assert not backend.contains("pruebas:ContractCreated:e-1")
+
+        handler({"event_id": "e-1"})
+        assert len(intentos) == 2
+        assert store.seen("ContractCreated:e-1")
+
+    def test_event_key_falls_back_to_partner_and_causation(self):
+        assert event_key("ContractCreated", {"event_id": "e-1"}) == "ContractCreated:e-1"
+        assert event_key("ContractCreated", {"partner_id": "p-1", "causation_id": "c-1"}) == "ContractCreated:p-1:c-1"
@@ -0,0 +1,156 @@
+"""
+IndexedCollection tests: filtered queries over the hash indexes, keyset paging over
+the sorted indexes and reindexing of entities mutated in place.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pytest
+
+from partner_management.seedwork.infraestructura.indexed_collection import IndexedCollection
+
+INICIO = datetime(2026, 1, 1)
+
+
+@dataclass
+class Registro:
+    id: str
+    estado: str
+    tipo: str
+    created_at: datetime
+    monto: Optional[int] = None
+
+
+def crear_coleccion() -> IndexedCollection:
+    return IndexedCollection(
+        hash_indexes={
+            'estado': lambda registro: registro.estado,
+            'tipo': lambda registro: registro.tipo
+        },
+        sorted_indexes={
+            'created_at': lambda registro: registro.created_at,
+            'monto': lambda registro: registro.monto
+        }
+    )
+
+
+def crear_registros(cantidad: int):
+    # Pairs of records share a timestamp so ties are broken by id
+    return [
+        Registro(
+            id=f"r-{i:03d}",
+            estado=("ACTIVO", "INACTIVO", "PENDIENTE")[i % 3],
+            tipo=("EMPRESA", "INDIVIDUAL")[i % 2],
+            created_at=INICIO + timedelta(minutes=i // 2),
+            monto=i * 10 if i % 5 else None
+        )
+        for i in range(cantidad)
+    ]
+
+
+class TestIndexedCollection:
+
+    @pytest.fixture
+    def registros(self):
+        return crear_registros(40)
+
+    @pytest.fixture
+    def coleccion(self, registros):
+        coleccion = crear_coleccion()
+        for registro in registros:
+            coleccion.add(registro)
+        return coleccion
+
+    def test_query_intersects_filters_in_insertion_order(self, coleccion, registros):
+        resultado = coleccion.query(where={'estado': 'ACTIVO', 'tipo': 'EMPRESA'})
+
+        esperado = [r for r in registros if r.estado == 'ACTIVO' and r.tipo == 'EMPRESA']
+        assert resultado == esperado
+        assert coleccion.count(where={'estado': 'ACTIVO', 'tipo': 'EMPRESA'}) == len(esperado)
+
+    def test_query_accepts_alternative_keys(self, coleccion, registros):
+        resultado = coleccion.query(where={'estado': ['ACTIVO', 'PENDIENTE']})
+
+        assert resultado == [r for r in registros if r.estado in ('ACTIVO', 'PENDIENTE')]
+
+    def test_query_unknown_key_returns_nothing(self, coleccion):
+        assert coleccion.query(where={'estado': 'ELIMINADO'}) == []
+        assert coleccion.count(where={'estado': 'ELIMINADO'}) == 0
+
+    def test_query_orders_and_bounds_sorted_index(self, coleccion, registros):
+        resultado = coleccion.query(order_by='monto', descending=True, lower=100, upper=300)
+
+        esperado = sorted(
+            (r for r in registros if r.monto is not None and 100 <= r.monto <= 300),
+            key=lambda r: (r.monto, r.id),
+            reverse=True
+        )
+        assert resultado == esperado
+        assert coleccion.count(order_by='monto', lower=100, upper=300) == len(esperado)
+
+    @pytest.mark.parametrize('descending', [False, True])
+    def test_keyset_pages_match_offset_pages(self, coleccion, descending):
+        where = {'tipo': 'EMPRESA'}
+        por_offset = coleccion.query(where=where, order_by='created_at', descending=descending)
+
+        por_keyset = []
+        after = None
+        while True:
+            pagina = coleccion.query(
+                where=where, order_by='created_at', descending=descending, limit=3, after=after
+            )
+            por_keyset.extend(pagina)
+            if len(pagina) < 3:
+                break
+            after = (pagina[-1].created_at, pagina[-1].id)
+
+        assert por_keyset == por_offset
+        assert len({r.id for r in por_keyset}) == len(por_offset)
+
+    def test_keyset_breaks_timestamp_ties_by_id(self, coleccion, registros):
+        primero, segundo = registros[0], registros[1]
+        assert primero.created_at == segundo.created_at
+
+        pagina = coleccion.query(order_by='created_at', limit=1, after=(primero.created_at, primero.id))
+
+        assert pagina == [segundo]
+
+    def test_add_reindexes_mutated_entity(self, coleccion, registros):
+        registro = registros[0]
+        registro.estado = 'INACTIVO'
+        registro.created_at = INICIO + timedelta(days=1)
+        registro.monto = 5
+
+        coleccion.add(registro)
+
+        assert registro not in coleccion.query(where={'estado': 'ACTIVO'})
+        assert registro in coleccion.query(where={'estado': 'INACTIVO'})
+        assert coleccion.query(order_by='created_at', descending=True, limit=1) == [registro]
+        assert coleccion.query(order_by='monto', limit=1) == [registro]
+        assert len(coleccion) == len(registros)
+
+    def test_add_keeps_insertion_position_on_update(self, coleccion, registros):
+        registros[0].tipo = 'INDIVIDUAL'
+
+        coleccion.add(registros[0])
+
+        assert coleccion.query(where={'tipo': 'INDIVIDUAL'})[0] is registros[0]
+
+    def test_remove_drops_index_entries(self, coleccion, registros):
+        registro = registros[3]
+
+        assert coleccion.remove(registro.id) is registro
+        assert registro.id not in coleccion
+        assert registro not in coleccion.query(where={'estado': registro.estado})
+        assert registro not in coleccion.query(order_by='created_at')
+        assert coleccion.remove(registro.id) is None
+
+    def test_entities_without_key_are_left_out_of_the_index(self, coleccion, registros):
+        sin_monto = {r.id for r in registros if r.monto is None}
+
+        ordenados = coleccion.query(order_by='monto')
+
+        assert sin_monto.isdisjoint(r.id for r in ordenados)
+        assert len(ordenados) == len(registros) - len(sin_monto)
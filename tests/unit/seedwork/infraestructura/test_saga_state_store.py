@@ -0,0 +1,252 @@
+"""
+SagaStateStore tests: compare-and-set on the state version for the sharded memory
+and SQL stores, and the read cache in front of them.
+"""
+
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from partner_management.seedwork.infraestructura import saga_state_store
+from partner_management.seedwork.infraestructura.saga_state_store import (
+    CachedSagaStateStore, SagaStateConflictError, ShardedMemorySagaStateStore, SqlAlchemySagaStateStore,
+    create_saga_state_store
+)
+
+
+def estado(status: str = "STARTED", **campos) -> dict:
+    return {"saga_id": "saga-1", "status": status, "completed_steps": [], **campos}
+
+
+def incrementar(store, partner_id: str, veces: int):
+    """Read-modify-write with the version as the guard, retrying on conflicts"""
+    for _ in range(veces):
+        while True:
+            actual = store.get(partner_id)
+            actual["contador"] += 1
+            try:
+                store.save(partner_id, actual, expected_version=actual["version"])
+                break
+            except SagaStateConflictError:
+                continue
+
+
+@pytest.fixture
+def sqlite_store():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    return SqlAlchemySagaStateStore(engine=engine)
+
+
+@pytest.fixture(params=["memoria", "sql"])
+def store(request):
+    if request.param == "memoria":
+        return ShardedMemorySagaStateStore(shards=4)
+    return request.getfixturevalue("sqlite_store")
+
+
+class TestCompareAndSet:
+
+    def test_versions_start_at_one_and_increase(self, store):
+        assert store.save("p-1", estado()) == 1
+        assert store.save("p-1", estado("PARTNER_REGISTERED"), expected_version=1) == 2
+
+        guardado = store.get("p-1")
+        assert guardado["version"] == 2
+        assert guardado["status"] == "PARTNER_REGISTERED"
+
+    def test_stale_version_is_rejected(self, store):
+        store.save("p-1", estado())
+        store.save("p-1", estado("PARTNER_REGISTERED"), expected_version=1)
+
+        with pytest.raises(SagaStateConflictError) as conflicto:
+            store.save("p-1", estado("FAILED"), expected_version=1)
+
+        assert (conflicto.value.expected_version, conflicto.value.current_version) == (1, 2)
+        assert store.get("p-1")["status"] == "PARTNER_REGISTERED"
+
+    def test_expected_version_of_a_missing_state_conflicts(self, store):
+        with pytest.raises(SagaStateConflictError):
+            store.save("p-1", estado(), expected_version=3)
+
+        assert store.get("p-1") is None
+
+    def test_blind_write_overwrites_any_version(self, store):
+        store.save("p-1", estado())
+        store.save("p-1", estado(), expected_version=1)
+
+        assert store.save("p-1", estado("COMPLETED")) == 3
+        assert store.get("p-1")["status"] == "COMPLETED"
+
+    def test_returned_states_are_copies(self, store):
+        store.save("p-1", estado())
+
+        store.get("p-1")["completed_steps"].append("mutado")
+
+        assert store.get("p-1")["completed_steps"] == []
+
+    def test_delete_and_get_all(self, store):
+        store.save("p-1", estado())
+        store.save("p-2", estado())
+
+        store.delete("p-1")
+
+        assert store.get("p-1") is None
+        assert [s["version"] for s in store.get_all()] == [1]
+
+
+class TestShardedMemorySagaStateStore:
+
+    def test_concurrent_writers_do_not_lose_updates(self):
+        store = ShardedMemorySagaStateStore(shards=4)
+        store.save("p-1", estado(contador=0))
+        hilos = [threading.Thread(target=incrementar, args=(store, "p-1", 25)) for _ in range(4)]
+
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert store.get("p-1")["contador"] == 100
+        assert store.get("p-1")["version"] == 101
+
+    def test_states_are_spread_over_the_shards(self):
+        store = ShardedMemorySagaStateStore(shards=4)
+
+        for i in range(40):
+            store.save(f"p-{i}", estado())
+
+        ocupados = [shard for shard in store._shards if shard]
+        assert len(ocupados) > 1
+        assert sum(len(shard) for shard in store._shards) == 40
+        assert len(store.get_all()) == 40
+
+    def test_each_state_lives_in_one_shard(self):
+        store = ShardedMemorySagaStateStore(shards=4)
+        store.save("p-1", estado())
+
+        shard, lock = store._shard("p-1")
+
+        assert list(shard) == ["p-1"]
+        assert lock is store._locks[store._shards.index(shard)]
+
+
+class TestSqlAlchemySagaStateStore:
+
+    @pytest.fixture
+    def replicas(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'sagas.db'}")
+        return SqlAlchemySagaStateStore(engine=engine), SqlAlchemySagaStateStore(engine=engine)
+
+    def test_replicas_share_the_version_guard(self, replicas):
+        a, b = replicas
+        a.save("p-1", estado(contador=0))
+        leido_a, leido_b = a.get("p-1"), b.get("p-1")
+
+        a.save("p-1", {**leido_a, "contador": 1}, expected_version=leido_a["version"])
+
+        with pytest.raises(SagaStateConflictError):
+            b.save("p-1", {**leido_b, "contador": 1}, expected_version=leido_b["version"])
+        assert b.get("p-1")["version"] == 2
+
+    def test_concurrent_inserts_conflict(self, replicas):
+        a, b = replicas
+        a.save("p-1", estado(), expected_version=None)
+
+        # Insert-only compare-and-set: the row already exists
+        with pytest.raises(SagaStateConflictError) as conflicto:
+            b._compare_and_set("p-1", estado(), None)
+
+        assert conflicto.value.current_version == 1
+
+    def test_indexed_columns_follow_the_state(self, sqlite_store):
+        sqlite_store.save("p-1", estado("COMPLETED"))
+
+        with sqlite_store._session_factory() as session:
+            registro = session.get(saga_state_store.SagaStateRecord, "p-1")
+
+        assert (registro.saga_id, registro.status, registro.version) == ("saga-1", "COMPLETED", 1)
+
+
+class TestCachedSagaStateStore:
+
+    class Reloj:
+        def __init__(self):
+            self.ahora = 100.0
+
+        def __call__(self):
+            return self.ahora
+
+    @pytest.fixture
+    def reloj(self, monkeypatch):
+        reloj = self.Reloj()
+        monkeypatch.setattr(saga_state_store.time, "monotonic", reloj)
+        return reloj
+
+    @pytest.fixture
+    def base(self):
+        return ShardedMemorySagaStateStore()
+
+    @pytest.fixture
+    def cache(self, base, reloj):
+        return CachedSagaStateStore(base, maxsize=2, ttl_seconds=1.0)
+
+    def test_own_writes_are_served_from_the_cache(self, cache):
+        cache.save("p-1", estado())
+
+        assert cache.get("p-1")["version"] == 1
+        assert (cache.hits, cache.misses) == (1, 0)
+
+    def test_entries_expire_after_the_ttl(self, cache, base, reloj):
+        cache.save("p-1", estado())
+        # Another replica moves the state on
+        base.save("p-1", estado("COMPLETED"), expected_version=1)
+
+        assert cache.get("p-1")["status"] == "STARTED"
+        reloj.ahora += 1.5
+        assert cache.get("p-1")["status"] == "COMPLETED"
+        assert cache.misses == 1
+
+    def test_conflict_invalidates_the_entry(self, cache, base):
+        cache.save("p-1", estado())
+        base.save("p-1", estado("COMPLETED"), expected_version=1)
+
+        with pytest.raises(SagaStateConflictError):
+            cache.save("p-1", estado("FAILED"), expected_version=1)
+
+        assert cache.get("p-1")["version"] == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        for partner_id in ("p-1", "p-2"):
+            cache.save(partner_id, estado())
+        cache.get("p-1")
+
+        cache.save("p-3", estado())
+
+        assert list(cache._entries) == ["p-1", "p-3"]
+
+    def test_delete_drops_the_entry(self, cache):
+        cache.save("p-1", estado())
+
+        cache.delete("p-1")
+
+        assert cache.get("p-1") is None
+
+
+class TestCreateSagaStateStore:
+
+    def test_memory_store_is_not_cached_by_default(self, monkeypatch):
+        monkeypatch.delenv("SAGA_STATE_STORE", raising=False)
+        monkeypatch.delenv("SAGA_STATE_CACHE_TTL_MS", raising=False)
+
+        assert isinstance(create_saga_state_store(), ShardedMemorySagaStateStore)
+
+    def test_cache_ttl_wraps_the_store(self, monkeypatch):
+        monkeypatch.setenv("SAGA_STATE_STORE", "memory")
+        monkeypatch.setenv("SAGA_STATE_CACHE_TTL_MS", "250")
+
+        store = create_saga_state_store()
+
+        assert isinstance(store, CachedSagaStateStore)
+        assert store.ttl_seconds == 0.25
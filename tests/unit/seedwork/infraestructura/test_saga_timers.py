@@ -0,0 +1,131 @@
+"""
+SagaTimerWheel tests: timers cascade down the wheel levels and fire on their
+deadline tick, rescheduling an id rearms it and cancelled timers never fire.
+"""
+
+import threading
+
+import pytest
+
+from partner_management.seedwork.infraestructura import saga_timers
+from partner_management.seedwork.infraestructura.saga_timers import SagaTimerWheel
+
+
+class Reloj:
+    """Monotonic clock that only moves when the test says so"""
+
+    def __init__(self):
+        self.ahora = 1000.0
+
+    def __call__(self):
+        return self.ahora
+
+
+class TestSagaTimerWheel:
+
+    @pytest.fixture
+    def reloj(self, monkeypatch):
+        reloj = Reloj()
+        monkeypatch.setattr(saga_timers.time, "monotonic", reloj)
+        return reloj
+
+    @pytest.fixture
+    def rueda(self, reloj):
+        # One-second ticks over 4 * 4 * 4 slots: a 64 tick horizon
+        rueda = SagaTimerWheel(tick_ms=1000, wheel_sizes=(4, 4, 4), max_workers=1)
+        # The ticker thread is never started; the test advances the wheel itself
+        rueda._running = True
+        yield rueda
+        rueda._running = False
+        rueda.stop()
+
+    def avanzar(self, rueda, ticks: int):
+        """Advance `ticks` ticks and return the tick on which each timer fired"""
+        vencidos = {}
+        for _ in range(ticks):
+            with rueda._lock:
+                for timer in rueda._advance():
+                    vencidos[timer.timer_id] = rueda._current_tick
+        return vencidos
+
+    def test_timer_fires_on_its_deadline_tick(self, rueda):
+        rueda.schedule("t", 3, lambda: None)
+
+        assert self.avanzar(rueda, 2) == {}
+        assert self.avanzar(rueda, 1) == {"t": 3}
+        assert rueda.pending() == 0
+
+    @pytest.mark.parametrize("delay, nivel", [(10, 1), (40, 2)])
+    def test_timers_cascade_down_to_fire_on_time(self, rueda, delay, nivel):
+        rueda.schedule("t", delay, lambda: None)
+
+        assert rueda._timers["t"].level == nivel
+        assert self.avanzar(rueda, delay) == {"t": delay}
+
+    def test_timer_beyond_the_horizon_is_replaced_by_its_deadline(self, rueda):
+        rueda.schedule("t", 100, lambda: None)
+
+        assert self.avanzar(rueda, 99) == {}
+        assert self.avanzar(rueda, 1) == {"t": 100}
+
+    def test_many_timers_each_fire_once_on_their_own_tick(self, rueda):
+        for delay in range(1, 70):
+            rueda.schedule(f"t-{delay}", delay, lambda: None)
+
+        vencidos = self.avanzar(rueda, 70)
+
+        assert vencidos == {f"t-{delay}": delay for delay in range(1, 70)}
+
+    def test_rescheduling_rearms_the_timer(self, rueda, reloj):
+        rueda.schedule("t", 5, lambda: None)
+        self.avanzar(rueda, 2)
+        reloj.ahora += 2
+
+        rueda.schedule("t", 20, lambda: None)
+
+        assert rueda.pending() == 1
+        assert self.avanzar(rueda, 19) == {}
+        assert self.avanzar(rueda, 1) == {"t": 22}
+
+    def test_cancelled_timer_never_fires(self, rueda):
+        rueda.schedule("t", 10, lambda: None)
+
+        assert rueda.cancel("t")
+        assert not rueda.cancel("t")
+        assert self.avanzar(rueda, 20) == {}
+
+    def test_past_deadline_fires_on_the_next_tick(self, rueda):
+        rueda.schedule("t", -5, lambda: None)
+
+        assert self.avanzar(rueda, 1) == {"t": 1}
+
+    def test_schedule_at_uses_the_wall_clock(self, rueda, monkeypatch):
+        monkeypatch.setattr(saga_timers.time, "time", lambda: 5000.0)
+
+        rueda.schedule_at("t", 5006.0, lambda: None)
+
+        assert self.avanzar(rueda, 6) == {"t": 6}
+
+
+class TestSagaTimerWheelThread:
+
+    @pytest.fixture
+    def rueda(self):
+        rueda = SagaTimerWheel(tick_ms=5, max_workers=2)
+        yield rueda
+        rueda.stop()
+
+    def test_expired_callbacks_run_on_the_workers(self, rueda):
+        disparado = threading.Event()
+        argumentos = []
+
+        def registrar(*args):
+            argumentos.append(args)
+            disparado.set()
+
+        rueda.schedule("falla", 0.01, lambda: 1 / 0)
+        rueda.schedule("t", 0.02, registrar, "saga-1", "paso")
+
+        assert disparado.wait(2.0)
+        assert argumentos == [("saga-1", "paso")]
+        assert rueda.pending() == 0
@@ -0,0 +1,176 @@
+"""
+SegmentedLogStore tests: size-based segment rotation and retention, streaming reads
+in both directions, buffered writes and the fsync policy.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from partner_management.seedwork.infraestructura import segmented_log_store
+from partner_management.seedwork.infraestructura.segmented_log_store import FsyncPolicy, SegmentedLogStore
+
+
+def registro(i: int) -> dict:
+    return {"seq": i, "payload": "x" * 20}
+
+
+class TestSegmentedLogStore:
+
+    @pytest.fixture
+    def abrir(self, tmp_path):
+        stores = []
+
+        def abrir(**opciones):
+            opciones.setdefault("flush_interval_seconds", 0)
+            store = SegmentedLogStore(str(tmp_path), "eventos", **opciones)
+            stores.append(store)
+            return store
+
+        yield abrir
+        for store in stores:
+            store.close()
+
+    @pytest.fixture
+    def fsyncs(self, monkeypatch):
+        llamadas = []
+        monkeypatch.setattr(segmented_log_store.os, "fsync", llamadas.append)
+        return llamadas
+
+    def test_rotates_when_the_segment_is_full(self, abrir):
+        store = abrir(max_segment_bytes=200)
+
+        for i in range(20):
+            store.append(registro(i))
+
+        segmentos = store.segments()
+        assert len(segmentos) > 1
+        assert all(os.path.getsize(segmento) <= 200 for segmento in segmentos)
+        assert store.active_sequence == len(segmentos)
+        assert [r["seq"] for r in store.iter_records()] == list(range(20))
+
+    def test_records_are_read_by_segment(self, abrir):
+        store = abrir(max_segment_bytes=200)
+        for i in range(20):
+            store.append(registro(i))
+
+        ultimo = [r["seq"] for r in store.iter_records(start_sequence=store.active_sequence)]
+        secuencias = {sequence for sequence, _ in store.iter_records_with_sequence()}
+
+        assert ultimo == list(range(20))[-len(ultimo):]
+        assert secuencias == set(range(1, store.active_sequence + 1))
+
+    def test_reverse_iteration_reads_newest_first(self, abrir):
+        store = abrir(max_segment_bytes=200)
+        for i in range(20):
+            store.append(registro(i))
+
+        assert [r["seq"] for r in store.iter_records_reverse()] == list(reversed(range(20)))
+
+    def test_retention_keeps_the_newest_segments(self, abrir):
+        store = abrir(max_segment_bytes=200, max_segments=2)
+
+        for i in range(40):
+            store.append(registro(i))
+
+        assert len(store.segments()) == 2
+        leidos = [r["seq"] for r in store.iter_records()]
+        assert leidos == list(range(40))[-len(leidos):]
+
+    def test_reopening_appends_to_the_last_segment(self, abrir):
+        primero = abrir(max_segment_bytes=200)
+        for i in range(10):
+            primero.append(registro(i))
+        secuencia = primero.active_sequence
+        primero.close()
+
+        segundo = abrir(max_segment_bytes=200)
+        segundo.append(registro(10))
+
+        assert segundo.active_sequence == secuencia
+        assert [r["seq"] for r in segundo.iter_records()] == list(range(11))
+
+    def test_torn_tail_line_is_skipped(self, abrir):
+        store = abrir()
+        store.append(registro(0))
+        with open(store.segments()[-1], "a", encoding="utf-8") as f:
+            f.write('{"seq": 1, "payl')
+
+        assert [r["seq"] for r in store.iter_records()] == [0]
+        assert store.get_stats()["corrupt_lines_skipped"] == 1
+
+    def test_buffered_records_are_written_on_flush(self, abrir):
+        store = abrir(flush_interval_seconds=60)
+
+        store.append(registro(0))
+        assert store.get_stats()["pending_records"] == 1
+        assert os.path.getsize(store.segments()[-1]) == 0
+
+        store.flush()
+        assert store.get_stats()["pending_records"] == 0
+        assert [r["seq"] for r in store.iter_records()] == [0]
+
+    def test_full_buffer_is_flushed_by_the_writer(self, abrir):
+        store = abrir(flush_interval_seconds=60, max_pending_records=3)
+
+        for i in range(3):
+            store.append(registro(i))
+
+        assert store.get_stats()["pending_records"] == 0
+        assert store.get_stats()["records_written"] == 3
+
+    def test_roll_starts_a_new_segment(self, abrir):
+        store = abrir()
+        store.append(registro(0))
+
+        secuencia = store.roll()
+
+        assert secuencia == 2
+        assert store.roll() == 2  # An empty active segment is not rotated
+
+    def test_old_closed_segments_are_dropped(self, abrir):
+        store = abrir()
+        store.append(registro(0))
+        store.roll()
+        store.append(registro(1))
+
+        eliminados = store.drop_segments_older_than(datetime.now(timezone.utc) + timedelta(seconds=1))
+
+        assert eliminados == 1
+        assert [r["seq"] for r in store.iter_records()] == [1]
+
+    def test_fsync_always_syncs_every_write(self, abrir, fsyncs):
+        store = abrir(fsync_policy=FsyncPolicy.ALWAYS)
+
+        for i in range(3):
+            store.append(registro(i))
+
+        assert len(fsyncs) == 3
+
+    def test_fsync_interval_syncs_once_the_interval_elapsed(self, abrir, fsyncs):
+        store = abrir(fsync_policy=FsyncPolicy.INTERVAL, fsync_interval_seconds=60)
+
+        store.append(registro(0))
+        assert fsyncs == []
+
+        store._last_fsync -= timedelta(seconds=61)
+        store.append(registro(1))
+        store.append(registro(2))
+        assert len(fsyncs) == 1
+
+    def test_fsync_never_leaves_syncing_to_the_os(self, abrir, fsyncs):
+        store = abrir(fsync_policy=FsyncPolicy.NEVER)
+
+        store.append(registro(0))
+        store.close()
+
+        assert fsyncs == []
+
+    def test_rotation_syncs_the_closed_segment(self, abrir, fsyncs):
+        store = abrir(fsync_policy=FsyncPolicy.NEVER, max_segment_bytes=200)
+
+        for i in range(20):
+            store.append(registro(i))
+
+        assert len(fsyncs) == len(store.segments()) - 1